@@ -116,6 +116,13 @@ CREATE TABLE Posts (
     price NUMERIC(15,2),
     status VARCHAR(20),
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    like_count INT NOT NULL DEFAULT 0,
+    deleted_at TIMESTAMP NULL,
+    search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(content, '')), 'B') ||
+        setweight(to_tsvector('simple', coalesce(location, '')), 'C')
+    ) STORED,
     FOREIGN KEY (user_id) REFERENCES users(id)
 );
 
@@ -178,6 +185,9 @@ CREATE TABLE Comments (
     status VARCHAR(20) DEFAULT 'active',
     added_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     commented_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    like_count INT NOT NULL DEFAULT 0,
+    reply_count INT NOT NULL DEFAULT 0,
+    descendant_count INT NOT NULL DEFAULT 0,
     FOREIGN KEY (post_id) REFERENCES Posts(id) ON DELETE CASCADE,
     FOREIGN KEY (parent_comment_id) REFERENCES Comments(id) ON DELETE CASCADE,
     FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
@@ -198,17 +208,26 @@ CREATE TABLE post_comment_likes (
 -- Add unique constraints
 ALTER TABLE users ADD CONSTRAINT users_email_unique UNIQUE (email);
 ALTER TABLE users ADD CONSTRAINT users_phone_unique UNIQUE (phone);
+ALTER TABLE post_likes ADD CONSTRAINT uq_post_likes_post_user UNIQUE (post_id, user_id);
+ALTER TABLE post_comment_likes ADD CONSTRAINT uq_post_comment_likes_comment_user UNIQUE (comment_id, user_id);
 
 -- Add indexes for better query performance
 CREATE INDEX idx_posts_user_id ON Posts(user_id);
+CREATE INDEX idx_posts_user_created ON Posts(user_id, created_at DESC);
+CREATE INDEX idx_posts_search_vector ON Posts USING GIN (search_vector);
+CREATE INDEX idx_posts_deleted_at ON Posts(deleted_at) WHERE deleted_at IS NOT NULL;
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE INDEX idx_posts_location_trgm ON Posts USING GIN (location gin_trgm_ops);
 CREATE INDEX idx_post_media_post_id ON post_media(post_id);
 CREATE INDEX idx_user_ratings_rated_user_id ON user_ratings(rated_user_id);
 CREATE INDEX idx_user_ratings_rated_by_user_id ON user_ratings(rated_by_user_id);
 CREATE INDEX idx_user_followers_user_id ON user_followers(user_id);
 CREATE INDEX idx_user_followers_following_id ON user_followers(following_id);
+CREATE INDEX idx_user_followers_following_user ON user_followers(following_id, user_id);
 CREATE INDEX idx_post_likes_post_id ON post_likes(post_id);
 CREATE INDEX idx_post_likes_user_id ON post_likes(user_id);
 CREATE INDEX idx_comments_post_id ON Comments(post_id);
 CREATE INDEX idx_comments_user_id ON Comments(user_id);
+CREATE INDEX idx_comments_parent_comment_id ON Comments(parent_comment_id);
 CREATE INDEX idx_post_comment_likes_comment_id ON post_comment_likes(comment_id);
 CREATE INDEX idx_post_comment_likes_user_id ON post_comment_likes(user_id); 
\ No newline at end of file
@@ -1,13 +1,34 @@
-from sqlalchemy import Column, Integer, DateTime, ForeignKey, String
+from sqlalchemy import Column, Integer, BigInteger, DateTime, ForeignKey, Index
 from sqlalchemy.sql import func
 from ..utils.db_connection import Base
-import uuid
 
 class FeedItem(Base):
+    """One post in one user's feed.
+
+    Range-partitioned by created_at into weekly partitions, which the
+    retention job creates ahead of time and drops once they age out (see
+    ``FeedRetention``). created_at is the post's own creation time, so the
+    partition key is part of every unique key without changing what it means.
+    """
     __tablename__ = 'feed_items'
+    __table_args__ = (
+        # GetFeed is one range scan over this index
+        Index('idx_feed_items_user_created', 'user_id', 'created_at'),
+        # A post appears in a user's feed at most once; writes rely on it for ON CONFLICT
+        Index('uq_feed_items_user_post', 'user_id', 'post_id', 'created_at', unique=True),
+        {'postgresql_partition_by': 'RANGE (created_at)'},
+    )
 
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
     post_id = Column(Integer, ForeignKey('posts.id'), nullable=False)
     user_id = Column(Integer, nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now()) 
\ No newline at end of file
+    created_at = Column(DateTime(timezone=True), primary_key=True)
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+class CelebrityAuthor(Base):
+    """Authors with too many followers to fan out to; GetFeed pulls their posts at read time"""
+    __tablename__ = 'celebrity_authors'
+
+    user_id = Column(Integer, primary_key=True)
+    follower_count = Column(Integer, nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text
+from sqlalchemy import Column, Integer, String, DateTime, Text, Numeric
 from sqlalchemy.sql import func
 from ..utils.db_connection import Base
 
@@ -9,5 +9,11 @@ class Post(Base):
     title = Column(String(255), nullable=False)
     content = Column(Text, nullable=False)
     user_id = Column(Integer, nullable=False)
+    price = Column(Numeric(15, 2))
+    location = Column(String(255))
+    property_type = Column(String(50))
+    status = Column(String(20))
+    like_count = Column(Integer, nullable=False, default=0)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now()) 
\ No newline at end of file
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    deleted_at = Column(DateTime)
\ No newline at end of file
@@ -22,25 +22,36 @@ _runtime_version.ValidateProtobufRuntimeVersion(
 _sym_db = _symbol_database.Default()
 
 
+from google.protobuf import field_mask_pb2 as google_dot_protobuf_dot_field__mask__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1a\x61pp/proto_files/feed.proto\x12\x04\x66\x65\x65\x64\"`\n\x08\x46\x65\x65\x64Item\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0f\n\x07post_id\x18\x02 \x01(\x05\x12\x0f\n\x07user_id\x18\x03 \x01(\x05\x12\x12\n\ncreated_at\x18\x04 \x01(\t\x12\x12\n\nupdated_at\x18\x05 \x01(\t\"2\n\x0c\x46\x65\x65\x64ItemList\x12\"\n\nfeed_items\x18\x01 \x03(\x0b\x32\x0e.feed.FeedItem\"@\n\x0eGetFeedRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\x05\x12\r\n\x05limit\x18\x02 \x01(\x05\x12\x0e\n\x06offset\x18\x03 \x01(\x05\"S\n\x0c\x46\x65\x65\x64Response\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12!\n\tfeed_item\x18\x03 \x01(\x0b\x32\x0e.feed.FeedItem\"[\n\x0fGetFeedResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12&\n\nfeed_items\x18\x03 \x01(\x0b\x32\x12.feed.FeedItemList2\xb2\x01\n\x0b\x46\x65\x65\x64Service\x12\x38\n\x07GetFeed\x12\x14.feed.GetFeedRequest\x1a\x15.feed.GetFeedResponse\"\x00\x12\x31\n\tAddToFeed\x12\x0e.feed.FeedItem\x1a\x12.feed.FeedResponse\"\x00\x12\x36\n\x0eRemoveFromFeed\x12\x0e.feed.FeedItem\x1a\x12.feed.FeedResponse\"\x00\x62\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1a\x61pp/proto_files/feed.proto\x12\x04\x66\x65\x65\x64\x1a google/protobuf/field_mask.proto\"\xff\x01\n\x0bPostSummary\x12\n\n\x02id\x18\x01 \x01(\x03\x12\x0f\n\x07user_id\x18\x02 \x01(\x03\x12\x13\n\x0b\x61uthor_name\x18\x03 \x01(\t\x12\r\n\x05title\x18\x04 \x01(\t\x12\x0f\n\x07\x63ontent\x18\x05 \x01(\t\x12\r\n\x05price\x18\x06 \x01(\x01\x12\x10\n\x08location\x18\x07 \x01(\t\x12\x15\n\rproperty_type\x18\x08 \x01(\t\x12\x0e\n\x06status\x18\t \x01(\t\x12\x17\n\x0f\x66irst_media_url\x18\n \x01(\t\x12\x12\n\nlike_count\x18\x0b \x01(\x05\x12\x15\n\rcomment_count\x18\x0c \x01(\x05\x12\x12\n\ncreated_at\x18\r \x01(\x03\"\x81\x01\n\x08\x46\x65\x65\x64Item\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0f\n\x07post_id\x18\x02 \x01(\x05\x12\x0f\n\x07user_id\x18\x03 \x01(\x05\x12\x12\n\ncreated_at\x18\x04 \x01(\t\x12\x12\n\nupdated_at\x18\x05 \x01(\t\x12\x1f\n\x04post\x18\x06 \x01(\x0b\x32\x11.feed.PostSummary\"2\n\x0c\x46\x65\x65\x64ItemList\x12\"\n\nfeed_items\x18\x01 \x03(\x0b\x32\x0e.feed.FeedItem\"\xa8\x01\n\x0eGetFeedRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\x05\x12\r\n\x05limit\x18\x02 \x01(\x05\x12\x0e\n\x06offset\x18\x03 \x01(\x05\x12\x0e\n\x06\x62\x65\x66ore\x18\x04 \x01(\x03\x12\x15\n\rinclude_posts\x18\x05 \x01(\x08\x12/\n\x0bpost_fields\x18\x06 \x01(\x0b\x32\x1a.google.protobuf.FieldMask\x12\x0e\n\x06ranked\x18\x07 \x01(\x08\"S\n\x0c\x46\x65\x65\x64Response\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12!\n\tfeed_item\x18\x03 \x01(\x0b\x32\x0e.feed.FeedItem\"p\n\x0fGetFeedResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12&\n\nfeed_items\x18\x03 \x01(\x0b\x32\x12.feed.FeedItemList\x12\x13\n\x0bnext_cursor\x18\x04 \x01(\x03\":\n\x14\x42ulkAddToFeedRequest\x12\"\n\nfeed_items\x18\x01 \x03(\x0b\x32\x0e.feed.FeedItem\"v\n\x15\x42ulkAddToFeedResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12&\n\nfeed_items\x18\x03 \x01(\x0b\x32\x12.feed.FeedItemList\x12\x13\n\x0b\x61\x64\x64\x65\x64_count\x18\x04 \x01(\x05\"=\n\x11\x46\x61nOutPostRequest\x12\x0f\n\x07post_id\x18\x01 \x01(\x03\x12\x11\n\tauthor_id\x18\x02 \x01(\x03J\x04\x08\x03\x10\x04\"]\n\x12\x46\x61nOutPostResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x12\n\nrecipients\x18\x03 \x01(\x05\x12\x11\n\tcelebrity\x18\x04 \x01(\x08\x32\xc1\x02\n\x0b\x46\x65\x65\x64Service\x12\x38\n\x07GetFeed\x12\x14.feed.GetFeedRequest\x1a\x15.feed.GetFeedResponse\"\x00\x12\x31\n\tAddToFeed\x12\x0e.feed.FeedItem\x1a\x12.feed.FeedResponse\"\x00\x12J\n\rBulkAddToFeed\x12\x1a.feed.BulkAddToFeedRequest\x1a\x1b.feed.BulkAddToFeedResponse\"\x00\x12\x36\n\x0eRemoveFromFeed\x12\x0e.feed.FeedItem\x1a\x12.feed.FeedResponse\"\x00\x12\x41\n\nFanOutPost\x12\x17.feed.FanOutPostRequest\x1a\x18.feed.FanOutPostResponse\"\x00\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'app.proto_files.feed_pb2', _globals)
 if not _descriptor._USE_C_DESCRIPTORS:
   DESCRIPTOR._loaded_options = None
-  _globals['_FEEDITEM']._serialized_start=36
-  _globals['_FEEDITEM']._serialized_end=132
-  _globals['_FEEDITEMLIST']._serialized_start=134
-  _globals['_FEEDITEMLIST']._serialized_end=184
-  _globals['_GETFEEDREQUEST']._serialized_start=186
-  _globals['_GETFEEDREQUEST']._serialized_end=250
-  _globals['_FEEDRESPONSE']._serialized_start=252
-  _globals['_FEEDRESPONSE']._serialized_end=335
-  _globals['_GETFEEDRESPONSE']._serialized_start=337
-  _globals['_GETFEEDRESPONSE']._serialized_end=428
-  _globals['_FEEDSERVICE']._serialized_start=431
-  _globals['_FEEDSERVICE']._serialized_end=609
+  _globals['_POSTSUMMARY']._serialized_start=71
+  _globals['_POSTSUMMARY']._serialized_end=326
+  _globals['_FEEDITEM']._serialized_start=329
+  _globals['_FEEDITEM']._serialized_end=458
+  _globals['_FEEDITEMLIST']._serialized_start=460
+  _globals['_FEEDITEMLIST']._serialized_end=510
+  _globals['_GETFEEDREQUEST']._serialized_start=513
+  _globals['_GETFEEDREQUEST']._serialized_end=681
+  _globals['_FEEDRESPONSE']._serialized_start=683
+  _globals['_FEEDRESPONSE']._serialized_end=766
+  _globals['_GETFEEDRESPONSE']._serialized_start=768
+  _globals['_GETFEEDRESPONSE']._serialized_end=880
+  _globals['_BULKADDTOFEEDREQUEST']._serialized_start=882
+  _globals['_BULKADDTOFEEDREQUEST']._serialized_end=940
+  _globals['_BULKADDTOFEEDRESPONSE']._serialized_start=942
+  _globals['_BULKADDTOFEEDRESPONSE']._serialized_end=1060
+  _globals['_FANOUTPOSTREQUEST']._serialized_start=1062
+  _globals['_FANOUTPOSTREQUEST']._serialized_end=1123
+  _globals['_FANOUTPOSTRESPONSE']._serialized_start=1125
+  _globals['_FANOUTPOSTRESPONSE']._serialized_end=1218
+  _globals['_FEEDSERVICE']._serialized_start=1221
+  _globals['_FEEDSERVICE']._serialized_end=1542
 # @@protoc_insertion_point(module_scope)
@@ -45,11 +45,21 @@ class FeedServiceStub(object):
                 request_serializer=app_dot_proto__files_dot_feed__pb2.FeedItem.SerializeToString,
                 response_deserializer=app_dot_proto__files_dot_feed__pb2.FeedResponse.FromString,
                 _registered_method=True)
+        self.BulkAddToFeed = channel.unary_unary(
+                '/feed.FeedService/BulkAddToFeed',
+                request_serializer=app_dot_proto__files_dot_feed__pb2.BulkAddToFeedRequest.SerializeToString,
+                response_deserializer=app_dot_proto__files_dot_feed__pb2.BulkAddToFeedResponse.FromString,
+                _registered_method=True)
         self.RemoveFromFeed = channel.unary_unary(
                 '/feed.FeedService/RemoveFromFeed',
                 request_serializer=app_dot_proto__files_dot_feed__pb2.FeedItem.SerializeToString,
                 response_deserializer=app_dot_proto__files_dot_feed__pb2.FeedResponse.FromString,
                 _registered_method=True)
+        self.FanOutPost = channel.unary_unary(
+                '/feed.FeedService/FanOutPost',
+                request_serializer=app_dot_proto__files_dot_feed__pb2.FanOutPostRequest.SerializeToString,
+                response_deserializer=app_dot_proto__files_dot_feed__pb2.FanOutPostResponse.FromString,
+                _registered_method=True)
 
 
 class FeedServiceServicer(object):
@@ -68,12 +78,25 @@ class FeedServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def BulkAddToFeed(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def RemoveFromFeed(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def FanOutPost(self, request, context):
+        """Called by the posts service after a post is created
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_FeedServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -87,11 +110,21 @@ def add_FeedServiceServicer_to_server(servicer, server):
                     request_deserializer=app_dot_proto__files_dot_feed__pb2.FeedItem.FromString,
                     response_serializer=app_dot_proto__files_dot_feed__pb2.FeedResponse.SerializeToString,
             ),
+            'BulkAddToFeed': grpc.unary_unary_rpc_method_handler(
+                    servicer.BulkAddToFeed,
+                    request_deserializer=app_dot_proto__files_dot_feed__pb2.BulkAddToFeedRequest.FromString,
+                    response_serializer=app_dot_proto__files_dot_feed__pb2.BulkAddToFeedResponse.SerializeToString,
+            ),
             'RemoveFromFeed': grpc.unary_unary_rpc_method_handler(
                     servicer.RemoveFromFeed,
                     request_deserializer=app_dot_proto__files_dot_feed__pb2.FeedItem.FromString,
                     response_serializer=app_dot_proto__files_dot_feed__pb2.FeedResponse.SerializeToString,
             ),
+            'FanOutPost': grpc.unary_unary_rpc_method_handler(
+                    servicer.FanOutPost,
+                    request_deserializer=app_dot_proto__files_dot_feed__pb2.FanOutPostRequest.FromString,
+                    response_serializer=app_dot_proto__files_dot_feed__pb2.FanOutPostResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'feed.FeedService', rpc_method_handlers)
@@ -158,6 +191,33 @@ class FeedService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def BulkAddToFeed(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/feed.FeedService/BulkAddToFeed',
+            app_dot_proto__files_dot_feed__pb2.BulkAddToFeedRequest.SerializeToString,
+            app_dot_proto__files_dot_feed__pb2.BulkAddToFeedResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def RemoveFromFeed(request,
             target,
@@ -184,3 +244,30 @@ class FeedService(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def FanOutPost(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/feed.FeedService/FanOutPost',
+            app_dot_proto__files_dot_feed__pb2.FanOutPostRequest.SerializeToString,
+            app_dot_proto__files_dot_feed__pb2.FanOutPostResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
@@ -1,32 +1,350 @@
 from sqlalchemy.orm import Session
-from ..entity.feed_entity import FeedItem
+from ..entity.feed_entity import FeedItem, CelebrityAuthor
 from ..entity.post_entity import Post
-from typing import List, Optional
-from datetime import datetime
+from .timeline_cache import TimelineCache, Timeline, to_score, from_score, to_member, from_member
+from typing import List, NamedTuple, Optional
+from datetime import datetime, timedelta, timezone
+import os
 import logging
-from sqlalchemy import desc, and_
+import time
+import redis
+from sqlalchemy import and_, delete, text, literal_column
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects.postgresql import insert
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Feed items for posts older than this are not written, and their weekly
+# partitions are dropped by the retention job
+RETENTION_DAYS = int(os.getenv("FEED_RETENTION_DAYS", "90"))
+
+# feed_items partitions are one week wide, Monday 00:00 UTC to the next
+# Monday, and named feed_items_pYYYYMMDD after their first day
+PARTITION_WIDTH = timedelta(days=7)
+PARTITION_PREFIX = "feed_items_p"
+
+# Recent posts from the celebrity authors a user follows; those are never
+# fanned out, so every read merges them in. For users who follow no
+# celebrities this is an empty join against the small celebrity_authors table.
+_CELEBRITY_POSTS = """
+    SELECT NULL AS id, p.id AS post_id, :user_id AS user_id,
+           p.created_at AT TIME ZONE 'UTC' AS created_at, NULL AS updated_at
+    FROM celebrity_authors c
+    JOIN user_followers f ON f.following_id = c.user_id AND f.user_id = :user_id AND f.status = 'active'
+    CROSS JOIN LATERAL (
+        SELECT id, created_at FROM posts
+        WHERE user_id = c.user_id AND deleted_at IS NULL
+          AND (CAST(:before AS timestamptz) IS NULL
+               OR created_at < CAST(:before AS timestamptz) AT TIME ZONE 'UTC')
+        ORDER BY created_at DESC
+        LIMIT :window
+    ) p
+"""
+
+# A feed page is the user's materialized feed items merged with the celebrity
+# posts above. DISTINCT ON drops posts fanned out before their author became a
+# celebrity.
+FEED_PAGE_SQL = text(f"""
+    SELECT id, post_id, user_id, created_at, updated_at FROM (
+        SELECT DISTINCT ON (post_id) id, post_id, user_id, created_at, updated_at
+        FROM (
+            (SELECT id, post_id, user_id, created_at, updated_at
+             FROM feed_items
+             WHERE user_id = :user_id
+               AND (CAST(:before AS timestamptz) IS NULL OR created_at < CAST(:before AS timestamptz))
+             ORDER BY created_at DESC
+             LIMIT :window)
+            UNION ALL
+            ({_CELEBRITY_POSTS})
+        ) merged
+        ORDER BY post_id, id NULLS LAST
+    ) page
+    ORDER BY created_at DESC, post_id DESC
+    OFFSET :offset LIMIT :limit
+""")
+
+# The celebrity half of a page, when the materialized half comes from the timeline cache
+CELEBRITY_POSTS_SQL = text(f"""
+    {_CELEBRITY_POSTS}
+    ORDER BY created_at DESC
+    LIMIT :window
+""")
+
+# Newest feed items for a user, to (re)load their cached timeline
+TIMELINE_LOAD_SQL = text("""
+    SELECT id, post_id, created_at FROM feed_items
+    WHERE user_id = :user_id
+    ORDER BY created_at DESC
+    LIMIT :limit
+""")
+
+FOLLOWER_COUNT_SQL = text("""
+    SELECT count(*) FROM (
+        SELECT 1 FROM user_followers
+        WHERE following_id = :author_id AND status = 'active'
+        LIMIT :cap
+    ) f
+""")
+
+# Keyset pagination over an author's followers, for chunked fan-out
+FOLLOWER_PAGE_SQL = text("""
+    SELECT DISTINCT user_id FROM user_followers
+    WHERE following_id = :author_id AND status = 'active' AND user_id > :after_user_id
+    ORDER BY user_id
+    LIMIT :limit
+""")
+
+# Feed items take their post's created_at, which keeps the (user_id, post_id)
+# dedupe a unique key on the partitioned table. Posts that are gone or older
+# than the retention window are skipped, so no row targets a dropped partition.
+FEED_INSERT_SQL = text("""
+    INSERT INTO feed_items (post_id, user_id, created_at)
+    SELECT i.post_id, i.user_id, p.created_at AT TIME ZONE 'UTC'
+    FROM unnest(CAST(:post_ids AS bigint[]), CAST(:user_ids AS bigint[])) AS i(post_id, user_id)
+    JOIN posts p ON p.id = i.post_id
+    WHERE p.created_at >= (now() - make_interval(days => :retention_days)) AT TIME ZONE 'UTC'
+    ON CONFLICT (user_id, post_id, created_at) DO NOTHING
+    RETURNING id, post_id, user_id, created_at, updated_at
+""")
+
+# Weeks (naive UTC Monday starts) a FEED_INSERT_SQL batch writes into
+FEED_INSERT_WEEKS_SQL = text("""
+    SELECT DISTINCT date_trunc('week', p.created_at)
+    FROM posts p
+    WHERE p.id = ANY(CAST(:post_ids AS bigint[]))
+      AND p.created_at >= (now() - make_interval(days => :retention_days)) AT TIME ZONE 'UTC'
+""")
+
+# SQLSTATE Postgres raises for a row that no feed_items partition accepts
+NO_PARTITION_PGCODE = "23514"
+
+FEED_PARTITIONS_SQL = text("""
+    SELECT c.relname FROM pg_inherits i
+    JOIN pg_class c ON c.oid = i.inhrelid
+    WHERE i.inhparent = 'feed_items'::regclass
+    ORDER BY c.relname
+""")
+
+# Users whose feeds gained items at or after :since (all users when NULL), in id order
+FEED_USERS_SQL = text("""
+    SELECT DISTINCT user_id FROM feed_items
+    WHERE user_id > :after_user_id
+      AND (CAST(:since AS timestamptz) IS NULL OR created_at >= CAST(:since AS timestamptz))
+    ORDER BY user_id
+    LIMIT :limit
+""")
+
+# Deletes everything older than each user's newest :cap items. Items sharing
+# the cutoff timestamp go too, so a feed can end up a little under the cap.
+FEED_CAP_SQL = text("""
+    DELETE FROM feed_items f
+    USING (
+        SELECT u.user_id, cutoff.created_at
+        FROM unnest(CAST(:user_ids AS bigint[])) AS u(user_id)
+        CROSS JOIN LATERAL (
+            SELECT created_at FROM feed_items
+            WHERE user_id = u.user_id
+            ORDER BY created_at DESC
+            OFFSET :cap LIMIT 1
+        ) cutoff
+    ) over_cap
+    WHERE f.user_id = over_cap.user_id AND f.created_at <= over_cap.created_at
+    RETURNING f.id, f.post_id, f.user_id
+""")
+
+
+def partition_start(moment: datetime) -> datetime:
+    """Start of the feed_items partition holding ``moment``"""
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    day = moment.astimezone(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    return day - timedelta(days=day.weekday())
+
+
+def partition_name(start: datetime) -> str:
+    return f"{PARTITION_PREFIX}{start:%Y%m%d}"
+
+# Everything the feed ranker scores candidate posts on, in one round trip.
+# map_location is "lat,lng" text; anything else ranks as location unknown.
+RANKING_SIGNALS_SQL = text("""
+    WITH viewer AS (
+        SELECT latitude, longitude FROM users WHERE id = :user_id
+    ), comment_counts AS (
+        SELECT post_id, count(*) AS comment_count
+        FROM comments
+        WHERE post_id = ANY(:post_ids)
+        GROUP BY post_id
+    ), located AS (
+        SELECT id, user_id, created_at, like_count,
+               CASE WHEN map_location ~ '^[[:space:]]*-?[0-9]+([.][0-9]+)?[[:space:]]*,[[:space:]]*-?[0-9]+([.][0-9]+)?[[:space:]]*$'
+                    THEN map_location END AS lat_lng
+        FROM posts
+        WHERE id = ANY(:post_ids) AND deleted_at IS NULL
+    )
+    SELECT p.id AS post_id,
+           CAST(extract(epoch FROM p.created_at AT TIME ZONE 'UTC') AS float) AS created_at,
+           p.like_count,
+           coalesce(cc.comment_count, 0) AS comment_count,
+           t.score AS trending_score,
+           EXISTS (SELECT 1 FROM user_followers f
+                   WHERE f.user_id = :user_id AND f.following_id = p.user_id AND f.status = 'active') AS follows_author,
+           EXISTS (SELECT 1 FROM user_followers f
+                   WHERE f.user_id = p.user_id AND f.following_id = :user_id AND f.status = 'active') AS followed_by_author,
+           CAST(split_part(p.lat_lng, ',', 1) AS float) AS latitude,
+           CAST(split_part(p.lat_lng, ',', 2) AS float) AS longitude,
+           v.latitude AS viewer_latitude,
+           v.longitude AS viewer_longitude
+    FROM located p
+    LEFT JOIN viewer v ON true
+    LEFT JOIN comment_counts cc ON cc.post_id = p.id
+    LEFT JOIN trending_posts t ON t.post_id = p.id
+""")
+
+# Post columns a hydrated feed item can carry, keyed by PostSummary field.
+# The correlated subqueries only run for the fields a caller asks for.
+POST_SUMMARY_COLUMNS = {
+    "id": Post.id,
+    "user_id": Post.user_id,
+    "title": Post.title,
+    "content": Post.content,
+    "price": Post.price,
+    "location": Post.location,
+    "property_type": Post.property_type,
+    "status": Post.status,
+    "like_count": Post.like_count,
+    "created_at": Post.created_at,
+    "author_name": literal_column(
+        "(SELECT concat_ws(' ', u.first_name, u.last_name) FROM users u WHERE u.id = posts.user_id)"
+    ),
+    "first_media_url": literal_column(
+        "(SELECT m.media_url FROM post_media m WHERE m.post_id = posts.id ORDER BY m.media_order, m.id LIMIT 1)"
+    ),
+    "comment_count": literal_column("(SELECT count(*) FROM comments c WHERE c.post_id = posts.id)")
+}
+
+class FeedEntry(NamedTuple):
+    """A feed item served from the timeline cache"""
+    id: str
+    post_id: int
+    user_id: int
+    created_at: datetime
+    updated_at: Optional[datetime]
+
 class FeedRepository:
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, cache: Optional[TimelineCache] = None):
         self.db = db
+        # Optional Redis timeline cache (FEED_CACHE_ENABLED); Postgres stays the source of truth
+        self.cache = cache
 
-    def get_feed_items(self, user_id: int, limit: int = 20, offset: int = 0) -> List[FeedItem]:
-        """Get feed items for a user with pagination"""
+    def get_feed_items(self, user_id: int, limit: int = 20, offset: int = 0, before: datetime = None) -> list:
+        """Get feed items for a user created before ``before``, with pagination, including posts from followed celebrity authors"""
         try:
-            items = self.db.query(FeedItem)\
-                .filter(FeedItem.user_id == user_id)\
-                .order_by(desc(FeedItem.created_at))\
-                .offset(offset)\
-                .limit(limit)\
-                .all()
+            window = offset + limit
+            if self.cache:
+                items = self._get_cached_feed_items(user_id, window, before)
+                if items is not None:
+                    return items[offset:window]
+
+            items = self.db.execute(FEED_PAGE_SQL, {
+                "user_id": user_id,
+                "before": before,
+                "window": window,
+                "offset": offset,
+                "limit": limit
+            }).all()
             return items if items else []
         except Exception as e:
             logger.error(f"Error in get_feed_items: {e}")
             return []
 
+    def _get_cached_feed_items(self, user_id: int, window: int, before: Optional[datetime]) -> Optional[list]:
+        """The first ``window`` items below the cursor from the user's cached timeline
+        plus celebrity posts, or None when the page has to come from Postgres"""
+        before_score = to_score(before) if before else None
+        try:
+            timeline = self.cache.page(user_id, before_score, window)
+            missed = timeline is None
+            if missed:
+                timeline = self._load_timeline(user_id, before_score, window)
+        except redis.RedisError as e:
+            logger.error(f"Feed cache error for user {user_id}: {e}")
+            self.cache.record_error()
+            return None
+
+        if timeline.truncated:
+            # The page runs past the oldest cached item
+            if not missed:
+                self.cache.record_overflow()
+            return None
+        if not missed:
+            self.cache.record_hit()
+
+        items = []
+        for member, score in timeline.items:
+            post_id, item_id = from_member(member)
+            items.append(FeedEntry(item_id, post_id, user_id, from_score(score), None))
+
+        celebrity_posts = self.db.execute(CELEBRITY_POSTS_SQL, {
+            "user_id": user_id,
+            "before": before,
+            "window": window
+        }).all()
+        if celebrity_posts:
+            seen = {item.post_id for item in items}
+            items.extend(post for post in celebrity_posts if post.post_id not in seen)
+            items.sort(key=lambda item: (item.created_at, item.post_id), reverse=True)
+        return items[:window]
+
+    def _load_timeline(self, user_id: int, before_score: Optional[int], window: int) -> Timeline:
+        """Rebuild a user's cached timeline from feed_items and return the requested slice of it"""
+        started = time.perf_counter()
+        # Before the query, so writes committed after its snapshot are kept for the load
+        self.cache.begin_load(user_id)
+        rows = self.db.execute(TIMELINE_LOAD_SQL, {"user_id": user_id, "limit": self.cache.max_items}).all()
+        loaded = [(to_member(row.post_id, row.id), to_score(row.created_at)) for row in rows]
+        # Postgres may hold older items than the ones loaded
+        floor = loaded[-1][1] if len(rows) >= self.cache.max_items else None
+        self.cache.load(user_id, loaded, floor)
+        self.cache.record_miss((time.perf_counter() - started) * 1000)
+
+        items = [
+            item for item in loaded
+            if (before_score is None or item[1] < before_score) and (floor is None or item[1] > floor)
+        ]
+        return Timeline(items[:window], floor is not None and len(items) < window)
+
+    def _cache_feed_items(self, feed_items: list) -> None:
+        """Write new feed items through to the loaded timelines they belong to"""
+        if not self.cache or not feed_items:
+            return
+        try:
+            self.cache.add([
+                (item.user_id, to_member(item.post_id, item.id), to_score(item.created_at))
+                for item in feed_items
+            ])
+        except redis.RedisError as e:
+            logger.error(f"Feed cache error while adding {len(feed_items)} items: {e}")
+            self.cache.record_error()
+
+    def get_ranking_signals(self, user_id: int, post_ids: List[int]) -> list:
+        """Ranking signals for the live posts among post_ids, as seen by user_id"""
+        if not post_ids:
+            return []
+        return self.db.execute(RANKING_SIGNALS_SQL, {"user_id": user_id, "post_ids": list(post_ids)}).all()
+
+    def get_post_summaries(self, post_ids: List[int], fields: List[str] = None) -> list:
+        """Summaries of many live posts in one query, limited to ``fields`` (all when empty)"""
+        if not post_ids:
+            return []
+        fields = fields or list(POST_SUMMARY_COLUMNS)
+        columns = [POST_SUMMARY_COLUMNS["id"].label("id")] + [
+            POST_SUMMARY_COLUMNS[field].label(field) for field in fields if field != "id"
+        ]
+        return self.db.query(*columns)\
+            .filter(Post.id.in_(post_ids), Post.deleted_at.is_(None))\
+            .all()
+
     def get_feed_item(self, post_id: int, user_id: int) -> Optional[FeedItem]:
         """Get a specific feed item"""
         try:
@@ -42,62 +360,174 @@ class FeedRepository:
             logger.error(f"Error in get_feed_item: {e}")
             return None
 
-    def add_to_feed(self, post_id: int, user_id: int) -> Optional[FeedItem]:
-        """Add a new item to user's feed"""
+    def add_to_feed(self, post_id: int, user_id: int):
+        """Add a new item to user's feed. Returns None if the post is already in it or was skipped."""
+        inserted = self.bulk_add_to_feed([{"post_id": post_id, "user_id": user_id}])
+        return inserted[0] if inserted else None
+
+    def remove_from_feed(self, post_id: int, user_id: int) -> bool:
+        """Remove an item from user's feed. Returns False if it was not there."""
         try:
-            # Check if item already exists
-            existing_item = self.get_feed_item(post_id, user_id)
-            if existing_item:
-                return existing_item
-
-            # Create new feed item
-            feed_item = FeedItem(
-                post_id=post_id,
-                user_id=user_id,
-                created_at=datetime.utcnow()
-            )
-            self.db.add(feed_item)
+            item_ids = self.db.execute(
+                delete(FeedItem)
+                .where(and_(FeedItem.post_id == post_id, FeedItem.user_id == user_id))
+                .returning(FeedItem.id)
+            ).scalars().all()
             self.db.commit()
-            self.db.refresh(feed_item)
-            return feed_item
+            if self.cache and item_ids:
+                try:
+                    self.cache.remove(user_id, [to_member(post_id, item_id) for item_id in item_ids])
+                except redis.RedisError as e:
+                    logger.error(f"Feed cache error while removing post {post_id} for user {user_id}: {e}")
+                    self.cache.record_error()
+            return len(item_ids) > 0
         except Exception as e:
-            logger.error(f"Error in add_to_feed: {e}")
+            logger.error(f"Error in remove_from_feed: {e}")
             self.db.rollback()
-            return None
+            raise
 
-    def remove_from_feed(self, post_id: int, user_id: int) -> bool:
-        """Remove an item from user's feed"""
+    def bulk_add_to_feed(self, items: List[dict]) -> list:
+        """Add multiple items to feed in one multi-row insert.
+        Items already in their feed, for missing posts or for posts past retention
+        are skipped; returns the rows actually inserted."""
+        if not items:
+            return []
+        params = {
+            "post_ids": [item['post_id'] for item in items],
+            "user_ids": [item['user_id'] for item in items],
+            "retention_days": RETENTION_DAYS
+        }
         try:
-            result = self.db.query(FeedItem)\
-                .filter(
-                    and_(
-                        FeedItem.post_id == post_id,
-                        FeedItem.user_id == user_id
-                    )
-                )\
-                .delete(synchronize_session=False)
+            try:
+                inserted = self.db.execute(FEED_INSERT_SQL, params).all()
+            except IntegrityError as e:
+                if getattr(e.orig, "pgcode", None) != NO_PARTITION_PGCODE:
+                    raise
+                # A post from a week the retention job has not created yet
+                # (or with the job disabled); add the weeks and retry once
+                self.db.rollback()
+                self._create_insert_partitions(params)
+                inserted = self.db.execute(FEED_INSERT_SQL, params).all()
             self.db.commit()
-            return result > 0
         except Exception as e:
-            logger.error(f"Error in remove_from_feed: {e}")
+            logger.error(f"Error in bulk_add_to_feed: {e}")
+            self.db.rollback()
+            raise
+        self._cache_feed_items(inserted)
+        return inserted
+
+    def _create_insert_partitions(self, params: dict) -> None:
+        """Create the partitions missing for a FEED_INSERT_SQL batch"""
+        existing = set(self.get_feed_partitions())
+        weeks = self.db.execute(FEED_INSERT_WEEKS_SQL, params).scalars().all()
+        for week in weeks:
+            start = week.replace(tzinfo=timezone.utc)
+            if start in existing:
+                continue
+            try:
+                self.create_feed_partition(start)
+            except Exception:
+                # Most likely a concurrent insert created it first; the retry
+                # surfaces anything else
+                pass
+
+    def get_feed_partitions(self) -> List[datetime]:
+        """Start of every existing feed_items partition, oldest first"""
+        names = self.db.execute(FEED_PARTITIONS_SQL).scalars().all()
+        return [
+            datetime.strptime(name[len(PARTITION_PREFIX):], "%Y%m%d").replace(tzinfo=timezone.utc)
+            for name in names if name.startswith(PARTITION_PREFIX)
+        ]
+
+    def create_feed_partition(self, start: datetime) -> None:
+        """Create the week-wide feed_items partition starting at ``start``"""
+        end = start + PARTITION_WIDTH
+        try:
+            self.db.execute(text(
+                f"CREATE TABLE IF NOT EXISTS {partition_name(start)} PARTITION OF feed_items "
+                f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+            ))
+            self.db.commit()
+        except Exception as e:
+            logger.error(f"Error in create_feed_partition: {e}")
+            self.db.rollback()
+            raise
+
+    def drop_feed_partition(self, start: datetime, lock_timeout_ms: int = 2000) -> None:
+        """Drop the feed_items partition starting at ``start`` with all its rows.
+
+        Detaching needs a brief exclusive lock on feed_items; ``lock_timeout_ms``
+        keeps it from queueing behind a long read and stalling every feed
+        query behind it. A timed-out drop is retried on the next run.
+        """
+        name = partition_name(start)
+        try:
+            self.db.execute(text(f"SET LOCAL lock_timeout = {int(lock_timeout_ms)}"))
+            self.db.execute(text(f"ALTER TABLE feed_items DETACH PARTITION {name}"))
+            self.db.execute(text(f"DROP TABLE {name}"))
+            self.db.commit()
+        except Exception as e:
+            logger.error(f"Error in drop_feed_partition: {e}")
             self.db.rollback()
-            return False
+            raise
 
-    def bulk_add_to_feed(self, items: List[dict]) -> List[FeedItem]:
-        """Add multiple items to feed at once"""
+    def get_feed_user_ids(self, since: Optional[datetime] = None, after_user_id: int = 0, limit: int = 500) -> List[int]:
+        """Next page of users with feed items created at or after ``since``, in id order"""
+        return list(self.db.execute(FEED_USERS_SQL, {
+            "since": since,
+            "after_user_id": after_user_id,
+            "limit": limit
+        }).scalars())
+
+    def cap_feeds(self, user_ids: List[int], cap: int) -> int:
+        """Trim each user's feed to its newest ``cap`` items. Returns the number of items deleted."""
+        if not user_ids:
+            return 0
         try:
-            feed_items = [
-                FeedItem(
-                    post_id=item['post_id'],
-                    user_id=item['user_id'],
-                    created_at=datetime.utcnow()
+            deleted = self.db.execute(FEED_CAP_SQL, {"user_ids": list(user_ids), "cap": cap}).all()
+            self.db.commit()
+        except Exception as e:
+            logger.error(f"Error in cap_feeds: {e}")
+            self.db.rollback()
+            raise
+        if self.cache and deleted:
+            by_user = {}
+            for item in deleted:
+                by_user.setdefault(item.user_id, []).append(to_member(item.post_id, item.id))
+            try:
+                for user_id, members in by_user.items():
+                    self.cache.remove(user_id, members)
+            except redis.RedisError as e:
+                logger.error(f"Feed cache error while capping {len(by_user)} feeds: {e}")
+                self.cache.record_error()
+        return len(deleted)
+
+    def count_followers(self, author_id: int, cap: int) -> int:
+        """Count an author's active followers, stopping at cap"""
+        return self.db.execute(FOLLOWER_COUNT_SQL, {"author_id": author_id, "cap": cap}).scalar()
+
+    def get_follower_ids(self, author_id: int, after_user_id: int = 0, limit: int = 1000) -> List[int]:
+        """Next page of an author's follower ids, in id order"""
+        return list(self.db.execute(FOLLOWER_PAGE_SQL, {
+            "author_id": author_id,
+            "after_user_id": after_user_id,
+            "limit": limit
+        }).scalars())
+
+    def set_celebrity(self, author_id: int, follower_count: int) -> None:
+        """Mark an author as read-time only (no fan-out)"""
+        try:
+            self.db.execute(
+                insert(CelebrityAuthor)
+                .values(user_id=author_id, follower_count=follower_count)
+                .on_conflict_do_update(
+                    index_elements=[CelebrityAuthor.user_id],
+                    set_={"follower_count": follower_count, "updated_at": datetime.utcnow()}
                 )
-                for item in items
-            ]
-            self.db.bulk_save_objects(feed_items)
+            )
             self.db.commit()
-            return feed_items
         except Exception as e:
-            logger.error(f"Error in bulk_add_to_feed: {e}")
+            logger.error(f"Error in set_celebrity: {e}")
             self.db.rollback()
-            return [] 
\ No newline at end of file
+            raise
+
@@ -0,0 +1,244 @@
+import os
+import threading
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import List, NamedTuple, Optional, Tuple
+from ..utils.redis_connection import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+# Member at score +inf marking a timeline that has been loaded from Postgres.
+# A key without it holds nothing trustworthy and is rebuilt on the next read.
+LOADED_MARKER = "loaded"
+# Member at score +inf marking a timeline whose load from Postgres is under
+# way. It is created before the load query runs, so feed writes that land
+# meanwhile are kept in the key and merged by the load instead of dropped.
+LOADING_MARKER = "loading"
+# Member scored at the newest item ever trimmed off a timeline. Items at or
+# below it may be missing, so a page that reaches it is read from Postgres.
+TRIMMED_MARKER = "trimmed"
+
+# Adds items to a timeline, then trims it to the newest max_items and moves
+# the trimmed marker up to the newest item dropped. In "add" mode a timeline
+# that is neither loaded nor being loaded is left alone, so fan-out to
+# inactive followers does not create Redis keys for them; items added to a
+# timeline being loaded wait in it for the load. "load" marks the timeline
+# loaded and raises the trimmed marker to ARGV[3] if it is below it.
+# KEYS[1] = timeline
+# ARGV = max_items, "add" | "load", floor score or "", score1, member1, ...
+WRITE_SCRIPT = """
+local key = KEYS[1]
+if ARGV[2] == 'add' and redis.call('EXISTS', key) == 0 then
+    return 0
+end
+if ARGV[2] == 'load' then
+    redis.call('ZREM', key, 'loading')
+end
+local floor = redis.call('ZSCORE', key, 'trimmed')
+if ARGV[3] ~= '' and (not floor or tonumber(ARGV[3]) > tonumber(floor)) then
+    floor = ARGV[3]
+end
+redis.call('ZREM', key, 'trimmed')
+for i = 4, #ARGV, 2 do
+    redis.call('ZADD', key, ARGV[i], ARGV[i + 1])
+end
+-- Exactly one of loaded and loading is present, hence the 1 below
+if not redis.call('ZSCORE', key, 'loading') then
+    redis.call('ZADD', key, 'inf', 'loaded')
+end
+local excess = redis.call('ZCARD', key) - 1 - tonumber(ARGV[1])
+if excess > 0 then
+    local dropped = redis.call('ZRANGE', key, 0, excess - 1, 'WITHSCORES')
+    redis.call('ZREMRANGEBYRANK', key, 0, excess - 1)
+    local newest = dropped[#dropped]
+    if not floor or tonumber(newest) > tonumber(floor) then
+        floor = newest
+    end
+end
+if floor then
+    redis.call('ZADD', key, floor, 'trimmed')
+end
+return 1
+"""
+
+# Creates the loading placeholder for a timeline that has no key yet; it
+# expires after ARGV[1] seconds if the load never finishes.
+# KEYS[1] = timeline
+BEGIN_LOAD_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    redis.call('ZADD', KEYS[1], 'inf', 'loading')
+    redis.call('EXPIRE', KEYS[1], ARGV[1])
+end
+return 1
+"""
+
+
+class Timeline(NamedTuple):
+    # (member, score) pairs newest first; member is "<post_id>:<feed item id>"
+    items: List[Tuple[str, int]]
+    # The page reached items that were trimmed off; the rest is only in Postgres
+    truncated: bool
+
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+MICROSECOND = timedelta(microseconds=1)
+
+
+def to_score(created_at: datetime) -> int:
+    """Microseconds since the epoch; naive datetimes are UTC like the rest of the feed service"""
+    if created_at.tzinfo is None:
+        created_at = created_at.replace(tzinfo=timezone.utc)
+    return (created_at - EPOCH) // MICROSECOND
+
+
+def from_score(score: int) -> datetime:
+    return EPOCH + score * MICROSECOND
+
+
+def to_member(post_id: int, item_id: str) -> str:
+    return f"{post_id}:{item_id}"
+
+
+def from_member(member: str) -> Tuple[int, str]:
+    post_id, item_id = member.split(":", 1)
+    return int(post_id), item_id
+
+
+class TimelineCache:
+    """Per-user feed timelines in Redis sorted sets.
+
+    Each user's materialized feed items live in ``feed:timeline:<user_id>``,
+    scored by created_at in microseconds and trimmed to the newest
+    ``max_items``. Timelines are loaded from Postgres on the first read after
+    a miss or expiry and kept current by the feed writes in between, so a
+    GetFeed page is one ZREVRANGEBYSCORE below the caller's cursor.
+
+    Hit rate and rebuild latency are counted here; ``stats()`` returns them
+    and a summary is logged every ``log_every`` lookups.
+    """
+
+    def __init__(self, client, max_items: int = 800, ttl_s: int = 86400, log_every: int = 1000,
+                 loading_ttl_s: int = 300):
+        self.client = client
+        self.max_items = max_items
+        self.ttl = ttl_s
+        self.loading_ttl = loading_ttl_s
+        self.log_every = log_every
+        self._write = client.register_script(WRITE_SCRIPT)
+        self._begin_load = client.register_script(BEGIN_LOAD_SCRIPT)
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._overflows = 0
+        self._errors = 0
+        self._rebuild_ms_total = 0.0
+        self._rebuild_ms_max = 0.0
+
+    @classmethod
+    def from_env(cls) -> Optional["TimelineCache"]:
+        """Build a cache from FEED_CACHE_* and REDIS_* env vars, or None when it is disabled or unreachable"""
+        client = get_redis_client()
+        if client is None:
+            return None
+        return cls(
+            client,
+            max_items=int(os.getenv("FEED_CACHE_MAX_ITEMS", "800")),
+            ttl_s=int(os.getenv("FEED_CACHE_TTL_S", "86400")),
+            log_every=int(os.getenv("FEED_CACHE_LOG_EVERY", "1000"))
+        )
+
+    @staticmethod
+    def _key(user_id: int) -> str:
+        return f"feed:timeline:{user_id}"
+
+    def page(self, user_id: int, before: Optional[int], count: int) -> Optional[Timeline]:
+        """Up to ``count`` items scored below ``before``, or None if the timeline is not loaded"""
+        key = self._key(user_id)
+        pipe = self.client.pipeline(transaction=False)
+        pipe.zscore(key, LOADED_MARKER)
+        pipe.zscore(key, TRIMMED_MARKER)
+        pipe.zrevrangebyscore(key, f"({before}" if before else "(+inf", "-inf", start=0, num=count, withscores=True)
+        loaded, floor, rows = pipe.execute()
+        if loaded is None:
+            return None
+        items = [
+            (member, int(score)) for member, score in rows
+            if member not in (TRIMMED_MARKER, LOADING_MARKER) and (floor is None or score > floor)
+        ]
+        return Timeline(items, floor is not None and len(items) < count)
+
+    def begin_load(self, user_id: int) -> None:
+        """Keep feed writes to a timeline about to be read from Postgres; call before the query"""
+        self._begin_load(keys=[self._key(user_id)], args=[self.loading_ttl])
+
+    def load(self, user_id: int, items: List[Tuple[str, int]], floor: Optional[int]) -> None:
+        """Merge the newest items read from Postgres into a timeline and mark it loaded.
+
+        ``floor`` is the oldest score read when Postgres holds more items than
+        were loaded. Writes that land between ``begin_load`` and here wait in
+        the placeholder key, and items are merged rather than swapped in, so
+        they are not lost.
+        """
+        key = self._key(user_id)
+        args = [self.max_items, "load", floor if floor is not None else ""]
+        for member, score in items:
+            args.extend((score, member))
+        pipe = self.client.pipeline(transaction=True)
+        self._write(keys=[key], args=args, client=pipe)
+        pipe.expire(key, self.ttl)
+        pipe.execute()
+
+    def add(self, items: List[Tuple[int, str, int]]) -> None:
+        """Add (user_id, member, score) items to the timelines among them that are loaded or loading"""
+        by_user = {}
+        for user_id, member, score in items:
+            by_user.setdefault(user_id, [self.max_items, "add", ""]).extend((score, member))
+        pipe = self.client.pipeline(transaction=False)
+        for user_id, args in by_user.items():
+            self._write(keys=[self._key(user_id)], args=args, client=pipe)
+        pipe.execute()
+
+    def remove(self, user_id: int, members: List[str]) -> None:
+        if members:
+            self.client.zrem(self._key(user_id), *members)
+
+    def record_hit(self) -> None:
+        self._record(hits=1)
+
+    def record_miss(self, rebuild_ms: float) -> None:
+        self._record(misses=1, rebuild_ms=rebuild_ms)
+
+    def record_overflow(self) -> None:
+        """A page ran past the oldest cached item and was read from Postgres"""
+        self._record(overflows=1)
+
+    def record_error(self) -> None:
+        self._record(errors=1)
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self._hits + self._misses + self._overflows
+            return {
+                "lookups": lookups,
+                "hits": self._hits,
+                "misses": self._misses,
+                "overflows": self._overflows,
+                "errors": self._errors,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+                "rebuild_ms_avg": round(self._rebuild_ms_total / self._misses, 3) if self._misses else 0.0,
+                "rebuild_ms_max": round(self._rebuild_ms_max, 3)
+            }
+
+    def _record(self, hits: int = 0, misses: int = 0, overflows: int = 0, errors: int = 0,
+                rebuild_ms: float = 0.0) -> None:
+        with self._lock:
+            self._hits += hits
+            self._misses += misses
+            self._overflows += overflows
+            self._errors += errors
+            self._rebuild_ms_total += rebuild_ms
+            self._rebuild_ms_max = max(self._rebuild_ms_max, rebuild_ms)
+            lookups = self._hits + self._misses + self._overflows
+            log = (hits or misses or overflows) and self.log_every and lookups % self.log_every == 0
+        if log:
+            logger.info(f"Feed timeline cache: {self.stats()}")
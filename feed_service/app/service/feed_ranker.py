@@ -0,0 +1,157 @@
+import os
+import time
+import threading
+import logging
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# A scorer maps a batch of candidate signals (one NumPy array per signal, all
+# the same length) to one score per candidate, roughly in [0, 1]
+Scorer = Callable[[Dict[str, np.ndarray]], np.ndarray]
+
+RECENCY_HALF_LIFE_H = float(os.getenv("FEED_RANK_RECENCY_HALF_LIFE_H", "24"))
+PROXIMITY_SCALE_KM = float(os.getenv("FEED_RANK_PROXIMITY_SCALE_KM", "10"))
+EARTH_RADIUS_KM = 6371.0
+
+DEFAULT_WEIGHTS = "recency:1.0,engagement:0.6,trending:0.8,affinity:0.5,proximity:0.4"
+
+
+def _normalize(values: np.ndarray) -> np.ndarray:
+    """Scale non-negative values into [0, 1] by the batch maximum"""
+    top = values.max(initial=0.0)
+    return values / top if top > 0 else np.zeros_like(values)
+
+
+def recency_score(batch: Dict[str, np.ndarray]) -> np.ndarray:
+    """Halves every RECENCY_HALF_LIFE_H hours of post age"""
+    return np.exp2(-np.maximum(batch["age_hours"], 0.0) / RECENCY_HALF_LIFE_H)
+
+
+def engagement_score(batch: Dict[str, np.ndarray]) -> np.ndarray:
+    """Log-scaled likes plus comments, a comment counting as two likes"""
+    return _normalize(np.log1p(batch["like_count"] + 2.0 * batch["comment_count"]))
+
+
+def trending_score(batch: Dict[str, np.ndarray]) -> np.ndarray:
+    """Where a post's hot score sits between the batch's least and most trending
+    posts; 0 for posts the trending service has not scored (NaN)"""
+    hot = batch["trending_score"]
+    scored = ~np.isnan(hot)
+    result = np.zeros_like(hot)
+    if scored.any():
+        low = hot[scored].min()
+        result[scored] = _normalize(hot[scored] - low) if hot[scored].max() > low else 1.0
+    return result
+
+
+def affinity_score(batch: Dict[str, np.ndarray]) -> np.ndarray:
+    """1 for authors who follow the viewer back, 0.5 for authors the viewer follows"""
+    return 0.5 * batch["follows_author"] + 0.5 * batch["follows_author"] * batch["followed_by_author"]
+
+
+def proximity_score(batch: Dict[str, np.ndarray]) -> np.ndarray:
+    """Decays with haversine distance between the viewer and the post's map location; 0 when either is unknown"""
+    lat1, lon1 = np.radians(batch["viewer_latitude"]), np.radians(batch["viewer_longitude"])
+    lat2, lon2 = np.radians(batch["latitude"]), np.radians(batch["longitude"])
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    distance_km = 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+    return np.nan_to_num(1.0 / (1.0 + distance_km / PROXIMITY_SCALE_KM), nan=0.0)
+
+
+SCORERS: Dict[str, Scorer] = {
+    "recency": recency_score,
+    "engagement": engagement_score,
+    "trending": trending_score,
+    "affinity": affinity_score,
+    "proximity": proximity_score
+}
+
+
+def parse_weights(spec: str) -> Dict[str, float]:
+    """Parse "name:weight,name:weight" into a dict"""
+    weights = {}
+    for part in spec.split(","):
+        if part.strip():
+            name, weight = part.split(":", 1)
+            weights[name.strip()] = float(weight)
+    return weights
+
+
+class FeedRanker:
+    """Orders a user's feed candidates by a weighted sum of scorer outputs.
+
+    Candidates are the newest ``candidates`` feed items. Their signals come
+    from one query (see ``FeedRepository.get_ranking_signals``) and are scored
+    as whole NumPy arrays, so ranking a few hundred items is a handful of
+    vector operations. Rankings are kept per user for ``ttl_s`` seconds, so
+    paging through a ranked feed does not re-rank it; new items appear once
+    the entry expires. Scorers are pluggable: pass any mapping of name to
+    ``Scorer`` and weight them by name.
+    """
+
+    def __init__(self, weights: Dict[str, float], scorers: Dict[str, Scorer] = None,
+                 candidates: int = 500, ttl_s: float = 60, max_users: int = 10000):
+        self.scorers = scorers or SCORERS
+        unknown = set(weights) - set(self.scorers)
+        if unknown:
+            raise ValueError(f"Unknown feed scorers: {', '.join(sorted(unknown))}")
+        self.weights = {name: weight for name, weight in weights.items() if weight}
+        self.candidates = candidates
+        self.ttl = ttl_s
+        self.max_users = max_users
+        self._cache = OrderedDict()  # {user_id: (expires_at, ranked_items)}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> Optional["FeedRanker"]:
+        """Build a ranker from FEED_RANK_* env vars, or None when ranking is disabled"""
+        if os.getenv("FEED_RANK_ENABLED", "true").lower() not in ("1", "true", "yes"):
+            return None
+        return cls(
+            parse_weights(os.getenv("FEED_RANK_WEIGHTS", DEFAULT_WEIGHTS)),
+            candidates=int(os.getenv("FEED_RANK_CANDIDATES", "500")),
+            ttl_s=float(os.getenv("FEED_RANK_TTL_S", "60")),
+            max_users=int(os.getenv("FEED_RANK_CACHE_USERS", "10000"))
+        )
+
+    def cached(self, user_id: int) -> Optional[list]:
+        with self._lock:
+            entry = self._cache.get(user_id)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                del self._cache[user_id]
+                return None
+            self._cache.move_to_end(user_id)
+            return entry[1]
+
+    def store(self, user_id: int, ranked: list) -> None:
+        with self._lock:
+            self._cache[user_id] = (time.monotonic() + self.ttl, ranked)
+            self._cache.move_to_end(user_id)
+            while len(self._cache) > self.max_users:
+                self._cache.popitem(last=False)
+
+    def rank(self, items: list, signals: list, now: float = None) -> list:
+        """Return the items that have signals, best first; ties keep feed order"""
+        started = time.perf_counter()
+        by_post = {row.post_id: row for row in signals}
+        items = [item for item in items if item.post_id in by_post]
+        if not items:
+            return []
+        # One float matrix for the whole batch; None becomes NaN (proximity_score maps it to 0)
+        matrix = np.array([tuple(by_post[item.post_id]) for item in items], dtype=np.float64)
+        columns = {name: matrix[:, i] for i, name in enumerate(signals[0]._fields)}
+        now = now if now is not None else time.time()
+
+        batch = dict(columns, age_hours=(now - columns["created_at"]) / 3600.0)
+        scores = np.zeros(len(items))
+        for name, weight in self.weights.items():
+            scores += weight * self.scorers[name](batch)
+
+        order = np.argsort(-scores, kind="stable")
+        logger.debug(f"Ranked {len(items)} feed items in {(time.perf_counter() - started) * 1000:.2f} ms")
+        return [items[i] for i in order]
@@ -0,0 +1,142 @@
+import os
+import threading
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from ..repository.feed_repository import FeedRepository, RETENTION_DAYS, PARTITION_WIDTH, partition_start
+from ..repository.timeline_cache import TimelineCache
+
+logger = logging.getLogger(__name__)
+
+
+class FeedRetention:
+    """Background partition maintenance and per-user caps for feed_items.
+
+    feed_items is partitioned by week. Every ``interval_s`` this thread creates
+    the partitions for the next ``weeks_ahead`` weeks, drops whole partitions
+    that ended more than ``retention_days`` ago (no row-by-row deletes, no
+    index bloat), and trims the feeds that gained items since the last run
+    to their newest ``max_items_per_user``, ``batch_size`` users per
+    statement. The first run looks at every feed.
+
+    Inserts fail for weeks without a partition, so ``start`` creates them
+    before returning.
+    """
+
+    def __init__(self, session_factory, cache: Optional[TimelineCache] = None, interval_s: float = 3600,
+                 retention_days: int = RETENTION_DAYS, weeks_ahead: int = 4, max_items_per_user: int = 1000,
+                 batch_size: int = 500):
+        self.session_factory = session_factory
+        self.cache = cache
+        self.interval = interval_s
+        self.retention = timedelta(days=retention_days)
+        self.weeks_ahead = weeks_ahead
+        self.max_items_per_user = max_items_per_user
+        self.batch_size = batch_size
+        self._last_capped_at = None
+        self._stopped = threading.Event()
+        self._thread = None
+
+    @classmethod
+    def from_env(cls, session_factory, cache: Optional[TimelineCache] = None) -> Optional["FeedRetention"]:
+        """Build a retention job from FEED_RETENTION_* env vars, or None when it is disabled"""
+        if os.getenv("FEED_RETENTION_ENABLED", "true").lower() not in ("1", "true", "yes"):
+            return None
+        return cls(
+            session_factory,
+            cache,
+            interval_s=float(os.getenv("FEED_RETENTION_INTERVAL_S", "3600")),
+            weeks_ahead=int(os.getenv("FEED_PARTITIONS_AHEAD", "4")),
+            max_items_per_user=int(os.getenv("FEED_MAX_ITEMS_PER_USER", "1000")),
+            batch_size=int(os.getenv("FEED_RETENTION_BATCH_USERS", "500"))
+        )
+
+    def start(self) -> None:
+        self.ensure_partitions()
+        self._thread = threading.Thread(target=self._run, name="feed-retention", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop after the batch in progress"""
+        self._stopped.set()
+        if self._thread:
+            self._thread.join()
+
+    def ensure_partitions(self) -> int:
+        """Create missing partitions from the retention horizon through ``weeks_ahead``. Returns how many were created."""
+        now = datetime.now(timezone.utc)
+        db = self.session_factory()
+        try:
+            repository = FeedRepository(db)
+            existing = set(repository.get_feed_partitions())
+            start = partition_start(now - self.retention)
+            last = partition_start(now) + self.weeks_ahead * PARTITION_WIDTH
+            created = 0
+            while start <= last:
+                if start not in existing:
+                    repository.create_feed_partition(start)
+                    created += 1
+                start += PARTITION_WIDTH
+            if created:
+                logger.info(f"Created {created} feed_items partitions")
+            return created
+        finally:
+            db.close()
+
+    def drop_expired_partitions(self) -> int:
+        """Drop partitions that end before the retention horizon. Returns how many were dropped."""
+        horizon = datetime.now(timezone.utc) - self.retention
+        db = self.session_factory()
+        try:
+            repository = FeedRepository(db)
+            dropped = 0
+            for start in repository.get_feed_partitions():
+                if start + PARTITION_WIDTH > horizon or self._stopped.is_set():
+                    break
+                repository.drop_feed_partition(start)
+                dropped += 1
+            if dropped:
+                logger.info(f"Dropped {dropped} expired feed_items partitions")
+            return dropped
+        finally:
+            db.close()
+
+    def cap_feeds(self) -> int:
+        """Trim feeds that grew since the last run. Returns the number of feed items deleted."""
+        started = datetime.now(timezone.utc)
+        db = self.session_factory()
+        try:
+            repository = FeedRepository(db, self.cache)
+            deleted = 0
+            after_user_id = 0
+            while not self._stopped.is_set():
+                user_ids = repository.get_feed_user_ids(self._last_capped_at, after_user_id, self.batch_size)
+                if not user_ids:
+                    break
+                deleted += repository.cap_feeds(user_ids, self.max_items_per_user)
+                after_user_id = user_ids[-1]
+            else:
+                return deleted
+            # Feed items carry their post's created_at, which can be a little older than
+            # the insert; the overlap picks up posts that were fanned out late
+            self._last_capped_at = started - timedelta(hours=1)
+            if deleted:
+                logger.info(f"Capped feeds at {self.max_items_per_user} items, deleted {deleted}")
+            return deleted
+        finally:
+            db.close()
+
+    def run(self) -> dict:
+        """One full round of retention work"""
+        return {
+            "created": self.ensure_partitions(),
+            "dropped": self.drop_expired_partitions(),
+            "capped": self.cap_feeds()
+        }
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            try:
+                self.run()
+            except Exception as e:
+                logger.error(f"Feed retention error: {e}")
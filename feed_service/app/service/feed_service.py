@@ -1,10 +1,14 @@
 from sqlalchemy.orm import Session
 from ..repository.feed_repository import FeedRepository
+from ..repository.timeline_cache import TimelineCache, to_score, from_score
+from .feed_ranker import FeedRanker
+from .feed_retention import FeedRetention
 from ..entity.feed_entity import FeedItem
 from ..entity.post_entity import Post
 from typing import List, Optional, Dict, Any, Tuple
 import grpc
 from concurrent import futures
+from contextlib import contextmanager
 import os
 import sys
 import logging
@@ -13,11 +17,6 @@ from sqlalchemy.orm import sessionmaker
 from datetime import datetime
 from sqlalchemy.exc import SQLAlchemyError
 
-# Set up logging with debug level
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
 # Add the app directory to sys.path
@@ -27,10 +26,28 @@ sys.path.append(app_dir)
 
 from ..proto_files import feed_pb2, feed_pb2_grpc
 
+# Fan-out on write: feed items are written in chunks of this many followers
+FANOUT_CHUNK_SIZE = int(os.getenv("FEED_FANOUT_CHUNK_SIZE", "1000"))
+# Upper bound on BulkAddToFeed request size
+MAX_BULK_FEED_ITEMS = int(os.getenv("FEED_MAX_BULK_ITEMS", "10000"))
+# Authors with more followers than this are not fanned out; GetFeed reads their posts instead
+CELEBRITY_FOLLOWER_THRESHOLD = int(os.getenv("FEED_CELEBRITY_THRESHOLD", "10000"))
+
+# gRPC server sizing. Each worker thread runs one RPC on its own pooled
+# connection, so the database pool is sized to the worker count.
+GRPC_PORT = int(os.getenv("FEED_GRPC_PORT", "50056"))
+GRPC_MAX_WORKERS = int(os.getenv("FEED_GRPC_MAX_WORKERS", "10"))
+# RPCs beyond this many in flight (queued or running) fail fast with RESOURCE_EXHAUSTED; 0 means no limit
+GRPC_MAX_CONCURRENT_RPCS = int(os.getenv("FEED_GRPC_MAX_CONCURRENT_RPCS", "0"))
+GRPC_MAX_MESSAGE_BYTES = int(os.getenv("FEED_GRPC_MAX_MESSAGE_BYTES", str(4 * 1024 * 1024)))
+GRPC_KEEPALIVE_TIME_MS = int(os.getenv("FEED_GRPC_KEEPALIVE_TIME_MS", "60000"))
+GRPC_KEEPALIVE_TIMEOUT_MS = int(os.getenv("FEED_GRPC_KEEPALIVE_TIMEOUT_MS", "20000"))
+
 class FeedService:
-    def __init__(self, db: Session):
-        self.repository = FeedRepository(db)
+    def __init__(self, db: Session, cache: Optional[TimelineCache] = None, ranker: Optional[FeedRanker] = None):
+        self.repository = FeedRepository(db, cache)
         self.db = db
+        self.ranker = ranker
 
     def validate_user_id(self, user_id: int) -> bool:
         """Validate if user exists"""
@@ -50,15 +67,22 @@ class FeedService:
             logger.error(f"Error validating post_id: {e}")
             return False
 
-    def get_feed(self, user_id: int, limit: int = 20, offset: int = 0) -> Tuple[List[Dict[str, Any]], str]:
+    def get_feed(self, user_id: int, limit: int = 20, offset: int = 0, before: int = 0,
+                 post_fields: Optional[List[str]] = None, ranked: bool = False) -> Tuple[List[Dict[str, Any]], int, str]:
         """
-        Get user's feed items with pagination
-        Returns: Tuple of (feed_items_list, error_message)
+        Get user's feed items with pagination, starting below the ``before`` cursor if given.
+        With ``ranked`` (and ranking enabled) items are ordered by the feed ranker instead of
+        time and paged by offset only.
+        When ``post_fields`` is given (empty for all fields) each item also carries its post,
+        fetched for the whole page in one query; items whose post is gone are dropped.
+        The next cursor is the last item fetched, dropped or not, so the next page
+        does not fetch them again; 0 for a ranked or empty page.
+        Returns: Tuple of (feed_items_list, next_cursor, error_message)
         """
         try:
             # Input validation
             if not self.validate_user_id(user_id):
-                return [], "Invalid user ID"
+                return [], 0, "Invalid user ID"
             
             if limit < 1 or limit > 100:
                 limit = 20  # Default limit
@@ -66,23 +90,59 @@ class FeedService:
             if offset < 0:
                 offset = 0
 
-            feed_items = self.repository.get_feed_items(user_id, limit, offset)
+            if ranked and self.ranker:
+                feed_items = self._ranked_feed_items(user_id, limit, offset)
+            else:
+                feed_items = self.repository.get_feed_items(
+                    user_id, limit, offset, from_score(before) if before > 0 else None
+                )
             
             # Transform feed items to dictionary format
-            return [{
-                "id": str(item.id) if item.id else "",
-                "post_id": int(item.post_id) if item.post_id else 0,
-                "user_id": int(item.user_id) if item.user_id else 0,
-                "created_at": item.created_at.strftime("%Y-%m-%dT%H:%M:%SZ") if item.created_at else "",
-                "updated_at": item.updated_at.strftime("%Y-%m-%dT%H:%M:%SZ") if item.updated_at else ""
-            } for item in feed_items], ""
+            feed = [self._feed_item_dict(item) for item in feed_items]
+            next_cursor = feed[-1]["cursor"] if feed and not (ranked and self.ranker) else 0
+
+            if post_fields is not None:
+                posts = self.repository.get_post_summaries([item["post_id"] for item in feed], post_fields)
+                posts_by_id = {post.id: self._post_summary_dict(post) for post in posts}
+                feed = [dict(item, post=posts_by_id[item["post_id"]]) for item in feed if item["post_id"] in posts_by_id]
+
+            return feed, next_cursor, ""
 
         except SQLAlchemyError as e:
             logger.error(f"Database error in get_feed: {e}")
-            return [], "Database error occurred"
+            return [], 0, "Database error occurred"
         except Exception as e:
             logger.error(f"Error in get_feed: {e}")
-            return [], f"Internal error: {str(e)}"
+            return [], 0, f"Internal error: {str(e)}"
+
+    def _ranked_feed_items(self, user_id: int, limit: int, offset: int) -> list:
+        """A page of the user's ranked feed; the ranking is reused until it expires"""
+        ranked = self.ranker.cached(user_id)
+        if ranked is None:
+            candidates = self.repository.get_feed_items(user_id, self.ranker.candidates, 0)
+            signals = self.repository.get_ranking_signals(user_id, [item.post_id for item in candidates])
+            ranked = self.ranker.rank(candidates, signals)
+            self.ranker.store(user_id, ranked)
+        return ranked[offset:offset + limit]
+
+    def _feed_item_dict(self, feed_item) -> Dict[str, Any]:
+        return {
+            "id": str(feed_item.id) if feed_item.id else "",
+            "post_id": int(feed_item.post_id) if feed_item.post_id else 0,
+            "user_id": int(feed_item.user_id) if feed_item.user_id else 0,
+            "created_at": feed_item.created_at.strftime("%Y-%m-%dT%H:%M:%SZ") if feed_item.created_at else "",
+            "updated_at": feed_item.updated_at.strftime("%Y-%m-%dT%H:%M:%SZ") if feed_item.updated_at else "",
+            "cursor": to_score(feed_item.created_at) if feed_item.created_at else 0
+        }
+
+    def _post_summary_dict(self, post) -> Dict[str, Any]:
+        """Fetched post columns in PostSummary field types"""
+        summary = dict(post._mapping)
+        if summary.get("price") is not None:
+            summary["price"] = float(summary["price"])
+        if summary.get("created_at") is not None:
+            summary["created_at"] = int(summary["created_at"].timestamp())
+        return {key: value for key, value in summary.items() if value is not None}
 
     def add_to_feed(self, post_id: int, user_id: int) -> Tuple[Optional[Dict[str, Any]], str]:
         """
@@ -97,23 +157,14 @@ class FeedService:
             if not self.validate_post_id(post_id):
                 return None, "Invalid post ID"
 
-            # Check if item already exists
-            existing_item = self.repository.get_feed_item(post_id, user_id)
-            if existing_item:
-                return None, "Item already exists in feed"
-
+            # Single INSERT ... ON CONFLICT DO NOTHING; no row means it was already there,
+            # or the post is missing or older than the feed retention window
             feed_item = self.repository.add_to_feed(post_id, user_id)
             
             if feed_item:
-                return {
-                    "id": str(feed_item.id) if feed_item.id else "",
-                    "post_id": int(feed_item.post_id) if feed_item.post_id else 0,
-                    "user_id": int(feed_item.user_id) if feed_item.user_id else 0,
-                    "created_at": feed_item.created_at.strftime("%Y-%m-%dT%H:%M:%SZ") if feed_item.created_at else "",
-                    "updated_at": feed_item.updated_at.strftime("%Y-%m-%dT%H:%M:%SZ") if feed_item.updated_at else ""
-                }, ""
+                return self._feed_item_dict(feed_item), ""
             
-            return None, "Failed to create feed item"
+            return None, "Item already exists in feed or post is not available"
 
         except SQLAlchemyError as e:
             logger.error(f"Database error in add_to_feed: {e}")
@@ -122,6 +173,38 @@ class FeedService:
             logger.error(f"Error in add_to_feed: {e}")
             return None, f"Internal error: {str(e)}"
 
+    def bulk_add_to_feed(self, items: List[Tuple[int, int]]) -> Tuple[Optional[List[Dict[str, Any]]], str]:
+        """
+        Add many (post_id, user_id) pairs to feeds, in multi-row inserts of FANOUT_CHUNK_SIZE
+        Pairs already in their feed are skipped
+        Returns: Tuple of (added_feed_items_list, error_message)
+        """
+        try:
+            if len(items) > MAX_BULK_FEED_ITEMS:
+                return None, f"At most {MAX_BULK_FEED_ITEMS} items per request"
+
+            pairs = list(dict.fromkeys(items))  # De-duplicate, keep request order
+            for post_id, user_id in pairs:
+                if not self.validate_user_id(user_id):
+                    return None, f"Invalid user ID {user_id}"
+                if not self.validate_post_id(post_id):
+                    return None, f"Invalid post ID {post_id}"
+
+            added = []
+            for start in range(0, len(pairs), FANOUT_CHUNK_SIZE):
+                added.extend(self.repository.bulk_add_to_feed([
+                    {"post_id": post_id, "user_id": user_id}
+                    for post_id, user_id in pairs[start:start + FANOUT_CHUNK_SIZE]
+                ]))
+            return [self._feed_item_dict(item) for item in added], ""
+
+        except SQLAlchemyError as e:
+            logger.error(f"Database error in bulk_add_to_feed: {e}")
+            return None, "Database error occurred"
+        except Exception as e:
+            logger.error(f"Error in bulk_add_to_feed: {e}")
+            return None, f"Internal error: {str(e)}"
+
     def remove_from_feed(self, post_id: int, user_id: int) -> Tuple[bool, str]:
         """
         Remove a post from user's feed
@@ -135,13 +218,9 @@ class FeedService:
             if not self.validate_post_id(post_id):
                 return False, "Invalid post ID"
 
-            # Check if item exists
-            existing_item = self.repository.get_feed_item(post_id, user_id)
-            if not existing_item:
-                return False, "Item not found in feed"
-
+            # Single DELETE ... RETURNING; no row means it was not there
             success = self.repository.remove_from_feed(post_id, user_id)
-            return success, "" if success else "Failed to remove item"
+            return success, "" if success else "Item not found in feed"
 
         except SQLAlchemyError as e:
             logger.error(f"Database error in remove_from_feed: {e}")
@@ -150,16 +229,93 @@ class FeedService:
             logger.error(f"Error in remove_from_feed: {e}")
             return False, f"Internal error: {str(e)}"
 
+    def fan_out_post(self, post_id: int, author_id: int) -> Tuple[Optional[Dict[str, Any]], str]:
+        """
+        Write a new post into the feeds of its author and the author's followers
+        Feed items take the post's created_at from the posts table
+        Returns: Tuple of (result_dict, error_message)
+        """
+        try:
+            if not self.validate_user_id(author_id):
+                return None, "Invalid user ID"
+
+            if not self.validate_post_id(post_id):
+                return None, "Invalid post ID"
+
+            # The author always sees their own post
+            written = len(self.repository.bulk_add_to_feed([{"post_id": post_id, "user_id": author_id}]))
+
+            follower_count = self.repository.count_followers(author_id, CELEBRITY_FOLLOWER_THRESHOLD + 1)
+            if follower_count > CELEBRITY_FOLLOWER_THRESHOLD:
+                # Too many followers to write to; followers pick the post up at read time
+                self.repository.set_celebrity(author_id, follower_count)
+                logger.info(f"Skipping fan-out of post {post_id}: author {author_id} has over "
+                            f"{CELEBRITY_FOLLOWER_THRESHOLD} followers")
+                return {"recipients": written, "celebrity": True}, ""
+
+            after_user_id = 0
+            while True:
+                follower_ids = self.repository.get_follower_ids(author_id, after_user_id, FANOUT_CHUNK_SIZE)
+                if not follower_ids:
+                    break
+                chunk = [
+                    {"post_id": post_id, "user_id": follower_id}
+                    for follower_id in follower_ids if follower_id != author_id
+                ]
+                # Followers who already have the post (a retried fan-out) are skipped
+                written += len(self.repository.bulk_add_to_feed(chunk))
+                after_user_id = follower_ids[-1]
+
+            logger.info(f"Fanned out post {post_id} to {written} feeds")
+            return {"recipients": written, "celebrity": False}, ""
+
+        except SQLAlchemyError as e:
+            logger.error(f"Database error in fan_out_post: {e}")
+            return None, "Database error occurred"
+        except Exception as e:
+            logger.error(f"Error in fan_out_post: {e}")
+            return None, f"Internal error: {str(e)}"
+
 class FeedServiceServicer(feed_pb2_grpc.FeedServiceServicer):
-    def __init__(self, db_session: sessionmaker):
+    def __init__(self, db_session: sessionmaker, timeline_cache: Optional[TimelineCache] = None,
+                 ranker: Optional[FeedRanker] = None):
         self.db_session = db_session
+        # Optional Redis timeline cache shared by all requests (FEED_CACHE_ENABLED)
+        self.timeline_cache = timeline_cache
+        # Optional ranking stage for GetFeed(ranked=true) (FEED_RANK_ENABLED)
+        self.ranker = ranker
+
+    @contextmanager
+    def feed_service(self):
+        """A FeedService on a session of its own for one RPC.
+
+        Servicer methods run concurrently on the server's worker threads; only
+        the thread-safe cache and ranker are shared between them. The session
+        is closed, and its connection returned to the pool, when the RPC ends.
+        """
+        with self.db_session() as session:
+            yield FeedService(session, self.timeline_cache, self.ranker)
 
     def GetFeed(self, request, context):
-        logger.info(f"Received GetFeed request: user_id={request.user_id}, limit={request.limit}, offset={request.offset}")
+        logger.info(f"Received GetFeed request: user_id={request.user_id}, limit={request.limit}, offset={request.offset}, before={request.before}, ranked={request.ranked}")
         try:
-            with self.db_session() as session:
-                feed_service = FeedService(session)
-                feed_items, error_message = feed_service.get_feed(request.user_id, request.limit, request.offset)
+            post_fields = None
+            if request.include_posts:
+                if not request.post_fields.IsValidForDescriptor(feed_pb2.PostSummary.DESCRIPTOR):
+                    error_msg = f"Invalid post field mask: {', '.join(request.post_fields.paths)}"
+                    context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+                    context.set_details(error_msg)
+                    return feed_pb2.GetFeedResponse(
+                        success=False,
+                        message=error_msg,
+                        feed_items=feed_pb2.FeedItemList(feed_items=[])
+                    )
+                post_fields = list(request.post_fields.paths)
+
+            with self.feed_service() as feed_service:
+                feed_items, next_cursor, error_message = feed_service.get_feed(
+                    request.user_id, request.limit, request.offset, request.before, post_fields, request.ranked
+                )
                 logger.debug(f"Raw feed items: {feed_items}")
                 
                 # Convert feed items to proto format
@@ -179,7 +335,8 @@ class FeedServiceServicer(feed_pb2_grpc.FeedServiceServicer):
                             post_id=post_id,
                             user_id=user_id,
                             created_at=created_at,
-                            updated_at=updated_at
+                            updated_at=updated_at,
+                            post=feed_pb2.PostSummary(**item["post"]) if "post" in item else None
                         )
                         logger.debug(f"Created feed item proto: {feed_item_proto}")
                         feed_items_proto.append(feed_item_proto)
@@ -192,7 +349,8 @@ class FeedServiceServicer(feed_pb2_grpc.FeedServiceServicer):
                 response = feed_pb2.GetFeedResponse(
                     success=True,
                     message="Feed retrieved successfully",
-                    feed_items=feed_items_list
+                    feed_items=feed_items_list,
+                    next_cursor=next_cursor
                 )
                 
                 logger.info(f"GetFeed response: success=True, items_count={len(feed_items_proto)}")
@@ -214,8 +372,7 @@ class FeedServiceServicer(feed_pb2_grpc.FeedServiceServicer):
     def AddToFeed(self, request, context):
         logger.info(f"Received AddToFeed request: post_id={request.post_id}, user_id={request.user_id}")
         try:
-            with self.db_session() as session:
-                feed_service = FeedService(session)
+            with self.feed_service() as feed_service:
                 post_id = request.post_id
                 user_id = request.user_id
                 feed_item, error_message = feed_service.add_to_feed(post_id, user_id)
@@ -255,11 +412,52 @@ class FeedServiceServicer(feed_pb2_grpc.FeedServiceServicer):
                 feed_item=None
             )
 
+    def BulkAddToFeed(self, request, context):
+        logger.info(f"Received BulkAddToFeed request: {len(request.feed_items)} items")
+        try:
+            with self.feed_service() as feed_service:
+                added, error_message = feed_service.bulk_add_to_feed(
+                    [(item.post_id, item.user_id) for item in request.feed_items]
+                )
+
+                if added is None:
+                    logger.warning(f"BulkAddToFeed failed: {error_message}")
+                    return feed_pb2.BulkAddToFeedResponse(
+                        success=False,
+                        message=error_message if error_message else "Failed to add to feed"
+                    )
+
+                logger.info(f"BulkAddToFeed response: success=True, added={len(added)}")
+                return feed_pb2.BulkAddToFeedResponse(
+                    success=True,
+                    message="Added to feed successfully",
+                    feed_items=feed_pb2.FeedItemList(feed_items=[
+                        feed_pb2.FeedItem(
+                            id=item["id"],
+                            post_id=item["post_id"],
+                            user_id=item["user_id"],
+                            created_at=item["created_at"],
+                            updated_at=item["updated_at"]
+                        )
+                        for item in added
+                    ]),
+                    added_count=len(added)
+                )
+
+        except Exception as e:
+            error_msg = f"Error adding to feed: {str(e)}"
+            logger.error(error_msg)
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(error_msg)
+            return feed_pb2.BulkAddToFeedResponse(
+                success=False,
+                message=error_msg
+            )
+
     def RemoveFromFeed(self, request, context):
         logger.info(f"Received RemoveFromFeed request: post_id={request.post_id}, user_id={request.user_id}")
         try:
-            with self.db_session() as session:
-                feed_service = FeedService(session)
+            with self.feed_service() as feed_service:
                 post_id = request.post_id
                 user_id = request.user_id
                 success, error_message = feed_service.remove_from_feed(post_id, user_id)
@@ -278,20 +476,83 @@ class FeedServiceServicer(feed_pb2_grpc.FeedServiceServicer):
                 message=error_msg
             )
 
+    def FanOutPost(self, request, context):
+        logger.info(f"Received FanOutPost request: post_id={request.post_id}, author_id={request.author_id}")
+        try:
+            with self.feed_service() as feed_service:
+                result, error_message = feed_service.fan_out_post(request.post_id, request.author_id)
+
+                if result:
+                    logger.info(f"FanOutPost response: success=True, recipients={result['recipients']}")
+                    return feed_pb2.FanOutPostResponse(
+                        success=True,
+                        message="Post fanned out successfully",
+                        recipients=result["recipients"],
+                        celebrity=result["celebrity"]
+                    )
+
+                logger.warning(f"FanOutPost failed: {error_message}")
+                return feed_pb2.FanOutPostResponse(
+                    success=False,
+                    message=error_message if error_message else "Failed to fan out post"
+                )
+
+        except Exception as e:
+            error_msg = f"Error fanning out post: {str(e)}"
+            logger.error(error_msg)
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(error_msg)
+            return feed_pb2.FanOutPostResponse(
+                success=False,
+                message=error_msg
+            )
+
+def grpc_server_options() -> List[Tuple[str, int]]:
+    return [
+        ("grpc.max_receive_message_length", GRPC_MAX_MESSAGE_BYTES),
+        ("grpc.max_send_message_length", GRPC_MAX_MESSAGE_BYTES),
+        ("grpc.keepalive_time_ms", GRPC_KEEPALIVE_TIME_MS),
+        ("grpc.keepalive_timeout_ms", GRPC_KEEPALIVE_TIMEOUT_MS),
+        # Let clients keep idle channels alive with pings no more often than we ping them
+        ("grpc.keepalive_permit_without_calls", 1),
+        ("grpc.http2.min_recv_ping_interval_without_data_ms", GRPC_KEEPALIVE_TIME_MS),
+        ("grpc.http2.max_pings_without_data", 0)
+    ]
+
 def serve():
+    logging.basicConfig(
+        level=os.getenv("LOG_LEVEL", "INFO").upper(),
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
     # Initialize database connection
-    engine = get_db_engine()
+    engine = get_db_engine(pool_size=GRPC_MAX_WORKERS)
     SessionLocal = sessionmaker(bind=engine)
+    timeline_cache = TimelineCache.from_env()
+    if timeline_cache:
+        logger.info(f"Feed timeline cache enabled (newest {timeline_cache.max_items} items per user)")
+    ranker = FeedRanker.from_env()
+    if ranker:
+        logger.info(f"Feed ranking enabled (weights {ranker.weights})")
+    retention = FeedRetention.from_env(SessionLocal, timeline_cache)
+    if retention:
+        retention.start()
     
     # Create gRPC server
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
-    feed_pb2_grpc.add_FeedServiceServicer_to_server(FeedServiceServicer(SessionLocal), server)
-    port = 50056
-    server.add_insecure_port(f'[::]:{port}')
-    logger.info(f"Starting feed service on port {port}...")
+    server = grpc.server(
+        futures.ThreadPoolExecutor(max_workers=GRPC_MAX_WORKERS, thread_name_prefix="feed-rpc"),
+        options=grpc_server_options(),
+        maximum_concurrent_rpcs=GRPC_MAX_CONCURRENT_RPCS or None
+    )
+    feed_pb2_grpc.add_FeedServiceServicer_to_server(FeedServiceServicer(SessionLocal, timeline_cache, ranker), server)
+    server.add_insecure_port(f'[::]:{GRPC_PORT}')
+    logger.info(f"Starting feed service on port {GRPC_PORT} with {GRPC_MAX_WORKERS} workers...")
     server.start()
     logger.info("Feed service is running...")
-    server.wait_for_termination()
+    try:
+        server.wait_for_termination()
+    finally:
+        if retention:
+            retention.stop()
 
 if __name__ == "__main__":
     serve() 
\ No newline at end of file
@@ -9,10 +9,14 @@ sys.path.append(app_dir)
 from .db_connection import Base, get_db_engine
 from ..entity.feed_entity import FeedItem
 from ..entity.post_entity import Post
+from ..service.feed_retention import FeedRetention
+from sqlalchemy.orm import sessionmaker
 
 def create_tables():
     engine = get_db_engine()
     Base.metadata.create_all(bind=engine)
+    # feed_items only accepts rows for weeks that have a partition
+    FeedRetention(sessionmaker(bind=engine)).ensure_partitions()
     print("Database tables created successfully!")
 
 if __name__ == "__main__":
@@ -6,7 +6,9 @@ from dotenv import load_dotenv
 # Load environment variables from .env file
 load_dotenv()
 
-def get_db_engine():
+def get_db_engine(pool_size: int = 5):
+    """Engine with a connection pool of ``pool_size`` (DB_POOL_SIZE overrides it)
+    plus DB_MAX_OVERFLOW burst connections"""
     # Get database connection details from environment variables or use defaults
     DB_USER = os.getenv("DB_USER", "postgres")
     DB_PASSWORD = os.getenv("DB_PASSWORD", "postgres")
@@ -17,8 +19,15 @@ def get_db_engine():
     # Create database URL
     DATABASE_URL = f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
 
-    # Create engine
-    engine = create_engine(DATABASE_URL)
+    # Create engine; pre-ping replaces connections the server or a proxy dropped while idle
+    engine = create_engine(
+        DATABASE_URL,
+        pool_size=int(os.getenv("DB_POOL_SIZE", str(pool_size))),
+        max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "5")),
+        pool_timeout=float(os.getenv("DB_POOL_TIMEOUT_S", "30")),
+        pool_recycle=int(os.getenv("DB_POOL_RECYCLE_S", "1800")),
+        pool_pre_ping=True
+    )
     
     try:
         # Test the connection
@@ -0,0 +1,32 @@
+import os
+import logging
+import redis
+from dotenv import load_dotenv
+
+# Load environment variables from .env file
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+def get_redis_client():
+    """Redis client for the feed timeline cache, or None when the cache is disabled or Redis is unreachable"""
+    if os.getenv("FEED_CACHE_ENABLED", "true").lower() not in ("1", "true", "yes"):
+        return None
+
+    redis_host = os.getenv("REDIS_HOST", "localhost")
+    redis_port = int(os.getenv("REDIS_PORT", "6379"))
+    try:
+        client = redis.Redis(
+            host=redis_host,
+            port=redis_port,
+            db=int(os.getenv("REDIS_DB", "0")),
+            decode_responses=True,
+            socket_connect_timeout=2,
+            socket_timeout=2
+        )
+        client.ping()
+        logger.info(f"Connected to Redis at {redis_host}:{redis_port}")
+        return client
+    except redis.RedisError as e:
+        logger.error(f"Redis connection error, feed cache disabled: {e}")
+        return None
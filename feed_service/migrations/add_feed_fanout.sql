@@ -0,0 +1,18 @@
+-- Fan-out on write. New databases get the feed tables from create_tables.py;
+-- this brings an existing one up to date.
+
+-- GetFeed reads one user's items newest first
+CREATE INDEX IF NOT EXISTS idx_feed_items_user_created ON feed_items(user_id, created_at);
+
+-- Authors over FEED_CELEBRITY_THRESHOLD followers; their posts are merged in at read time
+CREATE TABLE IF NOT EXISTS celebrity_authors (
+    user_id INT PRIMARY KEY,
+    follower_count INT NOT NULL,
+    updated_at TIMESTAMPTZ DEFAULT now()
+);
+
+-- Keyset pagination over an author's followers during fan-out
+CREATE INDEX IF NOT EXISTS idx_user_followers_following_user ON user_followers(following_id, user_id);
+
+-- Latest posts per celebrity author at read time
+CREATE INDEX IF NOT EXISTS idx_posts_user_created ON posts(user_id, created_at DESC);
@@ -0,0 +1,60 @@
+-- Rebuild feed_items as a table range-partitioned by week on created_at, with
+-- a bigint key instead of a UUID string. New databases get this layout from
+-- create_tables.py; this converts an existing one. Run it with the feed
+-- service stopped: it copies every feed item that is still inside the
+-- retention window.
+--
+-- A feed item's created_at becomes its post's created_at (fan-out already
+-- wrote it that way), which is what keeps (user_id, post_id) unique now that
+-- every unique key has to include the partition key.
+
+BEGIN;
+
+ALTER TABLE feed_items RENAME TO feed_items_unpartitioned;
+ALTER INDEX IF EXISTS idx_feed_items_user_created RENAME TO idx_feed_items_unpartitioned_user_created;
+ALTER INDEX IF EXISTS uq_feed_items_user_post RENAME TO uq_feed_items_unpartitioned_user_post;
+
+CREATE TABLE feed_items (
+    id BIGSERIAL,
+    post_id INT NOT NULL REFERENCES posts(id),
+    user_id INT NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL,
+    updated_at TIMESTAMPTZ,
+    PRIMARY KEY (id, created_at)
+) PARTITION BY RANGE (created_at);
+
+-- GetFeed reads one user's items newest first
+CREATE INDEX idx_feed_items_user_created ON feed_items(user_id, created_at);
+-- A post appears in a user's feed at most once
+CREATE UNIQUE INDEX uq_feed_items_user_post ON feed_items(user_id, post_id, created_at);
+
+-- Weekly partitions (Monday 00:00 UTC, named feed_items_pYYYYMMDD) covering the
+-- default 90-day FEED_RETENTION_DAYS and four weeks ahead. The service's
+-- retention job keeps creating and dropping them from here on.
+DO $$
+DECLARE
+    week_start TIMESTAMP := date_trunc('week', (now() - interval '90 days') AT TIME ZONE 'UTC');
+    last_start TIMESTAMP := date_trunc('week', now() AT TIME ZONE 'UTC') + interval '4 weeks';
+BEGIN
+    WHILE week_start <= last_start LOOP
+        EXECUTE format(
+            'CREATE TABLE IF NOT EXISTS %I PARTITION OF feed_items FOR VALUES FROM (%L) TO (%L)',
+            'feed_items_p' || to_char(week_start, 'YYYYMMDD'),
+            week_start AT TIME ZONE 'UTC',
+            (week_start + interval '1 week') AT TIME ZONE 'UTC'
+        );
+        week_start := week_start + interval '1 week';
+    END LOOP;
+END $$;
+
+INSERT INTO feed_items (post_id, user_id, created_at, updated_at)
+SELECT f.post_id, f.user_id, p.created_at AT TIME ZONE 'UTC', f.updated_at
+FROM feed_items_unpartitioned f
+JOIN posts p ON p.id = f.post_id
+WHERE p.created_at >= date_trunc('week', (now() - interval '90 days') AT TIME ZONE 'UTC')
+ORDER BY p.created_at
+ON CONFLICT (user_id, post_id, created_at) DO NOTHING;
+
+DROP TABLE feed_items_unpartitioned;
+
+COMMIT;
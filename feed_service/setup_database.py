@@ -1,6 +1,7 @@
 from app.utils.db_connection import Base, get_db_engine
 from app.entity.feed_entity import FeedItem
 from app.entity.post_entity import Post
+from app.service.feed_retention import FeedRetention
 from sqlalchemy.orm import sessionmaker
 from datetime import datetime
 import logging
@@ -20,6 +21,8 @@ def setup_database():
         
         # Create a session
         SessionLocal = sessionmaker(bind=engine)
+        # feed_items only accepts rows for weeks that have a partition
+        FeedRetention(SessionLocal).ensure_partitions()
         session = SessionLocal()
         
         try:
@@ -0,0 +1,79 @@
+"""TimelineCache against fakeredis; run from the feed_service directory:
+
+    python -m pytest tests
+"""
+from datetime import datetime, timezone
+import fakeredis
+import pytest
+from app.repository.timeline_cache import TimelineCache, Timeline, to_score, from_score, to_member, from_member
+
+
+@pytest.fixture
+def client():
+    return fakeredis.FakeRedis(decode_responses=True)
+
+
+@pytest.fixture
+def cache(client):
+    return TimelineCache(client, max_items=3, ttl_s=600, log_every=0)
+
+
+def test_page_reads_below_the_cursor_newest_first(cache, client):
+    assert cache.page(1, None, 10) is None
+    cache.load(1, [("1:a", 100), ("2:b", 200), ("3:c", 300)], None)
+
+    assert cache.page(1, None, 2) == Timeline([("3:c", 300), ("2:b", 200)], False)
+    assert cache.page(1, 200, 10) == Timeline([("1:a", 100)], False)
+    assert 0 < client.ttl("feed:timeline:1") <= 600
+
+
+def test_add_skips_timelines_nobody_has_loaded(cache, client):
+    cache.add([(1, "1:a", 100)])
+    assert not client.exists("feed:timeline:1")
+
+    cache.load(2, [], None)
+    cache.add([(1, "1:a", 100), (2, "2:b", 200)])
+    assert not client.exists("feed:timeline:1")
+    assert cache.page(2, None, 10) == Timeline([("2:b", 200)], False)
+
+
+def test_writes_during_a_load_are_kept(cache):
+    cache.begin_load(1)
+    assert cache.page(1, None, 10) is None
+    cache.add([(1, "3:c", 300)])  # fan-out landing after the load query ran
+
+    cache.load(1, [("1:a", 100)], None)
+    assert cache.page(1, None, 10) == Timeline([("3:c", 300), ("1:a", 100)], False)
+
+
+def test_trimmed_timeline_reports_truncated_pages(cache):
+    cache.load(1, [("1:a", 100), ("2:b", 200)], None)
+    cache.add([(1, "3:c", 300), (1, "4:d", 400)])
+
+    assert cache.page(1, None, 3) == Timeline([("4:d", 400), ("3:c", 300), ("2:b", 200)], False)
+    assert cache.page(1, 300, 3) == Timeline([("2:b", 200)], True)  # 1:a was trimmed off
+
+
+def test_load_floor_marks_older_items_missing(cache):
+    cache.load(1, [("2:b", 200), ("3:c", 300)], 200)
+    assert cache.page(1, None, 5) == Timeline([("3:c", 300)], True)
+
+
+def test_remove_and_stats(cache):
+    cache.load(1, [("1:a", 100), ("2:b", 200)], None)
+    cache.remove(1, ["2:b"])
+    assert cache.page(1, None, 10) == Timeline([("1:a", 100)], False)
+
+    cache.record_hit()
+    cache.record_hit()
+    cache.record_miss(4.0)
+    cache.record_overflow()
+    stats = cache.stats()
+    assert (stats["lookups"], stats["hits"], stats["hit_rate"], stats["rebuild_ms_max"]) == (4, 2, 0.5, 4.0)
+
+
+def test_scores_and_members_round_trip():
+    created_at = datetime(2024, 5, 1, 12, 30, 15, 123456, tzinfo=timezone.utc)
+    assert from_score(to_score(created_at)) == created_at
+    assert to_score(created_at.replace(tzinfo=None)) == to_score(created_at)
+    assert from_member(to_member(42, "7")) == (42, "7")
@@ -11,12 +11,14 @@ class PostsServiceClient(GRPCBaseClient):
     def __init__(self):
         super().__init__(post_pb2_grpc.PostsServiceStub, target='localhost:50052')
 
-    def get_comments(self, post_id: int, page: int = 1, limit: int = 10,token=None):
+    def get_comments(self, post_id: int, page: int = 1, limit: int = 10,
+                     include_replies: bool = True, token=None):
         try:
             request = post_pb2.GetCommentsRequest(
                 post_id=post_id,
                 page=page,
-                limit=limit
+                limit=limit,
+                include_replies=include_replies
             )
             return self._call(self.stub.GetComments, request,token=token)
         except grpc.RpcError as e:
@@ -25,7 +27,8 @@ class PostsServiceClient(GRPCBaseClient):
 
     def search_posts(self, property_type: str = None, location: str = None,
                      min_price: float = None, max_price: float = None,
-                     status: str = None, page: int = 1, limit: int = 10,token=None):
+                     status: str = None, page: int = 1, limit: int = 10,
+                     query: str = None, token=None):
         try:
             request = post_pb2.SearchPostsRequest(
                 property_type=property_type or "",
@@ -34,7 +37,8 @@ class PostsServiceClient(GRPCBaseClient):
                 max_price=max_price or 0.0,
                 status=status or "",
                 page=page,
-                limit=limit
+                limit=limit,
+                query=query or ""
             )
             return self._call(self.stub.SearchPosts, request,token=token)
         except grpc.RpcError as e:
@@ -131,6 +135,26 @@ class PostsServiceClient(GRPCBaseClient):
         except grpc.RpcError as e:
             return None
 
+    def batch_get_posts(self, post_ids: list, fields: list = None, token=None):
+        try:
+            request = post_pb2.BatchGetPostsRequest(post_ids=post_ids)
+            if fields:
+                request.field_mask.paths.extend(fields)
+            response = self._call(self.stub.BatchGetPosts, request, token=token)
+            return response.posts
+        except grpc.RpcError as e:
+            print(f"Error in batch_get_posts: {str(e)}")
+            return []
+
+    def get_post_summaries(self, post_ids: list, token=None):
+        try:
+            request = post_pb2.GetPostSummariesRequest(post_ids=post_ids)
+            response = self._call(self.stub.GetPostSummaries, request, token=token)
+            return response.summaries
+        except grpc.RpcError as e:
+            print(f"Error in get_post_summaries: {str(e)}")
+            return []
+
     def update_post(self, post_id: int,token=None, **kwargs) -> dict:
         try:
             # Filter out None values
@@ -238,10 +262,11 @@ class PostsServiceClient(GRPCBaseClient):
             )
             response = self._call(self.stub.LikePost, request,token=token)
 
-            # Convert the gRPC response to a dictionary
-            if response.post:
+            # LikePost only returns the new like count; merge it into the post fetched above
+            if response.success and response.post:
+                post = post_response.post
                 media_list = []
-                for m in response.post.media:
+                for m in post.media:
                     media_list.append({
                         'id': m.id,
                         'mediaType': m.media_type,
@@ -253,20 +278,20 @@ class PostsServiceClient(GRPCBaseClient):
                     })
 
                 post_dict = {
-                    'id': response.post.id,
-                    'userId': response.post.user_id,
-                    'title': response.post.title,
-                    'content': response.post.content,
-                    'visibility': response.post.visibility,
-                    'propertyType': response.post.property_type,
-                    'location': response.post.location,
-                    'mapLocation': response.post.map_location,
-                    'price': response.post.price,
-                    'status': response.post.status,
-                    'createdAt': datetime.fromtimestamp(response.post.created_at),
+                    'id': post.id,
+                    'userId': post.user_id,
+                    'title': post.title,
+                    'content': post.content,
+                    'visibility': post.visibility,
+                    'propertyType': post.property_type,
+                    'location': post.location,
+                    'mapLocation': post.map_location,
+                    'price': post.price,
+                    'status': post.status,
+                    'createdAt': datetime.fromtimestamp(post.created_at),
                     'media': media_list,
                     'likeCount': response.post.like_count,
-                    'commentCount': response.post.comment_count
+                    'commentCount': post.comment_count
                 }
             else:
                 post_dict = None
@@ -5,7 +5,7 @@ import warnings
 
 from . import post_pb2 as post__pb2
 
-GRPC_GENERATED_VERSION = '1.71.0'
+GRPC_GENERATED_VERSION = '1.73.1'
 GRPC_VERSION = grpc.__version__
 _version_not_supported = False
 
@@ -65,6 +65,16 @@ class PostsServiceStub(object):
                 request_serializer=post__pb2.SearchPostsRequest.SerializeToString,
                 response_deserializer=post__pb2.PostListResponse.FromString,
                 _registered_method=True)
+        self.BatchGetPosts = channel.unary_unary(
+                '/posts.PostsService/BatchGetPosts',
+                request_serializer=post__pb2.BatchGetPostsRequest.SerializeToString,
+                response_deserializer=post__pb2.BatchGetPostsResponse.FromString,
+                _registered_method=True)
+        self.GetPostSummaries = channel.unary_unary(
+                '/posts.PostsService/GetPostSummaries',
+                request_serializer=post__pb2.GetPostSummariesRequest.SerializeToString,
+                response_deserializer=post__pb2.PostSummaryListResponse.FromString,
+                _registered_method=True)
         self.AddPostMedia = channel.unary_unary(
                 '/posts.PostsService/AddPostMedia',
                 request_serializer=post__pb2.PostMediaRequest.SerializeToString,
@@ -123,6 +133,7 @@ class PostsServiceServicer(object):
 
     def CreatePost(self, request, context):
         """Post Operations
+        Post and media are created in one transaction
         """
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details('Method not implemented!')
@@ -158,8 +169,21 @@ class PostsServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def BatchGetPosts(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetPostSummaries(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def AddPostMedia(self, request, context):
         """Media Operations
+        Atomic; the response post carries all of its media but not its comments
         """
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details('Method not implemented!')
@@ -173,6 +197,7 @@ class PostsServiceServicer(object):
 
     def LikePost(self, request, context):
         """Like Operations
+        Idempotent; the response post/comment carries only id and the new like_count
         """
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details('Method not implemented!')
@@ -254,6 +279,16 @@ def add_PostsServiceServicer_to_server(servicer, server):
                     request_deserializer=post__pb2.SearchPostsRequest.FromString,
                     response_serializer=post__pb2.PostListResponse.SerializeToString,
             ),
+            'BatchGetPosts': grpc.unary_unary_rpc_method_handler(
+                    servicer.BatchGetPosts,
+                    request_deserializer=post__pb2.BatchGetPostsRequest.FromString,
+                    response_serializer=post__pb2.BatchGetPostsResponse.SerializeToString,
+            ),
+            'GetPostSummaries': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetPostSummaries,
+                    request_deserializer=post__pb2.GetPostSummariesRequest.FromString,
+                    response_serializer=post__pb2.PostSummaryListResponse.SerializeToString,
+            ),
             'AddPostMedia': grpc.unary_unary_rpc_method_handler(
                     servicer.AddPostMedia,
                     request_deserializer=post__pb2.PostMediaRequest.FromString,
@@ -478,6 +513,60 @@ class PostsService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def BatchGetPosts(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/posts.PostsService/BatchGetPosts',
+            post__pb2.BatchGetPostsRequest.SerializeToString,
+            post__pb2.BatchGetPostsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetPostSummaries(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/posts.PostsService/GetPostSummaries',
+            post__pb2.GetPostSummariesRequest.SerializeToString,
+            post__pb2.PostSummaryListResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def AddPostMedia(request,
             target,
@@ -25,6 +25,8 @@ class Comment:
     commentedAt: datetime
     replies: List['Comment']
     likeCount: int
+    replyCount: int = 0
+    descendantCount: int = 0
 
     @classmethod
     def from_dict(cls, data: dict):
@@ -43,7 +45,9 @@ class Comment:
             addedAt=data['addedAt'],
             commentedAt=data['commentedAt'],
             replies=[cls.from_dict(reply) for reply in data.get('replies', [])],
-            likeCount=data['likeCount']
+            likeCount=data['likeCount'],
+            replyCount=data.get('replyCount', 0),
+            descendantCount=data.get('descendantCount', 0)
         )
 
 @strawberry.type
@@ -98,6 +102,7 @@ class Post:
     media: List[PostMedia]
     likeCount: int
     commentCount: int
+    searchHeadline: Optional[str] = None
 
     @classmethod
     def from_dict(cls, data: dict):
@@ -133,7 +138,8 @@ class Post:
             createdAt=data['createdAt'],
             media=media_list,
             likeCount=data['likeCount'],
-            commentCount=data['commentCount']
+            commentCount=data['commentCount'],
+            searchHeadline=data.get('searchHeadline')
         )
 
 @strawberry.type
@@ -202,9 +208,10 @@ class Query:
         maxPrice: Optional[float] = None,
         status: Optional[str] = None,
         page: int = 1,
-        limit: int = 10
+        limit: int = 10,
+        query: Optional[str] = None
     ) -> List[Post]:
-        logger.debug(f"Query.searchPosts called with propertyType: {propertyType}, location: {location}")
+        logger.debug(f"Query.searchPosts called with propertyType: {propertyType}, location: {location}, query: {query}")
         token = get_token(info)
         result = post_service_client.search_posts(
             property_type=propertyType,
@@ -214,6 +221,7 @@ class Query:
             status=status,
             page=page,
             limit=limit,
+            query=query,
             token = token
         )
         
@@ -251,7 +259,8 @@ class Query:
                     'uploadedAt': datetime.fromtimestamp(m.uploaded_at)
                 } for m in post.media],
                 'likeCount': post.like_count,
-                'commentCount': post.comment_count
+                'commentCount': post.comment_count,
+                'searchHeadline': post.search_headline or None
             }
             logger.debug(f"Created post dict: {post_dict}")
             posts_data.append(post_dict)
@@ -265,11 +274,14 @@ class Query:
         self,info: Info,
         postId: int,
         page: int = 1,
-        limit: int = 10
+        limit: int = 10,
+        includeReplies: bool = True
     ) -> List[Comment]:
         logger.debug(f"Query.postComments called with postId: {postId}")
         token = get_token(info)
-        result = post_service_client.get_comments(post_id=postId, page=page, limit=limit, token=token)
+        result = post_service_client.get_comments(
+            post_id=postId, page=page, limit=limit, include_replies=includeReplies, token=token
+        )
         
         if not result or not result.success:
             return []
@@ -302,10 +314,14 @@ class Query:
                         'addedAt': datetime.fromtimestamp(r.added_at),
                         'commentedAt': datetime.fromtimestamp(r.commented_at),
                         'replies': [],
-                        'likeCount': r.like_count
+                        'likeCount': r.like_count,
+                        'replyCount': r.reply_count,
+                        'descendantCount': r.descendant_count
                     } for r in comment.replies
                 ],
-                'likeCount': comment.like_count
+                'likeCount': comment.like_count,
+                'replyCount': comment.reply_count,
+                'descendantCount': comment.descendant_count
             }
             comments_data.append(comment_dict)
             
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Float, Index
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Float, Index, text
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from ..utils.database import Base
@@ -6,6 +6,9 @@ from ..utils.database import Base
 class Notification(Base):
     __tablename__ = "notifications"
     __table_args__ = (
+        # A user hears about a trending post once; trending inserts skip rows that conflict here
+        Index('uq_notifications_trending_user_post', 'user_id', 'entity_id', unique=True,
+              postgresql_where=text("type = 'trending_post'")),
         {'extend_existing': True}
     )
 
@@ -24,7 +24,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x12notification.proto\x12\x0cnotification\"d\n\x1bGetUserNotificationsRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\x05\x12\x0c\n\x04page\x18\x02 \x01(\x05\x12\x11\n\tpage_size\x18\x03 \x01(\x05\x12\x13\n\x0bunread_only\x18\x04 \x01(\x08\"|\n\x1cGetUserNotificationsResponse\x12\x31\n\rnotifications\x18\x01 \x03(\x0b\x32\x1a.notification.Notification\x12\x13\n\x0btotal_count\x18\x02 \x01(\x05\x12\x14\n\x0cunread_count\x18\x03 \x01(\x05\"I\n\x1dMarkNotificationAsReadRequest\x12\x17\n\x0fnotification_id\x18\x01 \x01(\x05\x12\x0f\n\x07user_id\x18\x02 \x01(\x05\"1\n\x1eMarkNotificationAsReadResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\"e\n\x1aSubscribeToLocationRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\x05\x12\x10\n\x08latitude\x18\x02 \x01(\x01\x12\x11\n\tlongitude\x18\x03 \x01(\x01\x12\x11\n\tradius_km\x18\x04 \x01(\x01\"W\n\x1bSubscribeToLocationResponse\x12\x38\n\x0csubscription\x18\x01 \x01(\x0b\x32\".notification.LocationSubscription\"J\n\x1eUnsubscribeFromLocationRequest\x12\x17\n\x0fsubscription_id\x18\x01 \x01(\x05\x12\x0f\n\x07user_id\x18\x02 \x01(\x05\"2\n\x1fUnsubscribeFromLocationResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\".\n\x1bGetUserSubscriptionsRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\x05\"Y\n\x1cGetUserSubscriptionsResponse\x12\x39\n\rsubscriptions\x18\x01 \x03(\x0b\x32\".notification.LocationSubscription\"]\n!CreatePostLikeNotificationRequest\x12\x0f\n\x07post_id\x18\x01 \x01(\x05\x12\x15\n\rpost_owner_id\x18\x02 \x01(\x05\x12\x10\n\x08liker_id\x18\x03 \x01(\x05\"z\n$CreatePostCommentNotificationRequest\x12\x0f\n\x07post_id\x18\x01 \x01(\x05\x12\x15\n\rpost_owner_id\x18\x02 \x01(\x05\x12\x14\n\x0c\x63ommenter_id\x18\x03 \x01(\x05\x12\x14\n\x0c\x63omment_text\x18\x04 \x01(\t\"f\n$CreateCommentLikeNotificationRequest\x12\x12\n\ncomment_id\x18\x01 \x01(\x05\x12\x18\n\x10\x63omment_owner_id\x18\x02 \x01(\x05\x12\x10\n\x08liker_id\x18\x03 \x01(\x05\"}\n%CreateCommentReplyNotificationRequest\x12\x12\n\ncomment_id\x18\x01 \x01(\x05\x12\x18\n\x10\x63omment_owner_id\x18\x02 \x01(\x05\x12\x12\n\nreplier_id\x18\x03 \x01(\x05\x12\x12\n\nreply_text\x18\x04 \x01(\t\"`\n%CreateTrendingPostNotificationRequest\x12\x0f\n\x07post_id\x18\x01 \x01(\x05\x12\x0f\n\x07user_id\x18\x02 \x01(\x05\x12\x15\n\rlocation_name\x18\x03 \x01(\t\"|\n\x1aNotifyTrendingPostsRequest\x12\x0f\n\x07post_id\x18\x01 \x01(\x05\x12\x10\n\x08latitude\x18\x02 \x01(\x01\x12\x11\n\tlongitude\x18\x03 \x01(\x01\x12\x11\n\tradius_km\x18\x04 \x01(\x01\x12\x15\n\rlocation_name\x18\x05 \x01(\t\"h\n\x1bNotifyTrendingPostsResponse\x12\x31\n\rnotifications\x18\x01 \x03(\x0b\x32\x1a.notification.Notification\x12\x16\n\x0etotal_notified\x18\x02 \x01(\x05\"\xa8\x01\n\x0cNotification\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0f\n\x07user_id\x18\x02 \x01(\x05\x12\x0c\n\x04type\x18\x03 \x01(\t\x12\x0f\n\x07message\x18\x04 \x01(\t\x12\x11\n\tentity_id\x18\x05 \x01(\x05\x12\x13\n\x0b\x65ntity_type\x18\x06 \x01(\t\x12\x0f\n\x07is_read\x18\x07 \x01(\x08\x12\x12\n\ncreated_at\x18\x08 \x01(\t\x12\x0f\n\x07\x63ontext\x18\t \x01(\t\"\x92\x01\n\x14LocationSubscription\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0f\n\x07user_id\x18\x02 \x01(\x05\x12\x10\n\x08latitude\x18\x03 \x01(\x01\x12\x11\n\tlongitude\x18\x04 \x01(\x01\x12\x11\n\tradius_km\x18\x05 \x01(\x01\x12\x12\n\ncreated_at\x18\x06 \x01(\t\x12\x11\n\tis_active\x18\x07 \x01(\x08\x32\x81\n\n\x13NotificationService\x12o\n\x14GetUserNotifications\x12).notification.GetUserNotificationsRequest\x1a*.notification.GetUserNotificationsResponse\"\x00\x12u\n\x16MarkNotificationAsRead\x12+.notification.MarkNotificationAsReadRequest\x1a,.notification.MarkNotificationAsReadResponse\"\x00\x12l\n\x13SubscribeToLocation\x12(.notification.SubscribeToLocationRequest\x1a).notification.SubscribeToLocationResponse\"\x00\x12x\n\x17UnsubscribeFromLocation\x12,.notification.UnsubscribeFromLocationRequest\x1a-.notification.UnsubscribeFromLocationResponse\"\x00\x12o\n\x14GetUserSubscriptions\x12).notification.GetUserSubscriptionsRequest\x1a*.notification.GetUserSubscriptionsResponse\"\x00\x12k\n\x1a\x43reatePostLikeNotification\x12/.notification.CreatePostLikeNotificationRequest\x1a\x1a.notification.Notification\"\x00\x12q\n\x1d\x43reatePostCommentNotification\x12\x32.notification.CreatePostCommentNotificationRequest\x1a\x1a.notification.Notification\"\x00\x12q\n\x1d\x43reateCommentLikeNotification\x12\x32.notification.CreateCommentLikeNotificationRequest\x1a\x1a.notification.Notification\"\x00\x12s\n\x1e\x43reateCommentReplyNotification\x12\x33.notification.CreateCommentReplyNotificationRequest\x1a\x1a.notification.Notification\"\x00\x12s\n\x1e\x43reateTrendingPostNotification\x12\x33.notification.CreateTrendingPostNotificationRequest\x1a\x1a.notification.Notification\"\x00\x12l\n\x13NotifyTrendingPosts\x12(.notification.NotifyTrendingPostsRequest\x1a).notification.NotifyTrendingPostsResponse\"\x00\x62\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x12notification.proto\x12\x0cnotification\"d\n\x1bGetUserNotificationsRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\x05\x12\x0c\n\x04page\x18\x02 \x01(\x05\x12\x11\n\tpage_size\x18\x03 \x01(\x05\x12\x13\n\x0bunread_only\x18\x04 \x01(\x08\"|\n\x1cGetUserNotificationsResponse\x12\x31\n\rnotifications\x18\x01 \x03(\x0b\x32\x1a.notification.Notification\x12\x13\n\x0btotal_count\x18\x02 \x01(\x05\x12\x14\n\x0cunread_count\x18\x03 \x01(\x05\"I\n\x1dMarkNotificationAsReadRequest\x12\x17\n\x0fnotification_id\x18\x01 \x01(\x05\x12\x0f\n\x07user_id\x18\x02 \x01(\x05\"1\n\x1eMarkNotificationAsReadResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\"e\n\x1aSubscribeToLocationRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\x05\x12\x10\n\x08latitude\x18\x02 \x01(\x01\x12\x11\n\tlongitude\x18\x03 \x01(\x01\x12\x11\n\tradius_km\x18\x04 \x01(\x01\"W\n\x1bSubscribeToLocationResponse\x12\x38\n\x0csubscription\x18\x01 \x01(\x0b\x32\".notification.LocationSubscription\"J\n\x1eUnsubscribeFromLocationRequest\x12\x17\n\x0fsubscription_id\x18\x01 \x01(\x05\x12\x0f\n\x07user_id\x18\x02 \x01(\x05\"2\n\x1fUnsubscribeFromLocationResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\".\n\x1bGetUserSubscriptionsRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\x05\"Y\n\x1cGetUserSubscriptionsResponse\x12\x39\n\rsubscriptions\x18\x01 \x03(\x0b\x32\".notification.LocationSubscription\"]\n!CreatePostLikeNotificationRequest\x12\x0f\n\x07post_id\x18\x01 \x01(\x05\x12\x15\n\rpost_owner_id\x18\x02 \x01(\x05\x12\x10\n\x08liker_id\x18\x03 \x01(\x05\"z\n$CreatePostCommentNotificationRequest\x12\x0f\n\x07post_id\x18\x01 \x01(\x05\x12\x15\n\rpost_owner_id\x18\x02 \x01(\x05\x12\x14\n\x0c\x63ommenter_id\x18\x03 \x01(\x05\x12\x14\n\x0c\x63omment_text\x18\x04 \x01(\t\"f\n$CreateCommentLikeNotificationRequest\x12\x12\n\ncomment_id\x18\x01 \x01(\x05\x12\x18\n\x10\x63omment_owner_id\x18\x02 \x01(\x05\x12\x10\n\x08liker_id\x18\x03 \x01(\x05\"}\n%CreateCommentReplyNotificationRequest\x12\x12\n\ncomment_id\x18\x01 \x01(\x05\x12\x18\n\x10\x63omment_owner_id\x18\x02 \x01(\x05\x12\x12\n\nreplier_id\x18\x03 \x01(\x05\x12\x12\n\nreply_text\x18\x04 \x01(\t\"`\n%CreateTrendingPostNotificationRequest\x12\x0f\n\x07post_id\x18\x01 \x01(\x05\x12\x0f\n\x07user_id\x18\x02 \x01(\x05\x12\x15\n\rlocation_name\x18\x03 \x01(\t\"|\n\x1aNotifyTrendingPostsRequest\x12\x0f\n\x07post_id\x18\x01 \x01(\x05\x12\x10\n\x08latitude\x18\x02 \x01(\x01\x12\x11\n\tlongitude\x18\x03 \x01(\x01\x12\x11\n\tradius_km\x18\x04 \x01(\x01\x12\x15\n\rlocation_name\x18\x05 \x01(\t\"h\n\x1bNotifyTrendingPostsResponse\x12\x31\n\rnotifications\x18\x01 \x03(\x0b\x32\x1a.notification.Notification\x12\x16\n\x0etotal_notified\x18\x02 \x01(\x05\"n\n\x11TrendingPostEntry\x12\x0f\n\x07post_id\x18\x01 \x01(\x05\x12\x10\n\x08latitude\x18\x02 \x01(\x01\x12\x11\n\tlongitude\x18\x03 \x01(\x01\x12\x0c\n\x04rank\x18\x04 \x01(\x05\x12\x15\n\rlocation_name\x18\x05 \x01(\t\"d\n\x1fNotifyTrendingPostsBatchRequest\x12.\n\x05posts\x18\x01 \x03(\x0b\x32\x1f.notification.TrendingPostEntry\x12\x11\n\tradius_km\x18\x02 \x01(\x01\"n\n NotifyTrendingPostsBatchResponse\x12\x16\n\x0etotal_notified\x18\x01 \x01(\x05\x12\x16\n\x0eposts_notified\x18\x02 \x01(\x05\x12\x1a\n\x12\x64uplicates_skipped\x18\x03 \x01(\x05\"\xa8\x01\n\x0cNotification\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0f\n\x07user_id\x18\x02 \x01(\x05\x12\x0c\n\x04type\x18\x03 \x01(\t\x12\x0f\n\x07message\x18\x04 \x01(\t\x12\x11\n\tentity_id\x18\x05 \x01(\x05\x12\x13\n\x0b\x65ntity_type\x18\x06 \x01(\t\x12\x0f\n\x07is_read\x18\x07 \x01(\x08\x12\x12\n\ncreated_at\x18\x08 \x01(\t\x12\x0f\n\x07\x63ontext\x18\t \x01(\t\"\x92\x01\n\x14LocationSubscription\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0f\n\x07user_id\x18\x02 \x01(\x05\x12\x10\n\x08latitude\x18\x03 \x01(\x01\x12\x11\n\tlongitude\x18\x04 \x01(\x01\x12\x11\n\tradius_km\x18\x05 \x01(\x01\x12\x12\n\ncreated_at\x18\x06 \x01(\t\x12\x11\n\tis_active\x18\x07 \x01(\x08\x32\xfe\n\n\x13NotificationService\x12o\n\x14GetUserNotifications\x12).notification.GetUserNotificationsRequest\x1a*.notification.GetUserNotificationsResponse\"\x00\x12u\n\x16MarkNotificationAsRead\x12+.notification.MarkNotificationAsReadRequest\x1a,.notification.MarkNotificationAsReadResponse\"\x00\x12l\n\x13SubscribeToLocation\x12(.notification.SubscribeToLocationRequest\x1a).notification.SubscribeToLocationResponse\"\x00\x12x\n\x17UnsubscribeFromLocation\x12,.notification.UnsubscribeFromLocationRequest\x1a-.notification.UnsubscribeFromLocationResponse\"\x00\x12o\n\x14GetUserSubscriptions\x12).notification.GetUserSubscriptionsRequest\x1a*.notification.GetUserSubscriptionsResponse\"\x00\x12k\n\x1a\x43reatePostLikeNotification\x12/.notification.CreatePostLikeNotificationRequest\x1a\x1a.notification.Notification\"\x00\x12q\n\x1d\x43reatePostCommentNotification\x12\x32.notification.CreatePostCommentNotificationRequest\x1a\x1a.notification.Notification\"\x00\x12q\n\x1d\x43reateCommentLikeNotification\x12\x32.notification.CreateCommentLikeNotificationRequest\x1a\x1a.notification.Notification\"\x00\x12s\n\x1e\x43reateCommentReplyNotification\x12\x33.notification.CreateCommentReplyNotificationRequest\x1a\x1a.notification.Notification\"\x00\x12s\n\x1e\x43reateTrendingPostNotification\x12\x33.notification.CreateTrendingPostNotificationRequest\x1a\x1a.notification.Notification\"\x00\x12l\n\x13NotifyTrendingPosts\x12(.notification.NotifyTrendingPostsRequest\x1a).notification.NotifyTrendingPostsResponse\"\x00\x12{\n\x18NotifyTrendingPostsBatch\x12-.notification.NotifyTrendingPostsBatchRequest\x1a..notification.NotifyTrendingPostsBatchResponse\"\x00\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -65,10 +65,16 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_NOTIFYTRENDINGPOSTSREQUEST']._serialized_end=1521
   _globals['_NOTIFYTRENDINGPOSTSRESPONSE']._serialized_start=1523
   _globals['_NOTIFYTRENDINGPOSTSRESPONSE']._serialized_end=1627
-  _globals['_NOTIFICATION']._serialized_start=1630
-  _globals['_NOTIFICATION']._serialized_end=1798
-  _globals['_LOCATIONSUBSCRIPTION']._serialized_start=1801
-  _globals['_LOCATIONSUBSCRIPTION']._serialized_end=1947
-  _globals['_NOTIFICATIONSERVICE']._serialized_start=1950
-  _globals['_NOTIFICATIONSERVICE']._serialized_end=3231
+  _globals['_TRENDINGPOSTENTRY']._serialized_start=1629
+  _globals['_TRENDINGPOSTENTRY']._serialized_end=1739
+  _globals['_NOTIFYTRENDINGPOSTSBATCHREQUEST']._serialized_start=1741
+  _globals['_NOTIFYTRENDINGPOSTSBATCHREQUEST']._serialized_end=1841
+  _globals['_NOTIFYTRENDINGPOSTSBATCHRESPONSE']._serialized_start=1843
+  _globals['_NOTIFYTRENDINGPOSTSBATCHRESPONSE']._serialized_end=1953
+  _globals['_NOTIFICATION']._serialized_start=1956
+  _globals['_NOTIFICATION']._serialized_end=2124
+  _globals['_LOCATIONSUBSCRIPTION']._serialized_start=2127
+  _globals['_LOCATIONSUBSCRIPTION']._serialized_end=2273
+  _globals['_NOTIFICATIONSERVICE']._serialized_start=2276
+  _globals['_NOTIFICATIONSERVICE']._serialized_end=3682
 # @@protoc_insertion_point(module_scope)
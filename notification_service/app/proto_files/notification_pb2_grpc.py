@@ -89,6 +89,11 @@ class NotificationServiceStub(object):
                 request_serializer=notification__pb2.NotifyTrendingPostsRequest.SerializeToString,
                 response_deserializer=notification__pb2.NotifyTrendingPostsResponse.FromString,
                 _registered_method=True)
+        self.NotifyTrendingPostsBatch = channel.unary_unary(
+                '/notification.NotificationService/NotifyTrendingPostsBatch',
+                request_serializer=notification__pb2.NotifyTrendingPostsBatchRequest.SerializeToString,
+                response_deserializer=notification__pb2.NotifyTrendingPostsBatchResponse.FromString,
+                _registered_method=True)
 
 
 class NotificationServiceServicer(object):
@@ -171,6 +176,13 @@ class NotificationServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def NotifyTrendingPostsBatch(self, request, context):
+        """Notify users near each of many posts that just entered the trending top K, at most once per user and post
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_NotificationServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -229,6 +241,11 @@ def add_NotificationServiceServicer_to_server(servicer, server):
                     request_deserializer=notification__pb2.NotifyTrendingPostsRequest.FromString,
                     response_serializer=notification__pb2.NotifyTrendingPostsResponse.SerializeToString,
             ),
+            'NotifyTrendingPostsBatch': grpc.unary_unary_rpc_method_handler(
+                    servicer.NotifyTrendingPostsBatch,
+                    request_deserializer=notification__pb2.NotifyTrendingPostsBatchRequest.FromString,
+                    response_serializer=notification__pb2.NotifyTrendingPostsBatchResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'notification.NotificationService', rpc_method_handlers)
@@ -536,3 +553,30 @@ class NotificationService(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def NotifyTrendingPostsBatch(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/notification.NotificationService/NotifyTrendingPostsBatch',
+            notification__pb2.NotifyTrendingPostsBatchRequest.SerializeToString,
+            notification__pb2.NotifyTrendingPostsBatchResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
@@ -1,8 +1,9 @@
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 from ..entity.notification import Notification, LocationSubscription
-from typing import List, Optional, Tuple
-from sqlalchemy import func
+from typing import List, Optional, Set, Tuple
+from sqlalchemy import func, text
+from sqlalchemy.dialects.postgresql import insert
 import json
 import math
 import logging
@@ -11,6 +12,9 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Rows per multi-row INSERT when creating notifications in bulk
+INSERT_CHUNK_ROWS = 1000
+
 class NotificationRepository:
     def __init__(self, db: Session):
         self.db = db
@@ -142,4 +146,56 @@ class NotificationRepository:
                          .all()
         except SQLAlchemyError as e:
             logger.error(f"Error getting subscribers near location: {str(e)}")
-            raise 
\ No newline at end of file
+            raise 
+
+    def get_trending_notified(self, post_ids: List[int], user_ids: List[int]) -> Set[Tuple[int, int]]:
+        """(user_id, post_id) pairs among these users and posts that already have a trending notification"""
+        if not post_ids or not user_ids:
+            return set()
+        try:
+            rows = self.db.query(Notification.user_id, Notification.entity_id)\
+                         .filter(
+                             Notification.type == "trending_post",
+                             Notification.user_id.in_(user_ids),
+                             Notification.entity_id.in_(post_ids)
+                         )\
+                         .all()
+            return {(row.user_id, row.entity_id) for row in rows}
+        except SQLAlchemyError as e:
+            logger.error(f"Error getting trending notifications: {str(e)}")
+            raise
+
+    def get_trending_notification(self, user_id: int, post_id: int) -> Optional[Notification]:
+        try:
+            return self.db.query(Notification).filter(
+                Notification.type == "trending_post",
+                Notification.user_id == user_id,
+                Notification.entity_id == post_id
+            ).first()
+        except SQLAlchemyError as e:
+            logger.error(f"Error getting trending notification: {str(e)}")
+            raise
+
+    def create_trending_notifications(self, notifications: List[dict]) -> list:
+        """Insert trending notifications with multi-row INSERTs in one transaction, skipping
+        any user already notified about the post. Returns the rows actually inserted."""
+        if not notifications:
+            return []
+        try:
+            created = []
+            for start in range(0, len(notifications), INSERT_CHUNK_ROWS):
+                rows = [
+                    dict(row, type="trending_post", context=json.dumps(row["context"]) if row.get("context") else None)
+                    for row in notifications[start:start + INSERT_CHUNK_ROWS]
+                ]
+                statement = insert(Notification).values(rows).on_conflict_do_nothing(
+                    index_elements=["user_id", "entity_id"],
+                    index_where=text("type = 'trending_post'")
+                ).returning(*Notification.__table__.columns)
+                created.extend(self.db.execute(statement).all())
+            self.db.commit()
+            return created
+        except SQLAlchemyError as e:
+            logger.error(f"Error creating trending notifications: {str(e)}")
+            self.db.rollback()
+            raise
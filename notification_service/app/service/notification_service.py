@@ -5,7 +5,7 @@ import sys
 from sqlalchemy.orm import Session
 from ..repository.notification_repository import NotificationRepository
 from ..entity.notification import Notification, LocationSubscription
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set, Tuple
 from datetime import datetime
 import json
 
@@ -33,7 +33,8 @@ from app.proto_files.notification_pb2 import (
     CreateCommentReplyNotificationRequest,
     CreateTrendingPostNotificationRequest,
     NotifyTrendingPostsRequest,
-    NotifyTrendingPostsResponse
+    NotifyTrendingPostsResponse,
+    NotifyTrendingPostsBatchResponse
 )
 from app.proto_files import notification_pb2_grpc
 
@@ -145,30 +146,70 @@ class NotificationService:
 
     def notify_trending_post(self, post_id: int, latitude: float, longitude: float, radius_km: float, location_name: str) -> List[Notification]:
         """Create notifications for users subscribed to a location about a trending post."""
-        subscribers = self.repository.get_subscribers_near_location(
-            latitude=latitude,
-            longitude=longitude,
-            radius_km=radius_km
-        )
-        
-        notifications = []
-        for subscriber in subscribers:
-            notification = self.create_notification(
-                user_id=subscriber.user_id,
-                type="trending_post",
-                message=f"A post is trending in {location_name}",
-                entity_id=post_id,
-                entity_type="post",
-                context={
-                    "latitude": latitude,
-                    "longitude": longitude,
-                    "location_name": location_name
-                }
-            )
-            notifications.append(notification)
-        
+        notifications, _ = self.notify_trending_posts([{
+            "post_id": post_id,
+            "latitude": latitude,
+            "longitude": longitude,
+            "location_name": location_name
+        }], radius_km)
         return notifications
 
+    def notify_trending_posts(self, posts: List[Dict[str, Any]], radius_km: float) -> Tuple[list, int]:
+        """Notify the users subscribed near each post, once per user and post however many of
+        their subscriptions match or how often the post re-enters the top K. Subscribers are
+        resolved per post, checked against a per-user seen-set that starts from the
+        notifications already sent, and written with multi-row inserts.
+        Returns the notifications created and the number of duplicates skipped."""
+        candidates = []
+        for post in posts:
+            subscribers = self.repository.get_subscribers_near_location(
+                latitude=post["latitude"],
+                longitude=post["longitude"],
+                radius_km=radius_km
+            )
+            candidates.extend((post, subscriber.user_id) for subscriber in subscribers)
+        if not candidates:
+            return [], 0
+
+        seen: Dict[int, Set[int]] = {}  # user_id -> post_ids notified, or queued below
+        for user_id, post_id in self.repository.get_trending_notified(
+                list({post["post_id"] for post in posts}), list({user_id for _, user_id in candidates})):
+            seen.setdefault(user_id, set()).add(post_id)
+
+        rows = []
+        skipped = 0
+        for post, user_id in candidates:
+            notified = seen.setdefault(user_id, set())
+            if post["post_id"] in notified:
+                skipped += 1
+                continue
+            notified.add(post["post_id"])
+            rows.append(self._trending_notification(post, user_id))
+        created = self.repository.create_trending_notifications(rows)
+        # Rows another caller inserted first are skipped by the insert too
+        return created, skipped + len(rows) - len(created)
+
+    def notify_trending_post_user(self, post_id: int, user_id: int, location_name: str) -> Notification:
+        """Notify one user about a trending post, or return the notification they already have"""
+        created = self.repository.create_trending_notifications([
+            self._trending_notification({"post_id": post_id, "location_name": location_name}, user_id)
+        ])
+        return created[0] if created else self.repository.get_trending_notification(user_id, post_id)
+
+    def _trending_notification(self, post: Dict[str, Any], user_id: int) -> Dict[str, Any]:
+        location_name = post.get("location_name")
+        context = {key: post[key] for key in ("latitude", "longitude") if post.get(key) is not None}
+        context.update({key: post[key] for key in ("location_name", "rank") if post.get(key)})
+        return {
+            "user_id": user_id,
+            "message": f"A post is trending in {location_name}" if location_name else "A post is trending near you",
+            "entity_id": post["post_id"],
+            "entity_type": "post",
+            "is_read": False,
+            "created_at": datetime.utcnow(),
+            "context": context
+        }
+
 class NotificationServiceServicer(notification_pb2_grpc.NotificationServiceServicer):
     def __init__(self, db: Session):
         self.service = NotificationService(NotificationRepository(db))
@@ -338,13 +379,10 @@ class NotificationServiceServicer(notification_pb2_grpc.NotificationServiceServi
 
     def CreateTrendingPostNotification(self, request, context):
         try:
-            notification = self.service.create_notification(
-                request.user_id,
-                "trending_post",
-                f"A post is trending in {request.location_name}",
+            notification = self.service.notify_trending_post_user(
                 request.post_id,
-                "post",
-                {"location_name": request.location_name}
+                request.user_id,
+                request.location_name
             )
             
             return self._notification_to_proto(notification)
@@ -374,6 +412,32 @@ class NotificationServiceServicer(notification_pb2_grpc.NotificationServiceServi
             context.set_details(str(e))
             return NotifyTrendingPostsResponse()
 
+    def NotifyTrendingPostsBatch(self, request, context):
+        try:
+            notifications, skipped = self.service.notify_trending_posts(
+                [
+                    {
+                        "post_id": post.post_id,
+                        "latitude": post.latitude,
+                        "longitude": post.longitude,
+                        "rank": post.rank,
+                        "location_name": post.location_name
+                    }
+                    for post in request.posts
+                ],
+                request.radius_km
+            )
+
+            return NotifyTrendingPostsBatchResponse(
+                total_notified=len(notifications),
+                posts_notified=len({n.entity_id for n in notifications}),
+                duplicates_skipped=skipped
+            )
+        except Exception as e:
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(str(e))
+            return NotifyTrendingPostsBatchResponse()
+
     def _notification_to_proto(self, notification: Notification) -> ProtoNotification:
         """Helper method to convert Notification model to Proto message."""
         context_str = notification.context if isinstance(notification.context, str) else json.dumps(notification.context) if notification.context else ""
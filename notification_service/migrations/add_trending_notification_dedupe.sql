@@ -0,0 +1,15 @@
+-- A user is notified about a trending post at most once: trending inserts
+-- (NotifyTrendingPostsBatch and friends) skip rows that conflict with this
+-- index. New databases get it from the Notification entity.
+
+-- Keep the oldest of any trending notifications already sent twice
+DELETE FROM notifications n
+USING notifications older
+WHERE n.type = 'trending_post'
+  AND older.type = 'trending_post'
+  AND older.user_id = n.user_id
+  AND older.entity_id = n.entity_id
+  AND older.id < n.id;
+
+CREATE UNIQUE INDEX IF NOT EXISTS uq_notifications_trending_user_post
+    ON notifications(user_id, entity_id) WHERE type = 'trending_post';
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, BigInteger, String, TIMESTAMP, ForeignKey
+from sqlalchemy import Column, BigInteger, String, TIMESTAMP, ForeignKey, Integer
 from sqlalchemy.orm import relationship, backref
 from ..utils.db_connection import Base
 from datetime import datetime
@@ -15,6 +15,9 @@ class Comment(Base):
     status = Column(String(20), default='active')
     added_at = Column(TIMESTAMP, default=datetime.utcnow)
     commented_at = Column(TIMESTAMP, default=datetime.utcnow)
+    like_count = Column(Integer, nullable=False, default=0, server_default='0')  # Maintained by like_comment/unlike_comment
+    reply_count = Column(Integer, nullable=False, default=0, server_default='0')  # Direct replies; maintained by create_comment/delete_comment
+    descendant_count = Column(Integer, nullable=False, default=0, server_default='0')  # Whole subtree, excluding this comment
 
     # Relationships
     user = relationship("User", back_populates="comments")
@@ -1,5 +1,6 @@
-from sqlalchemy import Column, BigInteger, String, TIMESTAMP, ForeignKey, Text, Numeric, Integer
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, BigInteger, String, TIMESTAMP, ForeignKey, Text, Numeric, Integer, UniqueConstraint, Computed
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import relationship, deferred
 from datetime import datetime
 from ..utils.db_connection import Base
 from .comment_entity import Comment
@@ -18,6 +19,15 @@ class Post(Base):
     price = Column(Numeric(15,2))
     status = Column(String(20))
     created_at = Column(TIMESTAMP, default=datetime.utcnow)
+    like_count = Column(Integer, nullable=False, default=0, server_default='0')  # Maintained by like_post/unlike_post
+    deleted_at = Column(TIMESTAMP, nullable=True)  # Soft delete; PostPurger removes the row and its children later
+    # Full-text search document (see migrations/add_post_search.sql); weights rank title > content > location
+    search_vector = deferred(Column(TSVECTOR, Computed(
+        "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(content, '')), 'B') || "
+        "setweight(to_tsvector('simple', coalesce(location, '')), 'C')",
+        persisted=True
+    )))
 
     # Relationships
     user = relationship("User", back_populates="posts")
@@ -42,6 +52,9 @@ class PostMedia(Base):
 
 class PostLike(Base):
     __tablename__ = "post_likes"
+    __table_args__ = (
+        UniqueConstraint('post_id', 'user_id', name='uq_post_likes_post_user'),
+    )
 
     id = Column(BigInteger, primary_key=True)
     post_id = Column(BigInteger, ForeignKey('posts.id', ondelete='CASCADE'), nullable=False)
@@ -55,6 +68,9 @@ class PostLike(Base):
 
 class CommentLike(Base):
     __tablename__ = "post_comment_likes"
+    __table_args__ = (
+        UniqueConstraint('comment_id', 'user_id', name='uq_post_comment_likes_comment_user'),
+    )
 
     id = Column(BigInteger, primary_key=True)
     comment_id = Column(BigInteger, ForeignKey('comments.id', ondelete='CASCADE'), nullable=False)
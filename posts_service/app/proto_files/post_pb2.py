@@ -22,57 +22,68 @@ _runtime_version.ValidateProtobufRuntimeVersion(
 _sym_db = _symbol_database.Default()
 
 
+from google.protobuf import field_mask_pb2 as google_dot_protobuf_dot_field__mask__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\npost.proto\x12\x05posts\"\xa3\x03\n\x04Post\x12\n\n\x02id\x18\x01 \x01(\x03\x12\x0f\n\x07user_id\x18\x02 \x01(\x03\x12\x17\n\x0fuser_first_name\x18\x03 \x01(\t\x12\x16\n\x0euser_last_name\x18\x04 \x01(\t\x12\x12\n\nuser_email\x18\x05 \x01(\t\x12\x12\n\nuser_phone\x18\x06 \x01(\t\x12\x11\n\tuser_role\x18\x07 \x01(\t\x12\x0f\n\x07\x63ontent\x18\x08 \x01(\t\x12\r\n\x05title\x18\t \x01(\t\x12\x12\n\nvisibility\x18\n \x01(\t\x12\x15\n\rproperty_type\x18\x0b \x01(\t\x12\x10\n\x08location\x18\x0c \x01(\t\x12\x14\n\x0cmap_location\x18\r \x01(\t\x12\r\n\x05price\x18\x0e \x01(\x01\x12\x0e\n\x06status\x18\x0f \x01(\t\x12\x12\n\ncreated_at\x18\x10 \x01(\x03\x12\x1f\n\x05media\x18\x11 \x03(\x0b\x32\x10.posts.PostMedia\x12 \n\x08\x63omments\x18\x12 \x03(\x0b\x32\x0e.posts.Comment\x12\x12\n\nlike_count\x18\x13 \x01(\x05\x12\x15\n\rcomment_count\x18\x14 \x01(\x05\"\x9e\x01\n\tPostMedia\x12\n\n\x02id\x18\x01 \x01(\x03\x12\x0f\n\x07post_id\x18\x02 \x01(\x03\x12\x12\n\nmedia_type\x18\x03 \x01(\t\x12\x11\n\tmedia_url\x18\x04 \x01(\t\x12\x13\n\x0bmedia_order\x18\x05 \x01(\x05\x12\x12\n\nmedia_size\x18\x06 \x01(\x03\x12\x0f\n\x07\x63\x61ption\x18\x07 \x01(\t\x12\x13\n\x0buploaded_at\x18\x08 \x01(\x03\"\x94\x02\n\x07\x43omment\x12\n\n\x02id\x18\x01 \x01(\x03\x12\x0f\n\x07post_id\x18\x02 \x01(\x03\x12\x19\n\x11parent_comment_id\x18\x03 \x01(\x03\x12\x0f\n\x07\x63omment\x18\x04 \x01(\t\x12\x0f\n\x07user_id\x18\x05 \x01(\x03\x12\x17\n\x0fuser_first_name\x18\x06 \x01(\t\x12\x16\n\x0euser_last_name\x18\x07 \x01(\t\x12\x11\n\tuser_role\x18\x08 \x01(\t\x12\x0e\n\x06status\x18\t \x01(\t\x12\x10\n\x08\x61\x64\x64\x65\x64_at\x18\n \x01(\x03\x12\x14\n\x0c\x63ommented_at\x18\x0b \x01(\x03\x12\x1f\n\x07replies\x18\x0c \x03(\x0b\x32\x0e.posts.Comment\x12\x12\n\nlike_count\x18\r \x01(\x05\"&\n\x08PostList\x12\x1a\n\x05posts\x18\x01 \x03(\x0b\x32\x0b.posts.Post\"\x1e\n\x0bPostRequest\x12\x0f\n\x07post_id\x18\x01 \x01(\x03\"\xdd\x01\n\x11PostCreateRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\x03\x12\r\n\x05title\x18\x02 \x01(\t\x12\x0f\n\x07\x63ontent\x18\x03 \x01(\t\x12\x12\n\nvisibility\x18\x04 \x01(\t\x12\x15\n\rproperty_type\x18\x05 \x01(\t\x12\x10\n\x08location\x18\x06 \x01(\t\x12\x14\n\x0cmap_location\x18\x07 \x01(\t\x12\r\n\x05price\x18\x08 \x01(\x01\x12\x0e\n\x06status\x18\t \x01(\t\x12%\n\x05media\x18\n \x03(\x0b\x32\x16.posts.PostMediaUpload\"_\n\x0fPostMediaUpload\x12\x12\n\nmedia_type\x18\x01 \x01(\t\x12\x12\n\nmedia_data\x18\x02 \x01(\x0c\x12\x13\n\x0bmedia_order\x18\x03 \x01(\x05\x12\x0f\n\x07\x63\x61ption\x18\x04 \x01(\t\"\xb6\x01\n\x11PostUpdateRequest\x12\x0f\n\x07post_id\x18\x01 \x01(\x03\x12\r\n\x05title\x18\x02 \x01(\t\x12\x0f\n\x07\x63ontent\x18\x03 \x01(\t\x12\x12\n\nvisibility\x18\x04 \x01(\t\x12\x15\n\rproperty_type\x18\x05 \x01(\t\x12\x10\n\x08location\x18\x06 \x01(\t\x12\x14\n\x0cmap_location\x18\x07 \x01(\t\x12\r\n\x05price\x18\x08 \x01(\x01\x12\x0e\n\x06status\x18\t \x01(\t\"J\n\x10PostMediaRequest\x12\x0f\n\x07post_id\x18\x01 \x01(\x03\x12%\n\x05media\x18\x02 \x03(\x0b\x32\x16.posts.PostMediaUpload\"F\n\x0bLikeRequest\x12\x0f\n\x07post_id\x18\x01 \x01(\x03\x12\x0f\n\x07user_id\x18\x02 \x01(\x03\x12\x15\n\rreaction_type\x18\x03 \x01(\t\"P\n\x12\x43ommentLikeRequest\x12\x12\n\ncomment_id\x18\x01 \x01(\x03\x12\x0f\n\x07user_id\x18\x02 \x01(\x03\x12\x15\n\rreaction_type\x18\x03 \x01(\t\"d\n\x14\x43ommentCreateRequest\x12\x0f\n\x07post_id\x18\x01 \x01(\x03\x12\x19\n\x11parent_comment_id\x18\x02 \x01(\x03\x12\x0f\n\x07\x63omment\x18\x03 \x01(\t\x12\x0f\n\x07user_id\x18\x04 \x01(\x03\"K\n\x14\x43ommentUpdateRequest\x12\x12\n\ncomment_id\x18\x01 \x01(\x03\x12\x0f\n\x07\x63omment\x18\x02 \x01(\t\x12\x0e\n\x06status\x18\x03 \x01(\t\"B\n\x12GetCommentsRequest\x12\x0f\n\x07post_id\x18\x01 \x01(\x03\x12\x0c\n\x04page\x18\x02 \x01(\x05\x12\r\n\x05limit\x18\x03 \x01(\x05\"E\n\x15GetPostsByUserRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\x03\x12\x0c\n\x04page\x18\x02 \x01(\x05\x12\r\n\x05limit\x18\x03 \x01(\x05\"\x90\x01\n\x12SearchPostsRequest\x12\x15\n\rproperty_type\x18\x01 \x01(\t\x12\x10\n\x08location\x18\x02 \x01(\t\x12\x11\n\tmin_price\x18\x03 \x01(\x01\x12\x11\n\tmax_price\x18\x04 \x01(\x01\x12\x0e\n\x06status\x18\x05 \x01(\t\x12\x0c\n\x04page\x18\x06 \x01(\x05\x12\r\n\x05limit\x18\x07 \x01(\x05\"K\n\x0cPostResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x19\n\x04post\x18\x03 \x01(\x0b\x32\x0b.posts.Post\"\x88\x01\n\x10PostListResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x1a\n\x05posts\x18\x03 \x03(\x0b\x32\x0b.posts.Post\x12\x13\n\x0btotal_count\x18\x04 \x01(\x05\x12\x0c\n\x04page\x18\x05 \x01(\x05\x12\x13\n\x0btotal_pages\x18\x06 \x01(\x05\"\x91\x01\n\x13\x43ommentListResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12 \n\x08\x63omments\x18\x03 \x03(\x0b\x32\x0e.posts.Comment\x12\x13\n\x0btotal_count\x18\x04 \x01(\x05\x12\x0c\n\x04page\x18\x05 \x01(\x05\x12\x13\n\x0btotal_pages\x18\x06 \x01(\x05\"3\n\x0fGenericResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\"T\n\x0f\x43ommentResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x1f\n\x07\x63omment\x18\x03 \x01(\x0b\x32\x0e.posts.Comment2\xa0\x08\n\x0cPostsService\x12=\n\nCreatePost\x12\x18.posts.PostCreateRequest\x1a\x13.posts.PostResponse\"\x00\x12\x34\n\x07GetPost\x12\x12.posts.PostRequest\x1a\x13.posts.PostResponse\"\x00\x12=\n\nUpdatePost\x12\x18.posts.PostUpdateRequest\x1a\x13.posts.PostResponse\"\x00\x12:\n\nDeletePost\x12\x12.posts.PostRequest\x1a\x16.posts.GenericResponse\"\x00\x12I\n\x0eGetPostsByUser\x12\x1c.posts.GetPostsByUserRequest\x1a\x17.posts.PostListResponse\"\x00\x12\x43\n\x0bSearchPosts\x12\x19.posts.SearchPostsRequest\x1a\x17.posts.PostListResponse\"\x00\x12>\n\x0c\x41\x64\x64PostMedia\x12\x17.posts.PostMediaRequest\x1a\x13.posts.PostResponse\"\x00\x12?\n\x0f\x44\x65letePostMedia\x12\x12.posts.PostRequest\x1a\x16.posts.GenericResponse\"\x00\x12\x35\n\x08LikePost\x12\x12.posts.LikeRequest\x1a\x13.posts.PostResponse\"\x00\x12\x37\n\nUnlikePost\x12\x12.posts.LikeRequest\x1a\x13.posts.PostResponse\"\x00\x12\x46\n\rCreateComment\x12\x1b.posts.CommentCreateRequest\x1a\x16.posts.CommentResponse\"\x00\x12\x46\n\rUpdateComment\x12\x1b.posts.CommentUpdateRequest\x1a\x16.posts.CommentResponse\"\x00\x12=\n\rDeleteComment\x12\x12.posts.PostRequest\x1a\x16.posts.GenericResponse\"\x00\x12\x46\n\x0bGetComments\x12\x19.posts.GetCommentsRequest\x1a\x1a.posts.CommentListResponse\"\x00\x12\x42\n\x0bLikeComment\x12\x19.posts.CommentLikeRequest\x1a\x16.posts.CommentResponse\"\x00\x12\x44\n\rUnlikeComment\x12\x19.posts.CommentLikeRequest\x1a\x16.posts.CommentResponse\"\x00\x62\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\npost.proto\x12\x05posts\x1a google/protobuf/field_mask.proto\"\xd1\x03\n\x04Post\x12\n\n\x02id\x18\x01 \x01(\x03\x12\x0f\n\x07user_id\x18\x02 \x01(\x03\x12\x17\n\x0fuser_first_name\x18\x03 \x01(\t\x12\x16\n\x0euser_last_name\x18\x04 \x01(\t\x12\x12\n\nuser_email\x18\x05 \x01(\t\x12\x12\n\nuser_phone\x18\x06 \x01(\t\x12\x11\n\tuser_role\x18\x07 \x01(\t\x12\x0f\n\x07\x63ontent\x18\x08 \x01(\t\x12\r\n\x05title\x18\t \x01(\t\x12\x12\n\nvisibility\x18\n \x01(\t\x12\x15\n\rproperty_type\x18\x0b \x01(\t\x12\x10\n\x08location\x18\x0c \x01(\t\x12\x14\n\x0cmap_location\x18\r \x01(\t\x12\r\n\x05price\x18\x0e \x01(\x01\x12\x0e\n\x06status\x18\x0f \x01(\t\x12\x12\n\ncreated_at\x18\x10 \x01(\x03\x12\x1f\n\x05media\x18\x11 \x03(\x0b\x32\x10.posts.PostMedia\x12 \n\x08\x63omments\x18\x12 \x03(\x0b\x32\x0e.posts.Comment\x12\x12\n\nlike_count\x18\x13 \x01(\x05\x12\x15\n\rcomment_count\x18\x14 \x01(\x05\x12\x17\n\x0fsearch_headline\x18\x15 \x01(\t\x12\x13\n\x0bsearch_rank\x18\x16 \x01(\x02\"\xd9\x01\n\x0bPostSummary\x12\n\n\x02id\x18\x01 \x01(\x03\x12\x0f\n\x07user_id\x18\x02 \x01(\x03\x12\r\n\x05title\x18\x03 \x01(\t\x12\r\n\x05price\x18\x04 \x01(\x01\x12\x10\n\x08location\x18\x05 \x01(\t\x12\x15\n\rproperty_type\x18\x06 \x01(\t\x12\x0e\n\x06status\x18\x07 \x01(\t\x12\x17\n\x0f\x66irst_media_url\x18\x08 \x01(\t\x12\x12\n\nlike_count\x18\t \x01(\x05\x12\x15\n\rcomment_count\x18\n \x01(\x05\x12\x12\n\ncreated_at\x18\x0b \x01(\x03\"\x9e\x01\n\tPostMedia\x12\n\n\x02id\x18\x01 \x01(\x03\x12\x0f\n\x07post_id\x18\x02 \x01(\x03\x12\x12\n\nmedia_type\x18\x03 \x01(\t\x12\x11\n\tmedia_url\x18\x04 \x01(\t\x12\x13\n\x0bmedia_order\x18\x05 \x01(\x05\x12\x12\n\nmedia_size\x18\x06 \x01(\x03\x12\x0f\n\x07\x63\x61ption\x18\x07 \x01(\t\x12\x13\n\x0buploaded_at\x18\x08 \x01(\x03\"\xc3\x02\n\x07\x43omment\x12\n\n\x02id\x18\x01 \x01(\x03\x12\x0f\n\x07post_id\x18\x02 \x01(\x03\x12\x19\n\x11parent_comment_id\x18\x03 \x01(\x03\x12\x0f\n\x07\x63omment\x18\x04 \x01(\t\x12\x0f\n\x07user_id\x18\x05 \x01(\x03\x12\x17\n\x0fuser_first_name\x18\x06 \x01(\t\x12\x16\n\x0euser_last_name\x18\x07 \x01(\t\x12\x11\n\tuser_role\x18\x08 \x01(\t\x12\x0e\n\x06status\x18\t \x01(\t\x12\x10\n\x08\x61\x64\x64\x65\x64_at\x18\n \x01(\x03\x12\x14\n\x0c\x63ommented_at\x18\x0b \x01(\x03\x12\x1f\n\x07replies\x18\x0c \x03(\x0b\x32\x0e.posts.Comment\x12\x12\n\nlike_count\x18\r \x01(\x05\x12\x13\n\x0breply_count\x18\x0e \x01(\x05\x12\x18\n\x10\x64\x65scendant_count\x18\x0f \x01(\x05\"&\n\x08PostList\x12\x1a\n\x05posts\x18\x01 \x03(\x0b\x32\x0b.posts.Post\"\x1e\n\x0bPostRequest\x12\x0f\n\x07post_id\x18\x01 \x01(\x03\"X\n\x14\x42\x61tchGetPostsRequest\x12\x10\n\x08post_ids\x18\x01 \x03(\x03\x12.\n\nfield_mask\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.FieldMask\"+\n\x17GetPostSummariesRequest\x12\x10\n\x08post_ids\x18\x01 \x03(\x03\"\xdd\x01\n\x11PostCreateRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\x03\x12\r\n\x05title\x18\x02 \x01(\t\x12\x0f\n\x07\x63ontent\x18\x03 \x01(\t\x12\x12\n\nvisibility\x18\x04 \x01(\t\x12\x15\n\rproperty_type\x18\x05 \x01(\t\x12\x10\n\x08location\x18\x06 \x01(\t\x12\x14\n\x0cmap_location\x18\x07 \x01(\t\x12\r\n\x05price\x18\x08 \x01(\x01\x12\x0e\n\x06status\x18\t \x01(\t\x12%\n\x05media\x18\n \x03(\x0b\x32\x16.posts.PostMediaUpload\"_\n\x0fPostMediaUpload\x12\x12\n\nmedia_type\x18\x01 \x01(\t\x12\x12\n\nmedia_data\x18\x02 \x01(\x0c\x12\x13\n\x0bmedia_order\x18\x03 \x01(\x05\x12\x0f\n\x07\x63\x61ption\x18\x04 \x01(\t\"\xb6\x01\n\x11PostUpdateRequest\x12\x0f\n\x07post_id\x18\x01 \x01(\x03\x12\r\n\x05title\x18\x02 \x01(\t\x12\x0f\n\x07\x63ontent\x18\x03 \x01(\t\x12\x12\n\nvisibility\x18\x04 \x01(\t\x12\x15\n\rproperty_type\x18\x05 \x01(\t\x12\x10\n\x08location\x18\x06 \x01(\t\x12\x14\n\x0cmap_location\x18\x07 \x01(\t\x12\r\n\x05price\x18\x08 \x01(\x01\x12\x0e\n\x06status\x18\t \x01(\t\"J\n\x10PostMediaRequest\x12\x0f\n\x07post_id\x18\x01 \x01(\x03\x12%\n\x05media\x18\x02 \x03(\x0b\x32\x16.posts.PostMediaUpload\"F\n\x0bLikeRequest\x12\x0f\n\x07post_id\x18\x01 \x01(\x03\x12\x0f\n\x07user_id\x18\x02 \x01(\x03\x12\x15\n\rreaction_type\x18\x03 \x01(\t\"P\n\x12\x43ommentLikeRequest\x12\x12\n\ncomment_id\x18\x01 \x01(\x03\x12\x0f\n\x07user_id\x18\x02 \x01(\x03\x12\x15\n\rreaction_type\x18\x03 \x01(\t\"d\n\x14\x43ommentCreateRequest\x12\x0f\n\x07post_id\x18\x01 \x01(\x03\x12\x19\n\x11parent_comment_id\x18\x02 \x01(\x03\x12\x0f\n\x07\x63omment\x18\x03 \x01(\t\x12\x0f\n\x07user_id\x18\x04 \x01(\x03\"K\n\x14\x43ommentUpdateRequest\x12\x12\n\ncomment_id\x18\x01 \x01(\x03\x12\x0f\n\x07\x63omment\x18\x02 \x01(\t\x12\x0e\n\x06status\x18\x03 \x01(\t\"[\n\x12GetCommentsRequest\x12\x0f\n\x07post_id\x18\x01 \x01(\x03\x12\x0c\n\x04page\x18\x02 \x01(\x05\x12\r\n\x05limit\x18\x03 \x01(\x05\x12\x17\n\x0finclude_replies\x18\x04 \x01(\x08\"E\n\x15GetPostsByUserRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\x03\x12\x0c\n\x04page\x18\x02 \x01(\x05\x12\r\n\x05limit\x18\x03 \x01(\x05\"\x9f\x01\n\x12SearchPostsRequest\x12\x15\n\rproperty_type\x18\x01 \x01(\t\x12\x10\n\x08location\x18\x02 \x01(\t\x12\x11\n\tmin_price\x18\x03 \x01(\x01\x12\x11\n\tmax_price\x18\x04 \x01(\x01\x12\x0e\n\x06status\x18\x05 \x01(\t\x12\x0c\n\x04page\x18\x06 \x01(\x05\x12\r\n\x05limit\x18\x07 \x01(\x05\x12\r\n\x05query\x18\x08 \x01(\t\"K\n\x0cPostResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x19\n\x04post\x18\x03 \x01(\x0b\x32\x0b.posts.Post\"\x88\x01\n\x10PostListResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x1a\n\x05posts\x18\x03 \x03(\x0b\x32\x0b.posts.Post\x12\x13\n\x0btotal_count\x18\x04 \x01(\x05\x12\x0c\n\x04page\x18\x05 \x01(\x05\x12\x13\n\x0btotal_pages\x18\x06 \x01(\x05\"U\n\x15\x42\x61tchGetPostsResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x1a\n\x05posts\x18\x03 \x03(\x0b\x32\x0b.posts.Post\"b\n\x17PostSummaryListResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12%\n\tsummaries\x18\x03 \x03(\x0b\x32\x12.posts.PostSummary\"\x91\x01\n\x13\x43ommentListResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12 \n\x08\x63omments\x18\x03 \x03(\x0b\x32\x0e.posts.Comment\x12\x13\n\x0btotal_count\x18\x04 \x01(\x05\x12\x0c\n\x04page\x18\x05 \x01(\x05\x12\x13\n\x0btotal_pages\x18\x06 \x01(\x05\"3\n\x0fGenericResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\"T\n\x0f\x43ommentResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x1f\n\x07\x63omment\x18\x03 \x01(\x0b\x32\x0e.posts.Comment2\xc4\t\n\x0cPostsService\x12=\n\nCreatePost\x12\x18.posts.PostCreateRequest\x1a\x13.posts.PostResponse\"\x00\x12\x34\n\x07GetPost\x12\x12.posts.PostRequest\x1a\x13.posts.PostResponse\"\x00\x12=\n\nUpdatePost\x12\x18.posts.PostUpdateRequest\x1a\x13.posts.PostResponse\"\x00\x12:\n\nDeletePost\x12\x12.posts.PostRequest\x1a\x16.posts.GenericResponse\"\x00\x12I\n\x0eGetPostsByUser\x12\x1c.posts.GetPostsByUserRequest\x1a\x17.posts.PostListResponse\"\x00\x12\x43\n\x0bSearchPosts\x12\x19.posts.SearchPostsRequest\x1a\x17.posts.PostListResponse\"\x00\x12L\n\rBatchGetPosts\x12\x1b.posts.BatchGetPostsRequest\x1a\x1c.posts.BatchGetPostsResponse\"\x00\x12T\n\x10GetPostSummaries\x12\x1e.posts.GetPostSummariesRequest\x1a\x1e.posts.PostSummaryListResponse\"\x00\x12>\n\x0c\x41\x64\x64PostMedia\x12\x17.posts.PostMediaRequest\x1a\x13.posts.PostResponse\"\x00\x12?\n\x0f\x44\x65letePostMedia\x12\x12.posts.PostRequest\x1a\x16.posts.GenericResponse\"\x00\x12\x35\n\x08LikePost\x12\x12.posts.LikeRequest\x1a\x13.posts.PostResponse\"\x00\x12\x37\n\nUnlikePost\x12\x12.posts.LikeRequest\x1a\x13.posts.PostResponse\"\x00\x12\x46\n\rCreateComment\x12\x1b.posts.CommentCreateRequest\x1a\x16.posts.CommentResponse\"\x00\x12\x46\n\rUpdateComment\x12\x1b.posts.CommentUpdateRequest\x1a\x16.posts.CommentResponse\"\x00\x12=\n\rDeleteComment\x12\x12.posts.PostRequest\x1a\x16.posts.GenericResponse\"\x00\x12\x46\n\x0bGetComments\x12\x19.posts.GetCommentsRequest\x1a\x1a.posts.CommentListResponse\"\x00\x12\x42\n\x0bLikeComment\x12\x19.posts.CommentLikeRequest\x1a\x16.posts.CommentResponse\"\x00\x12\x44\n\rUnlikeComment\x12\x19.posts.CommentLikeRequest\x1a\x16.posts.CommentResponse\"\x00\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'post_pb2', _globals)
 if not _descriptor._USE_C_DESCRIPTORS:
   DESCRIPTOR._loaded_options = None
-  _globals['_POST']._serialized_start=22
-  _globals['_POST']._serialized_end=441
-  _globals['_POSTMEDIA']._serialized_start=444
-  _globals['_POSTMEDIA']._serialized_end=602
-  _globals['_COMMENT']._serialized_start=605
-  _globals['_COMMENT']._serialized_end=881
-  _globals['_POSTLIST']._serialized_start=883
-  _globals['_POSTLIST']._serialized_end=921
-  _globals['_POSTREQUEST']._serialized_start=923
-  _globals['_POSTREQUEST']._serialized_end=953
-  _globals['_POSTCREATEREQUEST']._serialized_start=956
-  _globals['_POSTCREATEREQUEST']._serialized_end=1177
-  _globals['_POSTMEDIAUPLOAD']._serialized_start=1179
-  _globals['_POSTMEDIAUPLOAD']._serialized_end=1274
-  _globals['_POSTUPDATEREQUEST']._serialized_start=1277
-  _globals['_POSTUPDATEREQUEST']._serialized_end=1459
-  _globals['_POSTMEDIAREQUEST']._serialized_start=1461
-  _globals['_POSTMEDIAREQUEST']._serialized_end=1535
-  _globals['_LIKEREQUEST']._serialized_start=1537
-  _globals['_LIKEREQUEST']._serialized_end=1607
-  _globals['_COMMENTLIKEREQUEST']._serialized_start=1609
-  _globals['_COMMENTLIKEREQUEST']._serialized_end=1689
-  _globals['_COMMENTCREATEREQUEST']._serialized_start=1691
-  _globals['_COMMENTCREATEREQUEST']._serialized_end=1791
-  _globals['_COMMENTUPDATEREQUEST']._serialized_start=1793
-  _globals['_COMMENTUPDATEREQUEST']._serialized_end=1868
-  _globals['_GETCOMMENTSREQUEST']._serialized_start=1870
-  _globals['_GETCOMMENTSREQUEST']._serialized_end=1936
-  _globals['_GETPOSTSBYUSERREQUEST']._serialized_start=1938
-  _globals['_GETPOSTSBYUSERREQUEST']._serialized_end=2007
-  _globals['_SEARCHPOSTSREQUEST']._serialized_start=2010
-  _globals['_SEARCHPOSTSREQUEST']._serialized_end=2154
-  _globals['_POSTRESPONSE']._serialized_start=2156
-  _globals['_POSTRESPONSE']._serialized_end=2231
-  _globals['_POSTLISTRESPONSE']._serialized_start=2234
-  _globals['_POSTLISTRESPONSE']._serialized_end=2370
-  _globals['_COMMENTLISTRESPONSE']._serialized_start=2373
-  _globals['_COMMENTLISTRESPONSE']._serialized_end=2518
-  _globals['_GENERICRESPONSE']._serialized_start=2520
-  _globals['_GENERICRESPONSE']._serialized_end=2571
-  _globals['_COMMENTRESPONSE']._serialized_start=2573
-  _globals['_COMMENTRESPONSE']._serialized_end=2657
-  _globals['_POSTSSERVICE']._serialized_start=2660
-  _globals['_POSTSSERVICE']._serialized_end=3716
+  _globals['_POST']._serialized_start=56
+  _globals['_POST']._serialized_end=521
+  _globals['_POSTSUMMARY']._serialized_start=524
+  _globals['_POSTSUMMARY']._serialized_end=741
+  _globals['_POSTMEDIA']._serialized_start=744
+  _globals['_POSTMEDIA']._serialized_end=902
+  _globals['_COMMENT']._serialized_start=905
+  _globals['_COMMENT']._serialized_end=1228
+  _globals['_POSTLIST']._serialized_start=1230
+  _globals['_POSTLIST']._serialized_end=1268
+  _globals['_POSTREQUEST']._serialized_start=1270
+  _globals['_POSTREQUEST']._serialized_end=1300
+  _globals['_BATCHGETPOSTSREQUEST']._serialized_start=1302
+  _globals['_BATCHGETPOSTSREQUEST']._serialized_end=1390
+  _globals['_GETPOSTSUMMARIESREQUEST']._serialized_start=1392
+  _globals['_GETPOSTSUMMARIESREQUEST']._serialized_end=1435
+  _globals['_POSTCREATEREQUEST']._serialized_start=1438
+  _globals['_POSTCREATEREQUEST']._serialized_end=1659
+  _globals['_POSTMEDIAUPLOAD']._serialized_start=1661
+  _globals['_POSTMEDIAUPLOAD']._serialized_end=1756
+  _globals['_POSTUPDATEREQUEST']._serialized_start=1759
+  _globals['_POSTUPDATEREQUEST']._serialized_end=1941
+  _globals['_POSTMEDIAREQUEST']._serialized_start=1943
+  _globals['_POSTMEDIAREQUEST']._serialized_end=2017
+  _globals['_LIKEREQUEST']._serialized_start=2019
+  _globals['_LIKEREQUEST']._serialized_end=2089
+  _globals['_COMMENTLIKEREQUEST']._serialized_start=2091
+  _globals['_COMMENTLIKEREQUEST']._serialized_end=2171
+  _globals['_COMMENTCREATEREQUEST']._serialized_start=2173
+  _globals['_COMMENTCREATEREQUEST']._serialized_end=2273
+  _globals['_COMMENTUPDATEREQUEST']._serialized_start=2275
+  _globals['_COMMENTUPDATEREQUEST']._serialized_end=2350
+  _globals['_GETCOMMENTSREQUEST']._serialized_start=2352
+  _globals['_GETCOMMENTSREQUEST']._serialized_end=2443
+  _globals['_GETPOSTSBYUSERREQUEST']._serialized_start=2445
+  _globals['_GETPOSTSBYUSERREQUEST']._serialized_end=2514
+  _globals['_SEARCHPOSTSREQUEST']._serialized_start=2517
+  _globals['_SEARCHPOSTSREQUEST']._serialized_end=2676
+  _globals['_POSTRESPONSE']._serialized_start=2678
+  _globals['_POSTRESPONSE']._serialized_end=2753
+  _globals['_POSTLISTRESPONSE']._serialized_start=2756
+  _globals['_POSTLISTRESPONSE']._serialized_end=2892
+  _globals['_BATCHGETPOSTSRESPONSE']._serialized_start=2894
+  _globals['_BATCHGETPOSTSRESPONSE']._serialized_end=2979
+  _globals['_POSTSUMMARYLISTRESPONSE']._serialized_start=2981
+  _globals['_POSTSUMMARYLISTRESPONSE']._serialized_end=3079
+  _globals['_COMMENTLISTRESPONSE']._serialized_start=3082
+  _globals['_COMMENTLISTRESPONSE']._serialized_end=3227
+  _globals['_GENERICRESPONSE']._serialized_start=3229
+  _globals['_GENERICRESPONSE']._serialized_end=3280
+  _globals['_COMMENTRESPONSE']._serialized_start=3282
+  _globals['_COMMENTRESPONSE']._serialized_end=3366
+  _globals['_POSTSSERVICE']._serialized_start=3369
+  _globals['_POSTSSERVICE']._serialized_end=4589
 # @@protoc_insertion_point(module_scope)
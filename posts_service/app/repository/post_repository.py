@@ -1,13 +1,230 @@
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import desc, func
+from sqlalchemy import desc, func, text, any_, bindparam, BigInteger, Row
+from sqlalchemy.dialects.postgresql import ARRAY
 from datetime import datetime
-from sqlalchemy.exc import SQLAlchemyError
-from ..entity.post_entity import Post, PostMedia, PostLike, CommentLike
+from sqlalchemy.exc import SQLAlchemyError, IntegrityError
+from ..entity.post_entity import Post, PostMedia
 from ..entity.comment_entity import Comment
 from ..entity.user_entity import User
 import sqlalchemy.orm
 
+# Like/unlike run as one statement each: the like row and the denormalized
+# counter change together, and the unique (target, user) constraint makes
+# concurrent double-taps idempotent. Each returns the liked post or comment
+# with its author and new count, so the response needs no reload; the
+# statement's snapshot predates its own update, hence the COALESCE with the
+# updated count. No row at all means the target is missing.
+LIKED_POST_SELECT = """
+    SELECT p.id, p.user_id, p.title, p.content, p.visibility, p.property_type, p.location,
+           p.map_location, p.price, p.status, p.created_at, COALESCE(upd.like_count, p.like_count) AS like_count,
+           u.first_name AS user_first_name, u.last_name AS user_last_name,
+           u.email AS user_email, u.phone AS user_phone, u.role AS user_role,
+           (SELECT count(*) FROM comments c WHERE c.post_id = p.id) AS comment_count
+    FROM posts p JOIN users u ON u.id = p.user_id LEFT JOIN upd ON upd.id = p.id
+    WHERE p.id = :post_id AND p.deleted_at IS NULL
+"""
+
+LIKE_POST_SQL = text(f"""
+    WITH ins AS (
+        INSERT INTO post_likes (post_id, user_id, reaction_type, liked_at)
+        SELECT id, :user_id, :reaction_type, :liked_at FROM posts WHERE id = :post_id AND deleted_at IS NULL
+        ON CONFLICT (post_id, user_id) DO NOTHING
+        RETURNING post_id
+    ), upd AS (
+        UPDATE posts SET like_count = like_count + 1
+        WHERE id IN (SELECT post_id FROM ins)
+        RETURNING id, like_count
+    )
+    {LIKED_POST_SELECT}
+""")
+
+UNLIKE_POST_SQL = text(f"""
+    WITH del AS (
+        DELETE FROM post_likes WHERE post_id = :post_id AND user_id = :user_id
+        RETURNING post_id
+    ), upd AS (
+        UPDATE posts SET like_count = GREATEST(like_count - 1, 0)
+        WHERE id IN (SELECT post_id FROM del)
+        RETURNING id, like_count
+    )
+    {LIKED_POST_SELECT}
+""")
+
+# Comments are only liked or unliked while their post is not deleted (the
+# "live" CTE)
+LIKED_COMMENT_SELECT = """
+    SELECT c.id, c.post_id, c.user_id, c.parent_comment_id, c.comment, c.status, c.added_at,
+           c.commented_at, COALESCE(upd.like_count, c.like_count) AS like_count,
+           c.reply_count, c.descendant_count,
+           u.first_name AS user_first_name, u.last_name AS user_last_name, u.role AS user_role
+    FROM live c LEFT JOIN users u ON u.id = c.user_id LEFT JOIN upd ON upd.id = c.id
+"""
+
+LIVE_COMMENT_CTE = """live AS (
+        SELECT c.* FROM comments c
+        JOIN posts p ON p.id = c.post_id AND p.deleted_at IS NULL
+        WHERE c.id = :comment_id
+    )"""
+
+LIKE_COMMENT_SQL = text(f"""
+    WITH {LIVE_COMMENT_CTE}, ins AS (
+        INSERT INTO post_comment_likes (comment_id, user_id, reaction_type, liked_at)
+        SELECT id, :user_id, :reaction_type, :liked_at FROM live
+        ON CONFLICT (comment_id, user_id) DO NOTHING
+        RETURNING comment_id
+    ), upd AS (
+        UPDATE comments SET like_count = like_count + 1
+        WHERE id IN (SELECT comment_id FROM ins)
+        RETURNING id, like_count
+    )
+    {LIKED_COMMENT_SELECT}
+""")
+
+UNLIKE_COMMENT_SQL = text(f"""
+    WITH {LIVE_COMMENT_CTE}, del AS (
+        DELETE FROM post_comment_likes
+        WHERE comment_id IN (SELECT id FROM live) AND user_id = :user_id
+        RETURNING comment_id
+    ), upd AS (
+        UPDATE comments SET like_count = GREATEST(like_count - 1, 0)
+        WHERE id IN (SELECT comment_id FROM del)
+        RETURNING id, like_count
+    )
+    {LIKED_COMMENT_SELECT}
+""")
+
+# Batched variant of LIKE_POST_SQL used by the write-behind like buffer.
+# Rows for unknown posts or users are skipped instead of failing the batch.
+BULK_LIKE_POSTS_SQL = text("""
+    WITH batch AS (
+        SELECT * FROM unnest(
+            CAST(:post_ids AS bigint[]), CAST(:user_ids AS bigint[]),
+            CAST(:reaction_types AS varchar[]), CAST(:liked_ats AS timestamp[])
+        ) AS b(post_id, user_id, reaction_type, liked_at)
+    ), ins AS (
+        INSERT INTO post_likes (post_id, user_id, reaction_type, liked_at)
+        SELECT b.post_id, b.user_id, b.reaction_type, b.liked_at
+        FROM batch b
+        JOIN posts p ON p.id = b.post_id AND p.deleted_at IS NULL
+        JOIN users u ON u.id = b.user_id
+        ON CONFLICT (post_id, user_id) DO NOTHING
+        RETURNING post_id
+    ), cnt AS (
+        SELECT post_id, count(*) AS n FROM ins GROUP BY post_id
+    )
+    UPDATE posts SET like_count = posts.like_count + cnt.n
+    FROM cnt WHERE posts.id = cnt.post_id
+    RETURNING posts.id, posts.like_count
+""")
+
+# What the like buffer needs before queueing a like: the stored count,
+# whether the like is already stored and whether the user exists (the
+# buffered insert would skip it). No row means the post is missing.
+POST_LIKE_STATE_SQL = text("""
+    SELECT like_count,
+           EXISTS (SELECT 1 FROM post_likes WHERE post_id = :post_id AND user_id = :user_id) AS liked,
+           EXISTS (SELECT 1 FROM users WHERE id = :user_id) AS user_exists
+    FROM posts WHERE id = :post_id AND deleted_at IS NULL
+""")
+
+# Post creation inserts the post and reads back the author in one statement;
+# no row means the user does not exist. Media go in with one multi-row insert
+# in the same transaction, so a post is never left half-created.
+POST_COLUMNS = """id, user_id, title, content, visibility, property_type, location,
+                  map_location, price, status, created_at, like_count"""
+
+CREATE_POST_SQL = text(f"""
+    WITH ins AS (
+        INSERT INTO posts (user_id, title, content, visibility, property_type, location,
+                           map_location, price, status, created_at)
+        SELECT id, :title, :content, :visibility, :property_type, :location,
+               :map_location, :price, :status, :created_at
+        FROM users WHERE id = :user_id
+        RETURNING {POST_COLUMNS}
+    )
+    SELECT ins.*, u.first_name AS user_first_name, u.last_name AS user_last_name,
+           u.email AS user_email, u.phone AS user_phone, u.role AS user_role,
+           0 AS comment_count
+    FROM ins JOIN users u ON u.id = ins.user_id
+""")
+
+POST_WITH_AUTHOR_SQL = text("""
+    SELECT p.id, p.user_id, p.title, p.content, p.visibility, p.property_type, p.location,
+           p.map_location, p.price, p.status, p.created_at, p.like_count,
+           u.first_name AS user_first_name, u.last_name AS user_last_name,
+           u.email AS user_email, u.phone AS user_phone, u.role AS user_role,
+           (SELECT count(*) FROM comments c WHERE c.post_id = p.id) AS comment_count
+    FROM posts p JOIN users u ON u.id = p.user_id
+    WHERE p.id = :post_id AND p.deleted_at IS NULL
+""")
+
+# Returns the post's existing media (as of the start of the statement) plus the new rows
+INSERT_POST_MEDIA_SQL = text("""
+    WITH ins AS (
+        INSERT INTO post_media (post_id, media_type, media_url, media_order, media_size, caption, uploaded_at)
+        SELECT :post_id, m.media_type, m.media_url, m.media_order, m.media_size, m.caption, :uploaded_at
+        FROM unnest(
+            CAST(:media_types AS varchar[]), CAST(:media_urls AS text[]), CAST(:media_orders AS int[]),
+            CAST(:media_sizes AS bigint[]), CAST(:captions AS text[])
+        ) AS m(media_type, media_url, media_order, media_size, caption)
+        RETURNING id, post_id, media_type, media_url, media_order, media_size, caption, uploaded_at
+    )
+    SELECT id, post_id, media_type, media_url, media_order, media_size, caption, uploaded_at
+    FROM post_media WHERE post_id = :post_id
+    UNION ALL
+    SELECT * FROM ins
+    ORDER BY media_order, id
+""")
+
+# Reply counters: a new or deleted comment shifts descendant_count on every
+# ancestor and reply_count on its direct parent. Ancestors are locked in id
+# order so concurrent replies in the same thread cannot deadlock.
+ADJUST_COMMENT_ANCESTORS_SQL = text("""
+    WITH RECURSIVE ancestors AS (
+        SELECT id, parent_comment_id FROM comments WHERE id = :parent_comment_id
+        UNION ALL
+        SELECT c.id, c.parent_comment_id FROM comments c JOIN ancestors a ON c.id = a.parent_comment_id
+    ), locked AS (
+        SELECT id FROM comments WHERE id IN (SELECT id FROM ancestors) ORDER BY id FOR UPDATE
+    )
+    UPDATE comments SET
+        descendant_count = GREATEST(descendant_count + :delta, 0),
+        reply_count = CASE WHEN comments.id = :parent_comment_id
+                           THEN GREATEST(reply_count + :reply_delta, 0) ELSE reply_count END
+    FROM locked WHERE comments.id = locked.id
+""")
+
+# Purge of soft-deleted posts, one bounded batch per statement. Children go
+# first (comment likes, then comments leaf-first so no delete cascades into a
+# large subtree, then likes and media), and the post rows last.
+PURGE_BATCH_SQL = [
+    ("post_comment_likes", text("""
+        DELETE FROM post_comment_likes WHERE id IN (
+            SELECT l.id FROM post_comment_likes l JOIN comments c ON c.id = l.comment_id
+            WHERE c.post_id = ANY(CAST(:post_ids AS bigint[])) LIMIT :batch_size
+        )
+    """)),
+    ("comments", text("""
+        DELETE FROM comments WHERE id IN (
+            SELECT c.id FROM comments c
+            WHERE c.post_id = ANY(CAST(:post_ids AS bigint[]))
+              AND NOT EXISTS (SELECT 1 FROM comments r WHERE r.parent_comment_id = c.id)
+            LIMIT :batch_size
+        )
+    """)),
+    ("post_likes", text("""
+        DELETE FROM post_likes WHERE id IN (
+            SELECT id FROM post_likes WHERE post_id = ANY(CAST(:post_ids AS bigint[])) LIMIT :batch_size
+        )
+    """)),
+    ("post_media", text("""
+        DELETE FROM post_media WHERE id IN (
+            SELECT id FROM post_media WHERE post_id = ANY(CAST(:post_ids AS bigint[])) LIMIT :batch_size
+        )
+    """)),
+]
+
 class PostRepository:
     def __init__(self, db: Session):
         self.db = db
@@ -15,24 +232,39 @@ class PostRepository:
     # Post Operations
     def create_post(self, user_id: int, title: str, content: str, visibility: str = None,
                    property_type: str = None, location: str = None, map_location: str = None,
-                   price: float = None, status: str = 'active') -> Post:
+                   price: float = None, status: str = 'active',
+                   media: List[Tuple[str, str, int, int, str]] = None) -> Tuple[Optional[Row], List[Row]]:
+        """Create a post and its media in one transaction.
+
+        ``media`` holds (media_type, media_url, media_order, media_size, caption)
+        tuples; media_url may contain a ``{post_id}`` placeholder. Returns the post
+        row (with its author's fields) and its media rows, or (None, []) if the
+        user does not exist.
+        """
         try:
-            post = Post(
-                user_id=user_id,
-                title=title,
-                content=content,
-                visibility=visibility,
-                property_type=property_type,
-                location=location,
-                map_location=map_location,
-                price=price,
-                status=status,
-                created_at=datetime.utcnow()
-            )
-            self.db.add(post)
+            now = datetime.utcnow()
+            post = self.db.execute(CREATE_POST_SQL, {
+                "user_id": user_id,
+                "title": title,
+                "content": content,
+                "visibility": visibility,
+                "property_type": property_type,
+                "location": location,
+                "map_location": map_location,
+                "price": price,
+                "status": status,
+                "created_at": now
+            }).first()
+            if post is None:
+                self.db.rollback()
+                return None, []
+
+            media_rows = self._insert_post_media(post.id, [
+                (media_type, media_url.format(post_id=post.id), media_order, media_size, caption)
+                for media_type, media_url, media_order, media_size, caption in media
+            ], now) if media else []
             self.db.commit()
-            self.db.refresh(post)
-            return post
+            return post, media_rows
         except SQLAlchemyError as e:
             self.db.rollback()
             raise Exception(f"Database error while creating post: {str(e)}")
@@ -41,10 +273,55 @@ class PostRepository:
         try:
             return self.db.query(Post).options(
                 sqlalchemy.orm.joinedload(Post.user)
-            ).filter(Post.id == post_id).first()
+            ).filter(Post.id == post_id, Post.deleted_at.is_(None)).first()
         except SQLAlchemyError as e:
             raise Exception(f"Database error while fetching post: {str(e)}")
 
+    def get_posts_by_ids(self, post_ids: List[int], load_user: bool = True,
+                         load_media: bool = True, load_comments: bool = True) -> List[Post]:
+        """Fetch many posts with one WHERE id = ANY(:ids) query (plus one per requested relationship)"""
+        try:
+            if not post_ids:
+                return []
+            query = self.db.query(Post).filter(
+                Post.id == any_(bindparam('post_ids', list(post_ids), type_=ARRAY(BigInteger))),
+                Post.deleted_at.is_(None)
+            )
+            if load_user:
+                query = query.options(sqlalchemy.orm.joinedload(Post.user))
+            if load_media:
+                query = query.options(sqlalchemy.orm.selectinload(Post.media))
+            if load_comments:
+                query = query.options(sqlalchemy.orm.selectinload(Post.comments))
+            return query.all()
+        except SQLAlchemyError as e:
+            raise Exception(f"Database error while fetching posts: {str(e)}")
+
+    def get_post_summaries(self, post_ids: List[int]) -> list:
+        """Headline fields, first media URL and counts for many posts in a single query"""
+        try:
+            if not post_ids:
+                return []
+            first_media_url = self.db.query(PostMedia.media_url)\
+                .filter(PostMedia.post_id == Post.id)\
+                .order_by(PostMedia.media_order, PostMedia.id)\
+                .limit(1)\
+                .scalar_subquery()
+            comment_count = self.db.query(func.count(Comment.id))\
+                .filter(Comment.post_id == Post.id)\
+                .scalar_subquery()
+            return self.db.query(
+                Post.id, Post.user_id, Post.title, Post.price, Post.location,
+                Post.property_type, Post.status, Post.created_at, Post.like_count,
+                first_media_url.label('first_media_url'),
+                comment_count.label('comment_count')
+            ).filter(
+                Post.id == any_(bindparam('post_ids', list(post_ids), type_=ARRAY(BigInteger))),
+                Post.deleted_at.is_(None)
+            ).all()
+        except SQLAlchemyError as e:
+            raise Exception(f"Database error while fetching post summaries: {str(e)}")
+
     def update_post(self, post_id: int, title: str = None, content: str = None,
                    visibility: str = None, property_type: str = None,
                    location: str = None, map_location: str = None,
@@ -76,20 +353,48 @@ class PostRepository:
             raise Exception(f"Database error while updating post: {str(e)}")
 
     def delete_post(self, post_id: int) -> bool:
+        """Soft-delete a post. It disappears from reads at once; PostPurger removes its rows later."""
         try:
-            post = self.get_post(post_id)
-            if post:
-                self.db.delete(post)
-                self.db.commit()
-                return True
-            return False
+            deleted = self.db.execute(
+                text("UPDATE posts SET deleted_at = :now WHERE id = :post_id AND deleted_at IS NULL RETURNING id"),
+                {"post_id": post_id, "now": datetime.utcnow()}
+            ).first()
+            self.db.commit()
+            return deleted is not None
         except SQLAlchemyError as e:
             self.db.rollback()
             raise Exception(f"Database error while deleting post: {str(e)}")
 
+    def get_deleted_post_ids(self, limit: int) -> List[int]:
+        """Oldest soft-deleted posts still waiting to be purged"""
+        return list(self.db.execute(
+            text("SELECT id FROM posts WHERE deleted_at IS NOT NULL ORDER BY deleted_at LIMIT :limit"),
+            {"limit": limit}
+        ).scalars())
+
+    def purge_deleted_posts_batch(self, post_ids: List[int], batch_size: int) -> Tuple[str, int]:
+        """Delete up to batch_size child rows of soft-deleted posts, or the posts themselves once
+        they have no children left. Returns the table touched and the rows deleted; ("", 0) when done."""
+        try:
+            params = {"post_ids": list(post_ids), "batch_size": batch_size}
+            for table, statement in PURGE_BATCH_SQL:
+                deleted = self.db.execute(statement, params).rowcount
+                if deleted:
+                    self.db.commit()
+                    return table, deleted
+            deleted = self.db.execute(
+                text("DELETE FROM posts WHERE id = ANY(CAST(:post_ids AS bigint[])) AND deleted_at IS NOT NULL"),
+                params
+            ).rowcount
+            self.db.commit()
+            return ("posts", deleted) if deleted else ("", 0)
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            raise Exception(f"Database error while purging posts: {str(e)}")
+
     def get_posts_by_user(self, user_id: int, page: int = 1, limit: int = 10) -> Tuple[List[Post], int]:
         try:
-            query = self.db.query(Post).filter(Post.user_id == user_id)
+            query = self.db.query(Post).filter(Post.user_id == user_id, Post.deleted_at.is_(None))
             total = query.count()
             posts = query.order_by(desc(Post.created_at)).offset((page - 1) * limit).limit(limit).all()
             return posts, total
@@ -98,11 +403,18 @@ class PostRepository:
 
     def search_posts(self, property_type: str = None, location: str = None,
                     min_price: float = None, max_price: float = None,
-                    status: str = None, page: int = 1, limit: int = 10) -> Tuple[List[Post], int]:
+                    status: str = None, page: int = 1, limit: int = 10,
+                    search_text: str = None) -> Tuple[List[Tuple[Post, Optional[float], Optional[str]]], int]:
+        """(post, search rank, search headline) rows of a page of matching posts, and the total.
+
+        Rank and headline are None without ``search_text``. They are returned
+        beside the post rather than set on it, as the post is the session's
+        shared instance that later reads of it also get.
+        """
         try:
             print("Starting search_posts in repository")
             # Join with User table to get user information
-            query = self.db.query(Post).join(User, Post.user_id == User.id)
+            query = self.db.query(Post).join(User, Post.user_id == User.id).filter(Post.deleted_at.is_(None))
             
             # Only apply filters if they are explicitly provided
             if property_type and property_type.strip():
@@ -110,6 +422,7 @@ class PostRepository:
                 query = query.filter(Post.property_type == property_type)
             if location and location.strip():
                 print(f"Filtering by location: {location}")
+                # Served by the idx_posts_location_trgm trigram index
                 query = query.filter(Post.location.ilike(f"%{location}%"))
             if min_price is not None and min_price > 0:
                 print(f"Filtering by min_price: {min_price}")
@@ -120,6 +433,11 @@ class PostRepository:
             if status and status.strip():
                 print(f"Filtering by status: {status}")
                 query = query.filter(Post.status == status)
+
+            ts_query = None
+            if search_text and search_text.strip():
+                ts_query = func.websearch_to_tsquery('english', search_text)
+                query = query.filter(Post.search_vector.op('@@')(ts_query))
             
             total = query.count()
             print(f"Total posts before pagination: {total}")
@@ -140,8 +458,25 @@ class PostRepository:
             query = query.options(
                 sqlalchemy.orm.joinedload(Post.user)
             )
-            
-            posts = query.order_by(desc(Post.created_at)).offset(offset).limit(limit).all()
+
+            if ts_query is None:
+                posts = [
+                    (post, None, None)
+                    for post in query.order_by(desc(Post.created_at)).offset(offset).limit(limit).all()
+                ]
+            else:
+                # Most relevant first, with matched terms highlighted in the content
+                rank = func.ts_rank_cd(Post.search_vector, ts_query)
+                headline = func.ts_headline(
+                    'english', func.coalesce(Post.content, ''), ts_query,
+                    'StartSel=<b>, StopSel=</b>, MaxFragments=2, MaxWords=20, MinWords=5'
+                )
+                posts = [
+                    tuple(row) for row in
+                    query.add_columns(rank.label('search_rank'), headline.label('search_headline'))
+                    .order_by(desc('search_rank'), desc(Post.created_at))
+                    .offset(offset).limit(limit).all()
+                ]
             print(f"Retrieved {len(posts)} posts after pagination")
             
             return posts, total
@@ -153,26 +488,39 @@ class PostRepository:
             raise e
 
     # Media Operations
-    def add_post_media(self, post_id: int, media_type: str, media_url: str,
-                      media_order: int, media_size: int = 0, caption: str = None) -> PostMedia:
+    def add_post_media(self, post_id: int,
+                       media: List[Tuple[str, str, int, int, str]]) -> Tuple[Optional[Row], List[Row]]:
+        """Add media to a post in one transaction.
+
+        Returns the post row (with its author's fields) and all of its media rows,
+        or (None, []) if the post does not exist.
+        """
         try:
-            media = PostMedia(
-                post_id=post_id,
-                media_type=media_type,
-                media_url=media_url,
-                media_order=media_order,
-                media_size=media_size,
-                caption=caption,
-                uploaded_at=datetime.utcnow()
-            )
-            self.db.add(media)
+            post = self.db.execute(POST_WITH_AUTHOR_SQL, {"post_id": post_id}).first()
+            if post is None:
+                self.db.rollback()
+                return None, []
+
+            media_rows = self._insert_post_media(post_id, media, datetime.utcnow())
             self.db.commit()
-            self.db.refresh(media)
-            return media
+            return post, media_rows
         except SQLAlchemyError as e:
             self.db.rollback()
             raise Exception(f"Database error while adding media: {str(e)}")
 
+    def _insert_post_media(self, post_id: int, media: List[Tuple[str, str, int, int, str]],
+                           uploaded_at: datetime) -> List[Row]:
+        # Caller commits
+        return self.db.execute(INSERT_POST_MEDIA_SQL, {
+            "post_id": post_id,
+            "media_types": [m[0] for m in media],
+            "media_urls": [m[1] for m in media],
+            "media_orders": [m[2] for m in media],
+            "media_sizes": [m[3] for m in media],
+            "captions": [m[4] for m in media],
+            "uploaded_at": uploaded_at
+        }).all()
+
     def delete_post_media(self, media_id: int) -> bool:
         media = self.db.query(PostMedia).filter(PostMedia.id == media_id).first()
         if media:
@@ -182,80 +530,76 @@ class PostRepository:
         return False
 
     # Like Operations
-    def like_post(self, post_id: int, user_id: int, reaction_type: str = 'like') -> Optional[Post]:
-        try:
-            # First check if post exists
-            post = self.get_post(post_id)
-            if not post:
-                raise Exception(f"Post with ID {post_id} not found")
+    def like_post(self, post_id: int, user_id: int, reaction_type: str = 'like') -> Optional[Row]:
+        """Like a post in a single statement and return it with its author and new like count.
 
-            # Check if user has already liked the post
-            existing_like = self.db.query(PostLike).filter(
-                PostLike.post_id == post_id,
-                PostLike.user_id == user_id
-            ).first()
-            
-            if not existing_like:
-                try:
-                    like = PostLike(
-                        post_id=post_id,  # Make sure we're using the correct post_id
-                        user_id=user_id,
-                        reaction_type=reaction_type,
-                        liked_at=datetime.utcnow()
-                    )
-                    self.db.add(like)
-                    self.db.commit()
-                except SQLAlchemyError as e:
-                    self.db.rollback()
-                    raise Exception(f"Database error while adding like: {str(e)}")
-            
-            # Get fresh post data with updated like count
-            try:
-                self.db.refresh(post)
-                return post
-            except SQLAlchemyError as e:
-                self.db.rollback()
-                raise Exception(f"Database error while refreshing post: {str(e)}")
-        except Exception as e:
+        Liking twice is a no-op. Returns None if the post does not exist.
+        """
+        try:
+            row = self.db.execute(LIKE_POST_SQL, {
+                "post_id": post_id,
+                "user_id": user_id,
+                "reaction_type": reaction_type,
+                "liked_at": datetime.utcnow()
+            }).first()
+            self.db.commit()
+            return row
+        except IntegrityError:
+            # Unknown user_id (foreign key violation)
             self.db.rollback()
-            raise e
+            raise
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            raise Exception(f"Database error while adding like: {str(e)}")
+
+    def bulk_like_posts(self, likes: List[Tuple[int, int, str, datetime]]) -> Dict[int, int]:
+        """Apply many (post_id, user_id, reaction_type, liked_at) likes in one statement.
 
-    def unlike_post(self, post_id: int, user_id: int) -> Optional[Post]:
+        Returns the new like count of every post whose count changed.
+        """
+        if not likes:
+            return {}
         try:
-            # First check if post exists
-            post = self.get_post(post_id)
-            if not post:
-                raise Exception(f"Post with ID {post_id} not found")
+            post_ids, user_ids, reaction_types, liked_ats = (list(column) for column in zip(*likes))
+            rows = self.db.execute(BULK_LIKE_POSTS_SQL, {
+                "post_ids": post_ids,
+                "user_ids": user_ids,
+                "reaction_types": reaction_types,
+                "liked_ats": liked_ats
+            }).all()
+            self.db.commit()
+            return {row.id: row.like_count for row in rows}
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            raise Exception(f"Database error while adding likes: {str(e)}")
 
-            # Check if user has liked the post
-            like = self.db.query(PostLike).filter(
-                PostLike.post_id == post_id,
-                PostLike.user_id == user_id
-            ).first()
-            
-            if like:
-                try:
-                    self.db.delete(like)
-                    self.db.commit()
-                except SQLAlchemyError as e:
-                    self.db.rollback()
-                    raise Exception(f"Database error while removing like: {str(e)}")
-            
-            # Get fresh post data with updated like count
-            try:
-                self.db.refresh(post)
-                return post
-            except SQLAlchemyError as e:
-                self.db.rollback()
-                raise Exception(f"Database error while refreshing post: {str(e)}")
-        except Exception as e:
+    def unlike_post(self, post_id: int, user_id: int) -> Optional[Row]:
+        """Remove a like in a single statement and return the post with its author and new like count.
+
+        Unliking a post that was not liked is a no-op. Returns None if the post does not exist.
+        """
+        try:
+            row = self.db.execute(UNLIKE_POST_SQL, {
+                "post_id": post_id,
+                "user_id": user_id
+            }).first()
+            self.db.commit()
+            return row
+        except SQLAlchemyError as e:
             self.db.rollback()
-            raise e
+            raise Exception(f"Database error while removing like: {str(e)}")
 
     # Comment Operations
     def create_comment(self, post_id: int, user_id: int, comment_text: str,
                       parent_comment_id: int = None) -> Comment:
         try:
+            # The post must exist and not be deleted; the share lock holds off a
+            # concurrent delete until the comment is committed
+            post = self.db.query(Post.id).filter(Post.id == post_id, Post.deleted_at.is_(None))\
+                .with_for_update(read=True).first()
+            if not post:
+                raise Exception(f"Post with ID {post_id} not found")
+
             # For replies (parent_comment_id > 0), verify parent comment exists
             if parent_comment_id and parent_comment_id > 0:
                 parent_comment = self.get_comment(parent_comment_id)
@@ -279,6 +623,12 @@ class PostRepository:
                 status='active'
             )
             self.db.add(comment)
+            if parent_comment_id:
+                self.db.execute(ADJUST_COMMENT_ANCESTORS_SQL, {
+                    "parent_comment_id": parent_comment_id,
+                    "delta": 1,
+                    "reply_delta": 1
+                })
             self.db.commit()
             self.db.refresh(comment)
             return comment
@@ -290,11 +640,14 @@ class PostRepository:
             raise e
 
     def get_comment(self, comment_id: int) -> Optional[Comment]:
-        return self.db.query(Comment).filter(Comment.id == comment_id).first()
+        # None also when the comment's post is deleted
+        return self.db.query(Comment).join(Post, Post.id == Comment.post_id)\
+            .filter(Comment.id == comment_id, Post.deleted_at.is_(None)).first()
 
     def get_comment_replies(self, comment_id: int, page: int = 1, limit: int = 10) -> Tuple[List[Comment], int]:
-        query = self.db.query(Comment).filter(
-            Comment.parent_comment_id == comment_id
+        query = self.db.query(Comment).join(Post, Post.id == Comment.post_id).filter(
+            Comment.parent_comment_id == comment_id,
+            Post.deleted_at.is_(None)
         )
         total = query.count()
         replies = query.order_by(desc(Comment.commented_at)).offset((page - 1) * limit).limit(limit).all()
@@ -314,12 +667,26 @@ class PostRepository:
         return comment
 
     def delete_comment(self, comment_id: int) -> bool:
-        comment = self.get_comment(comment_id)
-        if comment:
-            self.db.delete(comment)
+        try:
+            # The replies go with it via ON DELETE CASCADE
+            deleted = self.db.execute(
+                text("DELETE FROM comments WHERE id = :comment_id RETURNING parent_comment_id, descendant_count"),
+                {"comment_id": comment_id}
+            ).first()
+            if deleted is None:
+                self.db.rollback()
+                return False
+            if deleted.parent_comment_id:
+                self.db.execute(ADJUST_COMMENT_ANCESTORS_SQL, {
+                    "parent_comment_id": deleted.parent_comment_id,
+                    "delta": -(deleted.descendant_count + 1),
+                    "reply_delta": -1
+                })
             self.db.commit()
             return True
-        return False
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            raise Exception(f"Database error while deleting comment: {str(e)}")
 
     def get_comment_thread(self, comment_id: int) -> List[Comment]:
         """Get a comment and all its nested replies in a flat list"""
@@ -335,41 +702,24 @@ class PostRepository:
         
         return get_replies(comment)
 
-    def get_comments(self, post_id: int, page: int = 1, limit: int = 10) -> Tuple[List[Comment], int]:
+    def get_comments(self, post_id: int, page: int = 1, limit: int = 10) -> List[Comment]:
+        """One page of a post's top-level comments, newest first.
+
+        The caller sizes the page from get_post_comment_count, so no count is
+        taken here.
+        """
         try:
-            print(f"get_comments called with post_id: {post_id}, page: {page}, limit: {limit}")
-            
-            # Get only top-level comments (no parent)
+            # Get only top-level comments (no parent) of a post that is not deleted
             query = self.db.query(Comment).options(
                 sqlalchemy.orm.joinedload(Comment.user)
-            ).filter(
+            ).join(Post, Post.id == Comment.post_id).filter(
                 Comment.post_id == post_id,
-                Comment.parent_comment_id.is_(None)
+                Comment.parent_comment_id.is_(None),
+                Post.deleted_at.is_(None)
             ).order_by(desc(Comment.commented_at))
 
-            # Print the SQL query
-            print(f"SQL Query: {query}")
-            
-            # Get total count before pagination
-            total = query.count()
-            print(f"Total comments found: {total}")
-
-            # Apply pagination
             offset = (page - 1) * limit
-            print(f"Using offset: {offset}, limit: {limit}")
-            
-            comments = query.offset(offset).limit(limit).all()
-            print(f"Retrieved {len(comments)} comments")
-            
-            # Debug print each comment
-            for comment in comments:
-                print(f"Comment ID: {comment.id}, User ID: {comment.user_id}, "
-                      f"User: {comment.user.first_name if comment.user else 'None'} "
-                      f"{comment.user.last_name if comment.user else 'None'}, "
-                      f"Role: {comment.user.role if comment.user else 'None'}")
-                print(f"Has {len(comment.replies)} replies")
-
-            return comments, total
+            return query.offset(offset).limit(limit).all()
         except SQLAlchemyError as e:
             print(f"Database error in get_comments: {str(e)}")
             raise Exception(f"Database error while getting comments: {str(e)}")
@@ -377,86 +727,63 @@ class PostRepository:
             print(f"Unexpected error in get_comments: {str(e)}")
             raise e
 
-    def like_comment(self, comment_id: int, user_id: int, reaction_type: str = 'like') -> Optional[Comment]:
+    def like_comment(self, comment_id: int, user_id: int, reaction_type: str = 'like') -> Optional[Row]:
+        """Like a comment in a single statement and return it with its author and new like count.
+
+        Liking twice is a no-op. Returns None if the comment does not exist.
+        """
         try:
-            # First check if comment exists
-            comment = self.get_comment(comment_id)
-            if not comment:
-                raise Exception(f"Comment with ID {comment_id} not found")
-
-            # Check if user has already liked the comment
-            existing_like = self.db.query(CommentLike).filter(
-                CommentLike.comment_id == comment_id,
-                CommentLike.user_id == user_id
-            ).first()
-            
-            if not existing_like:
-                try:
-                    like = CommentLike(
-                        comment_id=comment_id,
-                        user_id=user_id,
-                        reaction_type=reaction_type,
-                        liked_at=datetime.utcnow()
-                    )
-                    self.db.add(like)
-                    self.db.commit()
-                except SQLAlchemyError as e:
-                    self.db.rollback()
-                    raise Exception(f"Database error while adding like: {str(e)}")
-            
-            # Get fresh comment data with updated like count
-            try:
-                self.db.refresh(comment)
-                return comment
-            except SQLAlchemyError as e:
-                self.db.rollback()
-                raise Exception(f"Database error while refreshing comment: {str(e)}")
-        except Exception as e:
+            row = self.db.execute(LIKE_COMMENT_SQL, {
+                "comment_id": comment_id,
+                "user_id": user_id,
+                "reaction_type": reaction_type,
+                "liked_at": datetime.utcnow()
+            }).first()
+            self.db.commit()
+            return row
+        except IntegrityError:
+            # Unknown user_id (foreign key violation)
             self.db.rollback()
-            raise e
+            raise
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            raise Exception(f"Database error while adding like: {str(e)}")
+
+    def unlike_comment(self, comment_id: int, user_id: int) -> Optional[Row]:
+        """Remove a comment like in a single statement and return the comment with its author and new like count.
 
-    def unlike_comment(self, comment_id: int, user_id: int) -> Optional[Comment]:
+        Unliking a comment that was not liked is a no-op. Returns None if the comment does not exist.
+        """
         try:
-            # First check if comment exists
-            comment = self.get_comment(comment_id)
-            if not comment:
-                raise Exception(f"Comment with ID {comment_id} not found")
-
-            # Check if user has liked the comment
-            like = self.db.query(CommentLike).filter(
-                CommentLike.comment_id == comment_id,
-                CommentLike.user_id == user_id
-            ).first()
-            
-            if like:
-                try:
-                    self.db.delete(like)
-                    self.db.commit()
-                except SQLAlchemyError as e:
-                    self.db.rollback()
-                    raise Exception(f"Database error while removing like: {str(e)}")
-            
-            # Get fresh comment data with updated like count
-            try:
-                self.db.refresh(comment)
-                return comment
-            except SQLAlchemyError as e:
-                self.db.rollback()
-                raise Exception(f"Database error while refreshing comment: {str(e)}")
-        except Exception as e:
+            row = self.db.execute(UNLIKE_COMMENT_SQL, {
+                "comment_id": comment_id,
+                "user_id": user_id
+            }).first()
+            self.db.commit()
+            return row
+        except SQLAlchemyError as e:
             self.db.rollback()
-            raise e
+            raise Exception(f"Database error while removing like: {str(e)}")
 
     # Helper Methods
-    def get_post_like_count(self, post_id: int) -> int:
-        return self.db.query(PostLike).filter(PostLike.post_id == post_id).count()
+    def get_post_like_count(self, post_id: int) -> Optional[int]:
+        # None when the post does not exist or is deleted
+        return self.db.query(Post.like_count).filter(Post.id == post_id, Post.deleted_at.is_(None)).scalar()
+
+    def get_post_like_state(self, post_id: int, user_id: int) -> Optional[Tuple[int, bool, bool]]:
+        """(like_count, whether the user's like is stored, whether the user exists) in one query;
+        None when the post does not exist"""
+        row = self.db.execute(POST_LIKE_STATE_SQL, {"post_id": post_id, "user_id": user_id}).first()
+        return (row.like_count, row.liked, row.user_exists) if row else None
 
     def get_comment_like_count(self, comment_id: int) -> int:
-        return self.db.query(CommentLike).filter(CommentLike.comment_id == comment_id).count()
+        return self.db.query(Comment.like_count).join(Post, Post.id == Comment.post_id)\
+            .filter(Comment.id == comment_id, Post.deleted_at.is_(None)).scalar() or 0
 
     def get_post_comment_count(self, post_id: int) -> int:
-        # Count only top-level comments
-        return self.db.query(Comment).filter(
+        # Count only top-level comments, and none of a deleted post
+        return self.db.query(Comment).join(Post, Post.id == Comment.post_id).filter(
             Comment.post_id == post_id,
-            Comment.parent_comment_id.is_(None)
+            Comment.parent_comment_id.is_(None),
+            Post.deleted_at.is_(None)
         ).count() 
\ No newline at end of file
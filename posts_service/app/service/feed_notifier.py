@@ -0,0 +1,60 @@
+import os
+import logging
+from concurrent import futures
+from typing import Optional
+import grpc
+from ..proto_files import feed_pb2, feed_pb2_grpc
+
+logger = logging.getLogger(__name__)
+
+
+class FeedNotifier:
+    """Tells the feed service about new posts so it can fan them out to followers.
+
+    Calls run on a small background pool after CreatePost has committed, so a
+    slow or unavailable feed service never adds latency to (or fails) post
+    creation. A failed call is logged and the post is not fanned out.
+    """
+
+    def __init__(self, target: str, timeout_s: float = 10, max_workers: int = 4):
+        self.timeout = timeout_s
+        self._channel = grpc.insecure_channel(target)
+        self._stub = feed_pb2_grpc.FeedServiceStub(self._channel)
+        self._executor = futures.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="feed-notifier")
+
+    @classmethod
+    def from_env(cls) -> Optional["FeedNotifier"]:
+        """Build a notifier from FEED_* env vars, or None when fan-out is disabled.
+
+        Fan-out is opt-in and needs FEED_SERVICE_TARGET, since there is no
+        port the feed service can be assumed to listen on.
+        """
+        if os.getenv("FEED_FANOUT_ENABLED", "false").lower() not in ("1", "true", "yes"):
+            return None
+        target = os.getenv("FEED_SERVICE_TARGET")
+        if not target:
+            logger.warning("FEED_FANOUT_ENABLED is set without FEED_SERVICE_TARGET; fan-out disabled")
+            return None
+        return cls(
+            target,
+            timeout_s=float(os.getenv("FEED_FANOUT_TIMEOUT_S", "10"))
+        )
+
+    def post_created(self, post_id: int, author_id: int) -> None:
+        self._executor.submit(self._fan_out, post_id, author_id)
+
+    def stop(self) -> None:
+        """Wait for queued notifications, then close the channel"""
+        self._executor.shutdown(wait=True)
+        self._channel.close()
+
+    def _fan_out(self, post_id: int, author_id: int) -> None:
+        try:
+            response = self._stub.FanOutPost(feed_pb2.FanOutPostRequest(
+                post_id=post_id,
+                author_id=author_id
+            ), timeout=self.timeout)
+            if not response.success:
+                logger.error(f"Fan-out of post {post_id} failed: {response.message}")
+        except grpc.RpcError as e:
+            logger.error(f"Fan-out of post {post_id} failed: {e.code().name} {e.details()}")
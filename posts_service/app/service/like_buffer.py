@@ -0,0 +1,175 @@
+import os
+import threading
+import logging
+from collections import defaultdict
+from datetime import datetime
+from typing import Callable, Dict, Optional, Set, Tuple, TypeVar
+from ..repository.post_repository import PostRepository
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class LikeBuffer:
+    """Write-behind buffer for post likes.
+
+    LikePost calls are acknowledged from memory and written to Postgres by a
+    background thread as one batched insert + counter update every
+    ``flush_interval_ms`` (or sooner once ``max_pending`` likes are queued).
+    Callers queue only likes of existing posts by existing users that are not
+    already stored (checked in the same query that reads the count), and
+    likes are deduplicated per (post, user) while queued, in flight and for
+    one flush cycle after, which covers a like checked before its batch
+    committed; ``repeat_count`` answers repeats in that window from memory.
+    ``merge`` adds the queued likes to a database count so callers never see
+    a count go backwards while a batch is in flight.
+
+    Likes whose post is deleted before the flush are dropped then.
+    """
+
+    def __init__(self, session_factory, flush_interval_ms: int = 200, max_pending: int = 10000):
+        self.session_factory = session_factory
+        self.flush_interval = flush_interval_ms / 1000.0
+        self.max_pending = max_pending
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending: Dict[Tuple[int, int], Tuple[str, datetime]] = {}
+        self._inflight: Dict[Tuple[int, int], Tuple[str, datetime]] = {}
+        self._flushed: Set[Tuple[int, int]] = set()  # likes written by the last flush
+        self._pending_by_post: Dict[int, int] = defaultdict(int)  # queued + in-flight likes per post
+        self._high_water: Dict[int, int] = {}  # last count served for posts with recent buffered likes
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    @classmethod
+    def from_env(cls, session_factory) -> Optional["LikeBuffer"]:
+        """Build a buffer from LIKE_BUFFER_* env vars, or None when it is disabled"""
+        if os.getenv("LIKE_BUFFER_ENABLED", "false").lower() not in ("1", "true", "yes"):
+            return None
+        return cls(
+            session_factory,
+            flush_interval_ms=int(os.getenv("LIKE_BUFFER_FLUSH_MS", "200")),
+            max_pending=int(os.getenv("LIKE_BUFFER_MAX_PENDING", "10000"))
+        )
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="like-buffer", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the flush thread and write out whatever is still queued"""
+        self._stopped.set()
+        self._wakeup.set()
+        if self._thread:
+            self._thread.join()
+        self.flush()
+
+    def like(self, post_id: int, user_id: int, reaction_type: str = 'like') -> bool:
+        """Queue a like the database does not hold yet. Returns False if the user already
+        has a like queued for the post, or written by the last flush."""
+        key = (post_id, user_id)
+        with self._lock:
+            if key in self._pending or key in self._inflight or key in self._flushed:
+                return False
+            self._pending[key] = (reaction_type, datetime.utcnow())
+            self._pending_by_post[post_id] += 1
+            full = len(self._pending) >= self.max_pending
+        if full:
+            self._wakeup.set()
+        return True
+
+    def repeat_count(self, post_id: int, user_id: int) -> Optional[int]:
+        """The count last served for the post if the user's like is queued, in flight or
+        written by the last flush, else None (the caller reads the database)"""
+        key = (post_id, user_id)
+        with self._lock:
+            if key in self._pending or key in self._inflight or key in self._flushed:
+                return self._high_water.get(post_id)
+            return None
+
+    def unlike(self, post_id: int, user_id: int, apply: Callable[[], T]) -> T:
+        """Drop a queued like and run ``apply`` (the database unlike) before the next flush.
+
+        Holding the flush lock keeps an in-flight batch from re-inserting the
+        like after ``apply`` has deleted it. Returns what ``apply`` returns;
+        ``merge`` the like count read from it.
+        """
+        with self._flush_lock:
+            with self._lock:
+                if self._pending.pop((post_id, user_id), None) is not None:
+                    self._release(post_id)
+                self._flushed.discard((post_id, user_id))
+                self._high_water.pop(post_id, None)
+            return apply()
+
+    def merge(self, post_id: int, db_count: int) -> int:
+        """Add queued likes to a like count read from the database"""
+        with self._lock:
+            count = db_count + self._pending_by_post.get(post_id, 0)
+            if post_id in self._high_water:
+                count = max(count, self._high_water[post_id])
+                self._high_water[post_id] = count
+            elif post_id in self._pending_by_post:
+                self._high_water[post_id] = count
+            return count
+
+    def flush(self) -> int:
+        """Write queued likes in one statement. Returns the number of likes flushed."""
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, {}
+                self._inflight = batch
+            if not batch:
+                with self._lock:
+                    self._flushed = set()
+                self._prune_high_water(set())
+                return 0
+
+            db = self.session_factory()
+            try:
+                PostRepository(db).bulk_like_posts([
+                    (post_id, user_id, reaction_type, liked_at)
+                    for (post_id, user_id), (reaction_type, liked_at) in batch.items()
+                ])
+            except Exception as e:
+                logger.error(f"Like buffer flush of {len(batch)} likes failed, requeueing: {e}")
+                with self._lock:
+                    for key, value in batch.items():
+                        self._pending.setdefault(key, value)
+                    self._inflight = {}
+                return 0
+            finally:
+                db.close()
+
+            with self._lock:
+                self._inflight = {}
+                self._flushed = set(batch)
+                for post_id, _ in batch:
+                    self._release(post_id)
+            self._prune_high_water({post_id for post_id, _ in batch})
+            return len(batch)
+
+    def _release(self, post_id: int) -> None:
+        # Caller holds self._lock
+        self._pending_by_post[post_id] -= 1
+        if self._pending_by_post[post_id] <= 0:
+            del self._pending_by_post[post_id]
+
+    def _prune_high_water(self, flushed_posts) -> None:
+        # Keep high-water marks for one flush cycle after a post's last buffered like,
+        # long enough for reads that fetched the count before the flush committed
+        with self._lock:
+            for post_id in list(self._high_water):
+                if post_id not in flushed_posts and post_id not in self._pending_by_post:
+                    del self._high_water[post_id]
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Like buffer flush error: {e}")
@@ -0,0 +1,75 @@
+import os
+import threading
+import logging
+from typing import Optional
+from ..repository.post_repository import PostRepository
+
+logger = logging.getLogger(__name__)
+
+
+class PostPurger:
+    """Background removal of soft-deleted posts.
+
+    ``delete_post`` only stamps ``deleted_at``. Every ``interval_s`` this thread
+    picks up to ``max_posts`` soft-deleted posts and deletes their comment likes,
+    comments, likes and media at most ``batch_size`` rows at a time, one short
+    transaction per batch, then the post rows themselves. A post with a huge
+    comment or like graph therefore never holds locks or session memory for
+    longer than one batch.
+    """
+
+    def __init__(self, session_factory, interval_s: float = 30, batch_size: int = 1000, max_posts: int = 100):
+        self.session_factory = session_factory
+        self.interval = interval_s
+        self.batch_size = batch_size
+        self.max_posts = max_posts
+        self._stopped = threading.Event()
+        self._thread = None
+
+    @classmethod
+    def from_env(cls, session_factory) -> Optional["PostPurger"]:
+        """Build a purger from POST_PURGE_* env vars, or None when it is disabled"""
+        if os.getenv("POST_PURGE_ENABLED", "true").lower() not in ("1", "true", "yes"):
+            return None
+        return cls(
+            session_factory,
+            interval_s=float(os.getenv("POST_PURGE_INTERVAL_S", "30")),
+            batch_size=int(os.getenv("POST_PURGE_BATCH_SIZE", "1000")),
+            max_posts=int(os.getenv("POST_PURGE_MAX_POSTS", "100"))
+        )
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="post-purger", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop after the batch in progress; unfinished posts are picked up on the next start"""
+        self._stopped.set()
+        if self._thread:
+            self._thread.join()
+
+    def purge(self) -> int:
+        """Purge one round of soft-deleted posts. Returns the number of post rows removed."""
+        db = self.session_factory()
+        try:
+            repository = PostRepository(db)
+            post_ids = repository.get_deleted_post_ids(self.max_posts)
+            purged = 0
+            while post_ids and not self._stopped.is_set():
+                table, deleted = repository.purge_deleted_posts_batch(post_ids, self.batch_size)
+                if not deleted:
+                    break
+                if table == "posts":
+                    purged += deleted
+            if purged:
+                logger.info(f"Purged {purged} deleted posts")
+            return purged
+        finally:
+            db.close()
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            try:
+                self.purge()
+            except Exception as e:
+                logger.error(f"Post purge error: {e}")
@@ -1,10 +1,16 @@
 import grpc
+import functools
+import threading
 from concurrent import futures
 from dotenv import load_dotenv
 from ..proto_files import post_pb2, post_pb2_grpc
 from ..repository.post_repository import PostRepository
+from .like_buffer import LikeBuffer
+from .post_purger import PostPurger
+from .feed_notifier import FeedNotifier
 from ..utils.db_connection import get_db_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.exc import IntegrityError
 from ..entity.user_entity import User
 from app.interceptors.auth_interceptor import AuthServerInterceptor
 # Load environment variables
@@ -13,6 +19,12 @@ load_dotenv()
 # Create database session
 SessionLocal = sessionmaker(bind=get_db_engine())
 
+# Upper bound on post ids per BatchGetPosts/GetPostSummaries call
+MAX_BATCH_POSTS = 100
+
+# Post fields that need the author row loaded
+POST_USER_FIELDS = {'user_first_name', 'user_last_name', 'user_email', 'user_phone', 'user_role'}
+
 def get_db():
     db = SessionLocal()
     try:
@@ -20,26 +32,48 @@ def get_db():
     finally:
         db.close()
 
+def per_rpc_session(method):
+    """Run a servicer method on a database session of its own.
+
+    The server's worker threads call into one PostsService concurrently, so
+    the session (and the repository bound to it) lives in thread-local state
+    for the duration of the RPC and is closed when it returns.
+    """
+    @functools.wraps(method)
+    def wrapper(self, request, context):
+        with self.db_session() as session:
+            self._local.repository = PostRepository(session)
+            try:
+                return method(self, request, context)
+            finally:
+                del self._local.repository
+    return wrapper
+
 class PostsService(post_pb2_grpc.PostsServiceServicer):
-    def __init__(self):
-        self.db = next(get_db())
-        self.repository = PostRepository(self.db)
+    def __init__(self, like_buffer: LikeBuffer = None, feed_notifier: FeedNotifier = None,
+                 db_session: sessionmaker = SessionLocal):
+        self.db_session = db_session
+        self._local = threading.local()
+        # Optional write-behind buffer for LikePost (LIKE_BUFFER_ENABLED)
+        self.like_buffer = like_buffer
+        # Optional fan-out of new posts to follower feeds (FEED_FANOUT_ENABLED)
+        self.feed_notifier = feed_notifier
+
+    @property
+    def repository(self) -> PostRepository:
+        return self._local.repository
+
+    @property
+    def db(self):
+        return self._local.repository.db
 
     def _convert_timestamp(self, dt):
         return int(dt.timestamp()) if dt else 0
 
-    def _convert_to_proto_post(self, post):
-        if not post:
-            return None
-
-        return post_pb2.Post(
+    def _post_scalar_fields(self, post):
+        return dict(
             id=post.id,
             user_id=post.user_id,
-            user_first_name=post.user.first_name if post.user else "",
-            user_last_name=post.user.last_name if post.user else "",
-            user_email=post.user.email if post.user else "",
-            user_phone=post.user.phone if post.user else "",
-            user_role=post.user.role if post.user else "",
             title=post.title,
             content=post.content,
             visibility=post.visibility or "",
@@ -48,13 +82,92 @@ class PostsService(post_pb2_grpc.PostsServiceServicer):
             map_location=post.map_location or "",
             price=float(post.price) if post.price else 0.0,
             status=post.status or "",
-            created_at=self._convert_timestamp(post.created_at),
+            created_at=self._convert_timestamp(post.created_at)
+        )
+
+    def _post_user_fields(self, post):
+        return dict(
+            user_first_name=post.user.first_name if post.user else "",
+            user_last_name=post.user.last_name if post.user else "",
+            user_email=post.user.email if post.user else "",
+            user_phone=post.user.phone if post.user else "",
+            user_role=post.user.role if post.user else ""
+        )
+
+    def _convert_to_proto_post(self, post):
+        if not post:
+            return None
+
+        return post_pb2.Post(
+            **self._post_scalar_fields(post),
+            **self._post_user_fields(post),
             media=[self._convert_to_proto_media(m) for m in post.media],
             comments=[self._convert_to_proto_comment(c) for c in post.comments],
-            like_count=len(post.likes),
+            like_count=self._merged_like_count(post),
             comment_count=len(post.comments)
         )
 
+    def _convert_to_proto_search_result(self, post, search_rank, search_headline):
+        result = self._convert_to_proto_post(post)
+        result.search_rank = search_rank or 0.0
+        result.search_headline = search_headline or ""
+        return result
+
+    def _convert_row_to_proto_post(self, post, media_rows):
+        """Build a Post from a create_post/add_post_media row; comments are not included"""
+        return post_pb2.Post(
+            **self._post_scalar_fields(post),
+            user_first_name=post.user_first_name or "",
+            user_last_name=post.user_last_name or "",
+            user_email=post.user_email or "",
+            user_phone=post.user_phone or "",
+            user_role=post.user_role or "",
+            media=[self._convert_to_proto_media(m) for m in media_rows],
+            like_count=self._merged_like_count(post),
+            comment_count=post.comment_count
+        )
+
+    def _convert_to_proto_post_fields(self, post, field_mask):
+        """Build a Post with only the fields named in field_mask, touching only the relationships they need"""
+        fields = {path.split('.')[0] for path in field_mask.paths}
+        source = post_pb2.Post(**self._post_scalar_fields(post))
+        if fields & POST_USER_FIELDS:
+            for name, value in self._post_user_fields(post).items():
+                setattr(source, name, value)
+        if 'media' in fields:
+            source.media.extend(self._convert_to_proto_media(m) for m in post.media)
+        if 'comments' in fields:
+            source.comments.extend(self._convert_to_proto_comment(c) for c in post.comments)
+        if 'comment_count' in fields:
+            source.comment_count = len(post.comments)
+        if 'like_count' in fields:
+            source.like_count = self._merged_like_count(post)
+
+        result = post_pb2.Post(id=post.id)
+        field_mask.MergeMessage(source, result)
+        return result
+
+    def _convert_to_proto_summary(self, summary):
+        return post_pb2.PostSummary(
+            id=summary.id,
+            user_id=summary.user_id,
+            title=summary.title or "",
+            price=float(summary.price) if summary.price else 0.0,
+            location=summary.location or "",
+            property_type=summary.property_type or "",
+            status=summary.status or "",
+            first_media_url=summary.first_media_url or "",
+            like_count=self._merged_like_count(summary),
+            comment_count=summary.comment_count or 0,
+            created_at=self._convert_timestamp(summary.created_at)
+        )
+
+    def _merged_like_count(self, post):
+        like_count = post.like_count or 0
+        if self.like_buffer:
+            like_count = self.like_buffer.merge(post.id, like_count)
+        return like_count
+
     def _convert_to_proto_media(self, media):
         return post_pb2.PostMedia(
             id=media.id,
@@ -67,7 +180,7 @@ class PostsService(post_pb2_grpc.PostsServiceServicer):
             uploaded_at=self._convert_timestamp(media.uploaded_at)
         )
 
-    def _convert_to_proto_comment(self, comment):
+    def _convert_to_proto_comment(self, comment, include_replies=True):
         return post_pb2.Comment(
             id=comment.id,
             post_id=comment.post_id,
@@ -80,15 +193,54 @@ class PostsService(post_pb2_grpc.PostsServiceServicer):
             status=comment.status,
             added_at=self._convert_timestamp(comment.added_at),
             commented_at=self._convert_timestamp(comment.commented_at),
-            replies=[self._convert_to_proto_comment(r) for r in comment.replies],
-            like_count=len(comment.likes)
+            replies=[self._convert_to_proto_comment(r) for r in comment.replies] if include_replies else [],
+            like_count=comment.like_count or 0,
+            reply_count=comment.reply_count or 0,
+            descendant_count=comment.descendant_count or 0
+        )
+
+    def _convert_row_to_proto_comment(self, comment):
+        """Build a Comment from a like_comment/unlike_comment row; replies are not included"""
+        return post_pb2.Comment(
+            id=comment.id,
+            post_id=comment.post_id,
+            parent_comment_id=comment.parent_comment_id or 0,
+            comment=comment.comment,
+            user_id=comment.user_id,
+            user_first_name=comment.user_first_name or "",
+            user_last_name=comment.user_last_name or "",
+            user_role=comment.user_role or "",
+            status=comment.status,
+            added_at=self._convert_timestamp(comment.added_at),
+            commented_at=self._convert_timestamp(comment.commented_at),
+            like_count=comment.like_count or 0,
+            reply_count=comment.reply_count or 0,
+            descendant_count=comment.descendant_count or 0
         )
 
+    @per_rpc_session
     def CreatePost(self, request, context):
         try:
-            # First check if user exists
-            user = self.db.query(User).filter(User.id == request.user_id).first()
-            if not user:
+            # For now, we'll create a simple URL from the media data
+            # In a real implementation, you would save the media data to a file/S3
+            # and use the resulting URL
+            media = [
+                (m.media_type, f"/media/{{post_id}}/{m.media_order}", m.media_order, 0, m.caption)
+                for m in request.media
+            ]
+            post, media_rows = self.repository.create_post(
+                user_id=request.user_id,
+                title=request.title,
+                content=request.content,
+                visibility=request.visibility,
+                property_type=request.property_type,
+                location=request.location,
+                map_location=request.map_location,
+                price=request.price,
+                status=request.status,
+                media=media
+            )
+            if not post:
                 context.set_code(grpc.StatusCode.NOT_FOUND)
                 context.set_details(f"User with id {request.user_id} not found")
                 return post_pb2.PostResponse(
@@ -96,53 +248,14 @@ class PostsService(post_pb2_grpc.PostsServiceServicer):
                     message=f"User with id {request.user_id} not found"
                 )
 
-            try:
-                post = self.repository.create_post(
-                    user_id=request.user_id,
-                    title=request.title,
-                    content=request.content,
-                    visibility=request.visibility,
-                    property_type=request.property_type,
-                    location=request.location,
-                    map_location=request.map_location,
-                    price=request.price,
-                    status=request.status
-                )
+            if self.feed_notifier:
+                self.feed_notifier.post_created(post.id, post.user_id)
 
-                # Handle media uploads if any
-                for media in request.media:
-                    # For now, we'll create a simple URL from the media data
-                    # In a real implementation, you would save the media data to a file/S3
-                    # and use the resulting URL
-                    media_url = f"/media/{post.id}/{media.media_order}"
-                    
-                    try:
-                        self.repository.add_post_media(
-                            post_id=post.id,
-                            media_type=media.media_type,
-                            media_url=media_url,
-                            media_order=media.media_order,
-                            caption=media.caption
-                        )
-                    except Exception as media_error:
-                        # Log the error but continue with other media
-                        print(f"Error adding media: {str(media_error)}")
-                        continue
-
-                # Refresh post to get the added media
-                post = self.repository.get_post(post.id)
-                return post_pb2.PostResponse(
-                    success=True,
-                    message="Post created successfully",
-                    post=self._convert_to_proto_post(post)
-                )
-            except Exception as e:
-                context.set_code(grpc.StatusCode.INTERNAL)
-                context.set_details(str(e))
-                return post_pb2.PostResponse(
-                    success=False,
-                    message=f"Failed to create post: {str(e)}"
-                )
+            return post_pb2.PostResponse(
+                success=True,
+                message="Post created successfully",
+                post=self._convert_row_to_proto_post(post, media_rows)
+            )
         except Exception as e:
             context.set_code(grpc.StatusCode.INTERNAL)
             context.set_details(str(e))
@@ -151,6 +264,7 @@ class PostsService(post_pb2_grpc.PostsServiceServicer):
                 message=f"Failed to create post: {str(e)}"
             )
 
+    @per_rpc_session
     def GetPost(self, request, context):
         try:
             post = self.repository.get_post(request.post_id)
@@ -175,6 +289,7 @@ class PostsService(post_pb2_grpc.PostsServiceServicer):
                 message=f"Failed to get post: {str(e)}"
             )
 
+    @per_rpc_session
     def UpdatePost(self, request, context):
         try:
             post = self.repository.update_post(
@@ -209,6 +324,7 @@ class PostsService(post_pb2_grpc.PostsServiceServicer):
                 message=f"Failed to update post: {str(e)}"
             )
 
+    @per_rpc_session
     def DeletePost(self, request, context):
         try:
             success = self.repository.delete_post(request.post_id)
@@ -232,6 +348,7 @@ class PostsService(post_pb2_grpc.PostsServiceServicer):
                 message=f"Failed to delete post: {str(e)}"
             )
 
+    @per_rpc_session
     def GetPostsByUser(self, request, context):
         try:
             posts, total = self.repository.get_posts_by_user(
@@ -256,6 +373,7 @@ class PostsService(post_pb2_grpc.PostsServiceServicer):
                 message=f"Failed to get posts: {str(e)}"
             )
 
+    @per_rpc_session
     def SearchPosts(self, request, context):
         try:
             # Ensure page number is at least 1
@@ -270,7 +388,8 @@ class PostsService(post_pb2_grpc.PostsServiceServicer):
                 max_price=request.max_price,
                 status=request.status,
                 page=page,
-                limit=limit
+                limit=limit,
+                search_text=request.query
             )
 
             # Calculate total pages
@@ -281,7 +400,7 @@ class PostsService(post_pb2_grpc.PostsServiceServicer):
             return post_pb2.PostListResponse(
                 success=True,
                 message="Posts retrieved successfully",
-                posts=[self._convert_to_proto_post(p) for p in posts],
+                posts=[self._convert_to_proto_search_result(*row) for row in posts],
                 total_count=total,
                 page=page,
                 total_pages=total_pages
@@ -294,9 +413,97 @@ class PostsService(post_pb2_grpc.PostsServiceServicer):
                 message=f"Failed to search posts: {str(e)}"
             )
 
+    @per_rpc_session
+    def BatchGetPosts(self, request, context):
+        try:
+            post_ids = list(dict.fromkeys(request.post_ids))  # De-duplicate, keep request order
+            if len(post_ids) > MAX_BATCH_POSTS:
+                context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+                context.set_details(f"At most {MAX_BATCH_POSTS} post ids per request")
+                return post_pb2.BatchGetPostsResponse(
+                    success=False,
+                    message=f"At most {MAX_BATCH_POSTS} post ids per request"
+                )
+
+            field_mask = request.field_mask
+            fields = {path.split('.')[0] for path in field_mask.paths}
+            if fields and not field_mask.IsValidForDescriptor(post_pb2.Post.DESCRIPTOR):
+                context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+                context.set_details(f"Invalid field mask: {', '.join(field_mask.paths)}")
+                return post_pb2.BatchGetPostsResponse(
+                    success=False,
+                    message=f"Invalid field mask: {', '.join(field_mask.paths)}"
+                )
+
+            posts = self.repository.get_posts_by_ids(
+                post_ids,
+                load_user=not fields or bool(fields & POST_USER_FIELDS),
+                load_media=not fields or 'media' in fields,
+                load_comments=not fields or bool(fields & {'comments', 'comment_count'})
+            )
+            posts_by_id = {post.id: post for post in posts}
+
+            proto_posts = []
+            for post_id in post_ids:
+                post = posts_by_id.get(post_id)
+                if not post:
+                    continue
+                if fields:
+                    proto_posts.append(self._convert_to_proto_post_fields(post, field_mask))
+                else:
+                    proto_posts.append(self._convert_to_proto_post(post))
+
+            return post_pb2.BatchGetPostsResponse(
+                success=True,
+                message="Posts retrieved successfully",
+                posts=proto_posts
+            )
+        except Exception as e:
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(str(e))
+            return post_pb2.BatchGetPostsResponse(
+                success=False,
+                message=f"Failed to get posts: {str(e)}"
+            )
+
+    @per_rpc_session
+    def GetPostSummaries(self, request, context):
+        try:
+            post_ids = list(dict.fromkeys(request.post_ids))  # De-duplicate, keep request order
+            if len(post_ids) > MAX_BATCH_POSTS:
+                context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+                context.set_details(f"At most {MAX_BATCH_POSTS} post ids per request")
+                return post_pb2.PostSummaryListResponse(
+                    success=False,
+                    message=f"At most {MAX_BATCH_POSTS} post ids per request"
+                )
+
+            summaries_by_id = {s.id: s for s in self.repository.get_post_summaries(post_ids)}
+            return post_pb2.PostSummaryListResponse(
+                success=True,
+                message="Post summaries retrieved successfully",
+                summaries=[
+                    self._convert_to_proto_summary(summaries_by_id[post_id])
+                    for post_id in post_ids if post_id in summaries_by_id
+                ]
+            )
+        except Exception as e:
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(str(e))
+            return post_pb2.PostSummaryListResponse(
+                success=False,
+                message=f"Failed to get post summaries: {str(e)}"
+            )
+
+    @per_rpc_session
     def AddPostMedia(self, request, context):
         try:
-            post = self.repository.get_post(request.post_id)
+            # Here you would implement media file handling
+            # For now, we'll assume media_url is provided
+            post, media_rows = self.repository.add_post_media(request.post_id, [
+                (m.media_type, "placeholder_url", m.media_order, 0, m.caption)
+                for m in request.media
+            ])
             if not post:
                 context.set_code(grpc.StatusCode.NOT_FOUND)
                 context.set_details("Post not found")
@@ -305,24 +512,10 @@ class PostsService(post_pb2_grpc.PostsServiceServicer):
                     message="Post not found"
                 )
 
-            for media in request.media:
-                # Here you would implement media file handling
-                # For now, we'll assume media_url is provided
-                self.repository.add_post_media(
-                    post_id=post.id,
-                    media_type=media.media_type,
-                    media_url="placeholder_url",  # This would be replaced with actual upload logic
-                    media_order=media.media_order,
-                    media_size=0,  # This would be actual file size
-                    caption=media.caption
-                )
-
-            # Refresh post to get updated media
-            post = self.repository.get_post(request.post_id)
             return post_pb2.PostResponse(
                 success=True,
                 message="Media added successfully",
-                post=self._convert_to_proto_post(post)
+                post=self._convert_row_to_proto_post(post, media_rows)
             )
         except Exception as e:
             context.set_code(grpc.StatusCode.INTERNAL)
@@ -332,6 +525,7 @@ class PostsService(post_pb2_grpc.PostsServiceServicer):
                 message=f"Failed to add media: {str(e)}"
             )
 
+    @per_rpc_session
     def DeletePostMedia(self, request, context):
         try:
             success = self.repository.delete_post_media(request.post_id)
@@ -355,48 +549,57 @@ class PostsService(post_pb2_grpc.PostsServiceServicer):
                 message=f"Failed to delete media: {str(e)}"
             )
 
+    @per_rpc_session
     def LikePost(self, request, context):
         try:
-            # First check if user exists
-            user = self.db.query(User).filter(User.id == request.user_id).first()
-            if not user:
-                context.set_code(grpc.StatusCode.NOT_FOUND)
-                context.set_details(f"User with id {request.user_id} not found")
-                return post_pb2.PostResponse(
-                    success=False,
-                    message=f"User with id {request.user_id} not found"
+            if self.like_buffer:
+                # Acknowledge from memory; the buffer writes the like on its next flush.
+                # A repeat of a like the buffer holds, or just wrote, is answered without the database.
+                like_count = self.like_buffer.repeat_count(request.post_id, request.user_id)
+                if like_count is None:
+                    state = self.repository.get_post_like_state(request.post_id, request.user_id)
+                    if state is not None:
+                        like_count, liked, user_exists = state
+                        if not user_exists:
+                            # The flush would drop the like, taking back the count served here
+                            context.set_code(grpc.StatusCode.NOT_FOUND)
+                            context.set_details(f"User with id {request.user_id} not found")
+                            return post_pb2.PostResponse(
+                                success=False,
+                                message=f"User with id {request.user_id} not found"
+                            )
+                        # A like already stored is not queued again, or it would be counted twice
+                        if not liked:
+                            self.like_buffer.like(request.post_id, request.user_id, request.reaction_type or 'like')
+                        like_count = self.like_buffer.merge(request.post_id, like_count)
+                post = post_pb2.Post(id=request.post_id, like_count=like_count) if like_count is not None else None
+            else:
+                row = self.repository.like_post(
+                    post_id=request.post_id,
+                    user_id=request.user_id,
+                    reaction_type=request.reaction_type or 'like'
                 )
-
-            # Check if post exists and get it first
-            post = self.repository.get_post(request.post_id)  # Changed from request.id
-            if not post:
+                post = self._convert_row_to_proto_post(row, []) if row else None
+            if post is None:
                 context.set_code(grpc.StatusCode.NOT_FOUND)
-                context.set_details(f"Post with id {request.post_id} not found")  # Changed from request.id
+                context.set_details(f"Post with id {request.post_id} not found")
                 return post_pb2.PostResponse(
                     success=False,
-                    message=f"Post with id {request.post_id} not found"  # Changed from request.id
+                    message=f"Post with id {request.post_id} not found"
                 )
 
-            # Try to like the post
-            try:
-                # Use the post ID from the post we found
-                post = self.repository.like_post(
-                    post_id=post.id,
-                    user_id=request.user_id,
-                    reaction_type=request.reaction_type
-                )
-                return post_pb2.PostResponse(
-                    success=True,
-                    message="Post liked successfully",
-                    post=self._convert_to_proto_post(post)
-                )
-            except Exception as e:
-                context.set_code(grpc.StatusCode.INTERNAL)
-                context.set_details(str(e))
-                return post_pb2.PostResponse(
-                    success=False,
-                    message=f"Failed to like post: {str(e)}"
-                )
+            return post_pb2.PostResponse(
+                success=True,
+                message="Post liked successfully",
+                post=post
+            )
+        except IntegrityError:
+            context.set_code(grpc.StatusCode.NOT_FOUND)
+            context.set_details(f"User with id {request.user_id} not found")
+            return post_pb2.PostResponse(
+                success=False,
+                message=f"User with id {request.user_id} not found"
+            )
         except Exception as e:
             context.set_code(grpc.StatusCode.INTERNAL)
             context.set_details(str(e))
@@ -405,46 +608,29 @@ class PostsService(post_pb2_grpc.PostsServiceServicer):
                 message=f"Failed to like post: {str(e)}"
             )
 
+    @per_rpc_session
     def UnlikePost(self, request, context):
         try:
-            # First check if user exists
-            user = self.db.query(User).filter(User.id == request.user_id).first()
-            if not user:
-                context.set_code(grpc.StatusCode.NOT_FOUND)
-                context.set_details(f"User with id {request.user_id} not found")
-                return post_pb2.PostResponse(
-                    success=False,
-                    message=f"User with id {request.user_id} not found"
+            def unlike():
+                return self.repository.unlike_post(
+                    post_id=request.post_id,
+                    user_id=request.user_id
                 )
 
-            # Check if post exists and get it first
-            post = self.repository.get_post(request.post_id)  # Changed from request.id
-            if not post:
+            row = self.like_buffer.unlike(request.post_id, request.user_id, unlike) if self.like_buffer else unlike()
+            if row is None:
                 context.set_code(grpc.StatusCode.NOT_FOUND)
-                context.set_details(f"Post with id {request.post_id} not found")  # Changed from request.id
+                context.set_details(f"Post with id {request.post_id} not found")
                 return post_pb2.PostResponse(
                     success=False,
-                    message=f"Post with id {request.post_id} not found"  # Changed from request.id
+                    message=f"Post with id {request.post_id} not found"
                 )
 
-            # Try to unlike the post
-            try:
-                post = self.repository.unlike_post(
-                    post_id=post.id,
-                    user_id=request.user_id
-                )
-                return post_pb2.PostResponse(
-                    success=True,
-                    message="Post unliked successfully",
-                    post=self._convert_to_proto_post(post)
-                )
-            except Exception as e:
-                context.set_code(grpc.StatusCode.INTERNAL)
-                context.set_details(str(e))
-                return post_pb2.PostResponse(
-                    success=False,
-                    message=f"Failed to unlike post: {str(e)}"
-                )
+            return post_pb2.PostResponse(
+                success=True,
+                message="Post unliked successfully",
+                post=self._convert_row_to_proto_post(row, [])
+            )
         except Exception as e:
             context.set_code(grpc.StatusCode.INTERNAL)
             context.set_details(str(e))
@@ -453,6 +639,7 @@ class PostsService(post_pb2_grpc.PostsServiceServicer):
                 message=f"Failed to unlike post: {str(e)}"
             )
 
+    @per_rpc_session
     def CreateComment(self, request, context):
         try:
             # First check if user exists
@@ -491,6 +678,7 @@ class PostsService(post_pb2_grpc.PostsServiceServicer):
             context.set_details(str(e))
             return post_pb2.Comment()
 
+    @per_rpc_session
     def UpdateComment(self, request, context):
         try:
             comment = self.repository.update_comment(
@@ -509,6 +697,7 @@ class PostsService(post_pb2_grpc.PostsServiceServicer):
             context.set_details(str(e))
             return post_pb2.Comment()
 
+    @per_rpc_session
     def DeleteComment(self, request, context):
         try:
             success = self.repository.delete_comment(request.post_id)  # Using post_id as comment_id
@@ -532,50 +721,36 @@ class PostsService(post_pb2_grpc.PostsServiceServicer):
                 message=f"Failed to delete comment: {str(e)}"
             )
 
+    @per_rpc_session
     def GetComments(self, request, context):
         try:
-            print(f"GetComments called with post_id: {request.post_id}, page: {request.page}, limit: {request.limit}")
-            
             # Validate page number
             total_comments = self.repository.get_post_comment_count(request.post_id)
-            print(f"Total comments for post {request.post_id}: {total_comments}")
-            
             total_pages = (total_comments + request.limit - 1) // request.limit
             if total_pages == 0:
                 total_pages = 1
-            print(f"Total pages: {total_pages}")
-            
+
             # If requested page is greater than total pages, return first page
             page = min(request.page, total_pages)
             if page < 1:
                 page = 1
-            print(f"Using page: {page}")
 
-            comments, total = self.repository.get_comments(
+            comments = self.repository.get_comments(
                 post_id=request.post_id,
                 page=page,
                 limit=request.limit
             )
-            print(f"Retrieved {len(comments)} comments")
-            
-            # Debug print each comment
-            for comment in comments:
-                print(f"Comment ID: {comment.id}, User ID: {comment.user_id}, "
-                      f"User: {comment.user.first_name if comment.user else 'None'} "
-                      f"{comment.user.last_name if comment.user else 'None'}, "
-                      f"Role: {comment.user.role if comment.user else 'None'}")
-                print(f"Has {len(comment.replies)} replies")
-
-            response = post_pb2.CommentListResponse(
+            return post_pb2.CommentListResponse(
                 success=True,
                 message="Comments retrieved successfully",
-                comments=[self._convert_to_proto_comment(c) for c in comments],
-                total_count=total,
+                comments=[
+                    self._convert_to_proto_comment(c, include_replies=request.include_replies)
+                    for c in comments
+                ],
+                total_count=total_comments,
                 page=page,
                 total_pages=total_pages
             )
-            print("Successfully created CommentListResponse")
-            return response
         except Exception as e:
             print(f"Error in GetComments: {str(e)}")
             context.set_code(grpc.StatusCode.INTERNAL)
@@ -585,21 +760,15 @@ class PostsService(post_pb2_grpc.PostsServiceServicer):
                 message=f"Failed to get comments: {str(e)}"
             )
 
+    @per_rpc_session
     def LikeComment(self, request, context):
         try:
-            # First check if user exists
-            user = self.db.query(User).filter(User.id == request.user_id).first()
-            if not user:
-                context.set_code(grpc.StatusCode.NOT_FOUND)
-                context.set_details(f"User with id {request.user_id} not found")
-                return post_pb2.CommentResponse(
-                    success=False,
-                    message=f"User with id {request.user_id} not found"
-                )
-
-            # Check if comment exists first
-            comment = self.repository.get_comment(request.comment_id)
-            if not comment:
+            row = self.repository.like_comment(
+                comment_id=request.comment_id,
+                user_id=request.user_id,
+                reaction_type=request.reaction_type or 'like'
+            )
+            if row is None:
                 context.set_code(grpc.StatusCode.NOT_FOUND)
                 context.set_details(f"Comment with id {request.comment_id} not found")
                 return post_pb2.CommentResponse(
@@ -607,24 +776,18 @@ class PostsService(post_pb2_grpc.PostsServiceServicer):
                     message=f"Comment with id {request.comment_id} not found"
                 )
 
-            try:
-                comment = self.repository.like_comment(
-                    comment_id=request.comment_id,
-                    user_id=request.user_id,
-                    reaction_type=request.reaction_type
-                )
-                return post_pb2.CommentResponse(
-                    success=True,
-                    message="Comment liked successfully",
-                    comment=self._convert_to_proto_comment(comment)
-                )
-            except Exception as e:
-                context.set_code(grpc.StatusCode.INTERNAL)
-                context.set_details(str(e))
-                return post_pb2.CommentResponse(
-                    success=False,
-                    message=f"Failed to like comment: {str(e)}"
-                )
+            return post_pb2.CommentResponse(
+                success=True,
+                message="Comment liked successfully",
+                comment=self._convert_row_to_proto_comment(row)
+            )
+        except IntegrityError:
+            context.set_code(grpc.StatusCode.NOT_FOUND)
+            context.set_details(f"User with id {request.user_id} not found")
+            return post_pb2.CommentResponse(
+                success=False,
+                message=f"User with id {request.user_id} not found"
+            )
         except Exception as e:
             context.set_code(grpc.StatusCode.INTERNAL)
             context.set_details(str(e))
@@ -633,21 +796,14 @@ class PostsService(post_pb2_grpc.PostsServiceServicer):
                 message=f"Failed to like comment: {str(e)}"
             )
 
+    @per_rpc_session
     def UnlikeComment(self, request, context):
         try:
-            # First check if user exists
-            user = self.db.query(User).filter(User.id == request.user_id).first()
-            if not user:
-                context.set_code(grpc.StatusCode.NOT_FOUND)
-                context.set_details(f"User with id {request.user_id} not found")
-                return post_pb2.CommentResponse(
-                    success=False,
-                    message=f"User with id {request.user_id} not found"
-                )
-
-            # Check if comment exists first
-            comment = self.repository.get_comment(request.comment_id)
-            if not comment:
+            row = self.repository.unlike_comment(
+                comment_id=request.comment_id,
+                user_id=request.user_id
+            )
+            if row is None:
                 context.set_code(grpc.StatusCode.NOT_FOUND)
                 context.set_details(f"Comment with id {request.comment_id} not found")
                 return post_pb2.CommentResponse(
@@ -655,23 +811,11 @@ class PostsService(post_pb2_grpc.PostsServiceServicer):
                     message=f"Comment with id {request.comment_id} not found"
                 )
 
-            try:
-                comment = self.repository.unlike_comment(
-                    comment_id=request.comment_id,
-                    user_id=request.user_id
-                )
-                return post_pb2.CommentResponse(
-                    success=True,
-                    message="Comment unliked successfully",
-                    comment=self._convert_to_proto_comment(comment)
-                )
-            except Exception as e:
-                context.set_code(grpc.StatusCode.INTERNAL)
-                context.set_details(str(e))
-                return post_pb2.CommentResponse(
-                    success=False,
-                    message=f"Failed to unlike comment: {str(e)}"
-                )
+            return post_pb2.CommentResponse(
+                success=True,
+                message="Comment unliked successfully",
+                comment=self._convert_row_to_proto_comment(row)
+            )
         except Exception as e:
             context.set_code(grpc.StatusCode.INTERNAL)
             context.set_details(str(e))
@@ -681,15 +825,32 @@ class PostsService(post_pb2_grpc.PostsServiceServicer):
             )
 
 def serve():
+    like_buffer = LikeBuffer.from_env(SessionLocal)
+    if like_buffer:
+        like_buffer.start()
+        print(f"Like buffer enabled (flush every {int(like_buffer.flush_interval * 1000)} ms)")
+    post_purger = PostPurger.from_env(SessionLocal)
+    if post_purger:
+        post_purger.start()
+    feed_notifier = FeedNotifier.from_env()
+
     server = grpc.server(
         futures.ThreadPoolExecutor(max_workers=10),
         interceptors=[AuthServerInterceptor()]
     )
-    post_pb2_grpc.add_PostsServiceServicer_to_server(PostsService(), server)
+    post_pb2_grpc.add_PostsServiceServicer_to_server(PostsService(like_buffer, feed_notifier), server)
     server.add_insecure_port('localhost:50053')  # Using port 50053 for posts service
     server.start()
     print("Posts service started on port 50053")
-    server.wait_for_termination()
+    try:
+        server.wait_for_termination()
+    finally:
+        if feed_notifier:
+            feed_notifier.stop()
+        if post_purger:
+            post_purger.stop()
+        if like_buffer:
+            like_buffer.stop()
 
 if __name__ == "__main__":
     serve() 
\ No newline at end of file
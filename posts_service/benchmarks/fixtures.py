@@ -0,0 +1,157 @@
+"""Synthetic users, posts, comment threads and likes for the benchmarks.
+
+Everything is generated server-side with generate_series, in chunks of
+``chunk`` posts per transaction, so seeding 10M rows needs no client memory.
+"""
+import sys
+import time
+from dataclasses import dataclass
+
+from sqlalchemy import text
+
+WORDS = [
+    "spacious", "sunny", "modern", "renovated", "furnished", "corner", "quiet", "garden",
+    "balcony", "parking", "villa", "apartment", "plot", "duplex", "penthouse", "studio",
+    "lake", "view", "metro", "school", "market", "gated", "society", "terrace", "pool",
+    "commercial", "office", "shop", "farmhouse", "independent", "house", "floor"
+]
+LOCATIONS = [
+    "Bandra West, Mumbai", "Andheri East, Mumbai", "Whitefield, Bangalore", "Koramangala, Bangalore",
+    "Gachibowli, Hyderabad", "Banjara Hills, Hyderabad", "Sector 62, Noida", "DLF Phase 3, Gurgaon",
+    "Salt Lake, Kolkata", "Anna Nagar, Chennai", "Baner, Pune", "Hinjewadi, Pune"
+]
+PROPERTY_TYPES = ["apartment", "villa", "plot", "commercial", "house"]
+
+# Each seed insert returns only (min id, max id); ids from one insert are contiguous
+SEED_USERS_SQL = text("""
+    WITH ins AS (
+        INSERT INTO users (first_name, last_name, email, password, role)
+        SELECT 'Bench', 'User ' || g, 'bench-' || :tag || '-' || g || '@example.com', 'x', 'user'
+        FROM generate_series(1, :rows) AS g
+        RETURNING id
+    )
+    SELECT min(id), max(id) FROM ins
+""")
+
+SEED_POSTS_SQL = text("""
+    WITH ins AS (
+        INSERT INTO posts (user_id, title, content, visibility, property_type, location, price, status, created_at)
+        SELECT
+            :first_user_id + (g % :user_count),
+            initcap(w[1 + (random() * (array_length(w, 1) - 1))::int] || ' ' ||
+                    w[1 + (random() * (array_length(w, 1) - 1))::int]),
+            array_to_string(ARRAY(
+                SELECT w[1 + (random() * (array_length(w, 1) - 1))::int]
+                FROM generate_series(1, 30 + g % 7)
+            ), ' '),
+            'public',
+            t[1 + (g % array_length(t, 1))],
+            l[1 + (g % array_length(l, 1))],
+            (100000 + random() * 50000000)::numeric(15, 2),
+            'active',
+            now() - (random() * interval '365 days')
+        FROM generate_series(1, :rows) AS g,
+             (SELECT CAST(:words AS text[]) AS w,
+                     CAST(:locations AS text[]) AS l,
+                     CAST(:property_types AS text[]) AS t) AS v
+        RETURNING id
+    )
+    SELECT min(id), max(id) FROM ins
+""")
+
+# Top-level comments, then replies to about half of them, then replies to those
+SEED_COMMENTS_SQL = text("""
+    INSERT INTO comments (post_id, user_id, comment, status, added_at, commented_at)
+    SELECT p, :first_user_id + ((p * 31 + k) % :user_count), 'Bench comment ' || k, 'active', now(), now()
+    FROM generate_series(CAST(:first_post_id AS bigint), :last_post_id) AS p,
+         generate_series(1, :per_post) AS k
+""")
+
+SEED_REPLIES_SQL = text("""
+    INSERT INTO comments (post_id, parent_comment_id, user_id, comment, status, added_at, commented_at)
+    SELECT c.post_id, c.id, :first_user_id + ((c.id * 17) % :user_count), 'Bench reply', 'active', now(), now()
+    FROM comments c
+    WHERE c.post_id BETWEEN :first_post_id AND :last_post_id
+      AND (c.parent_comment_id IS NULL) = :top_level
+      AND c.id % 2 = 0
+""")
+
+BACKFILL_REPLY_COUNTS_SQL = text("""
+    WITH RECURSIVE subtree AS (
+        SELECT id AS root_id, id FROM comments WHERE post_id BETWEEN :first_post_id AND :last_post_id
+        UNION ALL
+        SELECT s.root_id, c.id FROM comments c JOIN subtree s ON c.parent_comment_id = s.id
+    ), counts AS (
+        SELECT s.root_id,
+               count(*) - 1 AS descendants,
+               count(*) FILTER (WHERE c.parent_comment_id = s.root_id) AS replies
+        FROM subtree s JOIN comments c ON c.id = s.id
+        GROUP BY s.root_id
+    )
+    UPDATE comments SET reply_count = counts.replies, descendant_count = counts.descendants
+    FROM counts WHERE comments.id = counts.root_id AND counts.descendants > 0
+""")
+
+SEED_LIKES_SQL = text("""
+    WITH ins AS (
+        INSERT INTO post_likes (post_id, user_id, reaction_type, liked_at)
+        SELECT p, :first_user_id + ((p * 7919 + k) % :user_count), 'like', now()
+        FROM generate_series(CAST(:first_post_id AS bigint), :last_post_id) AS p,
+             generate_series(1, :per_post) AS k
+        ON CONFLICT (post_id, user_id) DO NOTHING
+        RETURNING post_id
+    )
+    UPDATE posts SET like_count = posts.like_count + cnt.n
+    FROM (SELECT post_id, count(*) AS n FROM ins GROUP BY post_id) cnt
+    WHERE posts.id = cnt.post_id
+""")
+
+
+@dataclass
+class Dataset:
+    first_user_id: int
+    user_count: int
+    first_post_id: int
+    post_count: int
+
+
+def seed_users(engine, rows: int) -> Dataset:
+    tag = time.time_ns()
+    with engine.begin() as conn:
+        first_id, last_id = conn.execute(SEED_USERS_SQL, {"tag": tag, "rows": rows}).first()
+    return Dataset(first_user_id=first_id, user_count=last_id - first_id + 1, first_post_id=0, post_count=0)
+
+
+def seed_posts(engine, dataset: Dataset, rows: int, chunk: int = 100000,
+               comments_per_post: int = 0, likes_per_post: int = 0) -> Dataset:
+    """Insert ``rows`` posts spread over the dataset's users, each with a comment
+    thread and likes. Post ids are contiguous, which the load generator relies on."""
+    users = {"first_user_id": dataset.first_user_id, "user_count": dataset.user_count}
+    likes_per_post = min(likes_per_post, dataset.user_count)
+    done = 0
+    while done < rows:
+        n = min(chunk, rows - done)
+        with engine.begin() as conn:
+            first_id, last_id = conn.execute(SEED_POSTS_SQL, {
+                **users,
+                "rows": n,
+                "words": WORDS,
+                "locations": LOCATIONS,
+                "property_types": PROPERTY_TYPES
+            }).first()
+            span = {"first_post_id": first_id, "last_post_id": last_id}
+            if comments_per_post:
+                conn.execute(SEED_COMMENTS_SQL, {**users, **span, "per_post": comments_per_post})
+                conn.execute(SEED_REPLIES_SQL, {**users, **span, "top_level": True})
+                conn.execute(SEED_REPLIES_SQL, {**users, **span, "top_level": False})
+                conn.execute(BACKFILL_REPLY_COUNTS_SQL, span)
+            if likes_per_post:
+                conn.execute(SEED_LIKES_SQL, {**users, **span, "per_post": likes_per_post})
+        if not dataset.post_count:
+            dataset.first_post_id = span["first_post_id"]
+        dataset.post_count += n
+        done += n
+        print(f"Seeded {done}/{rows} posts", file=sys.stderr)
+    with engine.begin() as conn:
+        conn.execute(text("ANALYZE"))
+    return dataset
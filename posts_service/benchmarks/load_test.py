@@ -0,0 +1,267 @@
+"""Drive PostsService RPCs over real gRPC and report latency, throughput and SQL per call.
+
+Point DB_* at a scratch Postgres (any local instance or container works;
+create_tables.sql plus migrations/ give the schema) and run from the
+posts_service directory:
+
+    python -m benchmarks.load_test --seed --users 10000 --posts 100000 --concurrency 16
+
+By default the service runs in-process on a free port (without the auth
+interceptor). Its SQLAlchemy engine is instrumented, so every result carries
+``sql_per_call``. Use ``--target host:port --token JWT`` to load a deployed
+service instead; SQL counts are then unavailable.
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent import futures
+
+current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(current_dir)
+
+import grpc
+from sqlalchemy import event, text
+from app.proto_files import post_pb2, post_pb2_grpc
+from benchmarks.fixtures import WORDS, LOCATIONS, PROPERTY_TYPES, Dataset, seed_users, seed_posts
+
+RPCS = ["CreatePost", "GetPost", "GetComments", "LikePost", "SearchPosts"]
+
+
+def build_request(rpc: str, dataset: Dataset, rng: random.Random):
+    post_id = dataset.first_post_id + rng.randrange(dataset.post_count)
+    user_id = dataset.first_user_id + rng.randrange(dataset.user_count)
+    if rpc == "CreatePost":
+        return post_pb2.PostCreateRequest(
+            user_id=user_id,
+            title=f"{rng.choice(WORDS).title()} {rng.choice(WORDS)}",
+            content=" ".join(rng.choices(WORDS, k=30)),
+            visibility="public",
+            property_type=rng.choice(PROPERTY_TYPES),
+            location=rng.choice(LOCATIONS),
+            price=rng.uniform(100000, 50000000),
+            status="active",
+            media=[
+                post_pb2.PostMediaUpload(media_type="image", media_data=b"\x00" * 64, media_order=i, caption="")
+                for i in range(rng.randint(0, 5))
+            ]
+        )
+    if rpc == "GetPost":
+        return post_pb2.PostRequest(post_id=post_id)
+    if rpc == "GetComments":
+        return post_pb2.GetCommentsRequest(post_id=post_id, page=1, limit=10)
+    if rpc == "LikePost":
+        return post_pb2.LikeRequest(post_id=post_id, user_id=user_id, reaction_type="like")
+    if rpc == "SearchPosts":
+        return post_pb2.SearchPostsRequest(query=" ".join(rng.sample(WORDS, 2)), page=1, limit=10)
+    raise ValueError(f"Unknown RPC {rpc}")
+
+
+class SqlCounter:
+    """Counts SQL statements per RPC by tagging the server's handler thread"""
+
+    def __init__(self, engine):
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.counts = Counter()
+        event.listen(engine, "before_cursor_execute", self._on_execute)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.counts.clear()
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        rpc = getattr(self._local, "rpc", None) or "(background)"
+        with self._lock:
+            self.counts[rpc] += 1
+
+    def interceptor(self) -> grpc.ServerInterceptor:
+        counter = self
+
+        class _Interceptor(grpc.ServerInterceptor):
+            def intercept_service(self, continuation, handler_call_details):
+                handler = continuation(handler_call_details)
+                if handler is None or handler.unary_unary is None:
+                    return handler
+                rpc = handler_call_details.method.rsplit("/", 1)[-1]
+
+                def behavior(request, context):
+                    counter._local.rpc = rpc
+                    try:
+                        return handler.unary_unary(request, context)
+                    finally:
+                        counter._local.rpc = None
+
+                return grpc.unary_unary_rpc_method_handler(
+                    behavior,
+                    request_deserializer=handler.request_deserializer,
+                    response_serializer=handler.response_serializer
+                )
+
+        return _Interceptor()
+
+
+def start_local_server(workers: int):
+    """Run PostsService in-process, the way serve() does, minus auth"""
+    from app.service import post_service
+    from app.service.like_buffer import LikeBuffer
+
+    engine = post_service.SessionLocal.kw["bind"]
+    engine.echo = False
+    counter = SqlCounter(engine)
+    like_buffer = LikeBuffer.from_env(post_service.SessionLocal)
+    if like_buffer:
+        like_buffer.start()
+
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=workers), interceptors=[counter.interceptor()])
+    post_pb2_grpc.add_PostsServiceServicer_to_server(post_service.PostsService(like_buffer), server)
+    port = server.add_insecure_port("localhost:0")
+    server.start()
+
+    def stop():
+        server.stop(grace=None)
+        if like_buffer:
+            like_buffer.stop()
+
+    return f"localhost:{port}", engine, counter, stop
+
+
+def run_rpc(stub, rpc: str, dataset: Dataset, concurrency: int, duration: float,
+            requests: int, metadata, seed: int) -> dict:
+    call = getattr(stub, rpc)
+    timings = []
+    errors = Counter()
+    lock = threading.Lock()
+    remaining = [requests]
+    deadline = time.perf_counter() + duration
+
+    def worker(worker_id: int):
+        rng = random.Random(seed * 1000 + worker_id)
+        local_timings, local_errors = [], Counter()
+        while time.perf_counter() < deadline:
+            if requests:
+                with lock:
+                    if remaining[0] <= 0:
+                        break
+                    remaining[0] -= 1
+            request = build_request(rpc, dataset, rng)
+            start = time.perf_counter()
+            try:
+                response = call(request, metadata=metadata)
+                if hasattr(response, "success") and not response.success:
+                    local_errors["NOT_SUCCESS"] += 1
+            except grpc.RpcError as e:
+                local_errors[e.code().name] += 1
+            local_timings.append((time.perf_counter() - start) * 1000)
+        with lock:
+            timings.extend(local_timings)
+            errors.update(local_errors)
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(concurrency)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - started
+
+    timings.sort()
+    if not timings:
+        return {"calls": 0}
+    return {
+        "calls": len(timings),
+        "errors": dict(errors),
+        "rps": round(len(timings) / elapsed, 1),
+        "p50_ms": round(statistics.median(timings), 3),
+        "p99_ms": round(timings[min(len(timings) - 1, int(len(timings) * 0.99))], 3),
+        "mean_ms": round(statistics.fmean(timings), 3),
+    }
+
+
+def existing_dataset(engine) -> Dataset:
+    """Use whatever users and posts are already in the database"""
+    with engine.connect() as conn:
+        first_user, last_user = conn.execute(text("SELECT min(id), max(id) FROM users")).first()
+        first_post, last_post = conn.execute(text("SELECT min(id), max(id) FROM posts")).first()
+    if first_user is None or first_post is None:
+        raise SystemExit("No users/posts found; run with --seed")
+    return Dataset(first_user, last_user - first_user + 1, first_post, last_post - first_post + 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--target", help="host:port of a running posts service (default: start one in-process)")
+    parser.add_argument("--token", default=os.getenv("BENCH_TOKEN"), help="JWT sent as Bearer token to --target")
+    parser.add_argument("--workers", type=int, default=10, help="server thread pool size for the in-process service")
+    parser.add_argument("--seed", action="store_true", help="insert synthetic data before measuring")
+    parser.add_argument("--users", type=int, default=10000, help="users to seed")
+    parser.add_argument("--posts", type=int, default=10000, help="posts to seed (10k to 10M)")
+    parser.add_argument("--comments-per-post", type=int, default=5, help="top-level comments per seeded post")
+    parser.add_argument("--likes-per-post", type=int, default=20, help="likes per seeded post")
+    parser.add_argument("--rpcs", default=",".join(RPCS), help="comma-separated RPCs to drive, in order")
+    parser.add_argument("--concurrency", type=int, default=8, help="concurrent client threads per RPC")
+    parser.add_argument("--duration", type=float, default=10, help="seconds to drive each RPC")
+    parser.add_argument("--requests", type=int, default=0, help="stop each RPC after this many calls (0: duration only)")
+    parser.add_argument("--random-seed", type=int, default=42)
+    parser.add_argument("--output", help="write the JSON report here instead of stdout (the service logs to stdout)")
+    args = parser.parse_args()
+
+    counter = None
+    stop = None
+    if args.target:
+        from app.utils.db_connection import get_db_engine
+        engine = get_db_engine()
+        engine.echo = False
+        target = args.target
+    else:
+        target, engine, counter, stop = start_local_server(args.workers)
+
+    if args.seed:
+        dataset = seed_posts(
+            engine, seed_users(engine, args.users), args.posts,
+            comments_per_post=args.comments_per_post, likes_per_post=args.likes_per_post
+        )
+    else:
+        dataset = existing_dataset(engine)
+
+    metadata = [("authorization", f"Bearer {args.token}")] if args.token else None
+    channel = grpc.insecure_channel(target)
+    stub = post_pb2_grpc.PostsServiceStub(channel)
+
+    results = {}
+    try:
+        for rpc in [r.strip() for r in args.rpcs.split(",") if r.strip()]:
+            if counter:
+                counter.reset()
+            print(f"Driving {rpc} ...", file=sys.stderr)
+            results[rpc] = run_rpc(
+                stub, rpc, dataset, args.concurrency, args.duration, args.requests, metadata, args.random_seed
+            )
+            if counter and results[rpc]["calls"]:
+                results[rpc]["sql_per_call"] = round(counter.counts[rpc] / results[rpc]["calls"], 2)
+                results[rpc]["background_sql"] = counter.counts["(background)"]
+    finally:
+        channel.close()
+        if stop:
+            stop()
+
+    report = json.dumps({
+        "target": args.target or "in-process",
+        "concurrency": args.concurrency,
+        "dataset": {"users": dataset.user_count, "posts": dataset.post_count},
+        "results": results
+    }, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(report + "\n")
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Compare location ILIKE scans against the trigram index and full-text search.
+
+Run from the posts_service directory against a scratch database:
+
+    python -m benchmarks.search_benchmark --seed --rows 1000000
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(current_dir)
+
+from sqlalchemy import text
+from app.utils.db_connection import get_db_engine
+from benchmarks.fixtures import seed_users, seed_posts
+
+CASES = {
+    # Baseline: what search_posts did before the trigram index existed
+    "location_ilike_seqscan": (
+        "SELECT id FROM posts WHERE location ILIKE :pattern ORDER BY created_at DESC LIMIT 20",
+        True
+    ),
+    "location_ilike_trigram": (
+        "SELECT id FROM posts WHERE location ILIKE :pattern ORDER BY created_at DESC LIMIT 20",
+        False
+    ),
+    # Old way of searching text: ILIKE over title and content
+    "text_ilike_seqscan": (
+        "SELECT id FROM posts WHERE title ILIKE :pattern OR content ILIKE :pattern "
+        "ORDER BY created_at DESC LIMIT 20",
+        True
+    ),
+    "text_fts_ranked": (
+        "SELECT id, ts_rank_cd(search_vector, q) AS rank FROM posts, websearch_to_tsquery('english', :query) q "
+        "WHERE search_vector @@ q ORDER BY rank DESC, created_at DESC LIMIT 20",
+        False
+    ),
+}
+
+
+def run_case(engine, sql: str, force_seqscan: bool, params: dict, iterations: int) -> dict:
+    timings = []
+    row_count = 0
+    for _ in range(iterations):
+        with engine.begin() as conn:
+            if force_seqscan:
+                conn.execute(text("SET LOCAL enable_bitmapscan = off"))
+                conn.execute(text("SET LOCAL enable_indexscan = off"))
+            start = time.perf_counter()
+            row_count = len(conn.execute(text(sql), params).all())
+            timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    return {
+        "rows": row_count,
+        "p50_ms": round(statistics.median(timings), 3),
+        "p99_ms": round(timings[min(len(timings) - 1, int(len(timings) * 0.99))], 3),
+        "mean_ms": round(statistics.fmean(timings), 3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seed", action="store_true", help="insert synthetic posts before measuring")
+    parser.add_argument("--rows", type=int, default=1000000, help="number of posts to seed")
+    parser.add_argument("--iterations", type=int, default=20, help="runs per query")
+    parser.add_argument("--location", default="Pune", help="location substring to search for")
+    parser.add_argument("--query", default="renovated villa", help="full-text query")
+    args = parser.parse_args()
+
+    engine = get_db_engine()
+    engine.echo = False
+    if args.seed:
+        seed_posts(engine, seed_users(engine, max(1, args.rows // 100)), args.rows)
+
+    with engine.connect() as conn:
+        total_posts = conn.execute(text("SELECT count(*) FROM posts")).scalar()
+
+    results = {}
+    for name, (sql, force_seqscan) in CASES.items():
+        pattern = args.location if name.startswith("location") else args.query.split()[0]
+        results[name] = run_case(engine, sql, force_seqscan, {
+            "pattern": f"%{pattern}%",
+            "query": args.query
+        }, args.iterations)
+
+    print(json.dumps({"posts": total_posts, "iterations": args.iterations, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,24 @@
+-- Materialized reply counters, maintained by create_comment/delete_comment
+ALTER TABLE comments ADD COLUMN IF NOT EXISTS reply_count INT NOT NULL DEFAULT 0;
+ALTER TABLE comments ADD COLUMN IF NOT EXISTS descendant_count INT NOT NULL DEFAULT 0;
+
+-- Used to walk a comment's subtree and to list replies
+CREATE INDEX IF NOT EXISTS idx_comments_parent_comment_id ON comments(parent_comment_id);
+
+-- Backfill from the existing threads
+UPDATE comments c
+    SET reply_count = r.cnt
+    FROM (SELECT parent_comment_id, count(*) AS cnt
+          FROM comments WHERE parent_comment_id IS NOT NULL
+          GROUP BY parent_comment_id) r
+    WHERE c.id = r.parent_comment_id;
+
+WITH RECURSIVE subtree AS (
+    SELECT id AS root_id, id FROM comments
+    UNION ALL
+    SELECT s.root_id, c.id FROM comments c JOIN subtree s ON c.parent_comment_id = s.id
+)
+UPDATE comments c
+    SET descendant_count = d.cnt
+    FROM (SELECT root_id, count(*) - 1 AS cnt FROM subtree GROUP BY root_id) d
+    WHERE c.id = d.root_id AND d.cnt > 0;
@@ -0,0 +1,34 @@
+-- Remove duplicate likes left behind by the old check-then-insert path
+DELETE FROM post_likes a
+    USING post_likes b
+    WHERE a.post_id = b.post_id
+      AND a.user_id = b.user_id
+      AND a.id > b.id;
+
+DELETE FROM post_comment_likes a
+    USING post_comment_likes b
+    WHERE a.comment_id = b.comment_id
+      AND a.user_id = b.user_id
+      AND a.id > b.id;
+
+-- One like per (post, user) and per (comment, user); backs ON CONFLICT in like_post/like_comment
+ALTER TABLE post_likes
+    ADD CONSTRAINT uq_post_likes_post_user UNIQUE (post_id, user_id);
+
+ALTER TABLE post_comment_likes
+    ADD CONSTRAINT uq_post_comment_likes_comment_user UNIQUE (comment_id, user_id);
+
+-- Denormalized like counters, updated in the same statement as the like row
+ALTER TABLE posts ADD COLUMN IF NOT EXISTS like_count INT NOT NULL DEFAULT 0;
+ALTER TABLE comments ADD COLUMN IF NOT EXISTS like_count INT NOT NULL DEFAULT 0;
+
+-- Backfill counters from the existing like rows
+UPDATE posts p
+    SET like_count = l.cnt
+    FROM (SELECT post_id, count(*) AS cnt FROM post_likes GROUP BY post_id) l
+    WHERE p.id = l.post_id;
+
+UPDATE comments c
+    SET like_count = l.cnt
+    FROM (SELECT comment_id, count(*) AS cnt FROM post_comment_likes GROUP BY comment_id) l
+    WHERE c.id = l.comment_id;
@@ -0,0 +1,13 @@
+-- Full-text search over title, content and location for SearchPosts(query)
+ALTER TABLE posts ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(content, '')), 'B') ||
+        setweight(to_tsvector('simple', coalesce(location, '')), 'C')
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_posts_search_vector ON posts USING GIN (search_vector);
+
+-- Trigram index so the location ILIKE '%...%' filter can use an index
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE INDEX IF NOT EXISTS idx_posts_location_trgm ON posts USING GIN (location gin_trgm_ops);
@@ -0,0 +1,6 @@
+-- Soft delete for posts: DeletePost only stamps deleted_at and the posts
+-- service's purge thread removes the post and its children in batches
+ALTER TABLE posts ADD COLUMN IF NOT EXISTS deleted_at TIMESTAMP NULL;
+
+-- Lets the purge job find pending posts without scanning live ones
+CREATE INDEX IF NOT EXISTS idx_posts_deleted_at ON posts(deleted_at) WHERE deleted_at IS NOT NULL;
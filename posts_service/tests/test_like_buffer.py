@@ -0,0 +1,86 @@
+"""LikeBuffer against an in-memory stand-in for the likes table; run from the posts_service directory:
+
+    python -m pytest tests
+"""
+from types import SimpleNamespace
+import pytest
+from app.service import like_buffer
+from app.service.like_buffer import LikeBuffer
+
+
+class FakeRepository:
+    """The part of PostRepository the buffer uses, over a list of written likes"""
+
+    likes = []
+    fail = False  # make the next flush raise, as a lost database connection would
+
+    def __init__(self, db):
+        pass
+
+    def bulk_like_posts(self, likes):
+        if self.fail:
+            raise ConnectionError("database unavailable")
+        self.likes.extend((post_id, user_id) for post_id, user_id, _, _ in likes)
+        return {}
+
+
+@pytest.fixture
+def buffer(monkeypatch):
+    monkeypatch.setattr(like_buffer, "PostRepository", FakeRepository)
+    FakeRepository.likes = []
+    FakeRepository.fail = False
+    return LikeBuffer(lambda: SimpleNamespace(close=lambda: None))
+
+
+def test_like_is_queued_once_and_counted_until_flushed(buffer):
+    assert buffer.like(1, 10)
+    assert not buffer.like(1, 10)
+    assert buffer.like(1, 11)
+    assert buffer.merge(1, 5) == 7
+
+    assert buffer.flush() == 2
+    assert sorted(FakeRepository.likes) == [(1, 10), (1, 11)]
+    assert buffer.merge(1, 7) == 7
+    assert buffer.flush() == 0
+
+
+def test_repeat_is_answered_from_memory_for_one_flush_cycle(buffer):
+    assert buffer.repeat_count(1, 10) is None
+    buffer.like(1, 10)
+    buffer.merge(1, 5)
+    assert buffer.repeat_count(1, 10) == 6
+    assert buffer.repeat_count(1, 11) is None
+
+    buffer.flush()
+    assert buffer.repeat_count(1, 10) == 6  # the batch may have committed after the caller's read
+    assert not buffer.like(1, 10)
+    assert buffer.merge(1, 5) == 6  # a read from before the commit never lowers the count
+
+    buffer.flush()
+    assert buffer.repeat_count(1, 10) is None
+    assert buffer.merge(1, 5) == 5
+
+
+def test_failed_flush_requeues(buffer):
+    buffer.like(1, 10)
+    FakeRepository.fail = True
+    assert buffer.flush() == 0
+    assert not buffer.like(1, 10)
+    assert buffer.merge(1, 5) == 6
+
+    FakeRepository.fail = False
+    assert buffer.flush() == 1
+    assert FakeRepository.likes == [(1, 10)]
+
+
+def test_unlike_drops_queued_like(buffer):
+    buffer.like(1, 10)
+    buffer.like(1, 11)
+    buffer.merge(1, 5)
+
+    assert buffer.unlike(1, 10, lambda: "unliked") == "unliked"
+    assert buffer.repeat_count(1, 10) is None
+    assert buffer.merge(1, 5) == 6
+    assert buffer.flush() == 1
+    assert FakeRepository.likes == [(1, 11)]
+    assert buffer.like(1, 10)  # liking again after the unlike queues a new like
@@ -1,13 +1,33 @@
-from sqlalchemy import Column, Integer, Float, TIMESTAMP
+from sqlalchemy import Column, Integer, Float, String, TIMESTAMP, Index
 from datetime import datetime
 from app.utils.db_connection import Base
 
 class TrendingPost(Base):
     __tablename__ = "trending_posts"
+    __table_args__ = (
+        # GetTrendingPosts and the top-K rank refresh read posts in score order
+        Index('idx_trending_posts_score', 'score', 'id'),
+        # Posts currently holding a rank (rank 0 means outside the top K)
+        Index('idx_trending_posts_ranked', 'rank', postgresql_where='rank > 0'),
+        # GetTrendingPosts filtered by property type
+        Index('idx_trending_posts_type_score', 'property_type', 'score', 'id'),
+        # Engine replicas re-reading the rows written since their last refresh
+        Index('idx_trending_posts_updated', 'updated_at'),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    post_id = Column(Integer, unique=True)  # Removed ForeignKey constraint temporarily
+    # Removed ForeignKey constraint temporarily. The unique constraint's index serves
+    # post_id lookups (GetPostRank, BatchGetPostRanks) and the ON CONFLICT upserts.
+    post_id = Column(Integer, unique=True)
     score = Column(Float, nullable=False)  # Calculated score based on likes and comments
+    # Engagement the score was computed from; metric deltas are added to these
+    like_count = Column(Integer, nullable=False, default=0, server_default='0')
+    comment_count = Column(Integer, nullable=False, default=0, server_default='0')
+    # Copied from the post (map_location "lat,lng" and property_type) whenever the row is written;
+    # NULL when the post has none
+    property_type = Column(String(50), nullable=True)
+    latitude = Column(Float, nullable=True)
+    longitude = Column(Float, nullable=True)
     rank = Column(Integer, nullable=False)  # Current rank in trending
     created_at = Column(TIMESTAMP, default=datetime.utcnow)
     updated_at = Column(TIMESTAMP, default=datetime.utcnow, onupdate=datetime.utcnow) 
\ No newline at end of file
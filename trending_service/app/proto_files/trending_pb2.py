@@ -1,12 +1,22 @@
 # -*- coding: utf-8 -*-
 # Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
 # source: trending.proto
-# Protobuf Python Version: 4.25.0
+# Protobuf Python Version: 6.31.0
 """Generated protocol buffer code."""
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
 from google.protobuf import symbol_database as _symbol_database
 from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    0,
+    '',
+    'trending.proto'
+)
 # @@protoc_insertion_point(imports)
 
 _sym_db = _symbol_database.Default()
@@ -14,29 +24,43 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0etrending.proto\x12\x08trending\"p\n\x0cTrendingPost\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0f\n\x07post_id\x18\x02 \x01(\x05\x12\r\n\x05score\x18\x03 \x01(\x02\x12\x0c\n\x04rank\x18\x04 \x01(\x05\x12\x12\n\ncreated_at\x18\x05 \x01(\t\x12\x12\n\nupdated_at\x18\x06 \x01(\t\"B\n\x10TrendingPostList\x12.\n\x0etrending_posts\x18\x01 \x03(\x0b\x32\x16.trending.TrendingPost\"V\n\x18UpdatePostMetricsRequest\x12\x0f\n\x07post_id\x18\x01 \x01(\x05\x12\x12\n\nlike_count\x18\x02 \x01(\x05\x12\x15\n\rcomment_count\x18\x03 \x01(\x05\"3\n\x12GetTrendingRequest\x12\r\n\x05limit\x18\x01 \x01(\x05\x12\x0e\n\x06offset\x18\x02 \x01(\x05\"%\n\x12GetPostRankRequest\x12\x0f\n\x07post_id\x18\x01 \x01(\x05\"c\n\x10TrendingResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12-\n\rtrending_post\x18\x03 \x01(\x0b\x32\x16.trending.TrendingPost\"k\n\x13GetTrendingResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x32\n\x0etrending_posts\x18\x03 \x01(\x0b\x32\x1a.trending.TrendingPostList\">\n\x0cRankResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x0c\n\x04rank\x18\x03 \x01(\x05\x32\x82\x02\n\x0fTrendingService\x12U\n\x11UpdatePostMetrics\x12\".trending.UpdatePostMetricsRequest\x1a\x1a.trending.TrendingResponse\"\x00\x12Q\n\x10GetTrendingPosts\x12\x1c.trending.GetTrendingRequest\x1a\x1d.trending.GetTrendingResponse\"\x00\x12\x45\n\x0bGetPostRank\x12\x1c.trending.GetPostRankRequest\x1a\x16.trending.RankResponse\"\x00\x62\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0etrending.proto\x12\x08trending\"\x98\x01\n\x0cTrendingPost\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0f\n\x07post_id\x18\x02 \x01(\x05\x12\r\n\x05score\x18\x03 \x01(\x02\x12\x0c\n\x04rank\x18\x04 \x01(\x05\x12\x12\n\ncreated_at\x18\x05 \x01(\t\x12\x12\n\nupdated_at\x18\x06 \x01(\t\x12\x0f\n\x07geohash\x18\x07 \x01(\t\x12\x15\n\rproperty_type\x18\x08 \x01(\t\"B\n\x10TrendingPostList\x12.\n\x0etrending_posts\x18\x01 \x03(\x0b\x32\x16.trending.TrendingPost\"V\n\x18UpdatePostMetricsRequest\x12\x0f\n\x07post_id\x18\x01 \x01(\x05\x12\x12\n\nlike_count\x18\x02 \x01(\x05\x12\x15\n\rcomment_count\x18\x03 \x01(\x05\"N\n\x10PostMetricsDelta\x12\x0f\n\x07post_id\x18\x01 \x01(\x05\x12\x12\n\nlike_delta\x18\x02 \x01(\x05\x12\x15\n\rcomment_delta\x18\x03 \x01(\x05\"K\n\x1d\x42\x61tchUpdatePostMetricsRequest\x12*\n\x06\x64\x65ltas\x18\x01 \x03(\x0b\x32\x1a.trending.PostMetricsDelta\"c\n\x1e\x42\x61tchUpdatePostMetricsResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x10\n\x08\x61\x63\x63\x65pted\x18\x03 \x01(\x05\x12\r\n\x05posts\x18\x04 \x01(\x05\"[\n\x12GetTrendingRequest\x12\r\n\x05limit\x18\x01 \x01(\x05\x12\x0e\n\x06offset\x18\x02 \x01(\x05\x12\x0f\n\x07geohash\x18\x03 \x01(\t\x12\x15\n\rproperty_type\x18\x04 \x01(\t\"%\n\x12GetPostRankRequest\x12\x0f\n\x07post_id\x18\x01 \x01(\x05\",\n\x18\x42\x61tchGetPostRanksRequest\x12\x10\n\x08post_ids\x18\x01 \x03(\x05\")\n\x08PostRank\x12\x0f\n\x07post_id\x18\x01 \x01(\x05\x12\x0c\n\x04rank\x18\x02 \x01(\x05\"c\n\x10TrendingResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12-\n\rtrending_post\x18\x03 \x01(\x0b\x32\x16.trending.TrendingPost\"k\n\x13GetTrendingResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x32\n\x0etrending_posts\x18\x03 \x01(\x0b\x32\x1a.trending.TrendingPostList\">\n\x0cRankResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x0c\n\x04rank\x18\x03 \x01(\x05\"`\n\x19\x42\x61tchGetPostRanksResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12!\n\x05ranks\x18\x03 \x03(\x0b\x32\x12.trending.PostRank\"v\n\x14\x45ngagementEventBatch\x12\r\n\x05\x61t_ms\x18\x01 \x03(\x03\x12\x10\n\x08post_ids\x18\x02 \x03(\x05\x12\x13\n\x0blike_counts\x18\x03 \x03(\x11\x12\x16\n\x0e\x63omment_counts\x18\x04 \x03(\x11\x12\x10\n\x08\x61\x62solute\x18\x05 \x03(\x08\x32\xb0\x04\n\x0fTrendingService\x12U\n\x11UpdatePostMetrics\x12\".trending.UpdatePostMetricsRequest\x1a\x1a.trending.TrendingResponse\"\x00\x12m\n\x16\x42\x61tchUpdatePostMetrics\x12\'.trending.BatchUpdatePostMetricsRequest\x1a(.trending.BatchUpdatePostMetricsResponse\"\x00\x12]\n\x11StreamPostMetrics\x12\x1a.trending.PostMetricsDelta\x1a(.trending.BatchUpdatePostMetricsResponse\"\x00(\x01\x12Q\n\x10GetTrendingPosts\x12\x1c.trending.GetTrendingRequest\x1a\x1d.trending.GetTrendingResponse\"\x00\x12\x45\n\x0bGetPostRank\x12\x1c.trending.GetPostRankRequest\x1a\x16.trending.RankResponse\"\x00\x12^\n\x11\x42\x61tchGetPostRanks\x12\".trending.BatchGetPostRanksRequest\x1a#.trending.BatchGetPostRanksResponse\"\x00\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'trending_pb2', _globals)
-if _descriptor._USE_C_DESCRIPTORS == False:
-  DESCRIPTOR._options = None
-  _globals['_TRENDINGPOST']._serialized_start=28
-  _globals['_TRENDINGPOST']._serialized_end=140
-  _globals['_TRENDINGPOSTLIST']._serialized_start=142
-  _globals['_TRENDINGPOSTLIST']._serialized_end=208
-  _globals['_UPDATEPOSTMETRICSREQUEST']._serialized_start=210
-  _globals['_UPDATEPOSTMETRICSREQUEST']._serialized_end=296
-  _globals['_GETTRENDINGREQUEST']._serialized_start=298
-  _globals['_GETTRENDINGREQUEST']._serialized_end=349
-  _globals['_GETPOSTRANKREQUEST']._serialized_start=351
-  _globals['_GETPOSTRANKREQUEST']._serialized_end=388
-  _globals['_TRENDINGRESPONSE']._serialized_start=390
-  _globals['_TRENDINGRESPONSE']._serialized_end=489
-  _globals['_GETTRENDINGRESPONSE']._serialized_start=491
-  _globals['_GETTRENDINGRESPONSE']._serialized_end=598
-  _globals['_RANKRESPONSE']._serialized_start=600
-  _globals['_RANKRESPONSE']._serialized_end=662
-  _globals['_TRENDINGSERVICE']._serialized_start=665
-  _globals['_TRENDINGSERVICE']._serialized_end=923
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_TRENDINGPOST']._serialized_start=29
+  _globals['_TRENDINGPOST']._serialized_end=181
+  _globals['_TRENDINGPOSTLIST']._serialized_start=183
+  _globals['_TRENDINGPOSTLIST']._serialized_end=249
+  _globals['_UPDATEPOSTMETRICSREQUEST']._serialized_start=251
+  _globals['_UPDATEPOSTMETRICSREQUEST']._serialized_end=337
+  _globals['_POSTMETRICSDELTA']._serialized_start=339
+  _globals['_POSTMETRICSDELTA']._serialized_end=417
+  _globals['_BATCHUPDATEPOSTMETRICSREQUEST']._serialized_start=419
+  _globals['_BATCHUPDATEPOSTMETRICSREQUEST']._serialized_end=494
+  _globals['_BATCHUPDATEPOSTMETRICSRESPONSE']._serialized_start=496
+  _globals['_BATCHUPDATEPOSTMETRICSRESPONSE']._serialized_end=595
+  _globals['_GETTRENDINGREQUEST']._serialized_start=597
+  _globals['_GETTRENDINGREQUEST']._serialized_end=688
+  _globals['_GETPOSTRANKREQUEST']._serialized_start=690
+  _globals['_GETPOSTRANKREQUEST']._serialized_end=727
+  _globals['_BATCHGETPOSTRANKSREQUEST']._serialized_start=729
+  _globals['_BATCHGETPOSTRANKSREQUEST']._serialized_end=773
+  _globals['_POSTRANK']._serialized_start=775
+  _globals['_POSTRANK']._serialized_end=816
+  _globals['_TRENDINGRESPONSE']._serialized_start=818
+  _globals['_TRENDINGRESPONSE']._serialized_end=917
+  _globals['_GETTRENDINGRESPONSE']._serialized_start=919
+  _globals['_GETTRENDINGRESPONSE']._serialized_end=1026
+  _globals['_RANKRESPONSE']._serialized_start=1028
+  _globals['_RANKRESPONSE']._serialized_end=1090
+  _globals['_BATCHGETPOSTRANKSRESPONSE']._serialized_start=1092
+  _globals['_BATCHGETPOSTRANKSRESPONSE']._serialized_end=1188
+  _globals['_ENGAGEMENTEVENTBATCH']._serialized_start=1190
+  _globals['_ENGAGEMENTEVENTBATCH']._serialized_end=1308
+  _globals['_TRENDINGSERVICE']._serialized_start=1311
+  _globals['_TRENDINGSERVICE']._serialized_end=1871
 # @@protoc_insertion_point(module_scope)
@@ -1,10 +1,32 @@
-"""Generated protocol buffer code."""
+# Generated by the gRPC Python protocol compiler plugin. DO NOT EDIT!
+"""Client and server classes corresponding to protobuf-defined services."""
 import grpc
+import warnings
 
 from app.proto_files import trending_pb2 as trending__pb2
 
+GRPC_GENERATED_VERSION = '1.73.1'
+GRPC_VERSION = grpc.__version__
+_version_not_supported = False
+
+try:
+    from grpc._utilities import first_version_is_lower
+    _version_not_supported = first_version_is_lower(GRPC_VERSION, GRPC_GENERATED_VERSION)
+except ImportError:
+    _version_not_supported = True
+
+if _version_not_supported:
+    raise RuntimeError(
+        f'The grpc package installed is at version {GRPC_VERSION},'
+        + f' but the generated code in trending_pb2_grpc.py depends on'
+        + f' grpcio>={GRPC_GENERATED_VERSION}.'
+        + f' Please upgrade your grpc module to grpcio>={GRPC_GENERATED_VERSION}'
+        + f' or downgrade your generated code using grpcio-tools<={GRPC_VERSION}.'
+    )
+
+
 class TrendingServiceStub(object):
-    """Search Service Definition
+    """Trending Service Definition
     """
 
     def __init__(self, channel):
@@ -17,20 +39,36 @@ class TrendingServiceStub(object):
                 '/trending.TrendingService/UpdatePostMetrics',
                 request_serializer=trending__pb2.UpdatePostMetricsRequest.SerializeToString,
                 response_deserializer=trending__pb2.TrendingResponse.FromString,
-                )
+                _registered_method=True)
+        self.BatchUpdatePostMetrics = channel.unary_unary(
+                '/trending.TrendingService/BatchUpdatePostMetrics',
+                request_serializer=trending__pb2.BatchUpdatePostMetricsRequest.SerializeToString,
+                response_deserializer=trending__pb2.BatchUpdatePostMetricsResponse.FromString,
+                _registered_method=True)
+        self.StreamPostMetrics = channel.stream_unary(
+                '/trending.TrendingService/StreamPostMetrics',
+                request_serializer=trending__pb2.PostMetricsDelta.SerializeToString,
+                response_deserializer=trending__pb2.BatchUpdatePostMetricsResponse.FromString,
+                _registered_method=True)
         self.GetTrendingPosts = channel.unary_unary(
                 '/trending.TrendingService/GetTrendingPosts',
                 request_serializer=trending__pb2.GetTrendingRequest.SerializeToString,
                 response_deserializer=trending__pb2.GetTrendingResponse.FromString,
-                )
+                _registered_method=True)
         self.GetPostRank = channel.unary_unary(
                 '/trending.TrendingService/GetPostRank',
                 request_serializer=trending__pb2.GetPostRankRequest.SerializeToString,
                 response_deserializer=trending__pb2.RankResponse.FromString,
-                )
+                _registered_method=True)
+        self.BatchGetPostRanks = channel.unary_unary(
+                '/trending.TrendingService/BatchGetPostRanks',
+                request_serializer=trending__pb2.BatchGetPostRanksRequest.SerializeToString,
+                response_deserializer=trending__pb2.BatchGetPostRanksResponse.FromString,
+                _registered_method=True)
+
 
 class TrendingServiceServicer(object):
-    """Search Service Definition
+    """Trending Service Definition
     """
 
     def UpdatePostMetrics(self, request, context):
@@ -39,6 +77,18 @@ class TrendingServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def BatchUpdatePostMetrics(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def StreamPostMetrics(self, request_iterator, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def GetTrendingPosts(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -51,6 +101,13 @@ class TrendingServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def BatchGetPostRanks(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+
 def add_TrendingServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
             'UpdatePostMetrics': grpc.unary_unary_rpc_method_handler(
@@ -58,6 +115,16 @@ def add_TrendingServiceServicer_to_server(servicer, server):
                     request_deserializer=trending__pb2.UpdatePostMetricsRequest.FromString,
                     response_serializer=trending__pb2.TrendingResponse.SerializeToString,
             ),
+            'BatchUpdatePostMetrics': grpc.unary_unary_rpc_method_handler(
+                    servicer.BatchUpdatePostMetrics,
+                    request_deserializer=trending__pb2.BatchUpdatePostMetricsRequest.FromString,
+                    response_serializer=trending__pb2.BatchUpdatePostMetricsResponse.SerializeToString,
+            ),
+            'StreamPostMetrics': grpc.stream_unary_rpc_method_handler(
+                    servicer.StreamPostMetrics,
+                    request_deserializer=trending__pb2.PostMetricsDelta.FromString,
+                    response_serializer=trending__pb2.BatchUpdatePostMetricsResponse.SerializeToString,
+            ),
             'GetTrendingPosts': grpc.unary_unary_rpc_method_handler(
                     servicer.GetTrendingPosts,
                     request_deserializer=trending__pb2.GetTrendingRequest.FromString,
@@ -68,10 +135,16 @@ def add_TrendingServiceServicer_to_server(servicer, server):
                     request_deserializer=trending__pb2.GetPostRankRequest.FromString,
                     response_serializer=trending__pb2.RankResponse.SerializeToString,
             ),
+            'BatchGetPostRanks': grpc.unary_unary_rpc_method_handler(
+                    servicer.BatchGetPostRanks,
+                    request_deserializer=trending__pb2.BatchGetPostRanksRequest.FromString,
+                    response_serializer=trending__pb2.BatchGetPostRanksResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'trending.TrendingService', rpc_method_handlers)
     server.add_generic_rpc_handlers((generic_handler,))
+    server.add_registered_method_handlers('trending.TrendingService', rpc_method_handlers)
 
 
  # This class is part of an EXPERIMENTAL API.
@@ -90,11 +163,75 @@ class TrendingService(object):
             wait_for_ready=None,
             timeout=None,
             metadata=None):
-        return grpc.experimental.unary_unary(request, target, '/trending.TrendingService/UpdatePostMetrics',
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/trending.TrendingService/UpdatePostMetrics',
             trending__pb2.UpdatePostMetricsRequest.SerializeToString,
             trending__pb2.TrendingResponse.FromString,
-            options, channel_credentials,
-            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def BatchUpdatePostMetrics(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/trending.TrendingService/BatchUpdatePostMetrics',
+            trending__pb2.BatchUpdatePostMetricsRequest.SerializeToString,
+            trending__pb2.BatchUpdatePostMetricsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def StreamPostMetrics(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_unary(
+            request_iterator,
+            target,
+            '/trending.TrendingService/StreamPostMetrics',
+            trending__pb2.PostMetricsDelta.SerializeToString,
+            trending__pb2.BatchUpdatePostMetricsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
 
     @staticmethod
     def GetTrendingPosts(request,
@@ -107,11 +244,21 @@ class TrendingService(object):
             wait_for_ready=None,
             timeout=None,
             metadata=None):
-        return grpc.experimental.unary_unary(request, target, '/trending.TrendingService/GetTrendingPosts',
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/trending.TrendingService/GetTrendingPosts',
             trending__pb2.GetTrendingRequest.SerializeToString,
             trending__pb2.GetTrendingResponse.FromString,
-            options, channel_credentials,
-            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
 
     @staticmethod
     def GetPostRank(request,
@@ -124,8 +271,45 @@ class TrendingService(object):
             wait_for_ready=None,
             timeout=None,
             metadata=None):
-        return grpc.experimental.unary_unary(request, target, '/trending.TrendingService/GetPostRank',
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/trending.TrendingService/GetPostRank',
             trending__pb2.GetPostRankRequest.SerializeToString,
             trending__pb2.RankResponse.FromString,
-            options, channel_credentials,
-            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def BatchGetPostRanks(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/trending.TrendingService/BatchGetPostRanks',
+            trending__pb2.BatchGetPostRanksRequest.SerializeToString,
+            trending__pb2.BatchGetPostRanksResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
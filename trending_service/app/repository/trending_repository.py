@@ -1,72 +1,282 @@
 from sqlalchemy.orm import Session
+from sqlalchemy import text
 from ..entity.trending_entity import TrendingPost
-from typing import List, Optional
+from ..utils.geohash import bounds
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
+import math
+import os
+
+# Scores are Reddit-style "hot" values: log10 of engagement plus the post's
+# age anchor, in DECAY_SECONDS units, since HOT_EPOCH. Ten times the
+# engagement is worth DECAY_SECONDS of recency, so an older post is
+# overtaken by newer ones without its score ever being rewritten, and
+# ordering by the stored score is always current. Changing either constant
+# needs migrations/rescore_trending_hot.sql to rescore the stored rows.
+# The in-memory engine adds a velocity boost on top (see VelocityTracker)
+# and rewrites the scores it changes as its rolling windows move.
+HOT_EPOCH = datetime(2024, 1, 1)
+DECAY_SECONDS = float(os.getenv("TRENDING_DECAY_SECONDS", "45000"))
+
+# The attributes trending posts are sharded by, read from the posts in
+# :post_ids. map_location is "lat,lng" text; anything else leaves the post
+# unlocated. Every trending_posts write copies them, so a post's shard
+# follows edits to it.
+POST_ATTRIBUTES = """
+    SELECT id, property_type,
+           CAST(split_part(lat_lng, ',', 1) AS float) AS latitude,
+           CAST(split_part(lat_lng, ',', 2) AS float) AS longitude
+    FROM (
+        SELECT id, property_type,
+               CASE WHEN map_location ~ '^[[:space:]]*-?[0-9]+([.][0-9]+)?[[:space:]]*,[[:space:]]*-?[0-9]+([.][0-9]+)?[[:space:]]*$'
+                    THEN map_location END AS lat_lng
+        FROM posts
+        WHERE id = ANY(CAST(:post_ids AS int[]))
+    ) located
+"""
+POST_ATTRIBUTES_SQL = text(POST_ATTRIBUTES)
+
+# Engine snapshots: many posts' scores in one statement
+UPSERT_TRENDING_SQL = text(f"""
+    INSERT INTO trending_posts (post_id, like_count, comment_count, score, rank,
+                                property_type, latitude, longitude, created_at, updated_at)
+    SELECT s.post_id, s.like_count, s.comment_count, s.score, 0,
+           p.property_type, p.latitude, p.longitude, s.created_at, s.updated_at
+    FROM unnest(CAST(:post_ids AS int[]), CAST(:like_counts AS int[]), CAST(:comment_counts AS int[]),
+                CAST(:scores AS float8[]), CAST(:created_ats AS timestamp[]), CAST(:updated_ats AS timestamp[]))
+         AS s(post_id, like_count, comment_count, score, created_at, updated_at)
+    LEFT JOIN ({POST_ATTRIBUTES}) p ON p.id = s.post_id
+    ON CONFLICT (post_id) DO UPDATE
+    SET like_count = EXCLUDED.like_count, comment_count = EXCLUDED.comment_count,
+        score = EXCLUDED.score, updated_at = EXCLUDED.updated_at,
+        property_type = EXCLUDED.property_type, latitude = EXCLUDED.latitude, longitude = EXCLUDED.longitude
+    RETURNING id, post_id, property_type, latitude, longitude
+""")
+
+# Adds coalesced (post_id, like_delta, comment_delta) rows to the stored
+# engagement and rescores, in one statement; post_ids must be unique. The
+# score is hot_score() in SQL plus the caller's velocity boost, which the
+# update reads back from the d CTE. Counts are not clamped: a post first seen
+# through an unlike holds net engagement since it was first seen, and
+# max(engagement, 1) keeps its score at the floor.
+APPLY_DELTAS_SQL = text(f"""
+    WITH d AS (
+        SELECT * FROM unnest(CAST(:post_ids AS int[]), CAST(:like_deltas AS int[]), CAST(:comment_deltas AS int[]),
+                             CAST(:boosts AS float8[]))
+            AS d(post_id, like_delta, comment_delta, boost)
+    )
+    INSERT INTO trending_posts AS t (post_id, like_count, comment_count, score, rank,
+                                     property_type, latitude, longitude, created_at, updated_at)
+    SELECT d.post_id, d.like_delta, d.comment_delta,
+           log(greatest(d.like_delta * 2 + d.comment_delta * 1.5, 1))
+               + extract(epoch FROM CAST(:now AS timestamp) - CAST(:hot_epoch AS timestamp)) / :decay_seconds
+               + d.boost,
+           0, p.property_type, p.latitude, p.longitude, :now, :now
+    FROM d
+    LEFT JOIN ({POST_ATTRIBUTES}) p ON p.id = d.post_id
+    ON CONFLICT (post_id) DO UPDATE
+    SET like_count = t.like_count + EXCLUDED.like_count,
+        comment_count = t.comment_count + EXCLUDED.comment_count,
+        score = log(greatest((t.like_count + EXCLUDED.like_count) * 2
+                             + (t.comment_count + EXCLUDED.comment_count) * 1.5, 1))
+                + extract(epoch FROM t.created_at - CAST(:hot_epoch AS timestamp)) / :decay_seconds
+                + (SELECT d.boost FROM d WHERE d.post_id = t.post_id),
+        updated_at = EXCLUDED.updated_at,
+        property_type = EXCLUDED.property_type, latitude = EXCLUDED.latitude, longitude = EXCLUDED.longitude
+    RETURNING id, post_id, like_count, comment_count, score, property_type, latitude, longitude, created_at
+""")
+
+
+def hot_score(like_count: int, comment_count: int, created_at: datetime) -> float:
+    # Score calculation formula:
+    # Engagement = (likes * 2) + (comments * 1.5)
+    # Score = log10(max(engagement, 1)) + (created_at - HOT_EPOCH) / DECAY_SECONDS
+    engagement = (like_count * 2) + (comment_count * 1.5)
+    return math.log10(max(engagement, 1)) + (created_at - HOT_EPOCH).total_seconds() / DECAY_SECONDS
+
+# Only the top K posts by score get a rank; everything below has rank 0
+RANK_TOP_K = int(os.getenv("TRENDING_RANK_TOP_K", "1000"))
+
+# Ranks the top :top_k posts 1..K by score (ties newest first) and resets posts that
+# fell out of the top K to 0, in one statement. Reads the top K off the score
+# index and the previously ranked posts off the partial rank index, so the
+# cost follows K rather than the size of the table, and only rows whose rank
+# actually changes are written. Returns each changed post's old and new rank,
+# which is what rank transitions (a post entering the top N) are read from.
+UPDATE_RANKS_SQL = text("""
+    WITH ranked AS (
+        SELECT id, rank AS old_rank, row_number() OVER (ORDER BY score DESC, id DESC) AS new_rank
+        FROM (
+            SELECT id, score, rank FROM trending_posts
+            ORDER BY score DESC, id DESC
+            LIMIT :top_k
+        ) top
+    ),
+    changes AS (
+        SELECT id, old_rank, new_rank FROM ranked
+        UNION ALL
+        SELECT t.id, t.rank, 0 FROM trending_posts t
+        WHERE t.rank > 0 AND NOT EXISTS (SELECT 1 FROM ranked r WHERE r.id = t.id)
+    )
+    UPDATE trending_posts t
+    SET rank = c.new_rank
+    FROM changes c
+    WHERE t.id = c.id AND t.rank IS DISTINCT FROM c.new_rank
+    RETURNING t.post_id, c.old_rank, c.new_rank, t.latitude, t.longitude
+""")
 
 class TrendingRepository:
     def __init__(self, db: Session):
         self.db = db
 
-    def calculate_score(self, like_count: int, comment_count: int, time_factor: float) -> float:
-        # Score calculation formula:
-        # Base score = (likes * 2) + (comments * 1.5)
-        # Time decay factor = 1 / (1 + hours_since_creation)
-        base_score = (like_count * 2) + (comment_count * 1.5)
-        return base_score * time_factor
+    def calculate_score(self, like_count: int, comment_count: int, created_at: datetime) -> float:
+        return hot_score(like_count, comment_count, created_at)
 
     def update_trending_posts(self, post_id: int, like_count: int, comment_count: int) -> Optional[TrendingPost]:
         # Get the post's creation time
         post = self.db.query(TrendingPost).filter(TrendingPost.post_id == post_id).first()
         
-        if not post:
-            # Create new trending post entry
-            hours_since_creation = 0
-            time_factor = 1.0
-        else:
-            # Calculate time factor for existing post
-            hours_since_creation = (datetime.utcnow() - post.created_at).total_seconds() / 3600
-            time_factor = 1.0 / (1.0 + hours_since_creation)
-
-        score = self.calculate_score(like_count, comment_count, time_factor)
+        # The score is anchored at the time the post was first seen, not at this update
+        created_at = post.created_at if post else datetime.utcnow()
+        score = self.calculate_score(like_count, comment_count, created_at)
+        attributes = self.db.execute(POST_ATTRIBUTES_SQL, {"post_ids": [post_id]}).first()
 
         if post:
             post.score = score
+            post.like_count = like_count
+            post.comment_count = comment_count
             post.updated_at = datetime.utcnow()
         else:
             post = TrendingPost(
                 post_id=post_id,
                 score=score,
+                like_count=like_count,
+                comment_count=comment_count,
                 rank=0,  # Will be updated in update_ranks
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow()
+                created_at=created_at,
+                updated_at=created_at
             )
             self.db.add(post)
+        post.property_type = attributes.property_type if attributes else None
+        post.latitude = attributes.latitude if attributes else None
+        post.longitude = attributes.longitude if attributes else None
 
         self.db.commit()
         self.db.refresh(post)
         return post
 
-    def get_trending_posts(self, limit: int = 20, offset: int = 0) -> List[TrendingPost]:
-        return self.db.query(TrendingPost)\
-            .order_by(TrendingPost.score.desc())\
+    def get_trending_posts(self, limit: int = 20, offset: int = 0, geohash: Optional[str] = None,
+                           property_type: Optional[str] = None) -> List[TrendingPost]:
+        """Trending posts in score order, optionally only those inside a geohash cell and/or of a property type"""
+        query = self.db.query(TrendingPost)
+        if property_type:
+            query = query.filter(TrendingPost.property_type == property_type)
+        if geohash:
+            min_lat, min_lng, max_lat, max_lng = bounds(geohash)
+            # Cells include their lower edges; the upper ones only at the edge of the globe
+            query = query.filter(
+                TrendingPost.latitude >= min_lat,
+                TrendingPost.latitude < max_lat if max_lat < 90 else TrendingPost.latitude <= max_lat,
+                TrendingPost.longitude >= min_lng,
+                TrendingPost.longitude < max_lng if max_lng < 180 else TrendingPost.longitude <= max_lng
+            )
+        return query\
+            .order_by(TrendingPost.score.desc(), TrendingPost.id.desc())\
             .offset(offset)\
             .limit(limit)\
             .all()
 
-    def update_ranks(self) -> None:
-        # Get all trending posts ordered by score
-        posts = self.db.query(TrendingPost)\
-            .order_by(TrendingPost.score.desc())\
-            .all()
-        
-        # Update ranks
-        for rank, post in enumerate(posts, 1):
-            post.rank = rank
-        
-        self.db.commit()
+    def upsert_trending_posts(self, posts: List[Tuple[int, int, int, float, datetime, datetime]]) -> list:
+        """Write (post_id, like_count, comment_count, score, created_at, updated_at) rows in one upsert.
+        Returns the written rows' ids and the post attributes copied into them."""
+        if not posts:
+            return []
+        try:
+            post_ids, like_counts, comment_counts, scores, created_ats, updated_ats = (
+                list(column) for column in zip(*posts)
+            )
+            rows = self.db.execute(UPSERT_TRENDING_SQL, {
+                "post_ids": post_ids,
+                "like_counts": like_counts,
+                "comment_counts": comment_counts,
+                "scores": scores,
+                "created_ats": created_ats,
+                "updated_ats": updated_ats
+            }).all()
+            self.db.commit()
+            return rows
+        except Exception:
+            self.db.rollback()
+            raise
+
+    def apply_metric_deltas(self, deltas: Dict[int, Tuple[int, int]], boosts: Optional[Dict[int, float]] = None) -> list:
+        """Add {post_id: (like_delta, comment_delta)} to stored engagement and rescore, in one upsert,
+        adding {post_id: velocity boost} where given. Returns the written rows with their new counts and scores."""
+        if not deltas:
+            return []
+        try:
+            rows = self.db.execute(APPLY_DELTAS_SQL, {
+                "post_ids": list(deltas),
+                "like_deltas": [like_delta for like_delta, _ in deltas.values()],
+                "comment_deltas": [comment_delta for _, comment_delta in deltas.values()],
+                "boosts": [(boosts or {}).get(post_id, 0.0) for post_id in deltas],
+                "now": datetime.utcnow(),
+                "hot_epoch": HOT_EPOCH,
+                "decay_seconds": DECAY_SECONDS
+            }).all()
+            self.db.commit()
+            return rows
+        except Exception:
+            self.db.rollback()
+            raise
+
+    def update_ranks(self, top_k: int = RANK_TOP_K) -> list:
+        """Recompute ranks for the top ``top_k`` posts. Returns the rows whose rank changed,
+        as (post_id, old_rank, new_rank, latitude, longitude)."""
+        try:
+            changed = self.db.execute(UPDATE_RANKS_SQL, {"top_k": top_k}).all()
+            self.db.commit()
+            return changed
+        except Exception:
+            self.db.rollback()
+            raise
 
     def get_post_rank(self, post_id: int) -> Optional[int]:
-        post = self.db.query(TrendingPost)\
+        # Only the rank column, looked up through the unique post_id index
+        return self.db.query(TrendingPost.rank)\
             .filter(TrendingPost.post_id == post_id)\
-            .first()
-        return post.rank if post else None 
\ No newline at end of file
+            .scalar()
+
+    def get_stored_posts(self, post_ids: List[int]) -> Dict[int, tuple]:
+        """{post_id: row} of the given posts' stored counts, first-seen time and attributes"""
+        if not post_ids:
+            return {}
+        rows = self.db.query(
+            TrendingPost.post_id, TrendingPost.id, TrendingPost.like_count, TrendingPost.comment_count,
+            TrendingPost.created_at, TrendingPost.updated_at, TrendingPost.latitude, TrendingPost.longitude,
+            TrendingPost.property_type
+        ).filter(TrendingPost.post_id.in_(post_ids)).all()
+        return {row.post_id: row for row in rows}
+
+    def get_posts_updated_since(self, since: datetime) -> list:
+        """Stored counts, first-seen time and attributes of the posts written after ``since``"""
+        return self.db.query(
+            TrendingPost.post_id, TrendingPost.id, TrendingPost.like_count, TrendingPost.comment_count,
+            TrendingPost.created_at, TrendingPost.updated_at, TrendingPost.latitude, TrendingPost.longitude,
+            TrendingPost.property_type
+        ).filter(TrendingPost.updated_at > since).all()
+
+    def get_post_ranks(self, post_ids: List[int]) -> Dict[int, int]:
+        """{post_id: rank} for the given posts that have a trending row"""
+        if not post_ids:
+            return {}
+        rows = self.db.query(TrendingPost.post_id, TrendingPost.rank)\
+            .filter(TrendingPost.post_id.in_(post_ids))\
+            .all()
+        return {row.post_id: row.rank for row in rows}
+
+    def get_ranked_posts(self) -> List[Tuple[int, int]]:
+        """(post_id, rank) of every post in the top K, read off the partial rank index"""
+        return self.db.query(TrendingPost.post_id, TrendingPost.rank)\
+            .filter(TrendingPost.rank > 0)\
+            .all()
@@ -0,0 +1,194 @@
+import os
+import glob
+import time
+import threading
+import logging
+from datetime import datetime, timezone
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple
+from ..proto_files.trending_pb2 import EngagementEventBatch
+
+logger = logging.getLogger(__name__)
+
+FILE_PREFIX = "trending-events-"
+FILE_SUFFIX = ".log"
+
+
+def write_batch(out: BinaryIO, batch: EngagementEventBatch) -> int:
+    """Write one record: the batch's size as a varint, then the batch. Returns the bytes written."""
+    payload = batch.SerializeToString()
+    size = len(payload)
+    header = bytearray()
+    while size > 0x7F:
+        header.append(size & 0x7F | 0x80)
+        size >>= 7
+    header.append(size)
+    out.write(header)
+    out.write(payload)
+    return len(header) + len(payload)
+
+
+def read_batches(path: str) -> Iterator[EngagementEventBatch]:
+    """Batches of one log file, in the order written. A record cut short at the
+    end (the service stopped mid-write) is skipped."""
+    with open(path, "rb") as f:
+        data = f.read()
+    position = 0
+    while position < len(data):
+        size = shift = 0
+        while position < len(data):
+            byte = data[position]
+            position += 1
+            size |= (byte & 0x7F) << shift
+            shift += 7
+            if not byte & 0x80:
+                break
+        else:
+            return
+        if position + size > len(data):
+            logger.warning(f"{path}: skipping a truncated record at byte {position}")
+            return
+        yield EngagementEventBatch.FromString(data[position:position + size])
+        position += size
+
+
+def log_files(directory: str) -> List[str]:
+    """The log files in a directory, oldest first"""
+    return sorted(glob.glob(os.path.join(directory, f"{FILE_PREFIX}*{FILE_SUFFIX}")))
+
+
+class EventLog:
+    """Append-only log of the engagement the service applies, for replaying offline.
+
+    Metric updates and coalesced deltas are buffered in memory as columns and
+    written every ``flush_interval_s`` seconds as one ``EngagementEventBatch``
+    record, its size as a varint followed by the message (protobuf's
+    delimited framing), so the hot path only appends to lists. Packed columns
+    cost about 10 bytes an event. Files are named after the UTC time they were
+    opened and a new one is started once one passes ``rotate_bytes``; nothing
+    is deleted, so retention is up to whatever ships or prunes ``directory``.
+    When a flush falls behind by more than ``max_pending`` events the newest
+    are dropped and counted rather than held in memory.
+
+    ``benchmarks/replay_trending.py`` reads the files back to score them
+    under alternative formulas.
+    """
+
+    def __init__(self, directory: str, flush_interval_s: float = 1.0, rotate_bytes: int = 256 * 1024 * 1024,
+                 max_pending: int = 1000000):
+        self.directory = directory
+        self.flush_interval = flush_interval_s
+        self.rotate_bytes = rotate_bytes
+        self.max_pending = max_pending
+        self._lock = threading.Lock()  # guards the pending columns
+        self._write_lock = threading.Lock()  # guards the open file
+        self._pending = self._new_columns()
+        self._file = None
+        self._file_bytes = 0
+        self._events = 0
+        self._dropped = 0
+        self._errors = 0
+        self._stopped = threading.Event()
+        self._thread = None
+
+    @classmethod
+    def from_env(cls) -> Optional["EventLog"]:
+        """Build a log from TRENDING_EVENT_LOG_* env vars, or None when no directory is set"""
+        directory = os.getenv("TRENDING_EVENT_LOG_DIR")
+        if not directory:
+            return None
+        return cls(
+            directory,
+            flush_interval_s=float(os.getenv("TRENDING_EVENT_LOG_FLUSH_S", "1")),
+            rotate_bytes=int(float(os.getenv("TRENDING_EVENT_LOG_ROTATE_MB", "256")) * 1024 * 1024),
+            max_pending=int(os.getenv("TRENDING_EVENT_LOG_MAX_PENDING", "1000000"))
+        )
+
+    def start(self) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        self._thread = threading.Thread(target=self._run, name="trending-event-log", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Write what is pending and close the file"""
+        self._stopped.set()
+        if self._thread:
+            self._thread.join()
+        self.flush()
+        with self._write_lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def append_update(self, post_id: int, like_count: int, comment_count: int) -> None:
+        """An UpdatePostMetrics call: the post's counts are now these"""
+        self._append({post_id: (like_count, comment_count)}, True)
+
+    def append_deltas(self, deltas: Dict[int, Tuple[int, int]]) -> None:
+        """Coalesced {post_id: (like_delta, comment_delta)} as applied"""
+        if deltas:
+            self._append(deltas, False)
+
+    def _append(self, counts: Dict[int, Tuple[int, int]], absolute: bool) -> None:
+        with self._lock:
+            # Stamped under the lock, so times never go backwards within a file
+            at_ms = int(time.time() * 1000)
+            pending = self._pending
+            if len(pending["post_ids"]) + len(counts) > self.max_pending:
+                self._dropped += len(counts)
+                return
+            pending["at_ms"].extend([at_ms] * len(counts))
+            pending["post_ids"].extend(counts.keys())
+            for like_count, comment_count in counts.values():
+                pending["like_counts"].append(like_count)
+                pending["comment_counts"].append(comment_count)
+            pending["absolute"].extend([absolute] * len(counts))
+
+    def flush(self) -> int:
+        """Write pending events as one record. Returns the number written."""
+        with self._lock:
+            pending, self._pending = self._pending, self._new_columns()
+        count = len(pending["post_ids"])
+        if not count:
+            return 0
+        batch = EngagementEventBatch(**pending)
+        with self._write_lock:
+            try:
+                if self._file is None or self._file_bytes >= self.rotate_bytes:
+                    self._open()
+                self._file_bytes += write_batch(self._file, batch)
+                self._file.flush()
+            except Exception as e:
+                logger.error(f"Trending event log write failed, {count} events lost: {e}")
+                self._errors += 1
+                self._dropped += count
+                return 0
+        self._events += count
+        return count
+
+    def stats(self) -> dict:
+        return {
+            "events": self._events,
+            "dropped": self._dropped,
+            "errors": self._errors,
+            "file_bytes": self._file_bytes
+        }
+
+    def _open(self) -> None:
+        if self._file is not None:
+            self._file.close()
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+        path = os.path.join(self.directory, f"{FILE_PREFIX}{stamp}{FILE_SUFFIX}")
+        self._file = open(path, "ab")
+        self._file_bytes = self._file.tell()
+        logger.info(f"Writing trending events to {path}")
+
+    @staticmethod
+    def _new_columns() -> Dict[str, list]:
+        return {"at_ms": [], "post_ids": [], "like_counts": [], "comment_counts": [], "absolute": []}
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Trending event log error: {e}")
@@ -0,0 +1,245 @@
+import os
+import random
+import threading
+import time
+import logging
+from bisect import bisect_left
+from typing import List, Optional, Tuple
+import numpy as np
+from sqlalchemy import text
+from ..repository.trending_repository import TrendingRepository, RANK_TOP_K
+from .trending_notifier import TrendingNotifier
+
+logger = logging.getLogger(__name__)
+
+# Session-level advisory lock held by the one replica that refreshes ranks.
+# Every replica must use the same key.
+RANK_LOCK_KEY = int(os.getenv("TRENDING_RANK_LOCK_KEY", "7305013"))
+TRY_LOCK_SQL = text("SELECT pg_try_advisory_lock(:key)")
+PING_SQL = text("SELECT 1")
+
+# Upper bounds, in milliseconds, of the run-time histogram buckets
+RUN_MS_BUCKETS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class RankIndex:
+    """The stored top K as two parallel arrays sorted by post_id, for many lookups at once"""
+
+    def __init__(self, rows: List[Tuple[int, int]]):
+        rows = sorted(rows)
+        self.post_ids = np.fromiter((post_id for post_id, _ in rows), dtype=np.int64, count=len(rows))
+        self.ranks = np.fromiter((rank for _, rank in rows), dtype=np.int32, count=len(rows))
+
+    def __len__(self) -> int:
+        return len(self.post_ids)
+
+    def lookup(self, post_ids: List[int]) -> List[int]:
+        """Ranks in the order asked for, 0 for posts outside the top K"""
+        if not len(self.post_ids):
+            return [0] * len(post_ids)
+        wanted = np.asarray(post_ids, dtype=np.int64)
+        positions = np.minimum(np.searchsorted(self.post_ids, wanted), len(self.post_ids) - 1)
+        return np.where(self.post_ids[positions] == wanted, self.ranks[positions], 0).tolist()
+
+
+class RankUpdater:
+    """Refreshes the stored trending ranks on one replica at a time.
+
+    Every ``interval_s`` seconds, give or take ``jitter`` of it so replicas
+    started together drift apart, the updater tries to take a Postgres
+    advisory lock and, if it holds it, runs ``update_ranks`` in a session of
+    its own. The lock lives on a dedicated autocommit connection, so it is
+    held for as long as the replica is up and released by ``stop`` or by the
+    connection going away, at which point another replica takes over on its
+    next pass. With N replicas the ranking work is done once per interval.
+
+    After every pass, leader or not, the replica reads the ranked posts back
+    into a ``RankIndex`` (K rows off the partial rank index) and swaps it in
+    whole, so ``ranks`` answers batches of rank lookups from memory and never
+    sees a half-refreshed index. Pass ``keep_index=False`` when ranks are
+    read from elsewhere.
+
+    The leader hands the ranks each refresh changed to ``notifier``, if any,
+    so posts entering the top N are announced once, by one replica.
+
+    Run times are kept in a histogram; ``stats()`` returns it and a summary
+    is logged every ``log_every`` runs.
+    """
+
+    def __init__(self, session_factory, interval_s: float = 300, jitter: float = 0.1, top_k: int = RANK_TOP_K,
+                 lock_key: int = RANK_LOCK_KEY, log_every: int = 12, keep_index: bool = True,
+                 notifier: Optional[TrendingNotifier] = None):
+        self.session_factory = session_factory
+        self.interval = interval_s
+        self.jitter = jitter
+        self.top_k = top_k
+        self.lock_key = lock_key
+        self.log_every = log_every
+        self.keep_index = keep_index
+        self.notifier = notifier
+        self._index: Optional[RankIndex] = None
+        self._lock_db = None  # session pinned to the connection that holds the advisory lock
+        self._lock_connection = None
+        self._leader = False
+        self._stats_lock = threading.Lock()
+        self._runs = 0
+        self._skipped = 0
+        self._errors = 0
+        self._changed = 0
+        self._last_ms = 0.0
+        self._max_ms = 0.0
+        self._buckets = [0] * (len(RUN_MS_BUCKETS) + 1)
+        self._stopped = threading.Event()
+        self._thread = None
+
+    @classmethod
+    def from_env(cls, session_factory, interval_s: float = 60, keep_index: bool = True,
+                 notifier: Optional[TrendingNotifier] = None) -> Optional["RankUpdater"]:
+        """Build an updater from TRENDING_RANK_* env vars, or None when it is disabled"""
+        if os.getenv("TRENDING_RANK_UPDATER_ENABLED", "true").lower() not in ("1", "true", "yes"):
+            return None
+        return cls(
+            session_factory,
+            interval_s=float(os.getenv("TRENDING_RANK_INTERVAL_S", str(interval_s))),
+            jitter=float(os.getenv("TRENDING_RANK_JITTER", "0.1")),
+            log_every=int(os.getenv("TRENDING_RANK_LOG_EVERY", "12")),
+            keep_index=keep_index,
+            notifier=notifier
+        )
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="trending-rank-updater", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop after the run in progress and hand the lock to another replica"""
+        self._stopped.set()
+        if self._thread:
+            self._thread.join()
+        self._release()
+
+    @property
+    def is_leader(self) -> bool:
+        return self._leader
+
+    def run(self) -> Optional[int]:
+        """One pass: refresh ranks if this replica is the leader, then reload the rank index.
+        Returns the number of rows whose rank changed, or None when another replica holds the lock."""
+        if self._acquire():
+            changed = self._update_ranks()
+        else:
+            changed = None
+            with self._stats_lock:
+                self._skipped += 1
+        if self.keep_index:
+            self._load_index()
+        return changed
+
+    def ranks(self, post_ids: List[int]) -> Optional[List[int]]:
+        """Stored ranks of the posts (0 outside the top K), or None until an index has loaded"""
+        index = self._index
+        return index.lookup(post_ids) if index is not None else None
+
+    def _update_ranks(self) -> Optional[int]:
+        started = time.perf_counter()
+        db = self.session_factory()
+        try:
+            changed = TrendingRepository(db).update_ranks(self.top_k)
+        except Exception as e:
+            logger.error(f"Trending rank update failed: {e}")
+            with self._stats_lock:
+                self._errors += 1
+            return None
+        finally:
+            db.close()
+        self._record((time.perf_counter() - started) * 1000, len(changed))
+        if self.notifier is not None:
+            self.notifier.ranks_changed(changed)
+        return len(changed)
+
+    def stats(self) -> dict:
+        with self._stats_lock:
+            labels = [f"le_{bound}" for bound in RUN_MS_BUCKETS] + ["inf"]
+            return {
+                "leader": self._leader,
+                "runs": self._runs,
+                "skipped": self._skipped,
+                "errors": self._errors,
+                "changed": self._changed,
+                "last_ms": round(self._last_ms, 2),
+                "max_ms": round(self._max_ms, 2),
+                "indexed": len(self._index) if self._index is not None else 0,
+                "run_ms": dict(zip(labels, self._buckets))
+            }
+
+    def _record(self, run_ms: float, changed: int) -> None:
+        with self._stats_lock:
+            self._runs += 1
+            self._changed += changed
+            self._last_ms = run_ms
+            self._max_ms = max(self._max_ms, run_ms)
+            self._buckets[bisect_left(RUN_MS_BUCKETS, run_ms)] += 1
+            runs = self._runs
+        logger.debug(f"Refreshed trending ranks in {run_ms:.1f} ms, {changed} changed")
+        if self.log_every and runs % self.log_every == 0:
+            logger.info(f"Trending rank updater: {self.stats()}")
+
+    def _load_index(self) -> None:
+        db = self.session_factory()
+        try:
+            index = RankIndex(TrendingRepository(db).get_ranked_posts())
+        except Exception as e:
+            logger.error(f"Trending rank index refresh failed, keeping the previous one: {e}")
+            return
+        finally:
+            db.close()
+        self._index = index
+
+    def _acquire(self) -> bool:
+        try:
+            if self._lock_db is None:
+                self._lock_db = self.session_factory()
+                # Autocommit, so holding the connection does not hold a transaction open
+                self._lock_connection = self._lock_db.connection(execution_options={"isolation_level": "AUTOCOMMIT"})
+            if self._leader:
+                # Held until its connection closes, so the leader only checks the connection is alive
+                self._lock_db.execute(PING_SQL)
+                leader = True
+            else:
+                leader = bool(self._lock_db.execute(TRY_LOCK_SQL, {"key": self.lock_key}).scalar())
+        except Exception as e:
+            logger.error(f"Trending rank lock check failed: {e}")
+            self._close_lock_db()
+            leader = False
+        if leader != self._leader:
+            logger.info("Took over trending rank updates" if leader else "Another replica now updates trending ranks")
+        self._leader = leader
+        return leader
+
+    def _release(self) -> None:
+        self._leader = False
+        self._close_lock_db()
+
+    def _close_lock_db(self) -> None:
+        # Closes the database connection rather than returning it to the pool, where
+        # it would go on holding the lock; Postgres releases it with the connection
+        if self._lock_db is not None:
+            try:
+                if self._lock_connection is not None:
+                    self._lock_connection.invalidate()
+                self._lock_db.close()
+            except Exception as e:
+                logger.error(f"Trending rank lock release failed: {e}")
+            self._lock_db = None
+            self._lock_connection = None
+
+    def _next_wait(self) -> float:
+        return self.interval * (1 + random.uniform(-self.jitter, self.jitter))
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                self.run()
+            except Exception as e:
+                logger.error(f"Trending rank updater error: {e}")
+            self._stopped.wait(self._next_wait())
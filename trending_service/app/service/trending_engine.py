@@ -0,0 +1,440 @@
+import os
+import time
+import threading
+import logging
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+from sortedcontainers import SortedList
+from ..repository.trending_repository import TrendingRepository, RANK_TOP_K, hot_score
+from ..utils.geohash import encode_location
+from .velocity import VelocityTracker
+
+logger = logging.getLogger(__name__)
+
+
+class Entry(NamedTuple):
+    id: int  # trending_posts.id, 0 until the first snapshot writes the row
+    like_count: int
+    comment_count: int
+    score: float
+    created_at: datetime
+    updated_at: datetime
+    # Copied from the post by the snapshot that first writes it; None until then, or when the post has none
+    geohash: Optional[str] = None
+    property_type: Optional[str] = None
+
+
+class TrendingEngine:
+    """Trending scores held in memory and snapshotted to trending_posts.
+
+    Posts sit in a ``SortedList`` by score, globally and in one shard per
+    geohash prefix and property type, so updates, ``top`` and ``rank`` cost
+    O(log n) (plus k read) with no database round trip. At most ``max_posts``
+    are tracked; the lowest scored are evicted past that. Every
+    ``snapshot_interval_s`` the changed posts are upserted in one statement,
+    and rows other replicas wrote since the last ``refresh`` are merged back
+    in. A post the engine does not track is read from trending_posts before
+    its first update. With a ``VelocityTracker`` a post's score is its hot
+    score plus its (unpersisted, per-replica) velocity boost.
+
+    Off by default (TRENDING_ENGINE_ENABLED): every replica running one is
+    another writer of trending_posts, and the last snapshot wins.
+    """
+
+    def __init__(self, session_factory, snapshot_interval_s: float = 10, max_posts: int = 100000,
+                 top_k: int = RANK_TOP_K, shard_precision: int = 5, velocity: Optional[VelocityTracker] = None,
+                 refresh_interval_s: float = 10, refresh_overlap_s: float = 60):
+        self.session_factory = session_factory
+        self.snapshot_interval = snapshot_interval_s
+        self.refresh_interval = refresh_interval_s
+        self.refresh_overlap = timedelta(seconds=refresh_overlap_s)
+        self.max_posts = max_posts
+        self.top_k = top_k
+        self.shard_precision = shard_precision
+        self.velocity = velocity
+        self._lock = threading.Lock()
+        self._snapshot_lock = threading.Lock()
+        self._entries: Dict[int, Entry] = {}
+        self._order = SortedList()  # (-score, -post_id), best first; ties newest first
+        self._shards: Dict[Tuple[str, str], SortedList] = {}  # (geohash prefix, property_type), "" for any
+        self._dirty = set()  # posts whose absolute counts the next snapshot writes
+        self._evicted: Dict[int, Entry] = {}  # dirty posts evicted before that snapshot
+        self._deltas: Dict[int, Tuple[int, int]] = {}  # unwritten deltas for posts without known counts
+        self._refreshed_at: Optional[datetime] = None  # rows written after this are merged by the next refresh
+        self._stopped = threading.Event()
+        self._thread = None
+
+    @classmethod
+    def from_env(cls, session_factory) -> Optional["TrendingEngine"]:
+        """Build an engine from TRENDING_ENGINE_* env vars, or None when it is disabled"""
+        if os.getenv("TRENDING_ENGINE_ENABLED", "false").lower() not in ("1", "true", "yes"):
+            return None
+        return cls(
+            session_factory,
+            snapshot_interval_s=float(os.getenv("TRENDING_ENGINE_SNAPSHOT_S", "10")),
+            max_posts=int(os.getenv("TRENDING_ENGINE_MAX_POSTS", "100000")),
+            shard_precision=int(os.getenv("TRENDING_GEOHASH_SHARD_PRECISION", "5")),
+            velocity=VelocityTracker.from_env(),
+            refresh_interval_s=float(os.getenv("TRENDING_ENGINE_REFRESH_S", "10")),
+            refresh_overlap_s=float(os.getenv("TRENDING_ENGINE_REFRESH_OVERLAP_S", "60"))
+        )
+
+    def start(self) -> None:
+        self.load()
+        self._thread = threading.Thread(target=self._run, name="trending-snapshot", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the snapshot thread and write out the updates it has not snapshotted yet"""
+        self._stopped.set()
+        if self._thread:
+            self._thread.join()
+        self.snapshot()
+
+    def load(self) -> int:
+        """Fill the engine with the top ``max_posts`` rows of trending_posts. Returns how many were loaded."""
+        self._refreshed_at = datetime.utcnow()
+        db = self.session_factory()
+        try:
+            rows = TrendingRepository(db).get_trending_posts(self.max_posts, 0)
+        finally:
+            db.close()
+        with self._lock:
+            for row in rows:
+                if row.post_id not in self._entries:
+                    score = hot_score(row.like_count, row.comment_count, row.created_at) + self._boost(row.post_id)
+                    self._put(row.post_id, Entry(
+                        row.id, row.like_count, row.comment_count, score, row.created_at, row.updated_at,
+                        encode_location(row.latitude, row.longitude), row.property_type
+                    ))
+                    if abs(score - row.score) > 1e-6:
+                        self._dirty.add(row.post_id)  # stored with a velocity boost that is gone
+        logger.info(f"Loaded {len(rows)} trending posts")
+        return len(rows)
+
+    def update(self, post_id: int, like_count: int, comment_count: int) -> dict:
+        """Rescore a post from its current metrics and return it as a trending post dict"""
+        stored = self._lookup([post_id])
+        with self._lock:
+            self._advance()
+            self._admit([post_id], stored)
+            previous = self._entries.get(post_id)
+            if previous and post_id not in self._deltas:
+                self._record(post_id, like_count - previous.like_count, comment_count - previous.comment_count)
+            entry = self._set(post_id, like_count, comment_count, datetime.utcnow())
+            rank = self._rank(post_id)
+            self._evict()
+        return self._to_dict(post_id, entry, rank)
+
+    def apply_deltas(self, deltas: Dict[int, Tuple[int, int]]) -> int:
+        """Add {post_id: (like_delta, comment_delta)} to the posts' engagement and rescore them.
+
+        Untracked posts with no stored row start from zero. Nothing is written
+        here; the next snapshot writes each changed post once, however many
+        deltas it got.
+        Returns the number of posts updated.
+        """
+        now = datetime.utcnow()
+        try:
+            stored = self._lookup(list(deltas))
+        except Exception as e:
+            # The snapshot's delta upsert still scores them from the stored rows
+            logger.error(f"Trending lookup of {len(deltas)} posts failed, applying their deltas unread: {e}")
+            stored = {}
+        with self._lock:
+            self._advance()
+            self._admit(deltas, stored)
+            for post_id, (like_delta, comment_delta) in deltas.items():
+                self._record(post_id, like_delta, comment_delta)
+                entry = self._entries.get(post_id)
+                if entry and post_id not in self._deltas:
+                    self._set(post_id, entry.like_count + like_delta, entry.comment_count + comment_delta, now)
+                    continue
+                # Counts unknown until the snapshot adds these to the stored ones; rank on what we have meanwhile
+                pending = self._deltas.get(post_id, (0, 0))
+                pending = self._deltas[post_id] = (pending[0] + like_delta, pending[1] + comment_delta)
+                if entry:
+                    self._set(post_id, entry.like_count + like_delta, entry.comment_count + comment_delta, now, dirty=False)
+                else:
+                    self._set(post_id, pending[0], pending[1], now, dirty=False)
+            self._evict()
+        return len(deltas)
+
+    def top(self, limit: int = 20, offset: int = 0, geohash: Optional[str] = None,
+            property_type: Optional[str] = None) -> List[dict]:
+        """Trending posts ``offset`` to ``offset + limit``, best first, optionally only those
+        inside a geohash cell and/or of a property type"""
+        geohash = geohash or ""
+        property_type = property_type or ""
+        with self._lock:
+            if not geohash and not property_type:
+                keys = list(self._order.islice(offset, offset + limit))
+            elif len(geohash) <= self.shard_precision:
+                shard = self._shards.get((geohash, property_type))
+                keys = list(shard.islice(offset, offset + limit)) if shard else []
+            else:
+                shard = self._shards.get((geohash[:self.shard_precision], property_type), ())
+                matching = (key for key in shard if self._entries[-key[1]].geohash.startswith(geohash))
+                keys = list(islice(matching, offset, offset + limit))
+            return [
+                self._to_dict(-post_id, self._entries[-post_id], offset + i + 1)
+                for i, (_, post_id) in enumerate(keys)
+            ]
+
+    def rank(self, post_id: int) -> Optional[int]:
+        """The post's rank, 0 outside the top K, or None when the engine does not track it"""
+        with self._lock:
+            if post_id not in self._entries:
+                return None
+            return self._rank(post_id)
+
+    def ranks(self, post_ids: List[int]) -> List[Optional[int]]:
+        """``rank`` for many posts under one lock"""
+        with self._lock:
+            return [self._rank(post_id) if post_id in self._entries else None for post_id in post_ids]
+
+    def snapshot(self) -> int:
+        """Write posts updated since the last snapshot to trending_posts. Returns how many were written."""
+        with self._snapshot_lock:
+            with self._lock:
+                self._advance()
+                dirty, self._dirty = self._dirty, set()
+                batch = {post_id: self._evicted.get(post_id) or self._entries[post_id] for post_id in dirty}
+                self._evicted = {}
+                deltas, self._deltas = self._deltas, {}
+                boosts = {post_id: self._boost(post_id) for post_id in deltas}
+            if not batch and not deltas:
+                return 0
+
+            db = self.session_factory()
+            try:
+                repository = TrendingRepository(db)
+                written = repository.upsert_trending_posts([
+                    (post_id, entry.like_count, entry.comment_count, entry.score, entry.created_at, entry.updated_at)
+                    for post_id, entry in batch.items()
+                ])
+                stored = repository.apply_metric_deltas(deltas, boosts)
+            except Exception as e:
+                logger.error(f"Trending snapshot of {len(batch) + len(deltas)} posts failed, will retry: {e}")
+                with self._lock:
+                    for post_id, entry in batch.items():
+                        if post_id not in self._entries:
+                            self._evicted[post_id] = entry
+                        self._dirty.add(post_id)
+                    for post_id, (like_delta, comment_delta) in deltas.items():
+                        if post_id in self._dirty and post_id not in batch:
+                            continue  # an absolute update replaced the counts these deltas were for
+                        pending = self._deltas.get(post_id, (0, 0))
+                        self._deltas[post_id] = (pending[0] + like_delta, pending[1] + comment_delta)
+                return 0
+            finally:
+                db.close()
+
+            with self._lock:
+                for row in written:
+                    entry = self._entries.get(row.post_id)
+                    geohash = encode_location(row.latitude, row.longitude)
+                    if entry and (entry.id, entry.geohash, entry.property_type) != (row.id, geohash, row.property_type):
+                        self._put(row.post_id, entry._replace(
+                            id=row.id, geohash=geohash, property_type=row.property_type
+                        ))
+                for row in stored:
+                    entry = self._entries.get(row.post_id)
+                    if entry is None or row.post_id in self._dirty and row.post_id not in self._deltas:
+                        continue
+                    # Stored counts plus whatever arrived since; those deltas stay queued for the next snapshot
+                    like_delta, comment_delta = self._deltas.get(row.post_id, (0, 0))
+                    self._put(row.post_id, Entry(
+                        row.id, row.like_count + like_delta, row.comment_count + comment_delta,
+                        hot_score(row.like_count + like_delta, row.comment_count + comment_delta, row.created_at)
+                        + self._boost(row.post_id),
+                        row.created_at, entry.updated_at, encode_location(row.latitude, row.longitude), row.property_type
+                    ))
+            return len(batch) + len(deltas)
+
+    def refresh(self) -> int:
+        """Merge the trending_posts rows written since the last refresh, by this replica or
+        others, into the posts without unwritten local changes. Returns how many changed."""
+        # Under the snapshot lock, so a row read here is never older than a snapshot that lands meanwhile
+        with self._snapshot_lock:
+            started = datetime.utcnow()
+            since = (self._refreshed_at or started) - self.refresh_overlap
+            db = self.session_factory()
+            try:
+                rows = TrendingRepository(db).get_posts_updated_since(since)
+            finally:
+                db.close()
+            self._refreshed_at = started
+            merged = 0
+            with self._lock:
+                self._advance()
+                for row in rows:
+                    if row.post_id in self._dirty or row.post_id in self._deltas or row.post_id in self._evicted:
+                        continue  # the next snapshot writes this replica's counts
+                    entry = self._entries.get(row.post_id)
+                    geohash = encode_location(row.latitude, row.longitude)
+                    if entry and (entry.id, entry.like_count, entry.comment_count, entry.geohash, entry.property_type)\
+                            == (row.id, row.like_count, row.comment_count, geohash, row.property_type):
+                        continue
+                    self._put(row.post_id, Entry(
+                        row.id, row.like_count, row.comment_count,
+                        hot_score(row.like_count, row.comment_count, row.created_at) + self._boost(row.post_id),
+                        row.created_at, row.updated_at, geohash, row.property_type
+                    ))
+                    merged += 1
+                self._evict()
+            if merged:
+                logger.info(f"Merged {merged} trending posts written since {since.isoformat()}")
+            return merged
+
+    def _set(self, post_id: int, like_count: int, comment_count: int, now: datetime, dirty: bool = True) -> Entry:
+        # Caller holds self._lock
+        entry = self._entries.get(post_id)
+        # The score is anchored at the time the post was first seen, not at this update
+        created_at = entry.created_at if entry else now
+        entry = Entry(
+            entry.id if entry else 0, like_count, comment_count,
+            hot_score(like_count, comment_count, created_at) + self._boost(post_id), created_at, now,
+            entry.geohash if entry else None, entry.property_type if entry else None
+        )
+        self._put(post_id, entry)
+        if dirty:
+            self._dirty.add(post_id)
+            self._deltas.pop(post_id, None)
+            self._evicted.pop(post_id, None)
+        return entry
+
+    def _lookup(self, post_ids: List[int]) -> dict:
+        """Stored rows of the posts among these that the engine does not track"""
+        # Read without the lock; _admit skips posts that were admitted meanwhile
+        untracked = [post_id for post_id in post_ids if post_id not in self._entries and post_id not in self._evicted]
+        if not untracked:
+            return {}
+        db = self.session_factory()
+        try:
+            return TrendingRepository(db).get_stored_posts(untracked)
+        finally:
+            db.close()
+
+    def _admit(self, post_ids: Iterable[int], stored: dict) -> None:
+        # Caller holds self._lock
+        for post_id in post_ids:
+            if post_id in self._entries:
+                continue
+            # Evicted before a snapshot wrote it, the stored row is behind the evicted entry; it is still dirty
+            entry = self._evicted.get(post_id)
+            if entry is None:
+                row = stored.get(post_id)
+                if row is None:
+                    continue  # never stored: new, first seen now
+                entry = Entry(row.id, row.like_count, row.comment_count, 0.0, row.created_at, row.updated_at,
+                              encode_location(row.latitude, row.longitude), row.property_type)
+            # Deltas that arrived while it was untracked are not in those counts yet
+            like_delta, comment_delta = self._deltas.get(post_id, (0, 0))
+            like_count, comment_count = entry.like_count + like_delta, entry.comment_count + comment_delta
+            self._put(post_id, entry._replace(
+                like_count=like_count, comment_count=comment_count,
+                score=hot_score(like_count, comment_count, entry.created_at) + self._boost(post_id)
+            ))
+
+    def _boost(self, post_id: int) -> float:
+        # Caller holds self._lock
+        return self.velocity.boost(post_id) if self.velocity is not None else 0.0
+
+    def _record(self, post_id: int, like_delta: int, comment_delta: int) -> None:
+        # Caller holds self._lock
+        if self.velocity is not None and (like_delta or comment_delta):
+            evicted = self.velocity.record(post_id, like_delta * 2 + comment_delta * 1.5, time.time())
+            if evicted is not None:
+                self._rescore(evicted, 0.0)
+
+    def _advance(self) -> None:
+        # Caller holds self._lock
+        if self.velocity is not None:
+            for post_id, boost in self.velocity.advance(time.time()).items():
+                self._rescore(post_id, boost)
+
+    def _rescore(self, post_id: int, boost: float) -> None:
+        # Caller holds self._lock
+        entry = self._entries.get(post_id)
+        if entry is None:
+            return
+        score = hot_score(entry.like_count, entry.comment_count, entry.created_at) + boost
+        if score != entry.score:
+            self._put(post_id, entry._replace(score=score))
+            if post_id not in self._deltas:
+                self._dirty.add(post_id)  # posts with pending deltas get their boost written with them
+
+    def _evict(self) -> None:
+        # Caller holds self._lock
+        while len(self._entries) > self.max_posts:
+            _, post_id = self._order[-1]
+            entry = self._entries.pop(-post_id)
+            self._unindex(-post_id, entry)
+            if -post_id in self._dirty:
+                # Keep the counts it was dirtied with; a later entry may be built on deltas alone
+                self._evicted.setdefault(-post_id, entry)
+
+    def _put(self, post_id: int, entry: Entry) -> None:
+        # Caller holds self._lock
+        previous = self._entries.get(post_id)
+        if previous is not None:
+            self._unindex(post_id, previous)
+        self._entries[post_id] = entry
+        key = (-entry.score, -post_id)
+        self._order.add(key)
+        for shard_key in self._shard_keys(entry):
+            shard = self._shards.get(shard_key)
+            if shard is None:
+                shard = self._shards[shard_key] = SortedList()
+            shard.add(key)
+
+    def _unindex(self, post_id: int, entry: Entry) -> None:
+        # Caller holds self._lock
+        key = (-entry.score, -post_id)
+        self._order.remove(key)
+        for shard_key in self._shard_keys(entry):
+            shard = self._shards[shard_key]
+            shard.remove(key)
+            if not shard:
+                del self._shards[shard_key]
+
+    def _shard_keys(self, entry: Entry) -> List[Tuple[str, str]]:
+        prefixes = [""]
+        if entry.geohash:
+            prefixes += [entry.geohash[:length] for length in range(1, self.shard_precision + 1)]
+        property_types = [""] + ([entry.property_type] if entry.property_type else [])
+        return [(prefix, property_type) for prefix in prefixes for property_type in property_types
+                if prefix or property_type]
+
+    def _rank(self, post_id: int) -> int:
+        # Caller holds self._lock
+        position = self._order.index((-self._entries[post_id].score, -post_id)) + 1
+        return position if position <= self.top_k else 0
+
+    def _to_dict(self, post_id: int, entry: Entry, rank: int) -> dict:
+        return {
+            "id": entry.id,
+            "post_id": post_id,
+            "score": entry.score,
+            "rank": rank if rank <= self.top_k else 0,
+            "geohash": entry.geohash or "",
+            "property_type": entry.property_type or "",
+            "created_at": entry.created_at.isoformat(),
+            "updated_at": entry.updated_at.isoformat()
+        }
+
+    def _run(self) -> None:
+        next_refresh = time.monotonic() + self.refresh_interval
+        while not self._stopped.wait(self.snapshot_interval):
+            try:
+                self.snapshot()
+            except Exception as e:
+                logger.error(f"Trending snapshot error: {e}")
+            if self.refresh_interval and time.monotonic() >= next_refresh:
+                next_refresh = time.monotonic() + self.refresh_interval
+                try:
+                    self.refresh()
+                except Exception as e:
+                    logger.error(f"Trending refresh error: {e}")
@@ -0,0 +1,80 @@
+import os
+import logging
+from concurrent import futures
+from typing import List, Optional
+import grpc
+from ..proto_files import notification_pb2, notification_pb2_grpc
+
+logger = logging.getLogger(__name__)
+
+
+class TrendingNotifier:
+    """Tells the notification service about posts that just entered the trending top N.
+
+    The rank refresh hands over every rank it changed; only posts moving from
+    outside the top ``top_n`` (or unranked) into it are sent, one
+    ``NotifyTrendingPostsBatch`` call per refresh, so notification work follows
+    how many posts break in rather than how many are trending. Posts with no
+    location are skipped, since subscriptions are by location. The
+    notification service notifies each user about a post once, so a post
+    bouncing around the cut-off does not notify anyone twice.
+
+    Calls run on a single background worker, in refresh order, so a slow or
+    unavailable notification service never holds up the rank refresh. A failed
+    call is logged and its posts are not notified.
+    """
+
+    def __init__(self, target: str, top_n: int = 100, radius_km: float = 10, timeout_s: float = 10):
+        self.top_n = top_n
+        self.radius_km = radius_km
+        self.timeout = timeout_s
+        self._channel = grpc.insecure_channel(target)
+        self._stub = notification_pb2_grpc.NotificationServiceStub(self._channel)
+        self._executor = futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="trending-notifier")
+
+    @classmethod
+    def from_env(cls) -> Optional["TrendingNotifier"]:
+        """Build a notifier from TRENDING_NOTIFY_* env vars, or None when notifications are disabled"""
+        if os.getenv("TRENDING_NOTIFY_ENABLED", "true").lower() not in ("1", "true", "yes"):
+            return None
+        return cls(
+            os.getenv("NOTIFICATION_SERVICE_TARGET", "localhost:50056"),
+            top_n=int(os.getenv("TRENDING_NOTIFY_TOP_N", "100")),
+            radius_km=float(os.getenv("TRENDING_NOTIFY_RADIUS_KM", "10")),
+            timeout_s=float(os.getenv("TRENDING_NOTIFY_TIMEOUT_S", "10"))
+        )
+
+    def entered(self, changed: list) -> List[notification_pb2.TrendingPostEntry]:
+        """The located posts among ``update_ranks`` rows that moved into the top N"""
+        return [
+            notification_pb2.TrendingPostEntry(
+                post_id=row.post_id,
+                latitude=row.latitude,
+                longitude=row.longitude,
+                rank=row.new_rank
+            )
+            for row in changed
+            if 0 < row.new_rank <= self.top_n and not 0 < (row.old_rank or 0) <= self.top_n
+            and row.latitude is not None and row.longitude is not None
+        ]
+
+    def ranks_changed(self, changed: list) -> None:
+        posts = self.entered(changed)
+        if posts:
+            self._executor.submit(self._notify, posts)
+
+    def stop(self) -> None:
+        """Wait for queued notifications, then close the channel"""
+        self._executor.shutdown(wait=True)
+        self._channel.close()
+
+    def _notify(self, posts: List[notification_pb2.TrendingPostEntry]) -> None:
+        try:
+            response = self._stub.NotifyTrendingPostsBatch(notification_pb2.NotifyTrendingPostsBatchRequest(
+                posts=posts,
+                radius_km=self.radius_km
+            ), timeout=self.timeout)
+            logger.info(f"{len(posts)} posts entered the trending top {self.top_n}: notified "
+                        f"{response.total_notified} users, skipped {response.duplicates_skipped} already notified")
+        except grpc.RpcError as e:
+            logger.error(f"Trending notification of {len(posts)} posts failed: {e.code().name} {e.details()}")
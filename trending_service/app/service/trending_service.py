@@ -1,12 +1,17 @@
-from sqlalchemy.orm import Session
-from ..repository.trending_repository import TrendingRepository
+from contextlib import contextmanager
+from sqlalchemy.orm import Session, sessionmaker
+from ..repository.trending_repository import TrendingRepository, RANK_TOP_K
 from ..entity.trending_entity import TrendingPost
-from typing import List, Optional, Dict, Any
+from .trending_engine import TrendingEngine
+from .rank_updater import RankUpdater
+from .event_log import EventLog
+from .trending_notifier import TrendingNotifier
+from ..utils.geohash import encode_location, is_valid
+from typing import Iterable, List, Optional, Dict, Any, Tuple
 import grpc
 from concurrent import futures
 import os
 import sys
-import threading
 import time
 
 # Add the app directory to sys.path
@@ -17,21 +22,44 @@ sys.path.append(app_dir)
 from app.proto_files.trending_pb2 import TrendingPost as TrendingPostProto
 from app.proto_files import trending_pb2, trending_pb2_grpc
 
-class TrendingService:
-    def __init__(self, db: Session):
-        self.repository = TrendingRepository(db)
-        self._start_rank_updater()
+# Upper bounds on BatchUpdatePostMetrics and BatchGetPostRanks request sizes
+MAX_BATCH_DELTAS = int(os.getenv("TRENDING_MAX_BATCH_DELTAS", "10000"))
+MAX_BATCH_RANKS = int(os.getenv("TRENDING_MAX_BATCH_RANKS", "1000"))
+# StreamPostMetrics applies what it has coalesced once this many distinct posts
+# are pending or this many seconds have passed, and again when the stream ends
+STREAM_FLUSH_POSTS = int(os.getenv("TRENDING_STREAM_FLUSH_POSTS", "5000"))
+STREAM_FLUSH_S = float(os.getenv("TRENDING_STREAM_FLUSH_S", "1"))
 
-    def _start_rank_updater(self):
-        def update_ranks_periodically():
-            while True:
-                self.repository.update_ranks()
-                time.sleep(300)  # Update ranks every 5 minutes
+def coalesce_deltas(deltas: Iterable, into: Dict[int, Tuple[int, int]] = None) -> Dict[int, Tuple[int, int]]:
+    """Sum PostMetricsDelta messages per post into {post_id: (like_delta, comment_delta)}"""
+    coalesced = into if into is not None else {}
+    for delta in deltas:
+        like_delta, comment_delta = coalesced.get(delta.post_id, (0, 0))
+        coalesced[delta.post_id] = (like_delta + delta.like_delta, comment_delta + delta.comment_delta)
+    return coalesced
 
-        thread = threading.Thread(target=update_ranks_periodically, daemon=True)
-        thread.start()
+class TrendingService:
+    def __init__(self, db: Session, engine: Optional[TrendingEngine] = None,
+                 rank_updater: Optional[RankUpdater] = None, event_log: Optional[EventLog] = None):
+        self.repository = TrendingRepository(db)
+        # Optional in-memory engine (TRENDING_ENGINE_ENABLED); it snapshots scores to trending_posts.
+        # Stored ranks are refreshed by the RankUpdater that serve() runs, which also keeps them
+        # in memory for rank lookups when there is no engine.
+        self.engine = engine
+        self.rank_updater = rank_updater
+        # Optional log of applied engagement (TRENDING_EVENT_LOG_DIR) for replaying offline
+        self.event_log = event_log
 
     def update_post_metrics(self, post_id: int, like_count: int, comment_count: int) -> Optional[Dict[str, Any]]:
+        if self.engine:
+            updated = self.engine.update(post_id, like_count, comment_count)
+        else:
+            updated = self._update_stored_metrics(post_id, like_count, comment_count)
+        if updated and self.event_log:
+            self.event_log.append_update(post_id, like_count, comment_count)
+        return updated
+
+    def _update_stored_metrics(self, post_id: int, like_count: int, comment_count: int) -> Optional[Dict[str, Any]]:
         trending_post = self.repository.update_trending_posts(post_id, like_count, comment_count)
         if trending_post:
             return {
@@ -40,37 +68,88 @@ class TrendingService:
                 "score": trending_post.score,
                 "rank": trending_post.rank,
                 "created_at": trending_post.created_at.isoformat(),
-                "updated_at": trending_post.updated_at.isoformat()
+                "updated_at": trending_post.updated_at.isoformat(),
+                "geohash": encode_location(trending_post.latitude, trending_post.longitude) or "",
+                "property_type": trending_post.property_type or ""
             }
         return None
 
-    def get_trending_posts(self, limit: int = 20, offset: int = 0) -> List[Dict[str, Any]]:
-        trending_posts = self.repository.get_trending_posts(limit, offset)
+    def apply_metric_deltas(self, deltas: Dict[int, Tuple[int, int]]) -> int:
+        """Apply coalesced {post_id: (like_delta, comment_delta)}: in memory when the engine is on
+        (written by its next snapshot), otherwise as one upsert. Returns the number of posts."""
+        deltas = {post_id: delta for post_id, delta in deltas.items() if post_id > 0 and delta != (0, 0)}
+        if self.engine:
+            applied = self.engine.apply_deltas(deltas)
+        else:
+            applied = len(self.repository.apply_metric_deltas(deltas))
+        if self.event_log:
+            self.event_log.append_deltas(deltas)
+        return applied
+
+    def get_trending_posts(self, limit: int = 20, offset: int = 0, geohash: Optional[str] = None,
+                           property_type: Optional[str] = None) -> List[Dict[str, Any]]:
+        if self.engine:
+            return self.engine.top(limit, offset, geohash, property_type)
+        trending_posts = self.repository.get_trending_posts(limit, offset, geohash, property_type)
+        filtered = bool(geohash or property_type)
         return [
             {
                 "id": post.id,
                 "post_id": post.post_id,
                 "score": post.score,
-                "rank": post.rank,
+                # Stored ranks are global; a filtered list is ranked within itself
+                "rank": (offset + i + 1 if offset + i < RANK_TOP_K else 0) if filtered else post.rank,
                 "created_at": post.created_at.isoformat(),
-                "updated_at": post.updated_at.isoformat()
+                "updated_at": post.updated_at.isoformat(),
+                "geohash": encode_location(post.latitude, post.longitude) or "",
+                "property_type": post.property_type or ""
             }
-            for post in trending_posts
+            for i, post in enumerate(trending_posts)
         ]
 
     def get_post_rank(self, post_id: int) -> Optional[int]:
+        if self.engine:
+            return self.engine.rank(post_id)
+        ranks = self.rank_updater.ranks([post_id]) if self.rank_updater else None
+        if ranks is not None:
+            return ranks[0]
         return self.repository.get_post_rank(post_id)
 
+    def get_post_ranks(self, post_ids: List[int]) -> List[int]:
+        """Ranks in the order asked for; 0 for posts outside the top K or not trending at all"""
+        if self.engine:
+            return [rank or 0 for rank in self.engine.ranks(post_ids)]
+        ranks = self.rank_updater.ranks(post_ids) if self.rank_updater else None
+        if ranks is not None:
+            return ranks
+        stored = self.repository.get_post_ranks(post_ids)
+        return [stored.get(post_id) or 0 for post_id in post_ids]
+
 class TrendingServiceServicer(trending_pb2_grpc.TrendingServiceServicer):
-    def __init__(self, db: Session):
-        self.trending_service = TrendingService(db)
+    def __init__(self, db_session: sessionmaker, engine: Optional[TrendingEngine] = None,
+                 rank_updater: Optional[RankUpdater] = None, event_log: Optional[EventLog] = None):
+        self.db_session = db_session
+        self.engine = engine
+        self.rank_updater = rank_updater
+        self.event_log = event_log
+
+    @contextmanager
+    def trending_service(self):
+        """A TrendingService over a fresh session, closed when the block ends.
+
+        The engine, rank updater and event log lock their own state and are
+        shared; a Session is not safe to share between worker threads.
+        """
+        with self.db_session() as session:
+            yield TrendingService(session, self.engine, self.rank_updater, self.event_log)
 
     def UpdatePostMetrics(self, request, context):
-        trending_post = self.trending_service.update_post_metrics(
-            request.post_id,
-            request.like_count,
-            request.comment_count
-        )
+        with self.trending_service() as trending_service:
+            trending_post = trending_service.update_post_metrics(
+                request.post_id,
+                request.like_count,
+                request.comment_count
+            )
         if trending_post:
             return trending_pb2.TrendingResponse(
                 success=True,
@@ -82,13 +161,85 @@ class TrendingServiceServicer(trending_pb2_grpc.TrendingServiceServicer):
             message="Failed to update post metrics"
         )
 
+    def BatchUpdatePostMetrics(self, request, context):
+        if len(request.deltas) > MAX_BATCH_DELTAS:
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details(f"At most {MAX_BATCH_DELTAS} deltas per request")
+            return trending_pb2.BatchUpdatePostMetricsResponse(
+                success=False,
+                message=f"At most {MAX_BATCH_DELTAS} deltas per request"
+            )
+        try:
+            with self.trending_service() as trending_service:
+                posts = trending_service.apply_metric_deltas(coalesce_deltas(request.deltas))
+            return trending_pb2.BatchUpdatePostMetricsResponse(
+                success=True,
+                message="Post metrics updated successfully",
+                accepted=len(request.deltas),
+                posts=posts
+            )
+        except Exception as e:
+            print(f"Error in BatchUpdatePostMetrics: {str(e)}")
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(str(e))
+            return trending_pb2.BatchUpdatePostMetricsResponse(
+                success=False,
+                message=f"Failed to update post metrics: {str(e)}"
+            )
+
+    def StreamPostMetrics(self, request_iterator, context):
+        accepted = 0
+        posts = 0
+        pending = {}
+        flushed_at = time.monotonic()
+        try:
+            for delta in request_iterator:
+                coalesce_deltas((delta,), pending)
+                accepted += 1
+                if len(pending) >= STREAM_FLUSH_POSTS or time.monotonic() - flushed_at >= STREAM_FLUSH_S:
+                    # A session per flush, so a long-lived stream does not hold a connection between them
+                    with self.trending_service() as trending_service:
+                        posts += trending_service.apply_metric_deltas(pending)
+                    pending = {}
+                    flushed_at = time.monotonic()
+            with self.trending_service() as trending_service:
+                posts += trending_service.apply_metric_deltas(pending)
+            return trending_pb2.BatchUpdatePostMetricsResponse(
+                success=True,
+                message="Post metrics updated successfully",
+                accepted=accepted,
+                posts=posts
+            )
+        except Exception as e:
+            print(f"Error in StreamPostMetrics: {str(e)}")
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(str(e))
+            return trending_pb2.BatchUpdatePostMetricsResponse(
+                success=False,
+                message=f"Failed to update post metrics after {accepted} deltas: {str(e)}",
+                accepted=accepted,
+                posts=posts
+            )
+
     def GetTrendingPosts(self, request, context):
         try:
             # Validate and sanitize parameters
             limit = max(1, min(request.limit if request.limit > 0 else 20, 100))  # Between 1 and 100, default 20
             offset = max(0, request.offset if request.offset >= 0 else 0)  # Non-negative, default 0
-            
-            trending_posts = self.trending_service.get_trending_posts(limit, offset)
+            geohash = request.geohash.strip().lower()
+            if geohash and not is_valid(geohash):
+                context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+                context.set_details(f"Invalid geohash: {request.geohash}")
+                return trending_pb2.GetTrendingResponse(
+                    success=False,
+                    message=f"Invalid geohash: {request.geohash}",
+                    trending_posts=trending_pb2.TrendingPostList(trending_posts=[])
+                )
+
+            with self.trending_service() as trending_service:
+                trending_posts = trending_service.get_trending_posts(
+                    limit, offset, geohash or None, request.property_type or None
+                )
             trending_post_protos = []
             
             for post in trending_posts:
@@ -98,7 +249,9 @@ class TrendingServiceServicer(trending_pb2_grpc.TrendingServiceServicer):
                     score=float(post["score"]),
                     rank=post["rank"],
                     created_at=post["created_at"],
-                    updated_at=post["updated_at"]
+                    updated_at=post["updated_at"],
+                    geohash=post["geohash"],
+                    property_type=post["property_type"]
                 )
                 trending_post_protos.append(trending_post_proto)
             
@@ -118,22 +271,79 @@ class TrendingServiceServicer(trending_pb2_grpc.TrendingServiceServicer):
             )
 
     def GetPostRank(self, request, context):
-        rank = self.trending_service.get_post_rank(request.post_id)
+        with self.trending_service() as trending_service:
+            rank = trending_service.get_post_rank(request.post_id)
         return trending_pb2.RankResponse(
             success=True,
             message="Post rank retrieved successfully",
             rank=rank if rank is not None else 0
         )
 
+    def BatchGetPostRanks(self, request, context):
+        if len(request.post_ids) > MAX_BATCH_RANKS:
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details(f"At most {MAX_BATCH_RANKS} posts per request")
+            return trending_pb2.BatchGetPostRanksResponse(
+                success=False,
+                message=f"At most {MAX_BATCH_RANKS} posts per request"
+            )
+        try:
+            post_ids = list(request.post_ids)
+            with self.trending_service() as trending_service:
+                ranks = trending_service.get_post_ranks(post_ids)
+            return trending_pb2.BatchGetPostRanksResponse(
+                success=True,
+                message="Post ranks retrieved successfully",
+                ranks=[trending_pb2.PostRank(post_id=post_id, rank=rank) for post_id, rank in zip(post_ids, ranks)]
+            )
+        except Exception as e:
+            print(f"Error in BatchGetPostRanks: {str(e)}")
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(str(e))
+            return trending_pb2.BatchGetPostRanksResponse(
+                success=False,
+                message=f"Failed to retrieve post ranks: {str(e)}"
+            )
+
 def serve():
-    from ..utils.db_connection import get_db_session
-    db = get_db_session()
+    from ..utils.db_connection import get_session_factory
+    session_factory = get_session_factory()
+    engine = TrendingEngine.from_env(session_factory)
+    if engine:
+        engine.start()
+        print(f"Trending engine enabled (snapshot every {engine.snapshot_interval:g}s)")
+    # Ranks follow the engine's snapshots, which also answers rank lookups; without it
+    # they are recomputed every minute and looked up in the updater's in-memory index.
+    # Posts entering the top N are passed on to the notification service.
+    notifier = TrendingNotifier.from_env()
+    rank_updater = RankUpdater.from_env(
+        session_factory,
+        interval_s=engine.snapshot_interval if engine else 60,
+        keep_index=engine is None,
+        notifier=notifier
+    )
+    if rank_updater:
+        rank_updater.start()
+    event_log = EventLog.from_env()
+    if event_log:
+        event_log.start()
+        print(f"Logging trending engagement events to {event_log.directory}")
     server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
-    trending_pb2_grpc.add_TrendingServiceServicer_to_server(TrendingServiceServicer(db), server)
+    trending_pb2_grpc.add_TrendingServiceServicer_to_server(TrendingServiceServicer(session_factory, engine, rank_updater, event_log), server)
     server.add_insecure_port('[::]:50054')
     print("Starting trending service on port 50054...")
     server.start()
-    server.wait_for_termination()
+    try:
+        server.wait_for_termination()
+    finally:
+        if engine:
+            engine.stop()
+        if rank_updater:
+            rank_updater.stop()
+        if notifier:
+            notifier.stop()
+        if event_log:
+            event_log.stop()
 
 if __name__ == "__main__":
     serve() 
\ No newline at end of file
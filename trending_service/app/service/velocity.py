@@ -0,0 +1,152 @@
+import os
+import math
+from typing import Dict, Optional
+import numpy as np
+
+# Windows the velocity signals are read over, in seconds
+VELOCITY_WINDOW_S = 3600
+BASELINE_WINDOW_S = 6 * 3600
+TRACKED_WINDOW_S = 24 * 3600
+
+
+class VelocityTracker:
+    """Rolling per-post engagement over the last 24 hours.
+
+    Every tracked post owns one row of a preallocated float32 array, a ring
+    of ``bucket_s`` buckets covering the tracked window (96 buckets, 384
+    bytes a post, by default), so memory is fixed at ``max_posts`` rows
+    however much engagement arrives. Events add their weighted engagement to
+    the current bucket. As time passes ``advance`` clears the bucket the ring
+    moves onto, for all posts in one array operation, reports the posts whose
+    boost that changed, and gives back the rows of posts with no engagement
+    left in the window. When every row is taken,
+    the post with the least engagement in the window loses its row.
+
+    ``velocity`` is engagement per hour over the last hour, ``acceleration``
+    how far that runs ahead of the hourly average over the last 6 hours, and
+    ``boost`` turns both into hot score units (log10 of engagement, like
+    ``hot_score``). Not thread-safe; the engine calls it under its lock.
+    """
+
+    def __init__(self, bucket_s: int = 900, max_posts: int = 50000, velocity_weight: float = 1.0,
+                 acceleration_weight: float = 0.5):
+        self.bucket_s = bucket_s
+        self.max_posts = max_posts
+        self.velocity_weight = velocity_weight
+        self.acceleration_weight = acceleration_weight
+        self.n_buckets = max(1, TRACKED_WINDOW_S // bucket_s)
+        # Newest-first bucket offsets making up each window
+        self._velocity_offsets = np.arange(min(self.n_buckets, max(1, math.ceil(VELOCITY_WINDOW_S / bucket_s))))
+        self._baseline_offsets = np.arange(min(self.n_buckets, max(1, math.ceil(BASELINE_WINDOW_S / bucket_s))))
+        self._counts = np.zeros((max_posts, self.n_buckets), dtype=np.float32)
+        self._totals = np.zeros(max_posts, dtype=np.float32)  # engagement in the whole window, per row
+        self._rows: Dict[int, int] = {}  # post_id -> row
+        self._post_ids = np.zeros(max_posts, dtype=np.int64)  # row -> post_id
+        self._free = list(range(max_posts - 1, -1, -1))
+        self._bucket = None  # time // bucket_s of the current bucket
+
+    @classmethod
+    def from_env(cls) -> Optional["VelocityTracker"]:
+        """Build a tracker from TRENDING_VELOCITY_* env vars, or None when it is disabled"""
+        if os.getenv("TRENDING_VELOCITY_ENABLED", "true").lower() not in ("1", "true", "yes"):
+            return None
+        return cls(
+            bucket_s=int(os.getenv("TRENDING_VELOCITY_BUCKET_S", "900")),
+            max_posts=int(os.getenv("TRENDING_VELOCITY_MAX_POSTS", "50000")),
+            velocity_weight=float(os.getenv("TRENDING_VELOCITY_WEIGHT", "1.0")),
+            acceleration_weight=float(os.getenv("TRENDING_ACCELERATION_WEIGHT", "0.5"))
+        )
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, post_id: int) -> bool:
+        return post_id in self._rows
+
+    def advance(self, now: float) -> Dict[int, float]:
+        """Move the ring to the bucket holding ``now`` (epoch seconds). Returns
+        {post_id: new boost} for the posts whose boost changed as buckets left
+        their windows, empty when the bucket is unchanged."""
+        bucket = int(now // self.bucket_s)
+        if self._bucket is None:
+            self._bucket = bucket
+        if bucket <= self._bucket or not self._rows:
+            self._bucket = max(bucket, self._bucket)
+            return {}
+        post_ids = np.fromiter(self._rows.keys(), dtype=np.int64, count=len(self._rows))
+        rows = np.fromiter(self._rows.values(), dtype=np.int64, count=len(self._rows))
+        before = self._boosts(rows)
+        for step in range(1, min(bucket - self._bucket, self.n_buckets) + 1):
+            self._counts[:, (self._bucket + step) % self.n_buckets] = 0
+        self._bucket = bucket
+        after = self._boosts(rows)
+        # Resumming also drops the float error the running totals picked up
+        self._totals[rows] = self._counts[rows].sum(axis=1)
+        for row in rows[~self._counts[rows].any(axis=1)]:
+            self._release(int(row))
+        changed = after != before
+        return dict(zip(post_ids[changed].tolist(), after[changed].tolist()))
+
+    def record(self, post_id: int, engagement: float, now: float) -> Optional[int]:
+        """Add engagement (negative for removals) to the post's current bucket.
+        Returns the post that lost its row to make room, if any."""
+        if self._bucket is None:
+            self._bucket = int(now // self.bucket_s)
+        row = self._rows.get(post_id)
+        evicted = None
+        if row is None:
+            if engagement <= 0:
+                return None  # a removal says nothing about a post with no engagement tracked
+            if not self._free:
+                evicted = int(self._post_ids[int(np.argmin(self._totals))])
+                self._release(self._rows[evicted])
+            row = self._rows[post_id] = self._free.pop()
+            self._post_ids[row] = post_id
+        self._counts[row, self._bucket % self.n_buckets] += engagement
+        self._totals[row] += engagement
+        return evicted
+
+    def signals(self, post_id: int) -> Dict[str, float]:
+        """Velocity and acceleration, in engagement per hour; zero for untracked posts"""
+        row = self._rows.get(post_id)
+        if row is None:
+            return {"velocity": 0.0, "acceleration": 0.0}
+        counts = self._counts[row]
+        velocity = float(counts[self._columns(self._velocity_offsets)].sum(dtype=np.float64)) \
+            / self._hours(self._velocity_offsets)
+        baseline = float(counts[self._columns(self._baseline_offsets)].sum(dtype=np.float64)) \
+            / self._hours(self._baseline_offsets)
+        return {"velocity": velocity, "acceleration": velocity - baseline}
+
+    def boost(self, post_id: int) -> float:
+        if post_id not in self._rows:
+            return 0.0
+        signals = self.signals(post_id)
+        return self._boost(signals["velocity"], signals["acceleration"])
+
+    def _boosts(self, rows: np.ndarray) -> np.ndarray:
+        """``boost`` for many rows at once"""
+        velocity = self._counts[rows[:, None], self._columns(self._velocity_offsets)].sum(axis=1, dtype=np.float64) \
+            / self._hours(self._velocity_offsets)
+        baseline = self._counts[rows[:, None], self._columns(self._baseline_offsets)].sum(axis=1, dtype=np.float64) \
+            / self._hours(self._baseline_offsets)
+        return self.velocity_weight * np.log10(1 + np.maximum(velocity, 0)) \
+            + self.acceleration_weight * np.log10(1 + np.maximum(velocity - baseline, 0))
+
+    def _boost(self, velocity: float, acceleration: float) -> float:
+        return self.velocity_weight * math.log10(1 + max(velocity, 0)) \
+            + self.acceleration_weight * math.log10(1 + max(acceleration, 0))
+
+    def _columns(self, offsets: np.ndarray) -> np.ndarray:
+        """The ring columns of a window ending at the current bucket"""
+        return (self._bucket - offsets) % self.n_buckets
+
+    def _hours(self, offsets: np.ndarray) -> float:
+        return len(offsets) * self.bucket_s / 3600
+
+    def _release(self, row: int) -> None:
+        del self._rows[int(self._post_ids[row])]
+        self._counts[row] = 0
+        self._totals[row] = 0
+        self._post_ids[row] = 0
+        self._free.append(row)
@@ -18,7 +18,9 @@ def get_db_engine():
     print("Connected to PostgreSQL database successfully!")
     return engine
 
-def get_db_session():
+def get_session_factory():
     engine = get_db_engine()
-    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-    return SessionLocal() 
\ No newline at end of file
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+def get_db_session():
+    return get_session_factory()()
@@ -0,0 +1,69 @@
+from typing import Optional, Tuple
+
+# Standard geohash: longitude and latitude bits interleaved (longitude first),
+# five bits per base32 character. Each character narrows the cell 32 times;
+# 5 characters is about 4.9 x 4.9 km, 6 about 1.2 x 0.6 km.
+BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+MAX_PRECISION = 12
+
+
+def is_valid(geohash: str) -> bool:
+    return 0 < len(geohash) <= MAX_PRECISION and all(char in BASE32 for char in geohash)
+
+
+def encode(latitude: float, longitude: float, precision: int = MAX_PRECISION) -> str:
+    """The geohash of the cell containing the point; raises ValueError off the globe"""
+    if not (-90.0 <= latitude <= 90.0 and -180.0 <= longitude <= 180.0):
+        raise ValueError(f"Invalid coordinates: {latitude},{longitude}")
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    chars = []
+    bits = 0
+    bit_count = 0
+    even = True
+    while len(chars) < precision:
+        value, interval = (longitude, lng_range) if even else (latitude, lat_range)
+        mid = (interval[0] + interval[1]) / 2
+        bits <<= 1
+        if value >= mid:
+            bits |= 1
+            interval[0] = mid
+        else:
+            interval[1] = mid
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(BASE32[bits])
+            bits = 0
+            bit_count = 0
+    return "".join(chars)
+
+
+def bounds(geohash: str) -> Tuple[float, float, float, float]:
+    """(min_latitude, min_longitude, max_latitude, max_longitude) of a geohash cell"""
+    if not is_valid(geohash):
+        raise ValueError(f"Invalid geohash: {geohash!r}")
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    even = True
+    for char in geohash:
+        bits = BASE32.index(char)
+        for shift in range(4, -1, -1):
+            interval = lng_range if even else lat_range
+            mid = (interval[0] + interval[1]) / 2
+            if bits >> shift & 1:
+                interval[0] = mid
+            else:
+                interval[1] = mid
+            even = not even
+    return lat_range[0], lng_range[0], lat_range[1], lng_range[1]
+
+
+def encode_location(latitude: Optional[float], longitude: Optional[float]) -> Optional[str]:
+    """Full precision geohash of a stored location, or None when it is missing or off the globe"""
+    if latitude is None or longitude is None:
+        return None
+    try:
+        return encode(latitude, longitude)
+    except ValueError:
+        return None
@@ -0,0 +1,356 @@
+"""Replay the trending event log under alternative scoring formulas and compare the leaderboards.
+
+Point it at a directory written with TRENDING_EVENT_LOG_DIR set (or at log
+files) and run from the trending_service directory:
+
+    python -m benchmarks.replay_trending /var/log/trending --variant likes=3,comments=1 --variant decay=30000
+
+or try it on a synthetic log first:
+
+    python -m benchmarks.replay_trending --synthetic 5000000 --variant likes=1,comments=3
+
+Each event is replayed the way the service applied it: an UpdatePostMetrics
+sets a post's counts, deltas add to them. Posts with engagement from before
+the log started begin at zero until their first update. A post's created_at
+is the first time it appears in the log unless --created-from-db looks it up
+in posts. At each checkpoint every post seen so far is scored by the current
+formula (hot_score) and by each variant, a variant giving any of likes,
+comments (weights), decay (seconds), velocity and acceleration (weights of
+the velocity boost); the rest are taken from the current formula. The
+current formula has no velocity boost, as with the engine off (the
+default); --velocity adds the one a service running TRENDING_ENGINE_ENABLED
+scores with, replayed from the same events over VelocityTracker's windows
+(without its max_posts limit). The report has, per variant and checkpoint, Spearman's rank
+correlation with the current leaderboard over all posts and over its top K,
+and how much of the top K the two share, plus replay throughput.
+"""
+import argparse
+import calendar
+import json
+import math
+import os
+import sys
+import tempfile
+import time
+
+current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(current_dir)
+
+import numpy as np
+from app.proto_files.trending_pb2 import EngagementEventBatch
+from app.repository.trending_repository import HOT_EPOCH, DECAY_SECONDS, hot_score
+from app.service.event_log import log_files, read_batches, write_batch
+from app.service.velocity import VELOCITY_WINDOW_S, BASELINE_WINDOW_S, TRACKED_WINDOW_S
+from datetime import datetime
+
+HOT_EPOCH_S = calendar.timegm(HOT_EPOCH.timetuple())
+BASELINE = {"likes": 2.0, "comments": 1.5, "decay": DECAY_SECONDS, "velocity": 0.0, "acceleration": 0.0}
+
+
+def engine_baseline():
+    """BASELINE plus the velocity boost the trending engine adds when it is enabled"""
+    return dict(
+        BASELINE,
+        velocity=float(os.getenv("TRENDING_VELOCITY_WEIGHT", "1.0")),
+        acceleration=float(os.getenv("TRENDING_ACCELERATION_WEIGHT", "0.5"))
+    )
+
+
+def parse_variant(spec, baseline=BASELINE):
+    """Parse "likes=3,comments=1,decay=30000" over the current formula's values"""
+    variant = dict(baseline)
+    for part in spec.split(","):
+        if part.strip():
+            name, value = part.split("=", 1)
+            if name.strip() not in baseline:
+                raise ValueError(f"Unknown scoring parameter {name.strip()!r}; use {', '.join(baseline)}")
+            variant[name.strip()] = float(value)
+    return variant
+
+
+def load_events(paths):
+    """All events in the files as columns, oldest first"""
+    columns = {"at_ms": [], "post_ids": [], "like_counts": [], "comment_counts": [], "absolute": []}
+    dtypes = {"at_ms": np.int64, "post_ids": np.int64, "like_counts": np.int64, "comment_counts": np.int64,
+              "absolute": np.bool_}
+    for path in paths:
+        for batch in read_batches(path):
+            for name, dtype in dtypes.items():
+                field = getattr(batch, name)
+                columns[name].append(np.fromiter(field, dtype=dtype, count=len(field)))
+    events = {name: np.concatenate(parts) if parts else np.zeros(0, dtype=dtypes[name])
+              for name, parts in columns.items()}
+    # Files are written in time order; the stable sort only fixes overlap between replicas' files
+    order = np.argsort(events["at_ms"], kind="stable")
+    return {name: values[order] for name, values in events.items()}
+
+
+def counts_at(events, post_index, n_posts, n):
+    """Like and comment counts of every post after the first n events: its last update, plus the deltas since"""
+    posts = post_index[:n]
+    absolute = events["absolute"][:n]
+    positions = np.arange(n)
+    last_update = np.full(n_posts, -1, dtype=np.int64)
+    np.maximum.at(last_update, posts[absolute], positions[absolute])
+    updated = last_update >= 0
+    counts = []
+    for name in ("like_counts", "comment_counts"):
+        values = events[name][:n]
+        total = np.zeros(n_posts)
+        total[updated] = values[last_update[updated]]
+        later = ~absolute & (positions > last_update[posts])
+        total += np.bincount(posts[later], weights=values[later], minlength=n_posts)
+        counts.append(total)
+    return counts
+
+
+def velocity_engagement(events, post_index):
+    """The engagement the engine records for velocity per event, weighted as it records it:
+    a delta as it is, an update as the difference from the counts before it, nothing for
+    an update opening a post's events, and nothing for a removal from a post with no
+    engagement recorded in the tracked window before it"""
+    n = len(post_index)
+    order = np.lexsort((np.arange(n), post_index))
+    posts = post_index[order]
+    absolute = events["absolute"][order]
+    first_of_post = np.ones(n, dtype=bool)
+    first_of_post[1:] = posts[1:] != posts[:-1]
+    # Counts restart from each update's values and from zero at each post's first event
+    segment_start = np.maximum.accumulate(np.where(absolute | first_of_post, np.arange(n), 0))
+    engagement = np.zeros(n)
+    for name, weight in (("like_counts", 2.0), ("comment_counts", 1.5)):
+        values = events[name][order].astype(np.float64)
+        total = np.cumsum(values)
+        after = total - (total[segment_start] - values[segment_start])
+        before = np.zeros(n)
+        before[1:] = after[:-1]
+        before[first_of_post] = 0
+        engagement += weight * np.where(absolute & ~first_of_post, values - before, np.where(absolute, 0, values))
+    # Time of each post's latest earlier positive engagement, offset per post so one running max serves all
+    at_ms = events["at_ms"][order]
+    span = int(at_ms.max(initial=0)) + 2
+    offset = posts.astype(np.int64) * span
+    latest = np.maximum.accumulate(np.where(engagement > 0, offset + at_ms, offset - 1))
+    previous = np.full(n, -1, dtype=np.int64)
+    previous[1:] = latest[:-1] - offset[1:]
+    untracked = (previous < 0) | (at_ms - previous >= TRACKED_WINDOW_S * 1000)
+    engagement[(engagement < 0) & untracked] = 0
+    unsorted = np.empty(n)
+    unsorted[order] = engagement
+    return unsorted
+
+
+def velocity_boosts(engagement, events, post_index, n, n_posts, checkpoint_ms, variant, bucket_s):
+    """Every post's velocity boost at the checkpoint from the first n events, over
+    VelocityTracker's bucketed windows"""
+    engagement = engagement[:n]
+    buckets = events["at_ms"][:n] // 1000 // bucket_s
+    current = int(checkpoint_ms) // 1000 // bucket_s
+    rates = []
+    for window_s in (VELOCITY_WINDOW_S, BASELINE_WINDOW_S):
+        n_buckets = max(1, math.ceil(window_s / bucket_s))
+        recent = buckets > current - n_buckets
+        rates.append(np.bincount(post_index[:n][recent], weights=engagement[recent], minlength=n_posts)
+                     / (n_buckets * bucket_s / 3600))
+    velocity, baseline = rates
+    return variant["velocity"] * np.log10(1 + np.maximum(velocity, 0)) \
+        + variant["acceleration"] * np.log10(1 + np.maximum(velocity - baseline, 0))
+
+
+def score(likes, comments, created_s, variant, boost=0.0):
+    """hot_score over arrays, with the variant's weights and decay, plus any velocity boost"""
+    engagement = variant["likes"] * likes + variant["comments"] * comments
+    return np.log10(np.maximum(engagement, 1)) + (created_s - HOT_EPOCH_S) / variant["decay"] + boost
+
+
+def leaderboard(scores, post_ids):
+    """Positions best first (ties newest post first, as the engine orders them), and each post's position"""
+    order = np.lexsort((-post_ids, -scores))
+    positions = np.empty(len(order), dtype=np.int64)
+    positions[order] = np.arange(len(order))
+    return order, positions
+
+
+def spearman(positions_a, positions_b):
+    """Rank correlation of two tie-free rankings of the same posts"""
+    n = len(positions_a)
+    if n < 2:
+        return 1.0
+    d = (positions_a - positions_b).astype(np.float64)
+    return float(1 - 6 * np.dot(d, d) / (n * (n * n - 1.0)))
+
+
+def created_from_db(post_ids):
+    from sqlalchemy import text
+    from app.utils.db_connection import get_db_engine
+    engine = get_db_engine()
+    engine.echo = False
+    with engine.connect() as conn:
+        rows = conn.execute(
+            text("SELECT id, extract(epoch FROM created_at) FROM posts WHERE id = ANY(:ids)"),
+            {"ids": post_ids.tolist()}
+        ).fetchall()
+    return {post_id: float(created) for post_id, created in rows}
+
+
+def write_synthetic(directory, n_events, seed=7):
+    """A two-day log: posts created throughout, engagement skewed to popular posts and
+    fading over the hours after each is created; 10% of posts start with an update"""
+    rng = np.random.default_rng(seed)
+    n_posts = max(1000, n_events // 200)
+    start_ms = int(time.time() * 1000) - 2 * 86400 * 1000
+    span_ms = 2 * 86400 * 1000
+    created_ms = start_ms + rng.integers(0, span_ms, n_posts)
+    popularity = 1.0 / np.arange(1, n_posts + 1) ** 1.1
+    posts = rng.choice(n_posts, size=n_events, p=popularity / popularity.sum())
+    at_ms = created_ms[posts] + rng.exponential(6 * 3600 * 1000, n_events).astype(np.int64)
+    kept = at_ms < start_ms + span_ms
+    order = np.argsort(at_ms[kept], kind="stable")
+    posts, at_ms = posts[kept][order], at_ms[kept][order]
+    kind = rng.random(len(posts))
+    likes = np.where(kind < 0.9, 1, np.where(kind < 0.93, -1, 0))
+    comments = (kind >= 0.93).astype(np.int64)
+    absolute = np.zeros(len(posts), dtype=bool)
+    # Posts opening with an update: counts carried over from before the log began
+    _, first = np.unique(posts, return_index=True)
+    backfilled = first[rng.random(len(first)) < 0.1]
+    absolute[backfilled] = True
+    likes[backfilled] = rng.integers(0, 500, len(backfilled))
+    comments[backfilled] = rng.integers(0, 50, len(backfilled))
+    path = os.path.join(directory, "trending-events-synthetic.log")
+    with open(path, "wb") as f:
+        for i in range(0, len(posts), 5000):
+            chunk = slice(i, i + 5000)
+            write_batch(f, EngagementEventBatch(
+                at_ms=at_ms[chunk].tolist(),
+                post_ids=(posts[chunk] + 100000).tolist(),
+                like_counts=likes[chunk].tolist(),
+                comment_counts=comments[chunk].tolist(),
+                absolute=absolute[chunk].tolist()
+            ))
+    return path
+
+
+def replay(events, variants, checkpoints, top_k, created_lookup=None, baseline=BASELINE, bucket_s=900):
+    unique_posts, post_index, first = _index_posts(events["post_ids"])
+    created_s = events["at_ms"][first] / 1000.0
+    if created_lookup is not None:
+        stored = created_lookup(unique_posts)
+        created_s = np.array([stored.get(int(post_id), s) for post_id, s in zip(unique_posts, created_s)])
+
+    # The vectorized baseline must agree with the service's own hot_score
+    sample = min(len(unique_posts), 1000)
+    likes, comments = counts_at(events, post_index, len(unique_posts), len(post_index))
+    expected = np.array([
+        hot_score(likes[i], comments[i], datetime.utcfromtimestamp(created_s[i])) for i in range(sample)
+    ])
+    baseline_error = float(np.abs(score(likes[:sample], comments[:sample], created_s[:sample], BASELINE)
+                                  - expected).max(initial=0.0))
+
+    with_velocity = any(v["velocity"] or v["acceleration"] for v in [baseline, *variants.values()])
+    engagement = velocity_engagement(events, post_index) if with_velocity else None
+
+    def boost(variant, n, checkpoint):
+        if not (variant["velocity"] or variant["acceleration"]):
+            return 0.0
+        return velocity_boosts(engagement, events, post_index, n, len(unique_posts), checkpoint, variant, bucket_s)[seen]
+
+    at_ms = events["at_ms"]
+    times = np.linspace(at_ms[0], at_ms[-1], checkpoints + 1)[1:] if len(at_ms) else []
+    results = {name: [] for name in variants}
+    count_s = score_s = 0.0
+    replayed_events = scored_posts = 0
+    for checkpoint in times:
+        n = int(np.searchsorted(at_ms, checkpoint, side="right"))
+        started = time.perf_counter()
+        likes, comments = counts_at(events, post_index, len(unique_posts), n)
+        seen = first < n
+        count_s += time.perf_counter() - started
+        replayed_events += n
+
+        started = time.perf_counter()
+        post_ids, likes, comments, created = unique_posts[seen], likes[seen], comments[seen], created_s[seen]
+        base_order, base_positions = leaderboard(
+            score(likes, comments, created, baseline, boost(baseline, n, checkpoint)), post_ids
+        )
+        k = min(top_k, len(post_ids))
+        for name, variant in variants.items():
+            order, positions = leaderboard(
+                score(likes, comments, created, variant, boost(variant, n, checkpoint)), post_ids
+            )
+            top = base_order[:k]
+            results[name].append({
+                "at": datetime.utcfromtimestamp(checkpoint / 1000).isoformat(timespec="seconds"),
+                "events": n,
+                "posts": len(post_ids),
+                "spearman": round(spearman(base_positions, positions), 6),
+                "top_k_spearman": round(spearman(np.arange(k), np.argsort(np.argsort(positions[top]))), 6),
+                "top_k_overlap": round(len(np.intersect1d(top, order[:k])) / k, 4) if k else 1.0
+            })
+        score_s += time.perf_counter() - started
+        scored_posts += len(post_ids) * (len(variants) + 1)
+
+    return {
+        "baseline_max_error": baseline_error,
+        "results": results,
+        "throughput": {
+            "replayed_events_per_s": round(replayed_events / count_s) if count_s else None,
+            "scored_posts_per_s": round(scored_posts / score_s) if score_s else None
+        }
+    }
+
+
+def _index_posts(post_ids):
+    """Distinct post ids, each event's index into them, and each post's first event"""
+    unique_posts, first, post_index = np.unique(post_ids, return_index=True, return_inverse=True)
+    return unique_posts, post_index, first
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("paths", nargs="*", help="event log files, or directories of them")
+    parser.add_argument("--variant", action="append", default=[],
+                        help="scoring to compare, e.g. likes=3,comments=1,decay=30000 (repeatable)")
+    parser.add_argument("--checkpoints", type=int, default=4, help="evenly spaced points in the log to compare at")
+    parser.add_argument("--top-k", type=int, default=100, help="leaderboard size for the top-K metrics")
+    parser.add_argument("--created-from-db", action="store_true", help="read created_at from posts")
+    parser.add_argument("--synthetic", type=int, metavar="EVENTS", help="replay a generated log of this many events")
+    parser.add_argument("--velocity", action="store_true",
+                        help="include the trending engine's velocity boost (TRENDING_VELOCITY_WEIGHT, "
+                             "TRENDING_ACCELERATION_WEIGHT) in the current formula")
+    parser.add_argument("--bucket-s", type=int, default=int(os.getenv("TRENDING_VELOCITY_BUCKET_S", "900")),
+                        help="velocity bucket width in seconds")
+    args = parser.parse_args()
+
+    baseline = engine_baseline() if args.velocity else BASELINE
+    variants = {spec: parse_variant(spec, baseline)
+                for spec in args.variant or ["likes=1,comments=1", "decay=30000"]}
+    if args.synthetic:
+        directory = tempfile.mkdtemp(prefix="trending-replay-")
+        paths = [write_synthetic(directory, args.synthetic)]
+    else:
+        paths = []
+        for path in args.paths:
+            paths.extend(log_files(path) if os.path.isdir(path) else [path])
+    if not paths:
+        parser.error("no event log files given")
+
+    started = time.perf_counter()
+    events = load_events(paths)
+    load_s = time.perf_counter() - started
+    if not len(events["at_ms"]):
+        parser.error("the event logs are empty")
+
+    report = replay(events, variants, args.checkpoints, args.top_k,
+                    created_from_db if args.created_from_db else None, baseline, args.bucket_s)
+    report["baseline"] = baseline
+    report["variants"] = variants
+    report["files"] = len(paths)
+    report["events"] = len(events["at_ms"])
+    report["throughput"]["load_s"] = round(load_s, 3)
+    report["throughput"]["loaded_events_per_s"] = round(len(events["at_ms"]) / load_s) if load_s else None
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
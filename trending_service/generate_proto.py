@@ -10,35 +10,43 @@ def generate_proto_files():
     # Create proto_files directory if it doesn't exist
     os.makedirs(proto_dir, exist_ok=True)
     
-    # Define the proto file path
-    proto_file = os.path.join(proto_dir, "trending.proto")
-    
-    # Check if proto file exists
-    if not os.path.exists(proto_file):
-        print(f"Error: Proto file not found at {proto_file}")
-        sys.exit(1)
-    
-    # Define the output directory for generated files
-    output_dir = os.path.join(current_dir, "app", "proto_files")
-    
-    try:
-        # Generate Python files from proto
-        subprocess.run([
-            "python", "-m", "grpc_tools.protoc",
-            f"--proto_path={proto_dir}",
-            f"--python_out={output_dir}",
-            f"--grpc_python_out={output_dir}",
-            "trending.proto"
-        ], check=True)
-        
-        print("Proto files generated successfully!")
-        
-    except subprocess.CalledProcessError as e:
-        print(f"Error generating proto files: {e}")
-        sys.exit(1)
-    except Exception as e:
-        print(f"Unexpected error: {e}")
-        sys.exit(1)
+    # trending.proto is ours; notification.proto is a copy of notification_service's,
+    # for the trending notifier client
+    for name in ("trending", "notification"):
+        proto_file = os.path.join(proto_dir, f"{name}.proto")
+
+        # Check if proto file exists
+        if not os.path.exists(proto_file):
+            print(f"Error: Proto file not found at {proto_file}")
+            sys.exit(1)
+
+        try:
+            # Generate Python files from proto
+            subprocess.run([
+                "python", "-m", "grpc_tools.protoc",
+                f"--proto_path={proto_dir}",
+                f"--python_out={proto_dir}",
+                f"--grpc_python_out={proto_dir}",
+                f"{name}.proto"
+            ], check=True)
+
+            # Fix the import in {name}_pb2_grpc.py
+            pb2_grpc_file = os.path.join(proto_dir, f"{name}_pb2_grpc.py")
+            with open(pb2_grpc_file, 'r') as f:
+                content = f.read()
+            content = content.replace(f'import {name}_pb2 as {name}__pb2',
+                                      f'from app.proto_files import {name}_pb2 as {name}__pb2')
+            with open(pb2_grpc_file, 'w') as f:
+                f.write(content)
+
+        except subprocess.CalledProcessError as e:
+            print(f"Error generating proto files: {e}")
+            sys.exit(1)
+        except Exception as e:
+            print(f"Unexpected error: {e}")
+            sys.exit(1)
+
+    print("Proto files generated successfully!")
 
 if __name__ == "__main__":
     generate_proto_files() 
\ No newline at end of file
@@ -0,0 +1,16 @@
+-- Batched metric deltas (BatchUpdatePostMetrics / StreamPostMetrics) are
+-- added to the engagement a post's score was computed from, so trending_posts
+-- stores it. New databases get these columns from init_db.py.
+
+ALTER TABLE trending_posts ADD COLUMN IF NOT EXISTS like_count INT NOT NULL DEFAULT 0;
+ALTER TABLE trending_posts ADD COLUMN IF NOT EXISTS comment_count INT NOT NULL DEFAULT 0;
+
+-- Seed them from the posts' own counters where the posts are in this database
+UPDATE trending_posts t
+SET like_count = coalesce(p.like_count, 0),
+    comment_count = coalesce(c.comment_count, 0)
+FROM posts p
+LEFT JOIN (
+    SELECT post_id, count(*) AS comment_count FROM comments GROUP BY post_id
+) c ON c.post_id = p.id
+WHERE p.id = t.post_id;
@@ -0,0 +1,23 @@
+-- GetTrendingPosts can be filtered by geohash cell and property type, so
+-- trending_posts carries the post's location and property type. Every write
+-- copies them from posts; this seeds the existing rows. New databases get
+-- these columns from init_db.py.
+
+ALTER TABLE trending_posts ADD COLUMN IF NOT EXISTS property_type VARCHAR(50);
+ALTER TABLE trending_posts ADD COLUMN IF NOT EXISTS latitude FLOAT;
+ALTER TABLE trending_posts ADD COLUMN IF NOT EXISTS longitude FLOAT;
+
+CREATE INDEX IF NOT EXISTS idx_trending_posts_type_score ON trending_posts(property_type, score, id);
+
+-- map_location is "lat,lng" text; anything else leaves the post unlocated
+UPDATE trending_posts t
+SET property_type = p.property_type,
+    latitude = CAST(split_part(p.lat_lng, ',', 1) AS float),
+    longitude = CAST(split_part(p.lat_lng, ',', 2) AS float)
+FROM (
+    SELECT id, property_type,
+           CASE WHEN map_location ~ '^[[:space:]]*-?[0-9]+([.][0-9]+)?[[:space:]]*,[[:space:]]*-?[0-9]+([.][0-9]+)?[[:space:]]*$'
+                THEN map_location END AS lat_lng
+    FROM posts
+) p
+WHERE p.id = t.post_id;
@@ -0,0 +1,12 @@
+-- Set-based, top-K rank refresh. New databases get these from init_db.py;
+-- this brings an existing one up to date.
+
+-- Score order for GetTrendingPosts and the top-K scan (read backwards)
+CREATE INDEX IF NOT EXISTS idx_trending_posts_score ON trending_posts(score, id);
+
+-- Only the top K posts (TRENDING_RANK_TOP_K, default 1000) hold a rank now.
+-- Clear the ranks the old full refresh gave everything else, so the first
+-- refresh does not rewrite the whole table.
+UPDATE trending_posts SET rank = 0 WHERE rank > 1000;
+
+CREATE INDEX IF NOT EXISTS idx_trending_posts_ranked ON trending_posts(rank) WHERE rank > 0;
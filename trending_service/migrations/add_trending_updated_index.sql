@@ -0,0 +1,4 @@
+-- Trending engine replicas merge the rows other replicas wrote, read by
+-- updated_at. New databases get this index from init_db.py.
+
+CREATE INDEX IF NOT EXISTS idx_trending_posts_updated ON trending_posts(updated_at);
@@ -0,0 +1,15 @@
+-- Rescore trending_posts with the time-anchored "hot" formula from
+-- TrendingRepository.calculate_score (HOT_EPOCH 2024-01-01, DECAY_SECONDS
+-- 45000). Stored scores no longer decay on a timer, so posts rescored here
+-- keep their place relative to newer ones from now on. Engagement is read
+-- from the posts' like counters and comments.
+
+UPDATE trending_posts t
+SET score = log(greatest(coalesce(p.like_count, 0) * 2 + coalesce(c.comment_count, 0) * 1.5, 1))
+            + extract(epoch FROM t.created_at - TIMESTAMP '2024-01-01') / 45000,
+    updated_at = now()
+FROM posts p
+LEFT JOIN (
+    SELECT post_id, count(*) AS comment_count FROM comments GROUP BY post_id
+) c ON c.post_id = p.id
+WHERE p.id = t.post_id;
@@ -0,0 +1,212 @@
+"""TrendingEngine against an in-memory stand-in for trending_posts; run from the trending_service directory:
+
+    python -m pytest tests
+"""
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+import pytest
+from app.service import trending_engine
+from app.service.trending_engine import TrendingEngine
+from app.utils.geohash import encode_location
+
+NOW = datetime.utcnow()
+
+
+class FakeRepository:
+    """The part of TrendingRepository the engine uses, over a dict of rows"""
+
+    rows = {}
+    locations = {}  # post_id -> (latitude, longitude, property_type) copied from the post on write
+    fail = False  # make the next writes raise, as a lost database connection would
+
+    def __init__(self, db):
+        pass
+
+    def get_trending_posts(self, limit, offset):
+        rows = sorted(self.rows.values(), key=lambda row: -row.score)
+        return rows[offset:offset + limit]
+
+    def get_stored_posts(self, post_ids):
+        return {post_id: self.rows[post_id] for post_id in post_ids if post_id in self.rows}
+
+    def upsert_trending_posts(self, posts):
+        if self.fail:
+            raise ConnectionError("database unavailable")
+        written = []
+        for post_id, like_count, comment_count, score, created_at, updated_at in posts:
+            stored = self.rows.get(post_id)
+            latitude, longitude, property_type = self.locations.get(post_id, (None, None, None))
+            self.rows[post_id] = row = SimpleNamespace(
+                id=post_id, post_id=post_id, like_count=like_count, comment_count=comment_count, score=score,
+                created_at=stored.created_at if stored else created_at, updated_at=updated_at,
+                latitude=latitude, longitude=longitude, property_type=property_type
+            )
+            written.append(row)
+        return written
+
+    def get_posts_updated_since(self, since):
+        return [row for row in self.rows.values() if row.updated_at > since]
+
+    def apply_metric_deltas(self, deltas, boosts):
+        if self.fail:
+            raise ConnectionError("database unavailable")
+        written = []
+        now = datetime.utcnow()
+        for post_id, (like_delta, comment_delta) in deltas.items():
+            stored = self.rows.get(post_id)
+            like_count = (stored.like_count if stored else 0) + like_delta
+            comment_count = (stored.comment_count if stored else 0) + comment_delta
+            created_at = stored.created_at if stored else now
+            self.rows[post_id] = row = SimpleNamespace(
+                id=post_id, post_id=post_id, like_count=like_count, comment_count=comment_count,
+                score=trending_engine.hot_score(like_count, comment_count, created_at) + boosts.get(post_id, 0.0),
+                created_at=created_at, updated_at=now, latitude=None, longitude=None, property_type=None
+            )
+            written.append(row)
+        return written
+
+
+def store(post_id, like_count, comment_count, created_at):
+    FakeRepository.rows[post_id] = SimpleNamespace(
+        id=post_id, post_id=post_id, like_count=like_count, comment_count=comment_count,
+        score=trending_engine.hot_score(like_count, comment_count, created_at), created_at=created_at,
+        updated_at=created_at, latitude=None, longitude=None, property_type=None
+    )
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    monkeypatch.setattr(trending_engine, "TrendingRepository", FakeRepository)
+    FakeRepository.rows = {}
+    FakeRepository.locations = {}
+    FakeRepository.fail = False
+    return TrendingEngine(lambda: SimpleNamespace(close=lambda: None), max_posts=2)
+
+
+def test_untracked_post_keeps_stored_created_at(engine):
+    old = NOW - timedelta(days=30)
+    store(1, 10, 0, NOW - timedelta(hours=1))
+    store(2, 10, 0, NOW - timedelta(hours=2))
+    store(3, 50, 5, old)
+    assert engine.load() == 2
+
+    post = engine.update(3, 51, 5)
+
+    assert post["created_at"] == old.isoformat()
+    assert post["score"] == trending_engine.hot_score(51, 5, old)
+    assert engine.rank(3) is None  # still below the two newer posts, so evicted again
+    assert [p["post_id"] for p in engine.top()] == [1, 2]
+
+
+def test_evicted_post_keeps_created_at_when_readmitted(engine):
+    engine.update(1, 1, 0)
+    created_at = datetime.fromisoformat(engine.update(1, 2, 0)["created_at"])
+    engine.update(2, 500, 0)
+    engine.update(3, 500, 0)
+    assert engine.rank(1) is None  # evicted before any snapshot wrote it
+
+    post = engine.update(1, 1000, 0)
+    assert datetime.fromisoformat(post["created_at"]) == created_at
+    assert post["rank"] == 1
+
+    engine.snapshot()
+    engine.update(4, 2000, 0)
+    engine.update(5, 2000, 0)
+    assert engine.rank(1) is None  # evicted after the snapshot wrote it
+
+    post = engine.update(1, 1001, 0)
+    assert datetime.fromisoformat(post["created_at"]) == created_at
+    assert FakeRepository.rows[1].created_at == created_at
+
+
+def test_refresh_merges_rows_written_by_other_replicas(engine):
+    store(1, 10, 0, NOW - timedelta(hours=1))
+    store(2, 10, 0, NOW - timedelta(hours=2))
+    other = TrendingEngine(engine.session_factory, max_posts=2)
+    engine.load()
+    other.load()
+
+    other.update(2, 100, 0)
+    other.snapshot()
+    engine.update(1, 20, 0)  # not snapshotted yet, so the refresh leaves it alone
+    FakeRepository.rows[1].like_count, FakeRepository.rows[1].updated_at = 5, datetime.utcnow()
+
+    assert engine.refresh() == 1
+    assert [p["post_id"] for p in engine.top()] == [2, 1]
+    assert engine.top()[0]["score"] == trending_engine.hot_score(100, 0, NOW - timedelta(hours=2))
+    assert engine.top()[1]["score"] == trending_engine.hot_score(20, 0, NOW - timedelta(hours=1))
+    assert engine.refresh() == 0
+
+
+def test_apply_deltas_adds_to_tracked_and_stored_counts(engine):
+    store(1, 10, 0, NOW - timedelta(hours=1))
+    engine.load()
+
+    assert engine.apply_deltas({1: (5, 1), 2: (3, 0)}) == 2
+    assert engine.top()[0]["score"] == trending_engine.hot_score(15, 1, NOW - timedelta(hours=1))
+    assert engine.rank(2) == 2  # ranked on its deltas alone until the snapshot reads its row
+
+    store(2, 7, 0, NOW - timedelta(hours=2))  # written by another replica meanwhile
+    assert engine.snapshot() == 2
+
+    assert (FakeRepository.rows[1].like_count, FakeRepository.rows[1].comment_count) == (15, 1)
+    assert FakeRepository.rows[2].like_count == 10
+    scores = {post["post_id"]: post["score"] for post in engine.top()}
+    assert scores[2] == trending_engine.hot_score(10, 0, NOW - timedelta(hours=2))
+
+
+def test_failed_snapshot_is_retried(engine):
+    engine.update(1, 5, 0)
+    engine.apply_deltas({2: (1, 0)})
+    FakeRepository.fail = True
+    assert engine.snapshot() == 0
+    assert FakeRepository.rows == {}
+
+    engine.apply_deltas({2: (1, 0)})
+    FakeRepository.fail = False
+    assert engine.snapshot() == 2
+    assert FakeRepository.rows[1].like_count == 5
+    assert FakeRepository.rows[2].like_count == 2
+    assert engine.snapshot() == 0
+
+
+def test_top_reads_geohash_and_property_type_shards(engine):
+    engine.max_posts = 10
+    FakeRepository.locations = {
+        1: (18.5204, 73.8567, "flat"),
+        2: (18.5310, 73.8446, "villa"),
+        3: (40.7128, -74.0060, "flat"),
+    }
+    for post_id, like_count in ((1, 30), (2, 20), (3, 10)):
+        engine.update(post_id, like_count, 0)
+    assert engine.top(geohash="tek") == []  # locations are copied in by the snapshot
+    engine.snapshot()
+
+    pune = encode_location(18.5204, 73.8567)
+    assert [p["post_id"] for p in engine.top(geohash=pune[:3])] == [1, 2]
+    assert [p["post_id"] for p in engine.top(property_type="flat")] == [1, 3]
+    assert [p["post_id"] for p in engine.top(geohash=pune[:3], property_type="villa")] == [2]
+    assert [p["rank"] for p in engine.top(geohash=pune[:3], property_type="villa")] == [1]
+    assert [p["post_id"] for p in engine.top(geohash=pune)] == [1]  # finer than the shards
+
+    engine.update(1, 30, 0)
+    engine.update(2, 40, 0)
+    assert [p["post_id"] for p in engine.top(geohash=pune[:3])] == [2, 1]
+
+
+def test_refresh_skips_unwritten_posts_and_keeps_max_posts(engine):
+    store(2, 50, 0, NOW)
+    store(3, 40, 0, NOW)
+    FakeRepository.rows[2].updated_at = FakeRepository.rows[3].updated_at = NOW - timedelta(hours=1)
+    engine.load()
+    engine.update(1, 100, 0)
+    assert engine.rank(3) is None  # evicted for the new post
+
+    store(1, 5, 0, NOW)  # another replica's write of a post with unwritten changes here
+    store(4, 500, 0, NOW)
+    FakeRepository.rows[1].updated_at = FakeRepository.rows[4].updated_at = datetime.utcnow()
+    assert engine.refresh() == 1
+
+    top = engine.top()
+    assert [p["post_id"] for p in top] == [4, 1]
+    assert top[1]["score"] == trending_engine.hot_score(100, 0, datetime.fromisoformat(top[1]["created_at"]))